@@ -0,0 +1,166 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+def solve_assignment(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    長方形の割り当て問題（コスト最小）を解く
+
+    最短増加路法（Jonker-Volgenant 型のハンガリアン法）を行ごとに適用し、
+    各ステップの列方向の計算は NumPy でまとめて行う。
+    コストが inf の組は割り当て不可として扱い、どの列にも割り当てられない行は
+    結果に含めない（割り当て可能な組の中で最大件数・最小コストとなる）。
+
+    Args:
+        cost: (行数, 列数) のコスト行列
+
+    Returns:
+        (行番号, 列番号) の配列（行番号の昇順）
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError("Cost matrix must be two-dimensional")
+    if cost.shape[0] > cost.shape[1]:
+        cols, rows = solve_assignment(cost.T)
+        order = np.argsort(rows)
+        return rows[order], cols[order]
+
+    n_rows, n_real_cols = cost.shape
+    finite = np.isfinite(cost)
+    if not finite.any():
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # 縮約コストが非負から始まるよう最小値を0にそろえる
+    cost = np.where(finite, cost - cost[finite].min(), np.inf)
+    # 行ごとに「割り当てなし」を表すダミー列を足す。どの実在の割り当ての合計よりも
+    # 高いコストにすることで、割り当て件数を優先したうえでコストを最小化する
+    unassigned_cost = (cost[finite].max() + 1.0) * n_rows
+    dummy = np.full((n_rows, n_rows), np.inf)
+    np.fill_diagonal(dummy, unassigned_cost)
+    cost = np.hstack([cost, dummy])
+    n_cols = cost.shape[1]
+
+    u = np.zeros(n_rows)
+    v = np.zeros(n_cols)
+    col4row = np.full(n_rows, -1, dtype=np.int64)
+    row4col = np.full(n_cols, -1, dtype=np.int64)
+
+    for current_row in range(n_rows):
+        shortest = np.full(n_cols, np.inf)
+        path = np.full(n_cols, -1, dtype=np.int64)
+        visited_cols = np.zeros(n_cols, dtype=bool)
+        visited_rows = [current_row]
+        i = current_row
+        min_value = 0.0
+        sink = -1
+
+        while sink < 0:
+            # i から各未訪問列への最短距離を更新（ダイクストラ法の1ステップ）
+            reduced = min_value + cost[i] - u[i] - v
+            improved = ~visited_cols & (reduced < shortest)
+            path[improved] = i
+            shortest[improved] = reduced[improved]
+
+            candidates = np.where(visited_cols, np.inf, shortest)
+            j = int(np.argmin(candidates))
+            min_value = candidates[j]
+            if row4col[j] >= 0:
+                # 同じ距離の列が複数ある場合は未割り当ての列を優先する（適合度が段階値で
+                # 同点が多いと、割り当て済みの列をたどる長い増加路になるのを避ける）
+                free = np.flatnonzero((candidates == min_value) & (row4col < 0))
+                if len(free):
+                    j = int(free[0])
+            visited_cols[j] = True
+            if row4col[j] < 0:
+                sink = j
+            else:
+                i = int(row4col[j])
+                visited_rows.append(i)
+
+        # 双対変数（ポテンシャル）の更新
+        u[current_row] += min_value
+        if len(visited_rows) > 1:
+            others = np.array(visited_rows[1:], dtype=np.int64)
+            u[others] += min_value - shortest[col4row[others]]
+        v[visited_cols] -= min_value - shortest[visited_cols]
+
+        # 増加路に沿って割り当てを入れ替える
+        j = sink
+        while True:
+            i = int(path[j])
+            row4col[j] = i
+            col4row[i], j = j, int(col4row[i])
+            if i == current_row:
+                break
+
+    rows = np.flatnonzero(col4row < n_real_cols)
+    return rows, col4row[rows]
+
+@dataclass
+class Position:
+    """募集ポジション（group_id を指定した場合はそのグループのユーザーに限る）"""
+    role_id: int
+    group_id: Optional[int] = None
+
+@dataclass
+class AssignmentResult:
+    """ポジションへのユーザーの割り当て結果"""
+    # (ポジションの位置, role_id, user_id, 適合度)
+    assignments: List[Tuple[int, int, int, float]] = field(default_factory=list)
+    # 割り当てられなかったポジションの位置
+    unfilled: List[int] = field(default_factory=list)
+
+    @property
+    def total_fit(self) -> float:
+        return float(sum(assignment[3] for assignment in self.assignments))
+
+def assign_positions(
+    fit: np.ndarray,
+    role_ids: np.ndarray,
+    user_ids: np.ndarray,
+    user_group_ids: np.ndarray,
+    positions: Sequence[Position],
+    candidate_rows: Optional[np.ndarray] = None,
+    min_fit: float = 0.0
+) -> AssignmentResult:
+    """
+    適合度の合計が最大になるようにポジションへユーザーを割り当てる
+
+    1人が担当するのは1ポジションまで。同じ役割のポジションを複数指定できる。
+
+    Args:
+        fit: (ユーザー数, 役割数) の適合度
+        role_ids: fit の列の role_id
+        user_ids: fit の行の user_id
+        user_group_ids: fit の行のユーザーの group_id
+        positions: 募集ポジション
+        candidate_rows: 候補者の行番号（None の場合は全ユーザー）
+        min_fit: これ未満の適合度の組は割り当てない
+    """
+    result = AssignmentResult()
+    if not len(positions):
+        return result
+    rows = np.arange(len(user_ids)) if candidate_rows is None else np.asarray(candidate_rows, dtype=np.int64)
+    role_position = {int(role_id): r for r, role_id in enumerate(role_ids)}
+
+    # ポジション × 候補者のコスト（適合度の符号を反転、割り当て不可は inf）
+    cost = np.full((len(positions), len(rows)), np.inf)
+    for p, position in enumerate(positions):
+        r = role_position.get(position.role_id)
+        if r is None:
+            continue
+        scores = fit[rows, r]
+        allowed = scores >= min_fit
+        if position.group_id is not None:
+            allowed &= user_group_ids[rows] == position.group_id
+        cost[p, allowed] = -scores[allowed]
+
+    position_indices, candidate_indices = solve_assignment(cost)
+    filled = set()
+    for p, c in zip(position_indices.tolist(), candidate_indices.tolist()):
+        row = rows[c]
+        result.assignments.append((
+            p, positions[p].role_id, int(user_ids[row]), float(fit[row, role_position[positions[p].role_id]])
+        ))
+        filled.add(p)
+    result.unfilled = [p for p in range(len(positions)) if p not in filled]
+    return result
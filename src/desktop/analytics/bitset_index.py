@@ -0,0 +1,253 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix, NO_GROUP
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix, WORD_BITS
+
+# レベルのしきい値の段階数（レベル k 以上、k = 0〜5）
+N_THRESHOLDS = 6
+
+class Query(ABC):
+    """
+    ユーザーの絞り込み条件
+
+    & / | / ~ で組み合わせられる（例: Has(python, 3) & Has(sql, 2) & ~InGroup(a)）。
+    """
+
+    @abstractmethod
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        """条件を満たすユーザーのビット列（ワード数,）を求める"""
+
+    def __and__(self, other: 'Query') -> 'Query':
+        return And(self, other)
+
+    def __or__(self, other: 'Query') -> 'Query':
+        return Or(self, other)
+
+    def __invert__(self) -> 'Query':
+        return Not(self)
+
+class Has(Query):
+    """スキルのレベルが level 以上（level=0 は評価済み）"""
+
+    def __init__(self, skill_id: int, level: int = 0):
+        if not 0 <= level < N_THRESHOLDS:
+            raise ValueError(f"Level must be between 0 and {N_THRESHOLDS - 1}")
+        self.skill_id = skill_id
+        self.level = level
+
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        return index.skill_bitset(self.skill_id, self.level)
+
+    def __repr__(self) -> str:
+        return f"Has({self.skill_id}, {self.level})"
+
+class InGroup(Query):
+    """グループに所属（None は未所属）"""
+
+    def __init__(self, group_id: Optional[int]):
+        self.group_id = group_id
+
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        return index.group_bitset(self.group_id)
+
+    def __repr__(self) -> str:
+        return f"InGroup({self.group_id})"
+
+class And(Query):
+    """全ての条件を満たす"""
+
+    def __init__(self, *terms: Query):
+        if not terms:
+            raise ValueError("And requires at least one term")
+        self.terms = terms
+
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        result = self.terms[0].evaluate(index).copy()
+        for term in self.terms[1:]:
+            result &= term.evaluate(index)
+        return result
+
+    def __and__(self, other: Query) -> Query:
+        return And(*self.terms, other)
+
+    def __repr__(self) -> str:
+        return " & ".join(f"({term!r})" for term in self.terms)
+
+class Or(Query):
+    """いずれかの条件を満たす"""
+
+    def __init__(self, *terms: Query):
+        if not terms:
+            raise ValueError("Or requires at least one term")
+        self.terms = terms
+
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        result = self.terms[0].evaluate(index).copy()
+        for term in self.terms[1:]:
+            result |= term.evaluate(index)
+        return result
+
+    def __or__(self, other: Query) -> Query:
+        return Or(*self.terms, other)
+
+    def __repr__(self) -> str:
+        return " | ".join(f"({term!r})" for term in self.terms)
+
+class Not(Query):
+    """条件を満たさない"""
+
+    def __init__(self, term: Query):
+        self.term = term
+
+    def evaluate(self, index: 'SkillBitsetIndex') -> np.ndarray:
+        return ~self.term.evaluate(index) & index.all_bitset()
+
+    def __repr__(self) -> str:
+        return f"~({self.term!r})"
+
+class SkillBitsetIndex:
+    """
+    スキル × レベルのしきい値ごとのユーザーのビット列（転置インデックス）
+
+    (スキル, k) ごとに「レベル k 以上のユーザー」を64ビット単位（uint64）の
+    ビット列で保持し、グループごとの所属ユーザーのビット列と合わせて
+    AND / OR / NOT の条件をワード単位のビット演算で評価する。
+    ユーザーの並びは構築時の行列の行番号に従う。
+    """
+
+    def __init__(self, matrix: BaseSkillMatrix):
+        """
+        Args:
+            matrix: 構築元のスキルマトリクス（構築後は参照しない）
+        """
+        n_users, n_skills = matrix.shape
+        self._user_ids = matrix.user_ids.copy()
+        self._user_index: Dict[int, int] = {int(user_id): i for i, user_id in enumerate(self._user_ids)}
+        self._skill_index: Dict[int, int] = {int(skill_id): j for j, skill_id in enumerate(matrix.skill_ids)}
+        self._n_users = n_users
+        self._n_words = max((n_users + WORD_BITS - 1) // WORD_BITS, 1)
+
+        self._all = self._pack(np.ones(n_users, dtype=bool))
+        self._empty = np.zeros(self._n_words, dtype=np.uint64)
+        self._groups: Dict[int, np.ndarray] = {}
+        group_ids, inverse = np.unique(matrix.user_group_ids, return_inverse=True)
+        for g, group_id in enumerate(group_ids):
+            self._groups[int(group_id)] = self._pack(inverse == g)
+
+        # (スキル, しきい値, ワード)
+        self._bitsets = np.zeros((max(n_skills, 1), N_THRESHOLDS, self._n_words), dtype=np.uint64)
+        if isinstance(matrix, PackedSkillMatrix):
+            for level in range(N_THRESHOLDS):
+                self._bitsets[:n_skills, level] = matrix.at_least_bitsets(level)
+        else:
+            self._load(*matrix.to_coo_indices(), n_skills)
+
+    def _pack(self, bits: np.ndarray) -> np.ndarray:
+        """ユーザー方向の真偽値をビット列に変換"""
+        padded = np.zeros(self._n_words * WORD_BITS, dtype=bool)
+        padded[:len(bits)] = bits
+        return np.packbits(padded, bitorder='little').view(np.uint64)
+
+    def _load(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray, n_skills: int):
+        """
+        評価済みセルからビット列を作る
+
+        同じワードに立つビットは互いに異なるため、ビットごとの OR は和に等しい。
+        浮動小数点で正確に足せるよう16ビットずつに分けて bincount で集計し、
+        レベルちょうどのビット列を作ってから上位のしきい値側から OR を累積する。
+        """
+        keys = (cols * N_THRESHOLDS + levels.astype(np.int64)) * self._n_words + rows // WORD_BITS
+        bits = rows % WORD_BITS
+        exact = self._bitsets[:n_skills].reshape(-1)
+        for lane in range(WORD_BITS // 16):
+            selected = (bits >> 4) == lane
+            sums = np.bincount(
+                keys[selected],
+                weights=np.ldexp(1.0, bits[selected] & 15),
+                minlength=len(exact)
+            )
+            exact |= sums.astype(np.uint64) << np.uint64(16 * lane)
+        # レベル L のセルは L 以下の全てのしきい値に含まれる
+        for level in range(N_THRESHOLDS - 2, -1, -1):
+            self._bitsets[:n_skills, level] |= self._bitsets[:n_skills, level + 1]
+
+    @property
+    def n_users(self) -> int:
+        return self._n_users
+
+    @property
+    def row_user_ids(self) -> np.ndarray:
+        """ビット位置に対応するユーザーID"""
+        return self._user_ids
+
+    @property
+    def nbytes(self) -> int:
+        return self._bitsets.nbytes + sum(bitset.nbytes for bitset in self._groups.values())
+
+    # ------------------------------------------------------------------
+    # ビット列の参照
+    # ------------------------------------------------------------------
+    def all_bitset(self) -> np.ndarray:
+        """全ユーザーのビット列"""
+        return self._all
+
+    def skill_bitset(self, skill_id: int, level: int = 0) -> np.ndarray:
+        """スキルのレベルが level 以上のユーザーのビット列（未知のスキルは空）"""
+        j = self._skill_index.get(skill_id)
+        if j is None:
+            return self._empty
+        return self._bitsets[j, level]
+
+    def group_bitset(self, group_id: Optional[int]) -> np.ndarray:
+        """グループに所属するユーザーのビット列（未知のグループは空）"""
+        return self._groups.get(NO_GROUP if group_id is None else group_id, self._empty)
+
+    # ------------------------------------------------------------------
+    # 更新
+    # ------------------------------------------------------------------
+    def set_level(self, user_id: int, skill_id: int, level: Optional[int]) -> bool:
+        """
+        1セル分のレベルを反映（None で未評価に戻す）
+
+        Returns:
+            bool: ユーザー・スキルがインデックスに存在し更新できた場合True
+        """
+        i = self._user_index.get(user_id)
+        j = self._skill_index.get(skill_id)
+        if i is None or j is None:
+            return False
+        word, shift = divmod(i, WORD_BITS)
+        mask = np.uint64(1 << shift)
+        self._bitsets[j, :, word] &= ~mask
+        if level is not None:
+            self._bitsets[j, :level + 1, word] |= mask
+        return True
+
+    def apply_changes(self, changes: Iterable[Tuple[int, int, Optional[int]]]) -> bool:
+        """
+        (user_id, skill_id, level) の変更をまとめて反映
+
+        Returns:
+            bool: 全ての変更が反映できた場合True（未知のIDを含む場合False）
+        """
+        applied = True
+        for user_id, skill_id, level in changes:
+            applied = self.set_level(user_id, skill_id, level) and applied
+        return applied
+
+    # ------------------------------------------------------------------
+    # 検索
+    # ------------------------------------------------------------------
+    def evaluate(self, query: Query) -> np.ndarray:
+        """条件を満たすユーザーのビット列（インデックスから独立したコピー）"""
+        return query.evaluate(self).copy()
+
+    def user_ids(self, query: Query) -> np.ndarray:
+        """条件を満たすユーザーID（行列の行順）"""
+        bits = np.unpackbits(self.evaluate(query).view(np.uint8), bitorder='little')[:self._n_users]
+        return self._user_ids[np.flatnonzero(bits)]
+
+    def count(self, query: Query) -> int:
+        """条件を満たすユーザー数"""
+        return int(np.bitwise_count(self.evaluate(query)).sum())
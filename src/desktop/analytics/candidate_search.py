@@ -0,0 +1,139 @@
+import heapq
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix
+
+@dataclass
+class Candidate:
+    """候補者と要件に対するスコア（Σ 重み × レベル、未評価は0）"""
+    user_id: int
+    score: float
+
+class CandidateSearch:
+    """
+    重み付きスキル要件に対する上位 k 人の検索
+
+    スキルごとにレベルの降順に並べた転置リスト（posting list）を持ち、
+    閾値アルゴリズム（Threshold Algorithm）で上位 k 人を求める。
+    各リストを先頭から少数ずつ（回ごとに倍に増やしながら）読み進め、新たに現れたユーザーだけを
+    行列から採点する。未読のユーザーが取り得る最大スコア
+    （Σ 重み × 各リストの読み位置のレベル）が現在の k 位のスコア以下になった
+    時点で打ち切るため、全ユーザーを採点する必要はない。
+
+    転置リストはスキルごとに必要になった時点で作り、レベルが変わった
+    スキルの分だけ作り直す。
+    """
+
+    def __init__(self, matrix: BaseSkillMatrix, max_batch_size: int = 1024):
+        """
+        Args:
+            matrix: 採点に使うスキルマトリクス（行・列の構成が変わった場合は作り直すこと）
+            max_batch_size: 1回に各リストから読み進める件数の上限
+        """
+        self.matrix = matrix
+        self.max_batch_size = max_batch_size
+        # 列番号 → (行番号, レベル)（レベルの降順）
+        self._postings: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        # 直近の検索で採点したユーザー数
+        self.last_scored_count = 0
+
+    def posting_list(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """列 j の転置リスト（行番号, レベル）をレベルの降順で取得"""
+        posting = self._postings.get(j)
+        if posting is None:
+            rows, levels = self.matrix.column_entries(j)
+            order = np.argsort(-levels.astype(np.int64), kind='stable')
+            posting = (rows[order], levels[order].astype(np.int64))
+            self._postings[j] = posting
+        return posting
+
+    def invalidate_skills(self, skill_ids: Iterable[int]):
+        """レベルが変わったスキルの転置リストを破棄"""
+        for skill_id in skill_ids:
+            j = self.matrix.skill_index(skill_id)
+            if j is not None:
+                self._postings.pop(j, None)
+
+    def top_k(self, requirements: Mapping[int, float], k: int = 10,
+              rows: Optional[np.ndarray] = None) -> List[Candidate]:
+        """
+        要件に対するスコアの上位 k 人を取得
+
+        Args:
+            requirements: スキルID → 重み（正の値）
+            k: 取得する人数
+            rows: 対象とする行番号（None の場合は全ユーザー）
+
+        Returns:
+            List[Candidate]: スコアの降順（k 位の同点の選び方は不定）。スコアが0のユーザーは含まない
+        """
+        if k <= 0:
+            return []
+        cols, weights = [], []
+        for skill_id, weight in requirements.items():
+            if weight <= 0:
+                raise ValueError(f"Weight for skill {skill_id} must be positive")
+            j = self.matrix.skill_index(skill_id)
+            if j is not None:
+                cols.append(j)
+                weights.append(float(weight))
+        self.last_scored_count = 0
+        if not cols:
+            return []
+        cols = np.array(cols, dtype=np.int64)
+        weights = np.array(weights)
+        postings = [self.posting_list(j) for j in cols]
+
+        n_users = self.matrix.shape[0]
+        # 採点済み（または対象外）のユーザー
+        seen = np.zeros(n_users, dtype=bool)
+        if rows is not None:
+            seen[:] = True
+            seen[np.asarray(rows, dtype=np.int64)] = False
+        # (スコア, -行番号) の最小ヒープ（k 位が先頭）
+        heap: List[Tuple[float, int]] = []
+        depth = 0
+        batch_size = max(k, 8)
+        longest = max(len(posting_rows) for posting_rows, _ in postings)
+
+        while depth < longest:
+            end = depth + batch_size
+            batch_size = min(batch_size * 2, self.max_batch_size)
+            batch = np.unique(np.concatenate([posting_rows[depth:end] for posting_rows, _ in postings]))
+            batch = batch[~seen[batch]]
+            seen[batch] = True
+            depth = end
+
+            if len(batch):
+                levels = self.matrix.to_dense(batch, cols).astype(np.int64)
+                scores = np.maximum(levels, 0) @ weights
+                if len(heap) == k:
+                    keep = scores > heap[0][0]
+                    batch, scores = batch[keep], scores[keep]
+                if len(scores) > k:
+                    best = np.argpartition(-scores, k - 1)[:k]
+                    batch, scores = batch[best], scores[best]
+                self.last_scored_count += len(levels)
+                for row, score in zip(batch.tolist(), scores.tolist()):
+                    if score <= 0:
+                        continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (score, -row))
+                    elif (score, -row) > heap[0]:
+                        heapq.heapreplace(heap, (score, -row))
+
+            # 未読のユーザーが取り得る最大スコア
+            threshold = sum(
+                weight * posting_levels[depth]
+                for weight, (_, posting_levels) in zip(weights.tolist(), postings)
+                if depth < len(posting_levels)
+            )
+            if len(heap) == k and heap[0][0] >= threshold:
+                break
+
+        user_ids = self.matrix.user_ids
+        return [
+            Candidate(user_id=int(user_ids[-neg_row]), score=score)
+            for score, neg_row in sorted(heap, reverse=True)
+        ]
@@ -0,0 +1,58 @@
+import logging
+from typing import Optional, Sequence, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix, SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+
+logger = logging.getLogger(__name__)
+
+# これ以下のセル数なら評価の割合に関わらず密行列を使う（4MB）
+DENSE_MAX_CELLS = 4_000_000
+# これを超えるセル数では密行列の代わりに3ビット詰めの行列を使う（64MB）
+PACKED_MIN_CELLS = 64_000_000
+
+def estimate_bytes(n_users: int, n_skills: int, n_levels: int) -> dict:
+    """
+    各格納方式のおおよそのメモリ使用量（バイト）
+
+    密行列は1セル1バイト、3ビット詰めは1セル3/8バイト、
+    CSRは1評価あたり約5バイト（列番号 int32 + レベル int8）と行ポインタ。
+    """
+    cells = n_users * n_skills
+    return {
+        'dense': cells,
+        'packed': cells * 3 // 8,
+        'sparse': n_levels * 5 + (n_users + 1) * 8,
+    }
+
+def create_skill_matrix(
+    users: Sequence[Tuple[int, Optional[int]]],
+    skills: Sequence[Tuple[int, int]],
+    levels: Sequence[Tuple[int, int, int]],
+    dense_max_cells: int = DENSE_MAX_CELLS,
+    packed_min_cells: int = PACKED_MIN_CELLS
+) -> BaseSkillMatrix:
+    """
+    行列の大きさと評価済みセルの割合に応じて格納方式を選んで構築
+
+    小さな行列は最も高速な密行列、それ以外は密行列（大規模な場合は3ビット詰め）と
+    CSRのうちメモリ使用量が小さい方を使う。
+
+    Args:
+        users: (user_id, group_id) のリスト
+        skills: (skill_id, category_id) のリスト
+        levels: (user_id, skill_id, level) のリスト
+        dense_max_cells: セル数がこれ以下なら常に密行列を使う
+        packed_min_cells: セル数がこれを超える場合は密行列の代わりに3ビット詰めを使う
+    """
+    cells = len(users) * len(skills)
+    if cells <= dense_max_cells:
+        return SkillMatrix.from_rows(users, skills, levels)
+
+    sizes = estimate_bytes(len(users), len(skills), len(levels))
+    full_kind = 'packed' if cells > packed_min_cells else 'dense'
+    kind = 'sparse' if sizes['sparse'] < sizes[full_kind] else full_kind
+    logger.debug(f"Using {kind} skill matrix: {cells} cells, {len(levels)} levels, ~{sizes[kind]} bytes")
+
+    matrix_class = {'dense': SkillMatrix, 'packed': PackedSkillMatrix, 'sparse': SparseSkillMatrix}[kind]
+    return matrix_class.from_rows(users, skills, levels)
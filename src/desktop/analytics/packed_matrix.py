@@ -0,0 +1,250 @@
+import numpy as np
+from typing import Iterable, Optional, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix, MAX_LEVEL, MIN_LEVEL, UNSET
+
+# 1セルあたりのビット数（レベル 0〜5 と未評価の7通りを 0〜6 の符号で表す）
+BITS_PER_CELL = 3
+WORD_BITS = 64
+
+class PackedSkillMatrix(BaseSkillMatrix):
+    """
+    ユーザー × スキルのレベルを1セル3ビットで保持する行列
+
+    各セルは code = level + 1（未評価は 0）として3ビットに符号化し、
+    ビットごとに分けた3枚のビット平面に格納する。各平面はスキルごとに
+    ユーザー方向へ64ビット単位（uint64）で詰めるため、
+    「レベル k 以上」のような比較は展開せずにワード単位のビット演算で求まる。
+    100k ユーザー × 10k スキルで約375MB（int8 の密行列は約1GB）。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        n_words = max(self._words_for(self._n_users), 1)
+        self._planes = np.zeros((BITS_PER_CELL, max(self._n_skills, 1), n_words), dtype=np.uint64)
+
+    @staticmethod
+    def _words_for(n_users: int) -> int:
+        """ユーザー数分のビットを格納するのに必要なワード数"""
+        return (n_users + WORD_BITS - 1) // WORD_BITS
+
+    @property
+    def _n_words(self) -> int:
+        return self._words_for(self._n_users)
+
+    # ------------------------------------------------------------------
+    # ビット演算
+    # ------------------------------------------------------------------
+    def _planes_for(self, cols: Optional[np.ndarray]) -> np.ndarray:
+        """対象列のビット平面 (3, 列数, ワード数)"""
+        planes = self._planes[:, :self._n_skills, :self._n_words]
+        return planes if cols is None else planes[:, cols]
+
+    @staticmethod
+    def _compare_at_least(planes: np.ndarray, code: int) -> np.ndarray:
+        """
+        符号が code 以上のセルを表すビット列を求める
+
+        上位ビットから順に「ここまで等しい (eq)」「既に大きい (gt)」を更新する。
+        code はレベルの符号 1〜6 に限る（3ビットを超える値は上位ビットが無視され誤った結果になる）。
+        """
+        if not MIN_LEVEL + 1 <= code <= MAX_LEVEL + 1:
+            raise ValueError(f"Code must be between {MIN_LEVEL + 1} and {MAX_LEVEL + 1}: {code}")
+        b0, b1, b2 = planes
+        eq = np.full(b0.shape, np.iinfo(np.uint64).max, dtype=np.uint64)
+        gt = np.zeros(b0.shape, dtype=np.uint64)
+        for bit, plane in ((2, b2), (1, b1), (0, b0)):
+            if (code >> bit) & 1:
+                eq &= plane
+            else:
+                gt |= eq & plane
+                eq &= ~plane
+        return gt | eq
+
+    def _row_mask(self, rows: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """行番号の集合をユーザー方向のビット列に変換"""
+        if rows is None:
+            return None
+        rows = np.asarray(rows, dtype=np.int64)
+        bits = np.zeros(self._n_words * WORD_BITS, dtype=np.uint8)
+        bits[rows] = 1
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def _count(self, bitsets: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """列ごとの立っているビット数（rows を指定した場合はその行のみ）"""
+        mask = self._row_mask(rows)
+        if mask is not None:
+            bitsets = bitsets & mask
+        return np.bitwise_count(bitsets).sum(axis=-1, dtype=np.int64)
+
+    def rated_bitsets(self, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """評価済みセルのビット列 (列数, ワード数)"""
+        b0, b1, b2 = self._planes_for(cols)
+        return b0 | b1 | b2
+
+    def at_least_bitsets(self, level: int, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """レベル level 以上のセルのビット列 (列数, ワード数)"""
+        if not MIN_LEVEL <= level <= MAX_LEVEL:
+            raise ValueError(f"Level must be between {MIN_LEVEL} and {MAX_LEVEL}: {level}")
+        if level == MIN_LEVEL:
+            return self.rated_bitsets(cols)
+        return self._compare_at_least(self._planes_for(cols), level + 1)
+
+    def users_at_least(self, skill_id: int, level: int) -> np.ndarray:
+        """スキルのレベルが level 以上のユーザーID"""
+        j = self._skill_index.get(skill_id)
+        if j is None:
+            return np.empty(0, dtype=np.int64)
+        bitset = self.at_least_bitsets(level, np.array([j]))[0]
+        bits = np.unpackbits(bitset.view(np.uint8), bitorder='little')[:self._n_users]
+        return self.user_ids[np.flatnonzero(bits)]
+
+    # ------------------------------------------------------------------
+    # BaseSkillMatrix の実装
+    # ------------------------------------------------------------------
+    @property
+    def nnz(self) -> int:
+        return int(self._count(self.rated_bitsets(), None).sum())
+
+    @property
+    def nbytes(self) -> int:
+        return self._planes.nbytes
+
+    def _load(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray):
+        codes = levels.astype(np.int64) + 1
+        words = rows // WORD_BITS
+        masks = np.left_shift(np.uint64(1), (rows % WORD_BITS).astype(np.uint64))
+        for bit in range(BITS_PER_CELL):
+            selected = ((codes >> bit) & 1).astype(bool)
+            np.bitwise_or.at(self._planes[bit], (cols[selected], words[selected]), masks[selected])
+
+    def _get_cell(self, i: int, j: int) -> int:
+        word, shift = divmod(i, WORD_BITS)
+        cell = self._planes[:, j, word] >> np.uint64(shift)
+        code = int(cell[0] & 1) | int(cell[1] & 1) << 1 | int(cell[2] & 1) << 2
+        return code - 1
+
+    def _set_cell(self, i: int, j: int, level: int):
+        word, shift = divmod(i, WORD_BITS)
+        mask = np.uint64(1 << shift)
+        code = level + 1
+        for bit in range(BITS_PER_CELL):
+            if (code >> bit) & 1:
+                self._planes[bit, j, word] |= mask
+            else:
+                self._planes[bit, j, word] &= ~mask
+
+    def _ensure_capacity(self, n_users: int, n_skills: int):
+        """必要に応じてビット平面の容量を倍々で拡張"""
+        _, skill_capacity, word_capacity = self._planes.shape
+        n_words = self._words_for(n_users)
+        if n_skills <= skill_capacity and n_words <= word_capacity:
+            return
+        while skill_capacity < n_skills:
+            skill_capacity *= 2
+        while word_capacity < n_words:
+            word_capacity *= 2
+        planes = np.zeros((BITS_PER_CELL, skill_capacity, word_capacity), dtype=np.uint64)
+        _, old_skills, old_words = self._planes.shape
+        planes[:, :old_skills, :old_words] = self._planes
+        self._planes = planes
+
+    def _append_row(self):
+        # 削除済みの行のビットは消去済みのため、容量の確保だけでよい
+        self._ensure_capacity(self._n_users + 1, self._n_skills)
+
+    def _append_column(self):
+        self._ensure_capacity(self._n_users, self._n_skills + 1)
+
+    def _move_row(self, source: int, target: int):
+        source_word, source_shift = divmod(source, WORD_BITS)
+        source_mask = np.uint64(1 << source_shift)
+        planes = self._planes[:, :self._n_skills]
+        if source != target:
+            target_word, target_shift = divmod(target, WORD_BITS)
+            target_mask = np.uint64(1 << target_shift)
+            bits = (planes[:, :, source_word] & source_mask) != 0
+            planes[:, :, target_word] &= ~target_mask
+            planes[:, :, target_word] |= np.where(bits, target_mask, np.uint64(0))
+        planes[:, :, source_word] &= ~source_mask
+
+    def _move_column(self, source: int, target: int):
+        if source != target:
+            self._planes[:, target] = self._planes[:, source]
+        self._planes[:, source] = 0
+
+    def _unpack_codes(self, cols: np.ndarray, first_word: int = 0,
+                      last_word: Optional[int] = None) -> np.ndarray:
+        """
+        対象列の符号を展開 (列数, ユーザー数)
+
+        first_word / last_word を指定した場合はその範囲のワードに含まれる行
+        （first_word × 64 行目から）だけを展開する。
+        """
+        last_word = self._n_words if last_word is None else last_word
+        planes = self._planes_for(cols)[:, :, first_word:last_word]
+        n_rows = min(self._n_users, last_word * WORD_BITS) - first_word * WORD_BITS
+        codes = np.zeros((len(cols), n_rows), dtype=np.int8)
+        for bit in range(BITS_PER_CELL):
+            bits = np.unpackbits(
+                np.ascontiguousarray(planes[bit]).view(np.uint8),
+                axis=-1,
+                bitorder='little'
+            )[:, :n_rows]
+            codes |= (bits << bit).astype(np.int8)
+        return codes
+
+    def to_dense(self, rows: Optional[np.ndarray] = None, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """指定した行・列の密行列を取得（小さな部分行列向け）"""
+        rows = np.arange(self._n_users) if rows is None else np.asarray(rows, dtype=np.int64)
+        cols = np.arange(self._n_skills) if cols is None else np.asarray(cols, dtype=np.int64)
+        if not len(rows) or not len(cols):
+            return np.full((len(rows), len(cols)), UNSET, dtype=np.int8)
+        # 対象行を含むワードの範囲だけを展開する
+        first_word = int(rows.min()) // WORD_BITS
+        last_word = int(rows.max()) // WORD_BITS + 1
+        codes = self._unpack_codes(cols, first_word, last_word)
+        return (codes[:, rows - first_word * WORD_BITS] - 1).T
+
+    def iter_column_chunks(self, chunk_size: int = 256) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+        """列を chunk_size ずつ展開して (列番号, レベル (ユーザー数, 列数)) を返す"""
+        for start in range(0, self._n_skills, chunk_size):
+            cols = np.arange(start, min(start + chunk_size, self._n_skills))
+            yield cols, (self._unpack_codes(cols) - 1).T
+
+    def to_coo_indices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        all_rows, all_cols, all_levels = [], [], []
+        for cols, block in self.iter_column_chunks():
+            rows, positions = np.nonzero(block != UNSET)
+            all_rows.append(rows)
+            all_cols.append(cols[positions])
+            all_levels.append(block[rows, positions])
+        if not all_rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+        return np.concatenate(all_rows), np.concatenate(all_cols), np.concatenate(all_levels)
+
+    def skill_rated_counts(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._count(self.rated_bitsets(), rows)
+
+    def skill_level_sums(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        # 符号の合計 = Σ 2^bit × (そのビットが立つ人数)、レベル = 符号 - 1
+        planes = self._planes_for(None)
+        code_sums = sum(self._count(planes[bit], rows) << bit for bit in range(BITS_PER_CELL))
+        return code_sums - self.skill_rated_counts(rows)
+
+    def skill_counts_at_least(self, level: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._count(self.at_least_bitsets(level), rows)
+
+    def user_levels(self, user_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        i = self._user_index.get(user_id)
+        if i is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+        word, shift = divmod(i, WORD_BITS)
+        bits = (self._planes_for(None)[:, :, word] >> np.uint64(shift)) & np.uint64(1)
+        codes = (bits[0] | bits[1] << np.uint64(1) | bits[2] << np.uint64(2)).astype(np.int8)
+        cols = np.flatnonzero(codes)
+        return self.skill_ids[cols], codes[cols] - 1
+
+    def column_entries(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        codes = self._unpack_codes(np.array([j]))[0]
+        rows = np.flatnonzero(codes)
+        return rows, codes[rows] - 1
@@ -0,0 +1,206 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix
+
+# 必要レベルの上限
+MAX_REQUIRED_LEVEL = 5
+
+@dataclass
+class RoleFitResult:
+    """
+    全ユーザー × 全役割の適合度
+
+    gaps は重み付きの不足レベルの合計 Σ 重み × max(必要レベル - レベル, 0)
+    （未評価はレベル0として扱う）、fit は 1 - gaps / 最大不足（0.0〜1.0）。
+    """
+    user_ids: np.ndarray    # (U,)
+    role_ids: np.ndarray    # (R,)
+    gaps: np.ndarray        # (U, R)
+    fit: np.ndarray         # (U, R)
+
+    def role_index(self, role_id: int) -> Optional[int]:
+        """role_id に対応する列番号（存在しない場合はNone）"""
+        positions = np.flatnonzero(self.role_ids == role_id)
+        return int(positions[0]) if len(positions) else None
+
+    def top_users(self, role_id: int, k: int = 10) -> List[Tuple[int, float]]:
+        """役割への適合度が高い k 人の (user_id, fit)"""
+        r = self.role_index(role_id)
+        if r is None or k <= 0 or not len(self.user_ids):
+            return []
+        scores = self.fit[:, r]
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(int(self.user_ids[i]), float(scores[i])) for i in best]
+
+    def user_fit(self, user_id: int) -> Dict[int, float]:
+        """ユーザーの役割ごとの適合度（role_id → fit）"""
+        positions = np.flatnonzero(self.user_ids == user_id)
+        if not len(positions):
+            return {}
+        return dict(zip(self.role_ids.tolist(), self.fit[positions[0]].tolist()))
+
+class RoleFitEngine:
+    """
+    全ユーザー × 全役割の適合度をまとめて計算する
+
+    不足レベル max(q - L, 0) は「レベル t 以上か」の指示関数 [L >= t] を使って
+    Σ_{t=1..q} (1 - [L >= t]) と分解できる。役割の要件を
+    W_t[スキル, 役割] = 重み（必要レベル >= t の場合）の行列にまとめると、
+    不足の合計は Σ 重み × 必要レベル - Σ_t [L >= t] @ W_t となり、
+    ユーザーごとのループなしに5回の行列積で全ユーザー × 全役割が求まる。
+
+    結果は保持し、レベルが変わったユーザーの行・要件が変わった役割の列だけを
+    計算し直す。
+    """
+
+    def __init__(self, matrix: BaseSkillMatrix, block_size: int = 4096):
+        """
+        Args:
+            matrix: 対象のスキルマトリクス（行・列の構成が変わった場合は作り直すこと）
+            block_size: 1回の行列積で扱う行数
+        """
+        self.matrix = matrix
+        self.block_size = block_size
+        # role_id → {skill_id: (必要レベル, 重み)}
+        self._requirements: Dict[int, Dict[int, Tuple[int, float]]] = {}
+        self._role_ids: List[int] = []
+        self._gaps = np.zeros((matrix.shape[0], 0), dtype=np.float64)
+        self._dirty_rows: Set[int] = set()
+        self._dirty_roles: Set[int] = set()
+        # 全役割分の (列番号, しきい値ごとの重み) のキャッシュ（役割の変更で破棄）
+        self._stacked: Optional[Tuple[np.ndarray, List[Tuple[np.ndarray, np.ndarray]]]] = None
+
+    # ------------------------------------------------------------------
+    # 役割・ユーザーの変更
+    # ------------------------------------------------------------------
+    def set_role(self, role_id: int, requirements: Iterable[Tuple[int, int, float]]):
+        """役割の要件 (skill_id, 必要レベル, 重み) を登録・置き換え"""
+        self._requirements[role_id] = {
+            skill_id: (int(level), float(weight)) for skill_id, level, weight in requirements
+        }
+        if role_id not in self._role_ids:
+            self._role_ids.append(role_id)
+            self._gaps = np.hstack([self._gaps, np.zeros((self._gaps.shape[0], 1))])
+        self._dirty_roles.add(role_id)
+        self._stacked = None
+
+    def remove_role(self, role_id: int) -> bool:
+        """役割を削除"""
+        if role_id not in self._requirements:
+            return False
+        r = self._role_ids.index(role_id)
+        del self._requirements[role_id]
+        del self._role_ids[r]
+        self._gaps = np.delete(self._gaps, r, axis=1)
+        self._dirty_roles.discard(role_id)
+        self._stacked = None
+        return True
+
+    def invalidate_users(self, user_ids: Iterable[int]):
+        """レベルが変わったユーザーの行を再計算対象にする"""
+        for user_id in user_ids:
+            i = self.matrix.user_index(user_id)
+            if i is not None:
+                self._dirty_rows.add(i)
+
+    # ------------------------------------------------------------------
+    # 計算
+    # ------------------------------------------------------------------
+    def _weights(self, role_ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        対象役割の要件を行列にまとめる
+
+        Returns:
+            (列番号, 必要レベル (列数, 役割数), 重み (列数, 役割数))
+            行列に無いスキルの要件は常に未評価（レベル0）として扱う
+        """
+        cols = sorted({
+            j for role_id in role_ids for skill_id in self._requirements[role_id]
+            for j in [self.matrix.skill_index(skill_id)] if j is not None
+        })
+        position = {j: n for n, j in enumerate(cols)}
+        levels = np.zeros((len(cols), len(role_ids)), dtype=np.int64)
+        weights = np.zeros((len(cols), len(role_ids)), dtype=np.float64)
+        for r, role_id in enumerate(role_ids):
+            for skill_id, (level, weight) in self._requirements[role_id].items():
+                j = self.matrix.skill_index(skill_id)
+                if j is not None:
+                    levels[position[j], r] = level
+                    weights[position[j], r] = weight
+        return np.array(cols, dtype=np.int64), levels, weights
+
+    def _totals(self, role_ids: Sequence[int]) -> np.ndarray:
+        """役割ごとの最大不足 Σ 重み × 必要レベル（行列に無いスキルの要件も含む）"""
+        return np.array([
+            sum(level * weight for level, weight in self._requirements[role_id].values())
+            for role_id in role_ids
+        ], dtype=np.float64)
+
+    def _stack(self, role_ids: Sequence[int]) -> Tuple[np.ndarray, List[Tuple[np.ndarray, np.ndarray]]]:
+        """
+        しきい値 t = 1〜5 ごとの W_t = 重み × [必要レベル >= t]
+
+        Returns:
+            (列番号, [(W_t の行がある列の位置, W_t の該当行 (float32))])
+            必要レベルが t 未満の列は積に寄与しないため t ごとに除く
+        """
+        cols, levels, weights = self._weights(role_ids)
+        stacked = []
+        for t in range(1, MAX_REQUIRED_LEVEL + 1):
+            required = np.flatnonzero((levels >= t).any(axis=1))
+            stacked.append((
+                required,
+                np.where(levels[required] >= t, weights[required], 0.0).astype(np.float32)
+            ))
+        return cols, stacked
+
+    def _compute(self, rows: np.ndarray, role_ids: Sequence[int]) -> np.ndarray:
+        """指定した行 × 役割の不足の合計 (行数, 役割数)"""
+        gaps = np.tile(self._totals(role_ids), (len(rows), 1))
+        if role_ids is self._role_ids:
+            if self._stacked is None:
+                self._stacked = self._stack(role_ids)
+            cols, stacked = self._stacked
+        else:
+            cols, stacked = self._stack(role_ids)
+        if not len(cols) or not len(rows):
+            return gaps
+        for start in range(0, len(rows), self.block_size):
+            block = rows[start:start + self.block_size]
+            user_levels = self.matrix.to_dense(block, cols)
+            for t, (required, weights) in enumerate(stacked, start=1):
+                if len(required):
+                    # float32 でもレベルの指示関数と重みの積和の精度は十分
+                    indicators = (user_levels[:, required] >= t).astype(np.float32)
+                    gaps[start:start + len(block)] -= indicators @ weights
+        # float32 の丸め誤差で負にならないようにする
+        return np.maximum(gaps, 0.0)
+
+    def refresh(self):
+        """変更のあったユーザー・役割の分だけ計算し直す"""
+        if self._dirty_roles:
+            role_ids = [role_id for role_id in self._role_ids if role_id in self._dirty_roles]
+            positions = [self._role_ids.index(role_id) for role_id in role_ids]
+            self._gaps[:, positions] = self._compute(np.arange(self.matrix.shape[0]), role_ids)
+            self._dirty_roles.clear()
+        if self._dirty_rows:
+            rows = np.array(sorted(self._dirty_rows), dtype=np.int64)
+            if self._role_ids:
+                self._gaps[rows] = self._compute(rows, self._role_ids)
+            self._dirty_rows.clear()
+
+    def result(self) -> RoleFitResult:
+        """全ユーザー × 全役割の適合度を取得"""
+        self.refresh()
+        totals = self._totals(self._role_ids)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fit = np.where(totals > 0, 1.0 - self._gaps / np.maximum(totals, 1e-12), 1.0)
+        return RoleFitResult(
+            user_ids=self.matrix.user_ids.copy(),
+            role_ids=np.array(self._role_ids, dtype=np.int64),
+            gaps=self._gaps.copy(),
+            fit=fit
+        )
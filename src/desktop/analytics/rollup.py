@@ -0,0 +1,115 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+from src.desktop.analytics.skill_matrix import NO_GROUP, BaseSkillMatrix
+
+# レベルの段階数（0〜5）
+N_LEVELS = 6
+
+@dataclass
+class RollupResult:
+    """
+    グループ × カテゴリーの集計結果
+
+    配列の先頭2軸は (group_ids の順, category_ids の順)。
+    評価者がいないセルの平均・中央値・パーセンタイルは NaN。
+    """
+    group_ids: np.ndarray        # (G,) group_id（未所属は NO_GROUP）
+    category_ids: np.ndarray     # (C,) category_id
+    member_counts: np.ndarray    # (G,) グループの人数
+    skill_counts: np.ndarray     # (C,) カテゴリーのスキル数
+    histogram: np.ndarray        # (G, C, 6) レベルごとの評価件数
+    counts: np.ndarray           # (G, C) 評価件数
+    means: np.ndarray            # (G, C) 平均レベル
+    medians: np.ndarray          # (G, C) 中央値
+    at_least: np.ndarray         # (G, C, 6) レベル k 以上の評価件数
+    coverage: np.ndarray         # (G, C) 評価済みセルの割合（0.0〜1.0）
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        パーセンタイル (G, C) を度数分布から求める
+
+        np.percentile（線形補間）と同じ値になる。
+
+        Args:
+            q: 0〜100
+        """
+        return _histogram_percentile(self.histogram, q)
+
+    def group_index(self, group_id: Optional[int]) -> Optional[int]:
+        """group_id に対応する行番号（None は未所属。存在しない場合はNone）"""
+        positions = np.flatnonzero(self.group_ids == (NO_GROUP if group_id is None else group_id))
+        return int(positions[0]) if len(positions) else None
+
+    def category_index(self, category_id: int) -> Optional[int]:
+        """category_id に対応する列番号（存在しない場合はNone）"""
+        positions = np.flatnonzero(self.category_ids == category_id)
+        return int(positions[0]) if len(positions) else None
+
+    def cell(self, group_id: Optional[int], category_id: int) -> Optional[dict]:
+        """グループ × カテゴリーの1セル分の集計値"""
+        g = self.group_index(group_id)
+        c = self.category_index(category_id)
+        if g is None or c is None:
+            return None
+        return {
+            'count': int(self.counts[g, c]),
+            'mean': float(self.means[g, c]),
+            'median': float(self.medians[g, c]),
+            'at_least': self.at_least[g, c].tolist(),
+            'coverage': float(self.coverage[g, c]),
+        }
+
+def _histogram_percentile(histogram: np.ndarray, q: float) -> np.ndarray:
+    """整数レベルの度数分布からパーセンタイルを求める（線形補間）"""
+    counts = histogram.sum(axis=-1)
+    cumulative = np.cumsum(histogram, axis=-1)
+    position = (q / 100.0) * np.maximum(counts - 1, 0)
+    lower = np.floor(position)
+    fraction = position - lower
+    # 小さい方から k 番目（0始まり）の値 = 累積度数が k を超える最小のレベル
+    lower_value = (cumulative <= lower[..., None]).sum(axis=-1)
+    upper_value = (cumulative <= np.minimum(lower + 1, np.maximum(counts - 1, 0))[..., None]).sum(axis=-1)
+    result = lower_value + fraction * (upper_value - lower_value)
+    return np.where(counts > 0, result, np.nan)
+
+def compute_rollup(matrix: BaseSkillMatrix) -> RollupResult:
+    """
+    全てのグループ × カテゴリーの集計値を1回の走査で求める
+
+    評価済みセルごとに (グループ, カテゴリー, レベル) の番号を作り、
+    bincount でレベルの度数分布を一度に数える。平均・中央値・パーセンタイル・
+    レベル k 以上の件数・カバー率は全てこの度数分布から導出する。
+    """
+    group_ids, user_groups = np.unique(matrix.user_group_ids, return_inverse=True)
+    category_ids, skill_categories = np.unique(matrix.skill_category_ids, return_inverse=True)
+    n_groups = len(group_ids)
+    n_categories = len(category_ids)
+
+    rows, cols, levels = matrix.to_coo_indices()
+    cells = (user_groups[rows] * n_categories + skill_categories[cols]) * N_LEVELS + levels
+    histogram = np.bincount(cells, minlength=n_groups * n_categories * N_LEVELS)
+    histogram = histogram.reshape(n_groups, n_categories, N_LEVELS)
+
+    member_counts = np.bincount(user_groups, minlength=n_groups)
+    skill_counts = np.bincount(skill_categories, minlength=n_categories)
+    counts = histogram.sum(axis=-1)
+    sums = histogram @ np.arange(N_LEVELS)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        capacity = np.outer(member_counts, skill_counts)
+        coverage = np.where(capacity > 0, counts / np.maximum(capacity, 1), 0.0)
+    at_least = np.cumsum(histogram[..., ::-1], axis=-1)[..., ::-1]
+
+    return RollupResult(
+        group_ids=group_ids,
+        category_ids=category_ids,
+        member_counts=member_counts,
+        skill_counts=skill_counts,
+        histogram=histogram,
+        counts=counts,
+        means=means,
+        medians=_histogram_percentile(histogram, 50),
+        at_least=at_least,
+        coverage=coverage,
+    )
@@ -0,0 +1,138 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Set
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix
+
+# 類似度の種類
+COSINE = 'cosine'
+EUCLIDEAN = 'euclidean'
+
+@dataclass
+class SimilarUser:
+    """類似ユーザーと距離（コサインは 1 - 類似度、ユークリッドは距離）"""
+    user_id: int
+    distance: float
+
+class SimilaritySearch:
+    """
+    スキルプロファイルの近いユーザーの検索（k近傍）
+
+    各ユーザーのレベル（未評価は0）を1本のベクトルとみなし、
+    行のまとまりごとの行列積で全ユーザーとの内積を求める。
+    距離の計算に使う各行のノルムの2乗はキャッシュし、
+    レベルが変わったユーザーの分だけ計算し直す。
+    """
+
+    def __init__(self, matrix: BaseSkillMatrix, block_size: int = 4096):
+        """
+        Args:
+            matrix: 対象のスキルマトリクス（行・列の構成が変わった場合は作り直すこと）
+            block_size: 1回の行列積で扱う行数
+        """
+        self.matrix = matrix
+        self.block_size = block_size
+        self._squared_norms: Optional[np.ndarray] = None
+        # ノルムの再計算が必要な行
+        self._dirty_rows: Set[int] = set()
+
+    def _vectors(self, rows: np.ndarray, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """行のプロファイルベクトル (行数, 列数)（float32 でもレベルの積和は正確に表せる）"""
+        levels = self.matrix.to_dense(rows, cols)
+        return np.maximum(levels, 0).astype(np.float32)
+
+    def _row_blocks(self) -> Iterable[np.ndarray]:
+        n_users = self.matrix.shape[0]
+        for start in range(0, n_users, self.block_size):
+            yield np.arange(start, min(start + self.block_size, n_users))
+
+    def squared_norms(self) -> np.ndarray:
+        """各行のノルムの2乗（変更のあった行だけ計算し直す）"""
+        if self._squared_norms is None:
+            rows, _, levels = self.matrix.to_coo_indices()
+            levels = levels.astype(np.float64)
+            self._squared_norms = np.bincount(rows, weights=levels * levels, minlength=self.matrix.shape[0])
+            self._dirty_rows.clear()
+        elif self._dirty_rows:
+            rows = np.array(sorted(self._dirty_rows), dtype=np.int64)
+            vectors = self._vectors(rows)
+            self._squared_norms[rows] = np.einsum('ij,ij->i', vectors, vectors)
+            self._dirty_rows.clear()
+        return self._squared_norms
+
+    def invalidate_users(self, user_ids: Iterable[int]):
+        """レベルが変わったユーザーのノルムを再計算対象にする"""
+        for user_id in user_ids:
+            i = self.matrix.user_index(user_id)
+            if i is not None:
+                self._dirty_rows.add(i)
+
+    def nearest(self, user_id: int, k: int = 10, metric: str = COSINE,
+                rows: Optional[np.ndarray] = None) -> List[SimilarUser]:
+        """
+        ユーザーに近い k 人を取得（本人は除く）
+
+        Args:
+            user_id: 基準のユーザーID
+            k: 取得する人数
+            metric: 'cosine' または 'euclidean'
+            rows: 対象とする行番号（None の場合は全ユーザー）
+
+        Returns:
+            List[SimilarUser]: 距離の昇順。未知のユーザーの場合は空
+        """
+        return self.nearest_many([user_id], k, metric, rows)[0]
+
+    def nearest_many(self, user_ids: Sequence[int], k: int = 10, metric: str = COSINE,
+                     rows: Optional[np.ndarray] = None) -> List[List[SimilarUser]]:
+        """
+        複数ユーザーそれぞれに近い k 人をまとめて取得
+
+        基準ユーザーのベクトルを並べた行列との積で、全ユーザーとの内積を一度に求める。
+        内積は基準ユーザーが評価済みのスキルの列だけで決まるため、その列だけを取り出す。
+        コサインでは評価が1件もないユーザー（ノルム0）は候補から除く。
+        """
+        if metric not in (COSINE, EUCLIDEAN):
+            raise ValueError(f"Unknown metric: {metric}")
+        indices = [self.matrix.user_index(user_id) for user_id in user_ids]
+        known = [n for n, i in enumerate(indices) if i is not None]
+        results: List[List[SimilarUser]] = [[] for _ in user_ids]
+        if not known or k <= 0:
+            return results
+
+        query_rows = np.array([indices[n] for n in known], dtype=np.int64)
+        queries = self._vectors(query_rows)
+        cols = np.flatnonzero(queries.any(axis=0))
+        queries = queries[:, cols]
+        norms = self.squared_norms()
+        dots = np.zeros((len(query_rows), self.matrix.shape[0]), dtype=np.float64)
+        if len(cols):
+            for block in self._row_blocks():
+                dots[:, block] = queries @ self._vectors(block, cols).T
+
+        query_norms = norms[query_rows][:, None]
+        if metric == COSINE:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                distances = 1.0 - dots / np.sqrt(query_norms * norms[None, :])
+            distances[:, norms == 0] = np.inf
+        else:
+            distances = np.sqrt(np.maximum(query_norms + norms[None, :] - 2.0 * dots, 0.0))
+
+        excluded = np.zeros(self.matrix.shape[0], dtype=bool)
+        if rows is not None:
+            excluded[:] = True
+            excluded[np.asarray(rows, dtype=np.int64)] = False
+        distances[:, excluded] = np.inf
+        distances[np.arange(len(query_rows)), query_rows] = np.inf
+
+        user_ids_by_row = self.matrix.user_ids
+        for n, row_distances in zip(known, distances):
+            count = min(k, int(np.isfinite(row_distances).sum()))
+            if count == 0:
+                continue
+            best = np.argpartition(row_distances, count - 1)[:count]
+            best = best[np.argsort(row_distances[best], kind='stable')]
+            results[n] = [
+                SimilarUser(user_id=int(user_ids_by_row[i]), distance=float(row_distances[i]))
+                for i in best
+            ]
+        return results
@@ -0,0 +1,540 @@
+import logging
+import numpy as np
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 未評価セルの値
+UNSET = -1
+# グループ未所属ユーザーの group_id
+NO_GROUP = -1
+# 格納できるレベルの範囲
+MIN_LEVEL = 0
+MAX_LEVEL = 5
+
+@dataclass
+class MatrixSlice:
+    """スキルマトリクスの部分行列（levels は元の行列から独立したコピー）"""
+    user_ids: np.ndarray
+    skill_ids: np.ndarray
+    levels: np.ndarray
+
+def check_level(level: Optional[int]):
+    """レベルが範囲内であることを確認（None は未評価として許可）"""
+    if level is not None and not MIN_LEVEL <= level <= MAX_LEVEL:
+        raise ValueError(f"Level must be between {MIN_LEVEL} and {MAX_LEVEL}: {level}")
+
+def grow_array(array: np.ndarray, size: int) -> np.ndarray:
+    """1次元配列の容量を倍々で拡張"""
+    if size <= len(array):
+        return array
+    grown = np.empty(max(size, len(array) * 2), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+class BaseSkillMatrix(ABC):
+    """
+    スキルマトリクスの共通部分
+
+    ユーザーID・スキルIDと行・列番号の相互変換、行ごとの group_id・列ごとの
+    category_id を管理する。レベルの格納方法はサブクラスで実装する。
+    """
+
+    def __init__(
+        self,
+        user_ids: Sequence[int] = (),
+        skill_ids: Sequence[int] = (),
+        user_group_ids: Optional[Sequence[Optional[int]]] = None,
+        skill_category_ids: Optional[Sequence[int]] = None
+    ):
+        """
+        Args:
+            user_ids: 行の並び順のユーザーID
+            skill_ids: 列の並び順のスキルID
+            user_group_ids: 各ユーザーの group_id（None は未所属）
+            skill_category_ids: 各スキルの category_id
+        """
+        n_users = len(user_ids)
+        n_skills = len(skill_ids)
+        if user_group_ids is None:
+            user_group_ids = [None] * n_users
+        if skill_category_ids is None:
+            skill_category_ids = [NO_GROUP] * n_skills
+        if len(user_group_ids) != n_users or len(skill_category_ids) != n_skills:
+            raise ValueError("Attribute arrays must match the number of users and skills")
+
+        self._n_users = n_users
+        self._n_skills = n_skills
+        self._user_ids = np.array(user_ids, dtype=np.int64).reshape(-1)
+        self._skill_ids = np.array(skill_ids, dtype=np.int64).reshape(-1)
+        self._user_group_ids = np.array(
+            [NO_GROUP if group_id is None else group_id for group_id in user_group_ids],
+            dtype=np.int64
+        ).reshape(-1)
+        self._skill_category_ids = np.array(skill_category_ids, dtype=np.int64).reshape(-1)
+
+        self._user_index: Dict[int, int] = {int(uid): i for i, uid in enumerate(self._user_ids)}
+        self._skill_index: Dict[int, int] = {int(sid): j for j, sid in enumerate(self._skill_ids)}
+        if len(self._user_index) != n_users or len(self._skill_index) != n_skills:
+            raise ValueError("User and skill ids must be unique")
+
+        # 内容が変わるたびに増える（派生データのキャッシュ判定用）
+        self.version = 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        users: Sequence[Tuple[int, Optional[int]]],
+        skills: Sequence[Tuple[int, int]],
+        levels: Sequence[Tuple[int, int, int]],
+        **kwargs
+    ) -> 'BaseSkillMatrix':
+        """
+        データベースの行から行列を構築
+
+        Args:
+            users: (user_id, group_id) のリスト（この順序が行の順序になる）
+            skills: (skill_id, category_id) のリスト（この順序が列の順序になる）
+            levels: (user_id, skill_id, level) のリスト
+        """
+        matrix = cls(
+            [row[0] for row in users],
+            [row[0] for row in skills],
+            [row[1] for row in users],
+            [row[1] for row in skills],
+            **kwargs
+        )
+        if len(levels) and matrix._n_users and matrix._n_skills:
+            data = np.array(levels, dtype=np.int64).reshape(-1, 3)
+            out_of_range = (data[:, 2] < MIN_LEVEL) | (data[:, 2] > MAX_LEVEL)
+            if out_of_range.any():
+                check_level(int(data[out_of_range, 2][0]))
+            rows, row_found = cls._lookup(matrix.user_ids, data[:, 0])
+            cols, col_found = cls._lookup(matrix.skill_ids, data[:, 1])
+            found = row_found & col_found
+            if not found.all():
+                logger.warning(f"Ignored {int((~found).sum())} skill levels for unknown users or skills")
+            matrix._load(rows[found], cols[found], data[found, 2].astype(np.int8))
+        return matrix
+
+    @staticmethod
+    def _lookup(ids: np.ndarray, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ID配列内での各キーの位置を求める（見つからないキーは found=False）"""
+        max_id = int(ids.max())
+        if int(ids.min()) >= 0 and max_id <= 4 * len(ids) + 1024:
+            # IDが密な場合は ID → 位置 の表を引く
+            table = np.full(max_id + 2, -1, dtype=np.int64)
+            table[ids] = np.arange(len(ids))
+            indices = table[np.clip(keys, 0, max_id + 1)]
+            return np.maximum(indices, 0), (indices >= 0) & (keys >= 0)
+        sorter = np.argsort(ids, kind='stable')
+        positions = np.searchsorted(ids, keys, sorter=sorter)
+        positions = np.minimum(positions, len(ids) - 1)
+        indices = sorter[positions]
+        return indices, ids[indices] == keys
+
+    # ------------------------------------------------------------------
+    # 基本情報
+    # ------------------------------------------------------------------
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(ユーザー数, スキル数)"""
+        return self._n_users, self._n_skills
+
+    @property
+    def density(self) -> float:
+        """評価済みセルの割合"""
+        cells = self._n_users * self._n_skills
+        return self.nnz / cells if cells else 0.0
+
+    @property
+    def user_ids(self) -> np.ndarray:
+        """行の並び順のユーザーID"""
+        return self._user_ids[:self._n_users]
+
+    @property
+    def skill_ids(self) -> np.ndarray:
+        """列の並び順のスキルID"""
+        return self._skill_ids[:self._n_skills]
+
+    @property
+    def user_group_ids(self) -> np.ndarray:
+        """各行のユーザーの group_id（未所属は NO_GROUP）"""
+        return self._user_group_ids[:self._n_users]
+
+    @property
+    def skill_category_ids(self) -> np.ndarray:
+        """各列のスキルの category_id"""
+        return self._skill_category_ids[:self._n_skills]
+
+    def user_index(self, user_id: int) -> Optional[int]:
+        """ユーザーIDに対応する行番号（存在しない場合はNone）"""
+        return self._user_index.get(user_id)
+
+    def skill_index(self, skill_id: int) -> Optional[int]:
+        """スキルIDに対応する列番号（存在しない場合はNone）"""
+        return self._skill_index.get(skill_id)
+
+    # ------------------------------------------------------------------
+    # セルの参照・更新
+    # ------------------------------------------------------------------
+    def get_level(self, user_id: int, skill_id: int) -> Optional[int]:
+        """レベルを取得（未評価または未知のIDの場合はNone）"""
+        i = self._user_index.get(user_id)
+        j = self._skill_index.get(skill_id)
+        if i is None or j is None:
+            return None
+        level = self._get_cell(i, j)
+        return None if level == UNSET else level
+
+    def set_level(self, user_id: int, skill_id: int, level: Optional[int]) -> bool:
+        """
+        レベルを設定（None で未評価に戻す）
+
+        Returns:
+            bool: ユーザー・スキルが行列に存在し更新できた場合True
+
+        Raises:
+            ValueError: レベルが範囲外の場合
+        """
+        check_level(level)
+        i = self._user_index.get(user_id)
+        j = self._skill_index.get(skill_id)
+        if i is None or j is None:
+            return False
+        self._set_cell(i, j, UNSET if level is None else level)
+        self.version += 1
+        return True
+
+    def apply_changes(self, changes: Iterable[Tuple[int, int, Optional[int]]]) -> bool:
+        """
+        (user_id, skill_id, level) の変更をまとめて反映
+
+        Returns:
+            bool: 全ての変更が反映できた場合True（未知のIDを含む場合False）
+
+        Raises:
+            ValueError: 範囲外のレベルを含む場合（いずれの変更も反映しない）
+        """
+        changes = list(changes)
+        for _, _, level in changes:
+            check_level(level)
+        applied = True
+        for user_id, skill_id, level in changes:
+            applied = self.set_level(user_id, skill_id, level) and applied
+        return applied
+
+    # ------------------------------------------------------------------
+    # 行・列の追加・削除
+    # ------------------------------------------------------------------
+    def add_user(self, user_id: int, group_id: Optional[int] = None) -> int:
+        """ユーザー行を追加（既に存在する場合はその行番号を返す）"""
+        if user_id in self._user_index:
+            return self._user_index[user_id]
+        i = self._n_users
+        self._user_ids = grow_array(self._user_ids, i + 1)
+        self._user_group_ids = grow_array(self._user_group_ids, i + 1)
+        self._user_ids[i] = user_id
+        self._user_group_ids[i] = NO_GROUP if group_id is None else group_id
+        self._append_row()
+        self._user_index[user_id] = i
+        self._n_users += 1
+        self.version += 1
+        return i
+
+    def add_skill(self, skill_id: int, category_id: int) -> int:
+        """スキル列を追加（既に存在する場合はその列番号を返す）"""
+        if skill_id in self._skill_index:
+            return self._skill_index[skill_id]
+        j = self._n_skills
+        self._skill_ids = grow_array(self._skill_ids, j + 1)
+        self._skill_category_ids = grow_array(self._skill_category_ids, j + 1)
+        self._skill_ids[j] = skill_id
+        self._skill_category_ids[j] = category_id
+        self._append_column()
+        self._skill_index[skill_id] = j
+        self._n_skills += 1
+        self.version += 1
+        return j
+
+    def remove_user(self, user_id: int) -> bool:
+        """ユーザー行を削除（最後の行を空いた位置へ移動するため行の順序は変わる）"""
+        i = self._user_index.pop(user_id, None)
+        if i is None:
+            return False
+        last = self._n_users - 1
+        self._move_row(last, i)
+        if i != last:
+            self._user_ids[i] = self._user_ids[last]
+            self._user_group_ids[i] = self._user_group_ids[last]
+            self._user_index[int(self._user_ids[i])] = i
+        self._n_users -= 1
+        self.version += 1
+        return True
+
+    def remove_skill(self, skill_id: int) -> bool:
+        """スキル列を削除（最後の列を空いた位置へ移動するため列の順序は変わる）"""
+        j = self._skill_index.pop(skill_id, None)
+        if j is None:
+            return False
+        last = self._n_skills - 1
+        self._move_column(last, j)
+        if j != last:
+            self._skill_ids[j] = self._skill_ids[last]
+            self._skill_category_ids[j] = self._skill_category_ids[last]
+            self._skill_index[int(self._skill_ids[j])] = j
+        self._n_skills -= 1
+        self.version += 1
+        return True
+
+    def set_user_group(self, user_id: int, group_id: Optional[int]) -> bool:
+        """ユーザーの所属グループを変更"""
+        i = self._user_index.get(user_id)
+        if i is None:
+            return False
+        self._user_group_ids[i] = NO_GROUP if group_id is None else group_id
+        self.version += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # 切り出し
+    # ------------------------------------------------------------------
+    def user_indices(self, group_id: Optional[int] = None) -> np.ndarray:
+        """グループに属するユーザーの行番号（None の場合は全行）"""
+        if group_id is None:
+            return np.arange(self._n_users)
+        return np.flatnonzero(self.user_group_ids == group_id)
+
+    def skill_indices(self, category_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """カテゴリーに属するスキルの列番号（None の場合は全列）"""
+        if category_ids is None:
+            return np.arange(self._n_skills)
+        category_ids = np.fromiter(category_ids, dtype=np.int64)
+        return np.flatnonzero(np.isin(self.skill_category_ids, category_ids))
+
+    def slice(
+        self,
+        group_id: Optional[int] = None,
+        category_ids: Optional[Iterable[int]] = None
+    ) -> MatrixSlice:
+        """
+        グループ・カテゴリーで部分行列を切り出す
+
+        Args:
+            group_id: 対象グループ（None の場合は全ユーザー）
+            category_ids: 対象カテゴリー（None の場合は全スキル）
+        """
+        rows = self.user_indices(group_id)
+        cols = self.skill_indices(category_ids)
+        return MatrixSlice(
+            user_ids=self.user_ids[rows],
+            skill_ids=self.skill_ids[cols],
+            levels=self.to_dense(rows, cols)
+        )
+
+    # ------------------------------------------------------------------
+    # スキルごとの集計
+    # ------------------------------------------------------------------
+    def skill_means(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """スキルごとの平均レベル（評価者がいないスキルは NaN）"""
+        counts = self.skill_rated_counts(rows)
+        sums = self.skill_level_sums(rows)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+    # ------------------------------------------------------------------
+    # サブクラスで実装する格納方法
+    # ------------------------------------------------------------------
+    @property
+    @abstractmethod
+    def nnz(self) -> int:
+        """評価済みセル数"""
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """レベルの格納に確保しているメモリ（バイト）"""
+
+    @abstractmethod
+    def _load(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray):
+        """空の行列に (行, 列, レベル) を一括で格納"""
+
+    @abstractmethod
+    def _get_cell(self, i: int, j: int) -> int:
+        """行 i・列 j のレベル（未評価は UNSET）"""
+
+    @abstractmethod
+    def _set_cell(self, i: int, j: int, level: int):
+        """行 i・列 j にレベルを格納（UNSET で未評価に戻す）"""
+
+    @abstractmethod
+    def _append_row(self):
+        """末尾に空の行を追加（_n_users の更新前に呼ばれる）"""
+
+    @abstractmethod
+    def _append_column(self):
+        """末尾に空の列を追加（_n_skills の更新前に呼ばれる）"""
+
+    @abstractmethod
+    def _move_row(self, source: int, target: int):
+        """source 行の内容で target 行を置き換え、source 行を取り除く"""
+
+    @abstractmethod
+    def _move_column(self, source: int, target: int):
+        """source 列の内容で target 列を置き換え、source 列を取り除く"""
+
+    @abstractmethod
+    def to_dense(self, rows: Optional[np.ndarray] = None, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """指定した行・列の密行列（コピー）を取得（None の場合は全体）"""
+
+    def to_coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        評価済みセルを座標形式で取得
+
+        Returns:
+            Tuple: (user_ids, skill_ids, levels) の配列
+        """
+        rows, cols, levels = self.to_coo_indices()
+        return self.user_ids[rows], self.skill_ids[cols], levels
+
+    @abstractmethod
+    def to_coo_indices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        評価済みセルを行・列番号の座標形式で取得
+
+        Returns:
+            Tuple: (行番号, 列番号, levels) の配列
+        """
+
+    @abstractmethod
+    def user_levels(self, user_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """ユーザーの評価済みスキルIDとレベル"""
+
+    def skill_levels(self, skill_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """スキルを評価済みのユーザーIDとレベル"""
+        j = self._skill_index.get(skill_id)
+        if j is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+        rows, levels = self.column_entries(j)
+        return self.user_ids[rows], levels
+
+    @abstractmethod
+    def column_entries(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """列 j の評価済みセルの行番号とレベル"""
+
+    @abstractmethod
+    def skill_rated_counts(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """スキルごとの評価済み人数（rows を指定した場合はその行のみ）"""
+
+    @abstractmethod
+    def skill_level_sums(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """スキルごとのレベル合計（未評価は含めない）"""
+
+    @abstractmethod
+    def skill_counts_at_least(self, level: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """スキルごとのレベル level 以上の人数"""
+
+class SkillMatrix(BaseSkillMatrix):
+    """
+    ユーザー × スキルのレベルを保持する密行列
+
+    レベルは int8 の2次元配列に格納し、未評価セルは UNSET (-1) とする。
+    セル単位の参照・更新は O(1)。行・列は容量を倍々で確保するため、
+    ユーザー・スキルの追加は償却 O(1)。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._levels = np.full((max(self._n_users, 1), max(self._n_skills, 1)), UNSET, dtype=np.int8)
+
+    @property
+    def levels(self) -> np.ndarray:
+        """レベル行列（ユーザー × スキル）のビュー"""
+        return self._levels[:self._n_users, :self._n_skills]
+
+    @property
+    def nnz(self) -> int:
+        return int(np.count_nonzero(self.levels != UNSET))
+
+    @property
+    def nbytes(self) -> int:
+        return self._levels.nbytes
+
+    def _load(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray):
+        self._levels[rows, cols] = levels
+
+    def _get_cell(self, i: int, j: int) -> int:
+        return int(self._levels[i, j])
+
+    def _set_cell(self, i: int, j: int, level: int):
+        self._levels[i, j] = level
+
+    def _ensure_capacity(self, n_users: int, n_skills: int):
+        """必要に応じて配列の容量を倍々で拡張"""
+        rows, cols = self._levels.shape
+        if n_users <= rows and n_skills <= cols:
+            return
+        new_rows = max(rows, 1)
+        while new_rows < n_users:
+            new_rows *= 2
+        new_cols = max(cols, 1)
+        while new_cols < n_skills:
+            new_cols *= 2
+        levels = np.full((new_rows, new_cols), UNSET, dtype=np.int8)
+        levels[:self._n_users, :self._n_skills] = self.levels
+        self._levels = levels
+
+    def _append_row(self):
+        self._ensure_capacity(self._n_users + 1, self._n_skills)
+        self._levels[self._n_users, :] = UNSET
+
+    def _append_column(self):
+        self._ensure_capacity(self._n_users, self._n_skills + 1)
+        self._levels[:, self._n_skills] = UNSET
+
+    def _move_row(self, source: int, target: int):
+        if source != target:
+            self._levels[target, :] = self._levels[source, :]
+
+    def _move_column(self, source: int, target: int):
+        if source != target:
+            self._levels[:, target] = self._levels[:, source]
+
+    def to_dense(self, rows: Optional[np.ndarray] = None, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        rows = np.arange(self._n_users) if rows is None else rows
+        cols = np.arange(self._n_skills) if cols is None else cols
+        return self.levels[np.ix_(rows, cols)]
+
+    def to_coo_indices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows, cols = np.nonzero(self.levels != UNSET)
+        return rows, cols, self.levels[rows, cols]
+
+    def _rows_view(self, rows: Optional[np.ndarray]) -> np.ndarray:
+        """集計対象の行（None の場合は全行のビュー）"""
+        return self.levels if rows is None else self.levels[rows]
+
+    def skill_rated_counts(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.count_nonzero(self._rows_view(rows) != UNSET, axis=0)
+
+    def skill_level_sums(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        levels = self._rows_view(rows)
+        # 未評価セルは -1 として合計されるため、その件数を足し戻す
+        unset = len(levels) - self.skill_rated_counts(rows)
+        return levels.sum(axis=0, dtype=np.int64) + unset
+
+    def skill_counts_at_least(self, level: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.count_nonzero(self._rows_view(rows) >= level, axis=0)
+
+    def user_levels(self, user_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """ユーザーの評価済みスキルIDとレベル"""
+        i = self._user_index.get(user_id)
+        if i is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+        cols = np.flatnonzero(self.levels[i] != UNSET)
+        return self.skill_ids[cols], self.levels[i, cols]
+
+    def column_entries(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.flatnonzero(self.levels[:, j] != UNSET)
+        return rows, self.levels[rows, j]
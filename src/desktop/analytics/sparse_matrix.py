@@ -0,0 +1,213 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix, UNSET
+
+class SparseSkillMatrix(BaseSkillMatrix):
+    """
+    ユーザー × スキルのレベルを保持する疎行列（CSR形式）
+
+    評価済みセルだけを行ごとに列番号順で格納する（indptr / indices / data）。
+    セル単位の更新は差分（overlay）に蓄積し、一定件数を超えるか集計・変換の
+    直前にまとめて本体へ反映する。列方向の参照用のCSC形式は必要になった時点で作る。
+    """
+
+    def __init__(self, *args, compact_threshold: int = 4096, **kwargs):
+        """
+        Args:
+            compact_threshold: 差分をまとめて反映する件数の下限
+        """
+        super().__init__(*args, **kwargs)
+        self.compact_threshold = compact_threshold
+        self._indptr = np.zeros(self._n_users + 1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._data = np.empty(0, dtype=np.int8)
+        # (行, 列) → レベル（UNSET は削除）の未反映の変更
+        self._overlay: Dict[Tuple[int, int], int] = {}
+        self._row_of_entry: Optional[np.ndarray] = None
+        self._csc: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # 内部構造
+    # ------------------------------------------------------------------
+    def _build(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray, n_rows: int):
+        """(行, 列, レベル) からCSRを作り直す"""
+        keys = rows * max(self._n_skills, 1) + cols
+        if len(keys) > 1 and (np.diff(keys) < 0).any():
+            order = np.argsort(keys, kind='stable')
+            rows, cols, levels = rows[order], cols[order], levels[order]
+        self._indices = cols.astype(np.int32)
+        self._data = levels.astype(np.int8)
+        self._indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=self._indptr[1:])
+        self._row_of_entry = None
+        self._csc = None
+
+    def _entry_rows(self) -> np.ndarray:
+        """各格納要素の行番号"""
+        if self._row_of_entry is None:
+            self._row_of_entry = np.repeat(
+                np.arange(len(self._indptr) - 1, dtype=np.int64),
+                np.diff(self._indptr)
+            )
+        return self._row_of_entry
+
+    def _compact(self):
+        """未反映の変更を本体へまとめて反映"""
+        if not self._overlay:
+            return
+        rows = self._entry_rows()
+        cols = self._indices.astype(np.int64)
+        width = max(self._n_skills, 1)
+
+        changes = np.array(
+            [(i, j, level) for (i, j), level in self._overlay.items()],
+            dtype=np.int64
+        )
+        self._overlay = {}
+        keep = ~np.isin(rows * width + cols, changes[:, 0] * width + changes[:, 1])
+        added = changes[changes[:, 2] != UNSET]
+
+        self._build(
+            np.concatenate([rows[keep], added[:, 0]]),
+            np.concatenate([cols[keep], added[:, 1]]),
+            np.concatenate([self._data[keep], added[:, 2].astype(np.int8)]),
+            len(self._indptr) - 1
+        )
+
+    def _column_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """列方向の参照用にCSC形式（indptr, 行番号, レベル）を取得"""
+        self._compact()
+        if self._csc is None:
+            order = np.argsort(self._indices, kind='stable')
+            indptr = np.zeros(self._n_skills + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self._indices, minlength=self._n_skills), out=indptr[1:])
+            self._csc = (indptr, self._entry_rows()[order], self._data[order])
+        return self._csc
+
+    def _entry_mask(self, rows: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """指定行に属する格納要素のマスク（None の場合は全要素）"""
+        if rows is None:
+            return None
+        selected = np.zeros(self._n_users, dtype=bool)
+        selected[rows] = True
+        return selected[self._entry_rows()]
+
+    # ------------------------------------------------------------------
+    # BaseSkillMatrix の実装
+    # ------------------------------------------------------------------
+    @property
+    def nnz(self) -> int:
+        self._compact()
+        return len(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        size = self._indptr.nbytes + self._indices.nbytes + self._data.nbytes
+        if self._csc is not None:
+            size += sum(array.nbytes for array in self._csc)
+        return size
+
+    def _load(self, rows: np.ndarray, cols: np.ndarray, levels: np.ndarray):
+        self._build(rows, cols, levels, self._n_users)
+
+    def _get_cell(self, i: int, j: int) -> int:
+        level = self._overlay.get((i, j))
+        if level is not None:
+            return level
+        start, end = self._indptr[i], self._indptr[i + 1]
+        k = start + np.searchsorted(self._indices[start:end], j)
+        if k < end and self._indices[k] == j:
+            return int(self._data[k])
+        return UNSET
+
+    def _set_cell(self, i: int, j: int, level: int):
+        self._overlay[(i, j)] = level
+        if len(self._overlay) > max(self.compact_threshold, len(self._data) // 16):
+            self._compact()
+
+    def _append_row(self):
+        self._indptr = np.append(self._indptr, self._indptr[-1])
+        self._row_of_entry = None
+
+    def _append_column(self):
+        self._csc = None
+
+    def _move_row(self, source: int, target: int):
+        self._compact()
+        rows = self._entry_rows()
+        keep = rows != target
+        rows = np.where(rows[keep] == source, target, rows[keep])
+        self._build(rows, self._indices[keep].astype(np.int64), self._data[keep], self._n_users - 1)
+
+    def _move_column(self, source: int, target: int):
+        self._compact()
+        cols = self._indices.astype(np.int64)
+        keep = cols != target
+        cols = np.where(cols[keep] == source, target, cols[keep])
+        self._build(self._entry_rows()[keep], cols, self._data[keep], self._n_users)
+
+    def to_dense(self, rows: Optional[np.ndarray] = None, cols: Optional[np.ndarray] = None) -> np.ndarray:
+        """指定した行・列の密行列を取得（小さな部分行列向け）"""
+        self._compact()
+        rows = np.arange(self._n_users) if rows is None else np.asarray(rows, dtype=np.int64)
+        cols = np.arange(self._n_skills) if cols is None else np.asarray(cols, dtype=np.int64)
+        dense = np.full((len(rows), len(cols)), UNSET, dtype=np.int8)
+        if not len(rows) or not len(cols):
+            return dense
+
+        # 選択した行の要素位置を連結して一括で取り出す
+        starts = self._indptr[rows]
+        lengths = self._indptr[rows + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        entries = np.arange(lengths.sum()) - np.repeat(offsets - starts, lengths)
+        out_rows = np.repeat(np.arange(len(rows)), lengths)
+
+        column_position = np.full(self._n_skills, -1, dtype=np.int64)
+        column_position[cols] = np.arange(len(cols))
+        out_cols = column_position[self._indices[entries]]
+        found = out_cols >= 0
+        dense[out_rows[found], out_cols[found]] = self._data[entries[found]]
+        return dense
+
+    def to_coo_indices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        self._compact()
+        return self._entry_rows().copy(), self._indices.astype(np.int64), self._data.copy()
+
+    def skill_rated_counts(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        self._compact()
+        mask = self._entry_mask(rows)
+        indices = self._indices if mask is None else self._indices[mask]
+        return np.bincount(indices, minlength=self._n_skills)
+
+    def skill_level_sums(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        self._compact()
+        mask = self._entry_mask(rows)
+        indices = self._indices if mask is None else self._indices[mask]
+        data = self._data if mask is None else self._data[mask]
+        return np.bincount(indices, weights=data, minlength=self._n_skills).astype(np.int64)
+
+    def skill_counts_at_least(self, level: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        self._compact()
+        mask = self._data >= level
+        entry_mask = self._entry_mask(rows)
+        if entry_mask is not None:
+            mask &= entry_mask
+        return np.bincount(self._indices[mask], minlength=self._n_skills)
+
+    # ------------------------------------------------------------------
+    # 行・列単位の参照
+    # ------------------------------------------------------------------
+    def user_levels(self, user_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """ユーザーの評価済みスキルIDとレベル"""
+        i = self._user_index.get(user_id)
+        if i is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8)
+        self._compact()
+        start, end = self._indptr[i], self._indptr[i + 1]
+        return self.skill_ids[self._indices[start:end]], self._data[start:end].copy()
+
+    def column_entries(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """列 j の評価済みセルの行番号とレベル"""
+        indptr, rows, data = self._column_index()
+        start, end = indptr[j], indptr[j + 1]
+        return rows[start:end].copy(), data[start:end].copy()
@@ -0,0 +1,204 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from src.desktop.analytics.bitset_index import N_THRESHOLDS, SkillBitsetIndex
+from src.desktop.analytics.packed_matrix import WORD_BITS
+
+# 厳密解モードで探索するノード数の既定の上限
+DEFAULT_MAX_NODES = 50000
+
+@dataclass
+class RequirementCoverage:
+    """要件 (スキル, 最低レベル) ごとの充足状況"""
+    skill_id: int
+    min_level: int
+    # 要件を満たすチームメンバーのユーザーID
+    user_ids: List[int] = field(default_factory=list)
+    # 要件を満たす候補者の総数
+    candidate_count: int = 0
+
+    @property
+    def covered(self) -> bool:
+        return bool(self.user_ids)
+
+@dataclass
+class TeamCoverResult:
+    """
+    要件をすべて満たす最小のチーム
+
+    user_ids は選んだ順。誰も満たせない要件は uncovered に入り、
+    残りの要件だけを対象にチームを選ぶ。
+    optimal は厳密解モードで探索を打ち切らずに終えた場合に True。
+    """
+    user_ids: List[int] = field(default_factory=list)
+    coverage: List[RequirementCoverage] = field(default_factory=list)
+    uncovered: List[Tuple[int, int]] = field(default_factory=list)
+    optimal: bool = False
+    explored_nodes: int = 0
+
+class TeamCoverSolver:
+    """
+    スキル要件の集合をすべて満たす最小人数のチーム（集合被覆）
+
+    要件ごとの「最低レベル以上のユーザー」のビット列をビット列インデックスから取り出し、
+    ユーザーごとに「満たす要件」のビット列（要件方向に64ビット単位）へ転置する。
+    満たす要件が同じユーザーは1人にまとめる。
+
+    貪欲法では未充足の要件を最も多く満たすユーザーを popcount で一括評価して
+    1人ずつ選ぶ。厳密解モードでは他のユーザーに包含される候補を除いたうえで、
+    候補の少ない要件から分岐する分枝限定法で最小人数を求める
+    （下界は 選択済み人数 + ⌈未充足数 / 1人で満たせる最大数⌉、初期の上界は貪欲法の解）。
+    """
+
+    def __init__(self, index: SkillBitsetIndex):
+        """
+        Args:
+            index: 要件の判定に使うビット列インデックス
+        """
+        self.index = index
+
+    # ------------------------------------------------------------------
+    # 準備
+    # ------------------------------------------------------------------
+    def _user_masks(self, requirements: Sequence[Tuple[int, int]],
+                    candidates: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        ユーザーごとの満たす要件のビット列
+
+        Returns:
+            (要件 × ユーザーの真偽値, 重複を除いたビット列 (件数, ワード数), その代表の行番号)
+        """
+        n_users = self.index.n_users
+        bitsets = np.stack([self.index.skill_bitset(skill_id, level) for skill_id, level in requirements])
+        if candidates is not None:
+            bitsets = bitsets & candidates
+        meets = np.unpackbits(bitsets.view(np.uint8), axis=1, bitorder='little')[:, :n_users].astype(bool)
+
+        rows = np.flatnonzero(meets.any(axis=0))
+        n_words = max((len(requirements) + WORD_BITS - 1) // WORD_BITS, 1)
+        padded = np.zeros((len(rows), n_words * WORD_BITS), dtype=bool)
+        padded[:, :len(requirements)] = meets[:, rows].T
+        masks = np.packbits(padded, axis=1, bitorder='little').view(np.uint64)
+        # 満たす要件が同じユーザーは行番号の最も小さい1人で代表する
+        masks, first = np.unique(masks, axis=0, return_index=True)
+        return meets, masks, rows[first]
+
+    # ------------------------------------------------------------------
+    # 求解
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _greedy(masks: np.ndarray, target: np.ndarray) -> List[int]:
+        """未充足の要件を最も多く満たす候補を順に選ぶ（masks の位置のリスト）"""
+        uncovered = target.copy()
+        team: List[int] = []
+        while uncovered.any():
+            gains = np.bitwise_count(masks & uncovered).sum(axis=1)
+            best = int(np.argmax(gains))
+            if gains[best] == 0:
+                break
+            team.append(best)
+            uncovered &= ~masks[best]
+        return team
+
+    @staticmethod
+    def _branch_and_bound(masks: np.ndarray, target: np.ndarray, upper: List[int],
+                          max_nodes: int) -> Tuple[List[int], bool, int]:
+        """
+        最小人数の被覆を分枝限定法で探索
+
+        Args:
+            masks: 候補ごとの満たす要件のビット列 (件数, ワード数)
+            target: 満たすべき要件のビット列
+            upper: 既知の解（masks の位置のリスト）
+            max_nodes: 探索ノード数の上限
+
+        Returns:
+            (最良の解, 探索を打ち切らずに終えたか, 探索したノード数)
+        """
+        # 他の候補に包含される候補は、包含する側に置き換えても解が悪くならないため除く
+        order = np.argsort(-np.bitwise_count(masks).sum(axis=1), kind='stable')
+        kept: List[int] = []
+        for m in order:
+            if kept and ((masks[m] & ~masks[kept]) == 0).all(axis=1).any():
+                continue
+            kept.append(int(m))
+        kept_masks = masks[kept]
+        # 候補 × 要件の真偽値と、要件ごとの候補数
+        covers = np.unpackbits(kept_masks.view(np.uint8), axis=1, bitorder='little').astype(bool)
+        counts = covers.sum(axis=0)
+
+        best = list(upper)
+        nodes = 0
+        completed = True
+
+        def search(uncovered: np.ndarray, team: List[int]):
+            nonlocal best, nodes, completed
+            if nodes >= max_nodes:
+                completed = False
+                return
+            nodes += 1
+            if not uncovered.any():
+                if len(team) < len(best):
+                    best = [kept[c] for c in team]
+                return
+            gains = np.bitwise_count(kept_masks & uncovered).sum(axis=1)
+            remaining = int(np.bitwise_count(uncovered).sum())
+            if len(team) + -(-remaining // int(gains.max())) >= len(best):
+                return
+
+            # 満たせる候補の最も少ない要件で分岐する（いずれかの候補は必ずチームに入る）
+            open_requirements = np.flatnonzero(np.unpackbits(uncovered.view(np.uint8), bitorder='little'))
+            r = open_requirements[np.argmin(counts[open_requirements])]
+            branch_candidates = np.flatnonzero(covers[:, r])
+            for c in branch_candidates[np.argsort(-gains[branch_candidates], kind='stable')]:
+                team.append(int(c))
+                search(uncovered & ~kept_masks[c], team)
+                team.pop()
+                if not completed:
+                    return
+
+        search(target, [])
+        return best, completed, nodes
+
+    def solve(self, requirements: Sequence[Tuple[int, int]], candidates: Optional[np.ndarray] = None,
+              exact: bool = False, max_nodes: int = DEFAULT_MAX_NODES) -> TeamCoverResult:
+        """
+        要件をすべて満たす最小のチームを求める
+
+        Args:
+            requirements: (skill_id, 最低レベル) のリスト（同じ組の重複は1件にまとめる）
+            candidates: 候補者のビット列（None の場合は全ユーザー）
+            exact: True の場合は分枝限定法で最小人数を求める（小規模向け）
+            max_nodes: 厳密解モードの探索ノード数の上限（超えた場合はその時点の最良の解）
+        """
+        requirements = list(dict.fromkeys((int(skill_id), int(level)) for skill_id, level in requirements))
+        for skill_id, level in requirements:
+            if not 0 <= level < N_THRESHOLDS:
+                raise ValueError(f"Level must be between 0 and {N_THRESHOLDS - 1}: {level}")
+        result = TeamCoverResult(optimal=exact)
+        if not requirements:
+            return result
+
+        meets, masks, rows = self._user_masks(requirements, candidates)
+        coverable = np.bitwise_or.reduce(masks, axis=0) if len(masks) else np.zeros(masks.shape[1], np.uint64)
+        team = self._greedy(masks, coverable)
+
+        if exact and len(team) > 1:
+            team, result.optimal, result.explored_nodes = self._branch_and_bound(
+                masks, coverable, team, max_nodes
+            )
+
+        user_ids = self.index.row_user_ids
+        team_rows = rows[np.array(team, dtype=np.int64)]
+        result.user_ids = [int(user_ids[i]) for i in team_rows]
+        for r, (skill_id, level) in enumerate(requirements):
+            members = team_rows[meets[r, team_rows]]
+            result.coverage.append(RequirementCoverage(
+                skill_id=skill_id,
+                min_level=level,
+                user_ids=[int(user_ids[i]) for i in members],
+                candidate_count=int(meets[r].sum())
+            ))
+            if not len(members):
+                result.uncovered.append((skill_id, level))
+        return result
@@ -0,0 +1,234 @@
+import logging
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+from src.desktop.analytics.skill_matrix import BaseSkillMatrix, MatrixSlice
+from src.desktop.analytics.bitset_index import Query, SkillBitsetIndex
+from src.desktop.analytics.candidate_search import Candidate, CandidateSearch
+from src.desktop.analytics.similarity import COSINE, SimilarUser, SimilaritySearch
+from src.desktop.analytics.team_cover import DEFAULT_MAX_NODES, TeamCoverResult, TeamCoverSolver
+from src.desktop.analytics.factory import create_skill_matrix
+from src.desktop.analytics.rollup import RollupResult, compute_rollup
+from src.desktop.controllers.user_skill_controller import UserSkillController
+from src.desktop.utils.identity_map import watch_tables
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class _StaleMarker:
+    """テーブル変更の通知を受けてスキルマトリクスを再構築対象にする"""
+    
+    def __init__(self, controller: 'AnalyticsController'):
+        self.controller = controller
+        
+    def clear(self):
+        self.controller.invalidate()
+
+class AnalyticsController:
+    """
+    分析コントローラー
+    
+    スキルマトリクスをメモリ上に保持し、グリッド・チャート・エクスポートの共通の
+    データ源とする。レベルの変更はコミット後に通知を受けてセル単位で反映し、
+    ユーザー・スキル・グループの構成が変わった場合は次回参照時に再構築する。
+    """
+    
+    def __init__(self, user_skill_controller: UserSkillController):
+        self.user_skill_controller = user_skill_controller
+        self.current_time = TimeProvider.get_current_time()
+        
+        self._matrix: Optional[BaseSkillMatrix] = None
+        # (行列, version) が変わらない間は集計結果を再利用する
+        self._rollup: Optional[Tuple[BaseSkillMatrix, int, RollupResult]] = None
+        self._bitset_index: Optional[SkillBitsetIndex] = None
+        self._candidate_search: Optional[CandidateSearch] = None
+        self._similarity: Optional[SimilaritySearch] = None
+        self.user_skill_controller.add_level_listener(self._on_levels_changed)
+        self._stale_marker = _StaleMarker(self)
+        watch_tables(
+            user_skill_controller.user_skill_manager.db,
+            self._stale_marker,
+            ('users', 'skills', 'groups')
+        )
+        
+    def close(self):
+        """レベル変更の通知を解除"""
+        self.user_skill_controller.remove_level_listener(self._on_levels_changed)
+        
+    def invalidate(self):
+        """スキルマトリクスを破棄し、次回参照時に再構築する"""
+        self._matrix = None
+        self._bitset_index = None
+        self._candidate_search = None
+        self._similarity = None
+        
+    def _on_levels_changed(self, changes: List[Tuple[int, int, Optional[int]]]):
+        """レベル変更をスキルマトリクスへ反映"""
+        if self._matrix is None:
+            return
+        applied = self._matrix.apply_changes(changes)
+        if self._bitset_index is not None:
+            applied = self._bitset_index.apply_changes(changes) and applied
+        if self._candidate_search is not None:
+            self._candidate_search.invalidate_skills({skill_id for _, skill_id, _ in changes})
+        if self._similarity is not None:
+            self._similarity.invalidate_users({user_id for user_id, _, _ in changes})
+        if not applied:
+            # 行列に無いユーザー・スキルの変更は再構築で取り込む
+            self.invalidate()
+            
+    def get_matrix(self) -> BaseSkillMatrix:
+        """
+        スキルマトリクスを取得（未構築の場合はデータベースから読み込む）
+        
+        大規模な組織では評価済みセルの割合に応じて疎行列（CSR）または3ビット詰めの行列となる。
+        """
+        try:
+            if self._matrix is None:
+                users, skills, levels = self.user_skill_controller.user_skill_manager.get_matrix_rows()
+                self._matrix = create_skill_matrix(users, skills, levels)
+                logger.debug(
+                    f"{self.current_time} - Built skill matrix: "
+                    f"{len(users)} users x {len(skills)} skills, {len(levels)} levels "
+                    f"({type(self._matrix).__name__}, {self._matrix.nbytes} bytes)"
+                )
+            return self._matrix
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to build skill matrix: {str(e)}")
+            raise
+            
+    def get_slice(self, group_id: Optional[int] = None,
+                  category_ids: Optional[Iterable[int]] = None) -> MatrixSlice:
+        """グループ・カテゴリーで切り出した部分行列を取得"""
+        try:
+            return self.get_matrix().slice(group_id, category_ids)
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to slice skill matrix: {str(e)}")
+            raise
+            
+    def get_rollup(self) -> RollupResult:
+        """グループ × カテゴリーの集計（平均・中央値・パーセンタイル・カバー率）を取得"""
+        try:
+            matrix = self.get_matrix()
+            if self._rollup is None or self._rollup[0] is not matrix or self._rollup[1] != matrix.version:
+                self._rollup = (matrix, matrix.version, compute_rollup(matrix))
+            return self._rollup[2]
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to compute rollup: {str(e)}")
+            raise
+            
+    def get_bitset_index(self) -> SkillBitsetIndex:
+        """スキル × レベルのしきい値ごとのビット列インデックスを取得（未構築の場合は行列から作る）"""
+        try:
+            if self._bitset_index is None:
+                self._bitset_index = SkillBitsetIndex(self.get_matrix())
+                logger.debug(
+                    f"{self.current_time} - Built skill bitset index: "
+                    f"{self._bitset_index.n_users} users ({self._bitset_index.nbytes} bytes)"
+                )
+            return self._bitset_index
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to build skill bitset index: {str(e)}")
+            raise
+            
+    def query_users(self, query: Query) -> List[int]:
+        """
+        条件を満たすユーザーIDを取得
+        
+        例: Has(python_id, 3) & Has(sql_id, 2) & ~InGroup(group_id)
+        """
+        try:
+            user_ids = self.get_bitset_index().user_ids(query).tolist()
+            logger.debug(f"{self.current_time} - Query {query!r} matched {len(user_ids)} users")
+            return user_ids
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to query users: {str(e)}")
+            raise
+            
+    def count_users(self, query: Query) -> int:
+        """条件を満たすユーザー数を取得"""
+        try:
+            return self.get_bitset_index().count(query)
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to count users: {str(e)}")
+            raise
+            
+    def find_candidates(self, requirements: Mapping[int, float], k: int = 10,
+                        group_id: Optional[int] = None) -> List[Candidate]:
+        """
+        重み付きスキル要件に対するスコアの上位 k 人を取得
+        
+        Args:
+            requirements: スキルID → 重み（正の値）
+            k: 取得する人数
+            group_id: 対象グループ（None の場合は全ユーザー）
+        """
+        try:
+            matrix = self.get_matrix()
+            if self._candidate_search is None:
+                self._candidate_search = CandidateSearch(matrix)
+            rows = None if group_id is None else matrix.user_indices(group_id)
+            candidates = self._candidate_search.top_k(requirements, k, rows)
+            logger.debug(
+                f"{self.current_time} - Found {len(candidates)} candidates for {len(requirements)} skills "
+                f"(scored {self._candidate_search.last_scored_count} of {matrix.shape[0]} users)"
+            )
+            return candidates
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find candidates: {str(e)}")
+            raise
+            
+    def find_similar_users(self, user_id: int, k: int = 10, metric: str = COSINE,
+                           group_id: Optional[int] = None) -> List[SimilarUser]:
+        """
+        スキルプロファイルの近いユーザーを取得（本人は除く）
+        
+        Args:
+            user_id: 基準のユーザーID
+            k: 取得する人数
+            metric: 'cosine' または 'euclidean'
+            group_id: 対象グループ（None の場合は全ユーザー）
+        """
+        try:
+            matrix = self.get_matrix()
+            if self._similarity is None:
+                self._similarity = SimilaritySearch(matrix)
+            rows = None if group_id is None else matrix.user_indices(group_id)
+            similar_users = self._similarity.nearest(user_id, k, metric, rows)
+            logger.debug(f"{self.current_time} - Found {len(similar_users)} users similar to {user_id} ({metric})")
+            return similar_users
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find similar users: {str(e)}")
+            raise
+            
+    def find_team_cover(self, requirements: Sequence[Tuple[int, int]], group_id: Optional[int] = None,
+                        exact: bool = False, max_nodes: int = DEFAULT_MAX_NODES) -> TeamCoverResult:
+        """
+        スキル要件をすべて満たす最小人数のチームを取得
+        
+        Args:
+            requirements: (skill_id, 最低レベル) のリスト
+            group_id: 対象グループ（None の場合は全ユーザー）
+            exact: True の場合は分枝限定法で最小人数を求める（小規模向け、既定は貪欲法）
+            max_nodes: 厳密解モードの探索ノード数の上限
+        """
+        try:
+            index = self.get_bitset_index()
+            candidates = None if group_id is None else index.group_bitset(group_id)
+            result = TeamCoverSolver(index).solve(requirements, candidates, exact, max_nodes)
+            logger.debug(
+                f"{self.current_time} - Found team of {len(result.user_ids)} users for "
+                f"{len(result.coverage)} requirements ({len(result.uncovered)} uncovered, "
+                f"{'optimal' if result.optimal else 'greedy'})"
+            )
+            return result
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find team cover: {str(e)}")
+            raise
@@ -0,0 +1,35 @@
+from typing import Callable
+from src.desktop.utils.identity_map import CacheStatistics, IdentityMap
+
+class CachedController:
+    """
+    読み込み結果のキャッシュを持つコントローラーの共通部分
+    
+    サブクラスは self.db（transaction / in_transaction / after_commit を持つデータベース）と
+    self.cache（IdentityMap）を設定する。
+    """
+    
+    db = None
+    cache: IdentityMap = None
+    
+    def transaction(self):
+        """複数の操作を1つのトランザクションにまとめる（with文で使用し、ブロック内の操作はまとめてコミット）"""
+        return self.db.transaction()
+        
+    def _cached(self, key, loader):
+        """キャッシュ経由で読み込む（トランザクション中の未確定の値は格納しない）"""
+        return self.cache.get_or_load(key, loader, store=not self.db.in_transaction())
+        
+    def get_cache_statistics(self) -> CacheStatistics:
+        """キャッシュの統計情報を取得"""
+        return self.cache.get_statistics()
+        
+    def _invalidate(self, invalidate: Callable[[], None]):
+        """
+        キャッシュを無効化し、コミット後にもう一度無効化する
+        
+        無効化からコミットまでの間に他のスレッドが確定済みの古い行を読み込んで
+        格納した値を、コミット後の無効化で取り除く。
+        """
+        invalidate()
+        self.db.after_commit(invalidate)
@@ -3,23 +3,29 @@ from typing import List, Optional
 from ..models.category import Category, CategoryManager
 import logging
 from ..utils.time_utils import TimeProvider
+from ..utils.identity_map import IdentityMap
+from .cached_controller import CachedController
 
 logger = logging.getLogger(__name__)
 
-class CategoryController:
+class CategoryController(CachedController):
     """カテゴリーコントローラー"""
     
-    def __init__(self, category_manager: CategoryManager):
+    def __init__(self, category_manager: CategoryManager, cache_max_bytes: int = 1024 * 1024):
         self.current_time = TimeProvider.get_current_time()
         self.current_user = TimeProvider.get_current_user()
         
         self.category_manager = category_manager
+        self.db = category_manager.db
+        # 読み込み結果のキャッシュ（キー: ('category', id) / ('all',)）
+        self.cache = IdentityMap(cache_max_bytes)
         logger.debug(f"{self.current_time} - CategoryController initialized")
 
     def create_category(self, name: str, description: str = None, parent_id: Optional[int] = None) -> int:
         """カテゴリーを作成"""
         try:
             category_id = self.category_manager.create_category(name, description, parent_id)
+            self._invalidate(lambda: self.cache.invalidate(('all',)))
             logger.debug(f"{self.current_time} - Created category: {name} (ID: {category_id})")
             return category_id
         except Exception as e:
@@ -29,7 +35,10 @@ class CategoryController:
     def get_category(self, category_id: int) -> Category:
         """カテゴリーを取得"""
         try:
-            category = self.category_manager.get_category(category_id)
+            category = self._cached(
+                ('category', category_id),
+                lambda: self.category_manager.get_category(category_id)
+            )
             if category is None:
                 raise ValueError(f"Category with ID {category_id} not found")
             return category
@@ -40,15 +49,68 @@ class CategoryController:
     def get_all_categories(self) -> List[Category]:
         """全てのカテゴリーを取得"""
         try:
-            return self.category_manager.get_all_categories()
+            return list(self._cached(('all',), self.category_manager.get_all_categories))
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to get all categories: {str(e)}")
             raise
 
+    def find_categories_by_name(self, name: str) -> List[Category]:
+        """表記の違い（全角・半角、ひらがな・カタカナ、大文字・小文字）を無視して名前でカテゴリーを検索"""
+        try:
+            return self.category_manager.find_categories_by_name(name)
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find categories by name: {str(e)}")
+            raise
+
+    def get_subtree(self, category_id: int, include_self: bool = True) -> List[Category]:
+        """カテゴリー配下の全カテゴリーを取得"""
+        try:
+            return self.category_manager.get_subtree(category_id, include_self)
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category subtree: {str(e)}")
+            raise
+
+    def get_subtree_ids(self, category_id: int) -> List[int]:
+        """カテゴリー自身と配下の全カテゴリーのIDを取得"""
+        try:
+            return self.category_manager.get_subtree_ids(category_id)
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category subtree ids: {str(e)}")
+            raise
+
+    def get_ancestors(self, category_id: int) -> List[Category]:
+        """カテゴリーの祖先をルートから順に取得"""
+        try:
+            return self.category_manager.get_ancestors(category_id)
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category ancestors: {str(e)}")
+            raise
+
+    def get_path(self, category_id: int, separator: str = " / ") -> str:
+        """ルートからカテゴリーまでのパス文字列を取得"""
+        try:
+            return self.category_manager.get_path(category_id, separator)
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category path: {str(e)}")
+            raise
+
+    def move_category(self, category_id: int, new_parent_id: Optional[int]) -> bool:
+        """カテゴリーを別の親の下へ移動"""
+        try:
+            success = self.category_manager.move_category(category_id, new_parent_id)
+            self._invalidate(lambda: self.cache.invalidate(('category', category_id), ('all',)))
+            if success:
+                logger.debug(f"{self.current_time} - Moved category {category_id} under {new_parent_id}")
+            return success
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to move category: {str(e)}")
+            raise
+
     def update_category(self, category_id: int, name: str, description: str = None) -> bool:
         """カテゴリーを更新"""
         try:
             success = self.category_manager.update_category(category_id, name, description)
+            self._invalidate(lambda: self.cache.invalidate(('category', category_id), ('all',)))
             if success:
                 logger.debug(f"{self.current_time} - Updated category: {name} (ID: {category_id})")
             return success
@@ -56,13 +118,16 @@ class CategoryController:
             logger.error(f"{self.current_time} - Failed to update category: {str(e)}")
             raise
 
-    def delete_category(self, category_id: int) -> bool:
-        """カテゴリーを削除"""
+    def delete_category(self, category_id: int) -> int:
+        """カテゴリーを配下のサブカテゴリーごと削除し、削除件数を返す"""
         try:
-            success = self.category_manager.delete_category(category_id)
-            if success:
-                logger.debug(f"{self.current_time} - Deleted category ID: {category_id}")
-            return success
+            deleted_count = self.category_manager.delete_category(category_id)
+            if deleted_count:
+                # 配下のサブカテゴリーも削除されるため全体を無効化
+                self._invalidate(self.cache.clear)
+            if deleted_count:
+                logger.debug(f"{self.current_time} - Deleted category ID: {category_id} ({deleted_count} categories)")
+            return deleted_count
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to delete category: {str(e)}")
             raise
\ No newline at end of file
@@ -1,22 +1,41 @@
 import logging
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 from src.desktop.models.group import Group
 from src.desktop.managers.group_manager import GroupManager
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.controllers.cached_controller import CachedController
+from src.desktop.utils.identity_map import IdentityMap, watch_tables, notify_tables_changed
 
 logger = logging.getLogger(__name__)
 
-class GroupController:
+class GroupController(CachedController):
     """グループコントローラー"""
     
-    def __init__(self, group_manager: GroupManager):
+    def __init__(self, group_manager: GroupManager, cache_max_bytes: int = 1024 * 1024):
         self.group_manager = group_manager
+        self.db = group_manager.db
         self.current_time = TimeProvider.get_current_time()
         
+        # 読み込み結果のキャッシュ（キー: ('group', id) / ('all',)）
+        self.cache = IdentityMap(cache_max_bytes)
+        watch_tables(group_manager.db, self.cache, ('groups',))
+        # 所属人数はユーザーの追加・異動でも変わるため別キャッシュで管理
+        self.member_count_cache = IdentityMap(cache_max_bytes)
+        watch_tables(group_manager.db, self.member_count_cache, ('groups', 'users'))
+        
+    def _invalidate_groups(self, *keys):
+        """指定したキー・グループ一覧・所属人数のキャッシュを無効化（コミット後にも繰り返す）"""
+        def invalidate():
+            self.cache.invalidate(('all',), *keys)
+            self.member_count_cache.clear()
+            
+        self._invalidate(invalidate)
+        
     def create_group(self, name: str) -> Group:
         """グループを作成"""
         try:
             group = self.group_manager.create_group(name)
+            self._invalidate_groups()
             logger.debug(f"{self.current_time} - Created group: {name}")
             return group
             
@@ -24,10 +43,22 @@ class GroupController:
             logger.error(f"{self.current_time} - Failed to create group: {str(e)}")
             raise
             
+    def create_groups_bulk(self, names: Iterable[str], upsert: bool = False) -> List[int]:
+        """グループを一括作成"""
+        try:
+            group_ids = self.group_manager.create_groups_bulk(names, upsert=upsert)
+            self._invalidate_groups(*[('group', group_id) for group_id in group_ids])
+            logger.debug(f"{self.current_time} - Created {len(group_ids)} groups in bulk")
+            return group_ids
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create groups in bulk: {str(e)}")
+            raise
+            
     def get_group(self, group_id: int) -> Group:
         """グループを取得"""
         try:
-            group = self.group_manager.get_group(group_id)
+            group = self._cached(('group', group_id), lambda: self.group_manager.get_group(group_id))
             logger.debug(f"{self.current_time} - Retrieved group: {group.name}")
             return group
             
@@ -35,10 +66,21 @@ class GroupController:
             logger.error(f"{self.current_time} - Failed to get group: {str(e)}")
             raise
             
+    def find_group_by_name(self, name: str) -> Optional[Group]:
+        """表記の違い（全角・半角、ひらがな・カタカナ、大文字・小文字）を無視して名前でグループを取得"""
+        try:
+            group = self.group_manager.find_group_by_name(name)
+            logger.debug(f"{self.current_time} - Found group by name {name!r}: {group.id if group else None}")
+            return group
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find group by name: {str(e)}")
+            raise
+            
     def get_all_groups(self) -> List[Group]:
         """全グループを取得"""
         try:
-            groups = self.group_manager.get_all_groups()
+            groups = list(self._cached(('all',), self.group_manager.get_all_groups))
             logger.debug(f"{self.current_time} - Retrieved {len(groups)} groups")
             return groups
             
@@ -46,10 +88,26 @@ class GroupController:
             logger.error(f"{self.current_time} - Failed to get all groups: {str(e)}")
             raise
             
+    def get_groups_with_member_counts(self) -> List[Tuple[Group, int]]:
+        """全グループと所属人数を取得"""
+        try:
+            groups = list(self.member_count_cache.get_or_load(
+                ('all',),
+                self.group_manager.get_groups_with_member_counts,
+                store=not self.db.in_transaction()
+            ))
+            logger.debug(f"{self.current_time} - Retrieved {len(groups)} groups with member counts")
+            return groups
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get groups with member counts: {str(e)}")
+            raise
+            
     def update_group(self, group_id: int, name: str) -> Group:
         """グループ情報を更新"""
         try:
             group = self.group_manager.update_group(group_id, name)
+            self._invalidate_groups(('group', group_id))
             logger.debug(f"{self.current_time} - Updated group: {group.name}")
             return group
             
@@ -61,6 +119,9 @@ class GroupController:
         """グループを削除"""
         try:
             success = self.group_manager.delete_group(group_id)
+            self._invalidate_groups(('group', group_id))
+            # 所属ユーザーの group_id は外部キー制約により NULL に更新される
+            self._invalidate(lambda: notify_tables_changed(self.db, 'groups', 'users', source=self.cache))
             logger.debug(f"{self.current_time} - Deleted group: {group_id}")
             return success
             
@@ -0,0 +1,257 @@
+import logging
+import numpy as np
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from src.desktop.models.role_profile import RoleProfile, RoleRequirement
+from src.desktop.managers.role_manager import RoleManager
+from src.desktop.analytics.role_fit import RoleFitEngine, RoleFitResult
+from src.desktop.analytics.assignment import AssignmentResult, Position, assign_positions
+from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.controllers.cached_controller import CachedController
+from src.desktop.utils.identity_map import IdentityMap, watch_tables, notify_tables_changed
+
+logger = logging.getLogger(__name__)
+
+class RoleController(CachedController):
+    """
+    役割プロファイルコントローラー
+    
+    役割の要件管理に加え、全ユーザー × 全役割の適合度を分析コントローラーの
+    スキルマトリクスから計算する。レベルが変わったユーザー・要件が変わった役割の
+    分だけコミット後に再計算対象とする。
+    """
+    
+    def __init__(self, role_manager: RoleManager, analytics_controller=None,
+                 cache_max_bytes: int = 1024 * 1024):
+        """
+        Args:
+            role_manager: 役割プロファイル管理クラス
+            analytics_controller: 適合度の計算に使う分析コントローラー（省略時は適合度を計算できない）
+            cache_max_bytes: 読み込み結果のキャッシュの上限
+        """
+        self.role_manager = role_manager
+        self.db = role_manager.db
+        self.analytics_controller = analytics_controller
+        self.current_time = TimeProvider.get_current_time()
+        
+        # 読み込み結果のキャッシュ（キー: ('role', id) / ('all',)）
+        # スキルの削除で要件も連鎖削除されるため skills の変更でも無効化する
+        self.cache = IdentityMap(cache_max_bytes)
+        watch_tables(role_manager.db, self.cache, ('role_profiles', 'role_requirements', 'skills'))
+        
+        self._fit_engine: Optional[RoleFitEngine] = None
+        self._fit_result: Optional[RoleFitResult] = None
+        self._dirty_roles: Set[int] = set()
+        if analytics_controller is not None:
+            analytics_controller.user_skill_controller.add_level_listener(self._on_levels_changed)
+            
+    def close(self):
+        """レベル変更の通知を解除"""
+        if self.analytics_controller is not None:
+            self.analytics_controller.user_skill_controller.remove_level_listener(self._on_levels_changed)
+            
+    def _invalidate_role(self, role_id: int, *tables: str):
+        """役割と一覧のキャッシュを無効化し、テーブルの変更を通知（コミット後にも繰り返す）"""
+        def invalidate():
+            self.cache.invalidate(('role', role_id), ('all',))
+            notify_tables_changed(self.db, *tables, source=self.cache)
+            
+        self._invalidate(invalidate)
+        
+    def _role_changed(self, role_id: int):
+        """役割の変更をキャッシュと適合度に反映（適合度の再計算はコミット後に対象とする）"""
+        self._invalidate_role(role_id, 'role_profiles', 'role_requirements')
+        
+        def mark_dirty():
+            self._dirty_roles.add(role_id)
+            self._fit_result = None
+            
+        self.role_manager.db.after_commit(mark_dirty)
+        
+    def _on_levels_changed(self, changes: List[Tuple[int, int, Optional[int]]]):
+        """レベルが変わったユーザーの適合度を再計算対象にする"""
+        if self._fit_engine is not None:
+            self._fit_engine.invalidate_users({user_id for user_id, _, _ in changes})
+            self._fit_result = None
+            
+    def create_role(self, name: str, description: str = None, requirements: Iterable = ()) -> RoleProfile:
+        """役割プロファイルを作成"""
+        try:
+            role = self.role_manager.create_role(name, description, requirements)
+            self._role_changed(role.id)
+            logger.debug(f"{self.current_time} - Created role: {name}")
+            return role
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create role: {str(e)}")
+            raise
+            
+    def get_role(self, role_id: int) -> RoleProfile:
+        """役割プロファイルを取得"""
+        try:
+            role = self._cached(('role', role_id), lambda: self.role_manager.get_role(role_id))
+            logger.debug(f"{self.current_time} - Retrieved role: {role_id}")
+            return role
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get role: {str(e)}")
+            raise
+            
+    def get_all_roles(self) -> List[RoleProfile]:
+        """全役割プロファイルを取得"""
+        try:
+            roles = list(self._cached(('all',), self.role_manager.get_all_roles))
+            logger.debug(f"{self.current_time} - Retrieved {len(roles)} roles")
+            return roles
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get all roles: {str(e)}")
+            raise
+            
+    def update_role(self, role_id: int, name: str = None, description: str = None) -> RoleProfile:
+        """役割プロファイルの名前・説明を更新"""
+        try:
+            role = self.role_manager.update_role(role_id, name, description)
+            self._invalidate_role(role_id, 'role_profiles')
+            logger.debug(f"{self.current_time} - Updated role: {role_id}")
+            return role
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to update role: {str(e)}")
+            raise
+            
+    def set_requirements(self, role_id: int, requirements: Iterable) -> List[RoleRequirement]:
+        """役割のスキル要件をまとめて置き換える"""
+        try:
+            result = self.role_manager.set_requirements(role_id, requirements)
+            self._role_changed(role_id)
+            logger.debug(f"{self.current_time} - Set {len(result)} requirements for role {role_id}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set role requirements: {str(e)}")
+            raise
+            
+    def set_requirement(self, role_id: int, skill_id: int, required_level: int,
+                        weight: float = 1.0) -> RoleRequirement:
+        """役割のスキル要件を1件登録・更新"""
+        try:
+            requirement = self.role_manager.set_requirement(role_id, skill_id, required_level, weight)
+            self._role_changed(role_id)
+            logger.debug(f"{self.current_time} - Set requirement: role {role_id}, skill {skill_id} -> {required_level}")
+            return requirement
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set role requirement: {str(e)}")
+            raise
+            
+    def remove_requirement(self, role_id: int, skill_id: int) -> bool:
+        """役割のスキル要件を1件削除"""
+        try:
+            success = self.role_manager.remove_requirement(role_id, skill_id)
+            self._role_changed(role_id)
+            logger.debug(f"{self.current_time} - Removed requirement: role {role_id}, skill {skill_id}")
+            return success
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to remove role requirement: {str(e)}")
+            raise
+            
+    def delete_role(self, role_id: int) -> bool:
+        """役割プロファイルを削除"""
+        try:
+            success = self.role_manager.delete_role(role_id)
+            self._role_changed(role_id)
+            logger.debug(f"{self.current_time} - Deleted role: {role_id}")
+            return success
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to delete role: {str(e)}")
+            raise
+            
+    def get_role_fit(self) -> RoleFitResult:
+        """
+        全ユーザー × 全役割の適合度を取得
+        
+        スキルマトリクスが再構築された場合は全体を、それ以外は変更のあった
+        ユーザー・役割の分だけを計算し直す。
+        """
+        try:
+            if self.analytics_controller is None:
+                raise ValueError("Role fit requires an analytics controller")
+            matrix = self.analytics_controller.get_matrix()
+            
+            if self._fit_engine is None or self._fit_engine.matrix is not matrix:
+                self._fit_engine = RoleFitEngine(matrix)
+                self._dirty_roles.clear()
+                for role in self.role_manager.get_all_roles():
+                    self._fit_engine.set_role(
+                        role.id,
+                        [(r.skill_id, r.required_level, r.weight) for r in role.requirements]
+                    )
+                self._fit_result = None
+            elif self._dirty_roles:
+                for role_id in list(self._dirty_roles):
+                    role = self.role_manager.get_role(role_id)
+                    if role is None:
+                        self._fit_engine.remove_role(role_id)
+                    else:
+                        self._fit_engine.set_role(
+                            role_id,
+                            [(r.skill_id, r.required_level, r.weight) for r in role.requirements]
+                        )
+                self._dirty_roles.clear()
+                self._fit_result = None
+                
+            if self._fit_result is None:
+                self._fit_result = self._fit_engine.result()
+                logger.debug(
+                    f"{self.current_time} - Computed role fit: "
+                    f"{len(self._fit_result.user_ids)} users x {len(self._fit_result.role_ids)} roles"
+                )
+            return self._fit_result
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get role fit: {str(e)}")
+            raise
+            
+    def get_best_users_for_role(self, role_id: int, k: int = 10) -> List[Tuple[int, float]]:
+        """役割への適合度が高い k 人の (user_id, 適合度) を取得"""
+        try:
+            return self.get_role_fit().top_users(role_id, k)
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get best users for role: {str(e)}")
+            raise
+            
+    def assign_positions(self, positions: Sequence[Position], candidate_user_ids: Iterable[int] = None,
+                         min_fit: float = 0.0) -> AssignmentResult:
+        """
+        適合度の合計が最大になるようにポジションへユーザーを割り当てる
+        
+        Args:
+            positions: 募集ポジション（group_id を指定したポジションはそのグループのユーザーに限る）
+            candidate_user_ids: 候補者のユーザーID（None の場合は全ユーザー）
+            min_fit: これ未満の適合度のユーザーは割り当てない
+        """
+        try:
+            fit_result = self.get_role_fit()
+            matrix = self.analytics_controller.get_matrix()
+            
+            candidate_rows = None
+            if candidate_user_ids is not None:
+                indices = (matrix.user_index(user_id) for user_id in candidate_user_ids)
+                candidate_rows = np.array(sorted({i for i in indices if i is not None}), dtype=np.int64)
+                
+            result = assign_positions(
+                fit_result.fit, fit_result.role_ids, fit_result.user_ids, matrix.user_group_ids,
+                positions, candidate_rows=candidate_rows, min_fit=min_fit
+            )
+            logger.debug(
+                f"{self.current_time} - Assigned {len(result.assignments)} of {len(positions)} positions "
+                f"(total fit {result.total_fit:.3f})"
+            )
+            return result
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to assign positions: {str(e)}")
+            raise
@@ -0,0 +1,63 @@
+import logging
+import time
+from typing import List, Optional
+from src.desktop.models.category import CategoryManager
+from src.desktop.models.search_result import KIND_CATEGORY, SearchResult
+from src.desktop.managers.search_manager import SearchManager
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class SearchController:
+    """
+    全文検索コントローラー
+    
+    ユーザー・スキル・スキルカテゴリー（メインのデータベース）と
+    カテゴリー（カテゴリー管理のデータベース）の検索結果を bm25 のスコア順に併合する。
+    インデックスはトリガーで本体と同期しているため、キャッシュは持たない。
+    """
+    
+    def __init__(self, search_manager: SearchManager, category_manager: Optional[CategoryManager] = None):
+        """
+        Args:
+            search_manager: 全文検索管理クラス
+            category_manager: カテゴリー管理クラス（省略時はカテゴリーを検索しない）
+        """
+        self.search_manager = search_manager
+        self.category_manager = category_manager
+        self.current_time = TimeProvider.get_current_time()
+        
+    def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """
+        前方一致で検索し、一致度の高い順に最大 limit 件を取得
+        
+        Args:
+            query: 検索文字列（空白区切りの語をすべて含むものに一致）
+            limit: 取得する件数の上限
+        """
+        try:
+            started = time.perf_counter()
+            results = self.search_manager.search(query, limit)
+            if self.category_manager is not None:
+                results.extend(
+                    SearchResult(
+                        kind=KIND_CATEGORY,
+                        id=category.id,
+                        title=category.name,
+                        detail=category.description,
+                        rank=rank
+                    )
+                    for category, rank in self.category_manager.search_categories(query, limit)
+                )
+                results.sort(key=lambda result: result.rank)
+                del results[limit:]
+                
+            logger.debug(
+                f"{self.current_time} - Search {query!r} returned {len(results)} results "
+                f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search: {str(e)}")
+            raise
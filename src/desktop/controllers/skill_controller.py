@@ -1,22 +1,39 @@
 import logging
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 from src.desktop.models.skill import Skill
 from src.desktop.managers.skill_manager import SkillManager
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.controllers.cached_controller import CachedController
+from src.desktop.utils.identity_map import IdentityMap, watch_tables, notify_tables_changed
 
 logger = logging.getLogger(__name__)
 
-class SkillController:
+class SkillController(CachedController):
     """スキルコントローラー"""
     
-    def __init__(self, skill_manager: SkillManager):
+    def __init__(self, skill_manager: SkillManager, cache_max_bytes: int = 4 * 1024 * 1024):
         self.skill_manager = skill_manager
+        self.db = skill_manager.db
         self.current_time = TimeProvider.get_current_time()
         
+        # 読み込み結果のキャッシュ（キー: ('skill', id) / ('all',) / ('category', category_id)）
+        self.cache = IdentityMap(cache_max_bytes)
+        watch_tables(skill_manager.db, self.cache, ('skills',))
+        
+    def _invalidate_skills(self, *keys):
+        """指定したキーとスキル一覧のキャッシュを無効化（コミット後にも繰り返す）"""
+        def invalidate():
+            self.cache.invalidate(*keys)
+            self.cache.invalidate_if(lambda key: key[0] in ('all', 'category'))
+            notify_tables_changed(self.db, 'skills', source=self.cache)
+            
+        self._invalidate(invalidate)
+        
     def create_skill(self, category_id: int, name: str, description: str = None) -> Skill:
         """スキルを作成"""
         try:
             skill = self.skill_manager.create_skill(category_id, name, description)
+            self._invalidate_skills()
             logger.debug(f"{self.current_time} - Created skill: {name}")
             return skill
             
@@ -24,10 +41,22 @@ class SkillController:
             logger.error(f"{self.current_time} - Failed to create skill: {str(e)}")
             raise
             
+    def upsert_skills_bulk(self, skills: Iterable[dict]) -> List[int]:
+        """スキルを一括作成・更新"""
+        try:
+            skill_ids = self.skill_manager.upsert_skills_bulk(skills)
+            self._invalidate_skills(*[('skill', skill_id) for skill_id in skill_ids])
+            logger.debug(f"{self.current_time} - Upserted {len(skill_ids)} skills in bulk")
+            return skill_ids
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to upsert skills in bulk: {str(e)}")
+            raise
+            
     def get_skill(self, skill_id: int) -> Skill:
         """スキルを取得"""
         try:
-            skill = self.skill_manager.get_skill(skill_id)
+            skill = self._cached(('skill', skill_id), lambda: self.skill_manager.get_skill(skill_id))
             logger.debug(f"{self.current_time} - Retrieved skill: {skill.name}")
             return skill
             
@@ -38,7 +67,7 @@ class SkillController:
     def get_all_skills(self) -> List[Skill]:
         """全スキルを取得"""
         try:
-            skills = self.skill_manager.get_all_skills()
+            skills = list(self._cached(('all',), self.skill_manager.get_all_skills))
             logger.debug(f"{self.current_time} - Retrieved {len(skills)} skills")
             return skills
             
@@ -49,7 +78,10 @@ class SkillController:
     def get_skills_by_category(self, category_id: int) -> List[Skill]:
         """カテゴリーに属するスキルを取得"""
         try:
-            skills = self.skill_manager.get_skills_by_category(category_id)
+            skills = list(self._cached(
+                ('category', category_id),
+                lambda: self.skill_manager.get_skills_by_category(category_id)
+            ))
             logger.debug(f"{self.current_time} - Retrieved {len(skills)} skills for category {category_id}")
             return skills
             
@@ -57,10 +89,48 @@ class SkillController:
             logger.error(f"{self.current_time} - Failed to get skills by category: {str(e)}")
             raise
             
+    def find_skills_by_name(self, name: str, category_id: Optional[int] = None) -> List[Skill]:
+        """表記の違い（全角・半角、ひらがな・カタカナ、大文字・小文字）を無視して名前でスキルを検索"""
+        try:
+            skills = self.skill_manager.find_skills_by_name(name, category_id)
+            logger.debug(f"{self.current_time} - Found {len(skills)} skills named {name!r}")
+            return skills
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find skills by name: {str(e)}")
+            raise
+            
+    def get_skills_by_categories(self, category_ids: Iterable[int]) -> List[Skill]:
+        """複数カテゴリーに属するスキルを取得"""
+        try:
+            skills = self.skill_manager.get_skills_by_categories(category_ids)
+            logger.debug(f"{self.current_time} - Retrieved {len(skills)} skills for multiple categories")
+            return skills
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skills by categories: {str(e)}")
+            raise
+            
+    def get_skills_page(self, after: Optional[Tuple[int, str]] = None, limit: int = 100) -> List[Skill]:
+        """(category_id, name) 順のキーセットページングでスキルを取得"""
+        try:
+            skills = self.skill_manager.get_skills_page(after, limit)
+            logger.debug(f"{self.current_time} - Retrieved page of {len(skills)} skills after {after}")
+            return skills
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skills page: {str(e)}")
+            raise
+            
+    def iter_skills(self, batch_size: int = 500) -> Iterator[Skill]:
+        """(category_id, name) 順に全スキルを逐次取得"""
+        return self.skill_manager.iter_skills(batch_size)
+        
     def update_skill(self, skill_id: int, category_id: int = None, name: str = None, description: str = None) -> Skill:
         """スキル情報を更新"""
         try:
             skill = self.skill_manager.update_skill(skill_id, category_id, name, description)
+            self._invalidate_skills(('skill', skill_id))
             logger.debug(f"{self.current_time} - Updated skill: {skill.name}")
             return skill
             
@@ -72,6 +142,7 @@ class SkillController:
         """スキルを削除"""
         try:
             success = self.skill_manager.delete_skill(skill_id)
+            self._invalidate_skills(('skill', skill_id))
             logger.debug(f"{self.current_time} - Deleted skill: {skill_id}")
             return success
             
@@ -1,22 +1,106 @@
 import logging
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional
 from src.desktop.models.user import User
 from src.desktop.managers.user_manager import UserManager
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.utils.prefix_index import PrefixIndex
+from src.desktop.controllers.cached_controller import CachedController
+from src.desktop.utils.identity_map import IdentityMap, watch_tables, notify_tables_changed
 
 logger = logging.getLogger(__name__)
 
-class UserController:
+class _UserSearchIndex:
+    """
+    社員番号・氏名の前方一致検索用インデックスと対象ユーザー
+    
+    グループを絞った検索で他グループの一致を読み飛ばさないよう、
+    グループ別のインデックスも必要になった時点で作る。clear() 後は次の検索時に作り直す。
+    """
+    
+    def __init__(self):
+        self.clear()
+        
+    def clear(self):
+        self.index: Optional[PrefixIndex] = None
+        self.users: Dict[int, User] = {}
+        self.groups: Dict[int, PrefixIndex] = {}
+        
+    @staticmethod
+    def keys(user: User) -> List[str]:
+        """検索キー（社員番号・氏名・氏名の2語目以降）"""
+        return [user.employee_id, user.name, *user.name.split()[1:]]
+        
+    def build(self, users: List[User]):
+        self.index = PrefixIndex()
+        self.index.build((user.id, self.keys(user)) for user in users)
+        self.users = {user.id: user for user in users}
+        self.groups = {}
+        
+    def group_index(self, group_id: int) -> PrefixIndex:
+        index = self.groups.get(group_id)
+        if index is None:
+            index = PrefixIndex()
+            index.build((user.id, self.keys(user)) for user in self.users.values() if user.group_id == group_id)
+            self.groups[group_id] = index
+        return index
+        
+    def add(self, user: User):
+        if self.index is None:
+            return
+        self.remove(user.id)
+        self.index.add(user.id, self.keys(user))
+        self.users[user.id] = user
+        if user.group_id in self.groups:
+            self.groups[user.group_id].add(user.id, self.keys(user))
+            
+    def remove(self, user_id: int):
+        if self.index is None:
+            return
+        user = self.users.pop(user_id, None)
+        self.index.remove(user_id)
+        if user is not None and user.group_id in self.groups:
+            self.groups[user.group_id].remove(user_id)
+            
+class UserController(CachedController):
     """ユーザーコントローラー"""
     
-    def __init__(self, user_manager: UserManager):
+    def __init__(self, user_manager: UserManager, cache_max_bytes: int = 4 * 1024 * 1024):
         self.user_manager = user_manager
+        self.db = user_manager.db
         self.current_time = TimeProvider.get_current_time()
         
+        # 読み込み結果のキャッシュ（キー: ('user', id) / ('all',) / ('group', group_id)）
+        self.cache = IdentityMap(cache_max_bytes)
+        watch_tables(user_manager.db, self.cache, ('users',))
+        
+        # 社員番号・氏名の前方一致検索用インデックス（初回の検索時に作成し、以降は変更分だけ反映）
+        # グループの削除で所属が外れた場合は作り直す
+        self._search_index = _UserSearchIndex()
+        watch_tables(user_manager.db, self._search_index, ('groups',))
+        
+    def _invalidate_users(self, *keys):
+        """指定したキーとユーザー一覧のキャッシュを無効化（コミット後にも繰り返す）"""
+        def invalidate():
+            self.cache.invalidate(*keys)
+            self.cache.invalidate_if(lambda key: key[0] in ('all', 'group'))
+            notify_tables_changed(self.db, 'users', source=self.cache)
+            
+        self._invalidate(invalidate)
+        
+    def _index_user(self, user: User):
+        """作成・更新したユーザーをコミット後に検索インデックスへ反映"""
+        self.user_manager.db.after_commit(lambda: self._search_index.add(user))
+        
+    def _unindex_user(self, user_id: int):
+        """削除したユーザーをコミット後に検索インデックスから除く"""
+        self.user_manager.db.after_commit(lambda: self._search_index.remove(user_id))
+        
     def create_user(self, employee_id: str, name: str, group_id: int = None) -> User:
         """ユーザーを作成"""
         try:
             user = self.user_manager.create_user(employee_id, name, group_id)
+            self._invalidate_users()
+            self._index_user(user)
             logger.debug(f"{self.current_time} - Created user: {name}")
             return user
             
@@ -24,10 +108,24 @@ class UserController:
             logger.error(f"{self.current_time} - Failed to create user: {str(e)}")
             raise
             
+    def create_users_bulk(self, users: Iterable[dict], upsert: bool = False) -> List[int]:
+        """ユーザーを一括作成"""
+        try:
+            user_ids = self.user_manager.create_users_bulk(users, upsert=upsert)
+            self._invalidate_users(*[('user', user_id) for user_id in user_ids])
+            # 一括登録後は次の検索時に作り直す
+            self.user_manager.db.after_commit(self._search_index.clear)
+            logger.debug(f"{self.current_time} - Created {len(user_ids)} users in bulk")
+            return user_ids
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create users in bulk: {str(e)}")
+            raise
+            
     def get_user(self, user_id: int) -> User:
         """ユーザーを取得"""
         try:
-            user = self.user_manager.get_user(user_id)
+            user = self._cached(('user', user_id), lambda: self.user_manager.get_user(user_id))
             logger.debug(f"{self.current_time} - Retrieved user: {user.name}")
             return user
             
@@ -38,7 +136,7 @@ class UserController:
     def get_all_users(self) -> List[User]:
         """全ユーザーを取得"""
         try:
-            users = self.user_manager.get_all_users()
+            users = list(self._cached(('all',), self.user_manager.get_all_users))
             logger.debug(f"{self.current_time} - Retrieved {len(users)} users")
             return users
             
@@ -49,7 +147,10 @@ class UserController:
     def get_users_by_group(self, group_id: int) -> List[User]:
         """グループに属するユーザーを取得"""
         try:
-            users = self.user_manager.get_users_by_group(group_id)
+            users = list(self._cached(
+                ('group', group_id),
+                lambda: self.user_manager.get_users_by_group(group_id)
+            ))
             logger.debug(f"{self.current_time} - Retrieved {len(users)} users for group {group_id}")
             return users
             
@@ -57,10 +158,39 @@ class UserController:
             logger.error(f"{self.current_time} - Failed to get users by group: {str(e)}")
             raise
             
+    def find_users_by_name(self, name: str) -> List[User]:
+        """表記の違い（全角・半角、ひらがな・カタカナ、大文字・小文字）を無視して名前でユーザーを検索"""
+        try:
+            users = self.user_manager.find_users_by_name(name)
+            logger.debug(f"{self.current_time} - Found {len(users)} users named {name!r}")
+            return users
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find users by name: {str(e)}")
+            raise
+            
+    def get_users_page(self, after_employee_id: Optional[str] = None, limit: int = 100,
+                       group_id: Optional[int] = None) -> List[User]:
+        """社員番号順のキーセットページングでユーザーを取得"""
+        try:
+            users = self.user_manager.get_users_page(after_employee_id, limit, group_id)
+            logger.debug(f"{self.current_time} - Retrieved page of {len(users)} users after {after_employee_id}")
+            return users
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get users page: {str(e)}")
+            raise
+            
+    def iter_users(self, group_id: Optional[int] = None, batch_size: int = 500) -> Iterator[User]:
+        """社員番号順に全ユーザーを逐次取得"""
+        return self.user_manager.iter_users(group_id, batch_size)
+        
     def update_user(self, user_id: int, employee_id: str = None, name: str = None, group_id: int = None) -> User:
         """ユーザー情報を更新"""
         try:
             user = self.user_manager.update_user(user_id, employee_id, name, group_id)
+            self._invalidate_users(('user', user_id))
+            self._index_user(user)
             logger.debug(f"{self.current_time} - Updated user: {user.name}")
             return user
             
@@ -72,9 +202,37 @@ class UserController:
         """ユーザーを削除"""
         try:
             success = self.user_manager.delete_user(user_id)
+            self._invalidate_users(('user', user_id))
+            self._unindex_user(user_id)
             logger.debug(f"{self.current_time} - Deleted user: {user_id}")
             return success
             
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to delete user: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+            
+    def search_users(self, prefix: str, limit: int = 50, group_id: Optional[int] = None) -> List[User]:
+        """
+        社員番号・氏名の前方一致でユーザーを検索（入力中の逐次検索向け）
+        
+        初回はユーザー一覧からメモリ上のインデックスを作り、以降の作成・更新・削除は
+        コミット後に差分だけ反映する。全角・半角、ひらがな・カタカナ、大文字・小文字の違いは無視する。
+        
+        Args:
+            prefix: 検索文字列
+            limit: 取得する件数の上限
+            group_id: 対象グループ（None の場合は全ユーザー）
+        """
+        try:
+            search_index = self._search_index
+            if search_index.index is None:
+                users = self.get_all_users()
+                search_index.build(users)
+                logger.debug(f"{self.current_time} - Built user prefix index: {len(users)} users")
+                
+            index = search_index.index if group_id is None else search_index.group_index(group_id)
+            return [search_index.users[user_id] for user_id in index.search(prefix, limit)]
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search users: {str(e)}")
+            raise
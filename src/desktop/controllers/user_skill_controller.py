@@ -0,0 +1,126 @@
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.desktop.models.user_skill import UserSkill
+from src.desktop.managers.user_skill_manager import UserSkillManager
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class UserSkillController:
+    """ユーザースキル（評価レベル）コントローラー"""
+    
+    def __init__(self, user_skill_manager: UserSkillManager):
+        self.user_skill_manager = user_skill_manager
+        self.current_time = TimeProvider.get_current_time()
+        self._level_listeners: List[Callable[[List[Tuple[int, int, Optional[int]]]], None]] = []
+        
+    def transaction(self):
+        """複数の操作を1つのトランザクションにまとめる（with文で使用し、ブロック内の操作はまとめてコミット）"""
+        return self.user_skill_manager.db.transaction()
+        
+    def add_level_listener(self, listener: Callable[[List[Tuple[int, int, Optional[int]]]], None]):
+        """
+        スキルレベル変更の通知先を登録
+        
+        通知はコミット後に (user_id, skill_id, level) のリストで行われる。
+        削除（未評価に戻す）の場合、level は None となる。
+        """
+        if listener not in self._level_listeners:
+            self._level_listeners.append(listener)
+            
+    def remove_level_listener(self, listener: Callable[[List[Tuple[int, int, Optional[int]]]], None]):
+        """スキルレベル変更の通知先を解除"""
+        if listener in self._level_listeners:
+            self._level_listeners.remove(listener)
+            
+    def _notify_level_changes(self, changes: List[Tuple[int, int, Optional[int]]]):
+        """コミット後に通知先へ変更内容を渡す"""
+        if not changes or not self._level_listeners:
+            return
+        listeners = list(self._level_listeners)
+        
+        def dispatch():
+            for listener in listeners:
+                listener(changes)
+                
+        self.user_skill_manager.db.after_commit(dispatch)
+        
+    def set_level(self, user_id: int, skill_id: int, level: int) -> UserSkill:
+        """スキルレベルを登録・更新"""
+        try:
+            user_skill = self.user_skill_manager.set_level(user_id, skill_id, level)
+            self._notify_level_changes([(user_id, skill_id, level)])
+            logger.debug(f"{self.current_time} - Set skill level: user {user_id}, skill {skill_id} -> {level}")
+            return user_skill
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set skill level: {str(e)}")
+            raise
+            
+    def set_levels_bulk(self, levels: Iterable[Tuple[int, int, int]]) -> int:
+        """スキルレベルを一括で登録・更新"""
+        try:
+            levels = list(levels)
+            count = self.user_skill_manager.set_levels_bulk(levels)
+            self._notify_level_changes(levels)
+            logger.debug(f"{self.current_time} - Set {count} skill levels in bulk")
+            return count
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set skill levels in bulk: {str(e)}")
+            raise
+            
+    def get_level(self, user_id: int, skill_id: int) -> int:
+        """スキルレベルを取得（未評価の場合はNone）"""
+        try:
+            return self.user_skill_manager.get_level(user_id, skill_id)
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skill level: {str(e)}")
+            raise
+            
+    def get_user_profile(self, user_id: int) -> Dict[int, int]:
+        """ユーザーの全スキルレベルを取得（skill_id → level）"""
+        try:
+            profile = self.user_skill_manager.get_user_profile(user_id)
+            logger.debug(f"{self.current_time} - Retrieved {len(profile)} skill levels for user {user_id}")
+            return profile
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get user profile: {str(e)}")
+            raise
+            
+    def get_skill_column(self, skill_id: int) -> Dict[int, int]:
+        """スキルに対する全ユーザーのレベルを取得（user_id → level）"""
+        try:
+            column = self.user_skill_manager.get_skill_column(skill_id)
+            logger.debug(f"{self.current_time} - Retrieved {len(column)} user levels for skill {skill_id}")
+            return column
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skill column: {str(e)}")
+            raise
+            
+    def get_all_levels(self) -> List[Tuple[int, int, int]]:
+        """全ての (user_id, skill_id, level) を取得"""
+        try:
+            levels = self.user_skill_manager.get_all_levels()
+            logger.debug(f"{self.current_time} - Retrieved {len(levels)} skill levels")
+            return levels
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get all skill levels: {str(e)}")
+            raise
+            
+    def delete_levels_bulk(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """スキルレベルを一括削除（未評価に戻す）"""
+        try:
+            pairs = list(pairs)
+            count = self.user_skill_manager.delete_levels_bulk(pairs)
+            self._notify_level_changes([(user_id, skill_id, None) for user_id, skill_id in pairs])
+            logger.debug(f"{self.current_time} - Deleted {count} skill levels")
+            return count
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to delete skill levels: {str(e)}")
+            raise
\ No newline at end of file
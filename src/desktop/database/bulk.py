@@ -0,0 +1,55 @@
+import sqlite3
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# 1文あたりのバインド変数の上限（古いSQLiteの既定値999に収まるよう余裕を持たせる）
+MAX_BIND_PARAMS = 900
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """イテラブルを size 件ずつのリストに分割"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def fetch_ids_by_keys(
+    cursor: sqlite3.Cursor,
+    table: str,
+    key_columns: Sequence[str],
+    keys: Sequence[Tuple]
+) -> List[int]:
+    """
+    一意キーの組からIDを一括取得
+
+    Args:
+        cursor: 実行に使うカーソル
+        table: テーブル名
+        key_columns: 一意キーを構成する列名
+        keys: キー値のタプルのリスト（重複可）
+
+    Returns:
+        List[int]: keys と同じ順序のIDリスト
+    """
+    width = len(key_columns)
+    columns = ", ".join(f"t.{column}" for column in key_columns)
+    # 行値の IN (VALUES ...) はインデックスを使わないため、VALUES との結合で検索する
+    join_condition = " AND ".join(
+        f"t.{column} = k.column{i + 1}" for i, column in enumerate(key_columns)
+    )
+    placeholder = "(" + ", ".join(["?"] * width) + ")"
+    id_by_key: Dict[Tuple, int] = {}
+
+    for chunk in chunked(dict.fromkeys(keys), MAX_BIND_PARAMS // width):
+        params = [value for key in chunk for value in key]
+        cursor.execute(
+            f"SELECT t.id, {columns} "
+            f"FROM (VALUES {', '.join([placeholder] * len(chunk))}) AS k "
+            f"JOIN {table} AS t ON {join_condition}",
+            params
+        )
+        for row in cursor.fetchall():
+            id_by_key[tuple(row[1:])] = row[0]
+
+    return [id_by_key[key] for key in keys]
@@ -0,0 +1,293 @@
+import sqlite3
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional
+from src.desktop.database.unit_of_work import TransactionScope
+from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.utils.text_normalizer import register_functions
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PragmaSettings:
+    """接続ごとに適用するPRAGMA設定"""
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -65536          # 負の値はKiB単位（約64MB）
+    mmap_size: int = 268435456        # 256MB
+    foreign_keys: bool = True
+    busy_timeout: int = 5000          # ミリ秒
+    temp_store: str = "MEMORY"
+
+    @staticmethod
+    def from_dict(data: dict) -> 'PragmaSettings':
+        """辞書からPragmaSettingsを作成（未指定の項目は既定値）"""
+        settings = PragmaSettings()
+        for key, value in (data or {}).items():
+            if not hasattr(settings, key):
+                raise ValueError(f"Unknown pragma setting: {key}")
+            setattr(settings, key, value)
+        return settings
+
+    def to_statements(self) -> List[str]:
+        """PRAGMA文のリストに変換"""
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+
+@dataclass
+class PoolStatistics:
+    """コネクションプールの統計情報"""
+    checkouts: int = 0
+    reentrant_checkouts: int = 0
+    waits: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    open_connections: int = 0
+    idle_connections: int = 0
+    in_use_connections: int = 0
+    created_connections: int = 0
+    discarded_connections: int = 0
+    health_check_failures: int = 0
+
+    def to_dict(self) -> dict:
+        """辞書に変換"""
+        return asdict(self)
+
+class _PooledConnection:
+    """プール内の接続と付随情報"""
+
+    __slots__ = ("connection", "scope", "last_used", "depth", "owner")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.scope = TransactionScope(connection)
+        self.last_used = time.monotonic()
+        self.depth = 0
+        self.owner = None
+
+class ConnectionPool:
+    """SQLite接続プール
+
+    スレッドごとに接続を再利用し、同時に開く接続数を max_size で制限する。
+    各接続は作成時に一度だけPRAGMA設定を適用する。
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        pragmas: Optional[PragmaSettings] = None,
+        health_check_interval: float = 30.0
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.pragmas = pragmas or PragmaSettings()
+        self.health_check_interval = health_check_interval
+        self.current_time = TimeProvider.get_current_time()
+
+        self._condition = threading.Condition(threading.Lock())
+        self._idle: List[_PooledConnection] = []
+        self._all: Dict[int, _PooledConnection] = {}
+        self._local = threading.local()
+        self._stats = PoolStatistics()
+        self._closed = False
+
+    def _create_connection(self) -> _PooledConnection:
+        """新しい接続を作成してPRAGMAを適用"""
+        # トランザクションは TransactionScope で明示的に管理する
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row  # 行を辞書形式で取得
+        register_functions(conn)
+        try:
+            for statement in self.pragmas.to_statements():
+                conn.execute(statement)
+        except Exception:
+            conn.close()
+            raise
+        return _PooledConnection(conn)
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        """一定時間使われていない接続の死活確認"""
+        if time.monotonic() - pooled.last_used < self.health_check_interval:
+            return True
+        try:
+            pooled.connection.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"{self.current_time} - Discarding unhealthy connection: {str(e)}")
+            return False
+
+    def _discard(self, pooled: _PooledConnection):
+        """接続を閉じてプールから除外（ロック保持中に呼び出す）"""
+        self._all.pop(id(pooled), None)
+        self._stats.discarded_connections += 1
+        try:
+            pooled.connection.close()
+        except sqlite3.Error:
+            pass
+
+    def _take_idle(self) -> Optional[_PooledConnection]:
+        """アイドル接続を取得（同じスレッドが前回使った接続を優先）"""
+        preferred = getattr(self._local, "last", None)
+        if preferred is not None and preferred in self._idle:
+            self._idle.remove(preferred)
+            return preferred
+        if self._idle:
+            return self._idle.pop()
+        return None
+
+    def _acquire(self) -> _PooledConnection:
+        """プールから接続を取得"""
+        started = time.monotonic()
+        waited = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+
+                pooled = self._take_idle()
+                if pooled is not None:
+                    if self._is_healthy(pooled):
+                        break
+                    self._stats.health_check_failures += 1
+                    self._discard(pooled)
+                    continue
+
+                if len(self._all) < self.max_size:
+                    pooled = self._create_connection()
+                    self._all[id(pooled)] = pooled
+                    self._stats.created_connections += 1
+                    break
+
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out waiting for a database connection after {self.timeout}s"
+                    )
+                waited = True
+                self._condition.wait(remaining)
+
+            elapsed = time.monotonic() - started
+            self._stats.checkouts += 1
+            if waited:
+                self._stats.waits += 1
+            self._stats.total_wait_time += elapsed
+            self._stats.max_wait_time = max(self._stats.max_wait_time, elapsed)
+
+        pooled.owner = threading.get_ident()
+        self._local.current = pooled
+        self._local.last = pooled
+        return pooled
+
+    def _release(self, pooled: _PooledConnection):
+        """接続をプールへ返却"""
+        self._local.current = None
+        pooled.owner = None
+        pooled.last_used = time.monotonic()
+        if pooled.connection.in_transaction:
+            # 呼び出し側で完了しなかったトランザクションは破棄
+            pooled.connection.execute("ROLLBACK")
+        with self._condition:
+            if self._closed:
+                self._discard(pooled)
+            else:
+                self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def _checkout(self) -> Iterator[_PooledConnection]:
+        """接続を借り出す（同じスレッド内の入れ子呼び出しでは同じ接続を返す）"""
+        pooled = getattr(self._local, "current", None)
+        if pooled is not None:
+            with self._condition:
+                self._stats.reentrant_checkouts += 1
+        else:
+            pooled = self._acquire()
+
+        pooled.depth += 1
+        try:
+            yield pooled
+        finally:
+            pooled.depth -= 1
+            if pooled.depth == 0:
+                self._release(pooled)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        トランザクションを開始せずに接続を借り出す
+
+        executescript など、自身でトランザクションを制御する処理向け。
+        """
+        with self._checkout() as pooled:
+            yield pooled.connection
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        接続を借り出してトランザクションを開始
+
+        同じスレッドで既にトランザクション中の場合はセーブポイントとなり、
+        最も外側のブロックを抜けた時点で一度だけコミットされる。
+        """
+        with self._checkout() as pooled:
+            with pooled.scope.begin(immediate=immediate) as conn:
+                yield conn
+
+    def in_transaction(self) -> bool:
+        """現在のスレッドがトランザクション中かどうか"""
+        pooled = getattr(self._local, "current", None)
+        return pooled is not None and pooled.scope.active
+
+    def after_commit(self, callback):
+        """
+        現在のスレッドのトランザクションがコミットされた後に実行する処理を登録
+
+        トランザクション外で呼ばれた場合は即座に実行する。
+        """
+        pooled = getattr(self._local, "current", None)
+        if pooled is not None and pooled.scope.active:
+            pooled.scope.after_commit(callback)
+        else:
+            TransactionScope._run_callbacks([callback])
+
+    def get_statistics(self) -> PoolStatistics:
+        """現在の統計情報のスナップショットを取得"""
+        with self._condition:
+            stats = PoolStatistics(**self._stats.to_dict())
+            stats.open_connections = len(self._all)
+            stats.idle_connections = len(self._idle)
+            stats.in_use_connections = len(self._all) - len(self._idle)
+            return stats
+
+    def discard_idle(self):
+        """アイドル接続を全て閉じる（スキーマ変更後に古いスキーマ情報を持つ接続を捨てる）"""
+        with self._condition:
+            for pooled in self._idle:
+                self._discard(pooled)
+            self._idle.clear()
+
+    def close_all(self):
+        """全てのアイドル接続を閉じ、以降の借り出しを拒否"""
+        with self._condition:
+            self._closed = True
+            for pooled in self._idle:
+                self._discard(pooled)
+            self._idle.clear()
+            self._condition.notify_all()
+        logger.info(f"{self.current_time} - Connection pool closed")
@@ -2,16 +2,32 @@ import sqlite3
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, ContextManager, List, Optional, Union
+from src.desktop.database.connection_pool import ConnectionPool, PragmaSettings, PoolStatistics
+from src.desktop.services.migration_manager import MigrationManager
 
 logger = logging.getLogger(__name__)
 
 class Database:
     """データベース管理クラス"""
     
-    def __init__(self, db_path: str = "skill_matrix.db"):
+    def __init__(
+        self,
+        db_path: str = "skill_matrix.db",
+        pool_size: int = 5,
+        pragmas: Optional[Union[PragmaSettings, dict]] = None
+    ):
+        """
+        Args:
+            db_path: データベースファイルのパス
+            pool_size: 同時に開く接続の上限
+            pragmas: 接続ごとのPRAGMA設定（環境ごとに上書き可能）
+        """
         self.db_path = db_path
         self.current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(pragmas, dict):
+            pragmas = PragmaSettings.from_dict(pragmas)
+        self.pool = ConnectionPool(db_path, max_size=pool_size, pragmas=pragmas)
         self._setup_database()
         
     def _setup_database(self):
@@ -95,31 +111,136 @@ class Database:
                     )
                 ''')
                 
-                conn.commit()
                 logger.info(f"{self.current_time} - Database tables created successfully")
                 
+            # インデックス等のスキーマ変更を適用
+            migration_manager = MigrationManager(
+                self.db_path,
+                migrations_dir=Path(__file__).parent / 'migrations'
+            )
+            migration_manager.migrate()
+            self.pool.discard_idle()
+            self._report_name_key_collisions()
+                
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to setup database: {str(e)}")
             raise
             
-    def get_connection(self) -> sqlite3.Connection:
-        """データベース接続を取得"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # 行を辞書形式で取得
-            return conn
+    def _report_name_key_collisions(self):
+        """
+        表記の違いだけで重複していた既存の名前を警告する
+
+        name_key のマイグレーションは、重複する名前のうち最も古い行以外の
+        キーに区切り文字と id を付けて一意インデックスを作成する。
+        該当する行は名前を変更するまで名前での検索で見つからないため、起動時に報告する。
+        """
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT 'groups', id, name FROM groups WHERE instr(name_key, char(31)) > 0
+                UNION ALL
+                SELECT 'skills', id, name FROM skills WHERE instr(name_key, char(31)) > 0
+                """
+            ).fetchall()
+        for table, row_id, name in rows:
+            logger.warning(
+                f"{self.current_time} - {table} {row_id} ({name!r}) duplicates an existing name "
+                f"up to width/kana differences; rename it to make it searchable by name"
+            )
             
+    def get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """
+        プールからデータベース接続を借り出す
+
+        with文で使用し、ブロック全体が1つのトランザクションとなる。
+        transaction() の内側で呼ばれた場合はセーブポイントとして扱われ、
+        コミットは最も外側のブロックで一度だけ行われる。
+        """
+        try:
+            return self.pool.transaction()
+
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to get database connection: {str(e)}")
             raise
+
+    def get_read_connection(self) -> ContextManager[sqlite3.Connection]:
+        """
+        トランザクションを開始せずに接続を借り出す
+        
+        途中で打ち切られる可能性のあるストリーミング読み出し向け。
+        transaction() の内側で呼ばれた場合は同じ接続・同じトランザクションを共有する。
+        """
+        return self.pool.connection()
+
+    def transaction(self, immediate: bool = True) -> ContextManager[sqlite3.Connection]:
+        """
+        複数のマネージャー操作をまとめる作業単位（Unit of Work）を開始
+
+        ブロック内で呼ばれた各マネージャーのメソッドはセーブポイントとして実行され、
+        ブロックを正常に抜けた時点でまとめてコミットされる。入れ子で使用可能。
+
+        Args:
+            immediate: 書き込みロックを開始時に取得する（最も外側のみ有効）
+        """
+        return self.pool.transaction(immediate=immediate)
+            
+    def in_transaction(self) -> bool:
+        """現在のスレッドがトランザクション中かどうか"""
+        return self.pool.in_transaction()
+        
+    def after_commit(self, callback: Callable[[], None]):
+        """
+        現在のトランザクションのコミット後に実行する処理を登録
+        
+        巻き戻された場合は実行されない。トランザクション外では即座に実行する。
+        """
+        self.pool.after_commit(callback)
+        
+    def get_pool_statistics(self) -> PoolStatistics:
+        """コネクションプールの統計情報を取得"""
+        return self.pool.get_statistics()
+        
+    def close(self):
+        """統計情報を更新してからプール内の全接続を閉じる"""
+        self.optimize()
+        self.pool.close_all()
+        
+    def optimize(self):
+        """必要に応じてクエリプランナーの統計情報を更新（PRAGMA optimize）"""
+        try:
+            with self.pool.connection() as conn:
+                conn.execute("PRAGMA optimize")
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to optimize database: {str(e)}")
+            
+    def explain_query_plan(self, query: str, params: tuple = ()) -> List[str]:
+        """
+        クエリの実行計画を取得
+        
+        Args:
+            query: 対象のSQL
+            params: クエリパラメータ
+            
+        Returns:
+            List[str]: 実行計画の各ステップ（例: "SEARCH users USING INDEX ..."）
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"EXPLAIN QUERY PLAN {query}", params)
+                return [row[3] for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to explain query plan: {str(e)}")
+            raise
             
     def execute_migration(self, migration_sql: str) -> bool:
         """マイグレーションを実行"""
         try:
-            with self.get_connection() as conn:
+            with self.pool.connection() as conn:
                 cursor = conn.cursor()
                 cursor.executescript(migration_sql)
-                conn.commit()
                 logger.info(f"{self.current_time} - Migration executed successfully")
                 return True
                 
@@ -146,7 +267,7 @@ class Database:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = f"backup_{timestamp}.db"
                 
-            with self.get_connection() as source_conn:
+            with self.pool.connection() as source_conn:
                 backup_conn = sqlite3.connect(backup_path)
                 source_conn.backup(backup_conn)
                 backup_conn.close()
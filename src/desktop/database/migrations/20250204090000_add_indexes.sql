@@ -0,0 +1,22 @@
+-- src/desktop/database/migrations/20250204090000_add_indexes.sql
+
+-- Up migration
+-- 外部キー列のインデックス（UNIQUE 制約の自動インデックスで賄えないもののみ）
+-- 並び順の経路は既存の自動インデックスが担う:
+--   ORDER BY employee_id         → sqlite_autoindex_users_1 (UNIQUE employee_id)
+--   ORDER BY category_id, name   → sqlite_autoindex_skills_1 (UNIQUE (category_id, name))
+--   user_skills WHERE user_id = ? → sqlite_autoindex_user_skills_1 (UNIQUE (user_id, skill_id))
+
+-- グループ別ユーザー一覧は employee_id 順で返すため並べ替えの列を続ける
+CREATE INDEX IF NOT EXISTS idx_users_group_id
+    ON users (group_id, employee_id);
+
+CREATE INDEX IF NOT EXISTS idx_user_skills_skill_id
+    ON user_skills (skill_id);
+
+-- クエリプランナー用の統計情報を収集
+ANALYZE;
+
+-- Down migration
+DROP INDEX IF EXISTS idx_user_skills_skill_id;
+DROP INDEX IF EXISTS idx_users_group_id;
@@ -0,0 +1,37 @@
+-- src/desktop/database/migrations/20250205090000_add_role_profiles.sql
+
+-- Up migration
+-- 役割プロファイル（プロジェクトの役割・ポジションなど）
+CREATE TABLE IF NOT EXISTS role_profiles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- 役割ごとのスキル要件（必要レベルと重み）
+CREATE TABLE IF NOT EXISTS role_requirements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    required_level INTEGER NOT NULL CHECK (required_level BETWEEN 0 AND 5),
+    weight REAL NOT NULL DEFAULT 1.0 CHECK (weight > 0),
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    FOREIGN KEY (role_id) REFERENCES role_profiles (id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills (id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    UNIQUE (role_id, skill_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_role_requirements_skill_id
+    ON role_requirements (skill_id, role_id);
+
+-- Down migration
+DROP INDEX IF EXISTS idx_role_requirements_skill_id;
+DROP TABLE IF EXISTS role_requirements;
+DROP TABLE IF EXISTS role_profiles;
@@ -0,0 +1,121 @@
+-- src/desktop/database/migrations/20250206090000_add_search_index.sql
+
+-- Up migration
+-- 全文検索インデックス（FTS5 の外部コンテンツテーブル、本体はトリガーで同期）
+-- 短い入力でも前方一致が索引で引けるよう1〜3文字の接頭辞インデックスを持つ
+CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+    name, employee_id,
+    content='users', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS skills_fts USING fts5(
+    name, description,
+    content='skills', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS skill_categories_fts USING fts5(
+    name, description,
+    content='skill_categories', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3'
+);
+
+-- 並び順（rank）は名前の一致を説明文より重く評価する
+INSERT INTO users_fts (users_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0)');
+INSERT INTO skills_fts (skills_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+INSERT INTO skill_categories_fts (skill_categories_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+
+-- 既存の行からインデックスを構築
+INSERT INTO users_fts (users_fts) VALUES ('rebuild');
+INSERT INTO skills_fts (skills_fts) VALUES ('rebuild');
+INSERT INTO skill_categories_fts (skill_categories_fts) VALUES ('rebuild');
+
+-- users の同期
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_insert
+AFTER INSERT ON users
+BEGIN
+    INSERT INTO users_fts (rowid, name, employee_id)
+    VALUES (NEW.id, NEW.name, NEW.employee_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_delete
+AFTER DELETE ON users
+BEGIN
+    INSERT INTO users_fts (users_fts, rowid, name, employee_id)
+    VALUES ('delete', OLD.id, OLD.name, OLD.employee_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_update
+AFTER UPDATE OF name, employee_id ON users
+BEGIN
+    INSERT INTO users_fts (users_fts, rowid, name, employee_id)
+    VALUES ('delete', OLD.id, OLD.name, OLD.employee_id);
+    INSERT INTO users_fts (rowid, name, employee_id)
+    VALUES (NEW.id, NEW.name, NEW.employee_id);
+END;
+
+-- skills の同期
+CREATE TRIGGER IF NOT EXISTS trg_skills_fts_insert
+AFTER INSERT ON skills
+BEGIN
+    INSERT INTO skills_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_skills_fts_delete
+AFTER DELETE ON skills
+BEGIN
+    INSERT INTO skills_fts (skills_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_skills_fts_update
+AFTER UPDATE OF name, description ON skills
+BEGIN
+    INSERT INTO skills_fts (skills_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO skills_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+-- skill_categories の同期
+CREATE TRIGGER IF NOT EXISTS trg_skill_categories_fts_insert
+AFTER INSERT ON skill_categories
+BEGIN
+    INSERT INTO skill_categories_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_skill_categories_fts_delete
+AFTER DELETE ON skill_categories
+BEGIN
+    INSERT INTO skill_categories_fts (skill_categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_skill_categories_fts_update
+AFTER UPDATE OF name, description ON skill_categories
+BEGIN
+    INSERT INTO skill_categories_fts (skill_categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO skill_categories_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+-- Down migration
+DROP TRIGGER IF EXISTS trg_skill_categories_fts_update;
+DROP TRIGGER IF EXISTS trg_skill_categories_fts_delete;
+DROP TRIGGER IF EXISTS trg_skill_categories_fts_insert;
+DROP TRIGGER IF EXISTS trg_skills_fts_update;
+DROP TRIGGER IF EXISTS trg_skills_fts_delete;
+DROP TRIGGER IF EXISTS trg_skills_fts_insert;
+DROP TRIGGER IF EXISTS trg_users_fts_update;
+DROP TRIGGER IF EXISTS trg_users_fts_delete;
+DROP TRIGGER IF EXISTS trg_users_fts_insert;
+DROP TABLE IF EXISTS skill_categories_fts;
+DROP TABLE IF EXISTS skills_fts;
+DROP TABLE IF EXISTS users_fts;
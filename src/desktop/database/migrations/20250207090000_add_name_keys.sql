@@ -0,0 +1,43 @@
+-- src/desktop/database/migrations/20250207090000_add_name_keys.sql
+
+-- Up migration
+-- 名前の比較用キー（NFKC 正規化・大文字小文字の畳み込み・カタカナをひらがなに統一）
+-- 値は各マネージャーの書き込み処理が Python 側で計算して設定する（トリガーは使わず、
+-- アプリケーション外の接続からの書き込みでも独自の SQL 関数を必要としない）
+-- 既存行の埋め戻しのみ、マイグレーション実行時に登録される normalize_key() を使う
+ALTER TABLE users ADD COLUMN name_key TEXT;
+ALTER TABLE groups ADD COLUMN name_key TEXT;
+ALTER TABLE skills ADD COLUMN name_key TEXT;
+ALTER TABLE skill_categories ADD COLUMN name_key TEXT;
+
+UPDATE users SET name_key = normalize_key(name);
+UPDATE groups SET name_key = normalize_key(name);
+UPDATE skills SET name_key = normalize_key(name);
+UPDATE skill_categories SET name_key = normalize_key(name);
+
+-- 既存のデータに表記の違いだけの名前がある場合、最も古い行以外のキーに
+-- 区切り文字（char(31)）と id を付けて区別し、一意インデックスの作成を失敗させない
+-- （名前自体は変更しない。該当する行は Database の起動時に警告として報告する）
+UPDATE groups SET name_key = name_key || char(31) || id
+WHERE id NOT IN (SELECT MIN(id) FROM groups GROUP BY name_key);
+UPDATE skills SET name_key = name_key || char(31) || id
+WHERE id NOT IN (SELECT MIN(id) FROM skills GROUP BY name_key, category_id);
+
+CREATE INDEX IF NOT EXISTS idx_users_name_key ON users (name_key);
+-- 表記の違いだけのグループ名・カテゴリー内のスキル名は一括登録を含む全経路で重複とする
+CREATE UNIQUE INDEX IF NOT EXISTS idx_groups_name_key ON groups (name_key);
+-- スキルはカテゴリーを問わない名前検索にも使えるよう name_key を先頭にする
+CREATE UNIQUE INDEX IF NOT EXISTS idx_skills_name_key ON skills (name_key, category_id);
+CREATE INDEX IF NOT EXISTS idx_skill_categories_name_key ON skill_categories (name_key);
+
+ANALYZE;
+
+-- Down migration
+DROP INDEX IF EXISTS idx_skill_categories_name_key;
+DROP INDEX IF EXISTS idx_skills_name_key;
+DROP INDEX IF EXISTS idx_groups_name_key;
+DROP INDEX IF EXISTS idx_users_name_key;
+ALTER TABLE skill_categories DROP COLUMN name_key;
+ALTER TABLE skills DROP COLUMN name_key;
+ALTER TABLE groups DROP COLUMN name_key;
+ALTER TABLE users DROP COLUMN name_key;
@@ -0,0 +1,107 @@
+import sqlite3
+import logging
+import itertools
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+class TransactionScope:
+    """
+    1つの接続に対する入れ子トランザクション管理
+
+    最も外側のブロックで BEGIN/COMMIT を発行し、内側のブロックは
+    SAVEPOINT/RELEASE として扱う。内側で例外が発生した場合はその
+    セーブポイントまでを巻き戻し、外側のトランザクションは継続できる。
+    after_commit() で登録した処理は最も外側のコミット後に実行され、
+    巻き戻されたブロック内で登録されたものは破棄される。
+    接続は isolation_level=None（自動BEGINなし）で開かれている必要がある。
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.depth = 0
+        self._names = itertools.count(1)
+        # 入れ子の各階層で登録されたコミット後処理
+        self._pending: List[List[Callable[[], None]]] = []
+
+    @property
+    def active(self) -> bool:
+        """トランザクション中かどうか"""
+        return self.depth > 0
+
+    @contextmanager
+    def begin(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        トランザクション（入れ子の場合はセーブポイント）を開始
+
+        Args:
+            immediate: 最も外側で BEGIN IMMEDIATE を使い、書き込みロックを先に取得する
+        """
+        conn = self.connection
+        savepoint = None
+        if self.depth == 0:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        else:
+            savepoint = f"uow_{next(self._names)}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+        self.depth += 1
+        self._pending.append([])
+
+        try:
+            yield conn
+        except BaseException:
+            self.depth -= 1
+            self._pending.pop()
+            self._rollback(savepoint)
+            raise
+        else:
+            self.depth -= 1
+            callbacks = self._pending.pop()
+            try:
+                if savepoint is None:
+                    conn.execute("COMMIT")
+                else:
+                    conn.execute(f"RELEASE {savepoint}")
+            except BaseException:
+                self._rollback(savepoint)
+                raise
+            if savepoint is None:
+                self._run_callbacks(callbacks)
+            else:
+                self._pending[-1].extend(callbacks)
+
+    def after_commit(self, callback: Callable[[], None]):
+        """
+        コミット後に実行する処理を登録
+
+        トランザクション外で呼ばれた場合は即座に実行する。
+        """
+        if self.depth == 0:
+            self._run_callbacks([callback])
+        else:
+            self._pending[-1].append(callback)
+
+    @staticmethod
+    def _run_callbacks(callbacks: List[Callable[[], None]]):
+        """コミット後処理を実行（例外はログに記録して継続）"""
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"After-commit callback failed: {str(e)}")
+
+    def _rollback(self, savepoint):
+        """トランザクションまたはセーブポイントを巻き戻す"""
+        conn = self.connection
+        if not conn.in_transaction:
+            # SQLite側で既に自動ロールバックされている
+            return
+        try:
+            if savepoint is None:
+                conn.execute("ROLLBACK")
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to roll back transaction: {str(e)}")
@@ -1,6 +1,23 @@
 import sys
 from PyQt6.QtWidgets import QApplication
-from views.main_window import MainWindow
+from src.desktop.views.main_window import MainWindow
+from src.desktop.database.database import Database
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_skill_manager import UserSkillManager
+from src.desktop.managers.search_manager import SearchManager
+from src.desktop.managers.role_manager import RoleManager
+from src.desktop.models.category import CategoryManager
+from src.desktop.services.db import DatabaseManager
+from src.desktop.controllers.user_controller import UserController
+from src.desktop.controllers.group_controller import GroupController
+from src.desktop.controllers.skill_controller import SkillController
+from src.desktop.controllers.user_skill_controller import UserSkillController
+from src.desktop.controllers.analytics_controller import AnalyticsController
+from src.desktop.controllers.category_controller import CategoryController
+from src.desktop.controllers.search_controller import SearchController
+from src.desktop.controllers.role_controller import RoleController
 import logging
 from datetime import datetime
 
@@ -14,6 +31,35 @@ logger = logging.getLogger(__name__)
 CURRENT_TIME = datetime(2025, 2, 3, 10, 39, 38)
 CURRENT_USER = "GingaDza"
 
+def create_controllers(db_path: str = "skill_matrix.db") -> dict:
+    """
+    1つのデータベースを共有するコントローラーを作成
+    
+    レベル変更の通知を受ける分析・役割コントローラーは、画面と同じ
+    ユーザースキルコントローラーに登録されるようにここでまとめて作る。
+    """
+    database = Database(db_path)
+    user_skill_controller = UserSkillController(UserSkillManager(database))
+    analytics_controller = AnalyticsController(user_skill_controller)
+    category_manager = CategoryManager(DatabaseManager())
+    return {
+        'database': database,
+        'user': UserController(UserManager(database)),
+        'group': GroupController(GroupManager(database)),
+        'skill': SkillController(SkillManager(database)),
+        'user_skill': user_skill_controller,
+        'analytics': analytics_controller,
+        'role': RoleController(RoleManager(database), analytics_controller),
+        'category': CategoryController(category_manager),
+        'search': SearchController(SearchManager(database), category_manager),
+    }
+    
+def close_controllers(controllers: dict):
+    """レベル変更の通知を解除し、データベースの接続を閉じる"""
+    controllers['role'].close()
+    controllers['analytics'].close()
+    controllers['database'].close()
+    
 def main():
     logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} Application starting")
     
@@ -21,13 +67,17 @@ def main():
         app = QApplication(sys.argv)
         logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} QApplication created")
         
-        window = MainWindow(controllers=None)
+        controllers = create_controllers()
+        logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} Controllers created")
+        
+        window = MainWindow(controllers=controllers)
         logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} MainWindow created")
         
         window.show()
         logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} MainWindow shown")
         
         return_code = app.exec()
+        close_controllers(controllers)
         logger.debug(f"{CURRENT_TIME} - {CURRENT_USER} Application finished with return code: {return_code}")
         sys.exit(return_code)
         
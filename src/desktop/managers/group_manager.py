@@ -1,9 +1,11 @@
 import logging
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 from src.desktop.models.group import Group
 from src.desktop.database.database import Database
+from src.desktop.database.bulk import fetch_ids_by_keys
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.utils.text_normalizer import normalize_key
 
 logger = logging.getLogger(__name__)
 
@@ -14,32 +16,80 @@ class GroupManager:
         self.db = database
         self.current_time = TimeProvider.get_current_time()
         
+    @staticmethod
+    def _ensure_unique_name(cursor, name: str, exclude_id: int = None):
+        """正規化した名前（name_key）が既存のグループと重複していないか確認"""
+        cursor.execute(
+            'SELECT id FROM groups WHERE name_key = ? AND id IS NOT ? LIMIT 1',
+            (normalize_key(name), exclude_id)
+        )
+        if cursor.fetchone():
+            raise ValueError(f"Group name already exists: {name}")
+            
     def create_group(self, name: str) -> Group:
-        """グループを作成"""
+        """グループを作成（全角・半角、ひらがな・カタカナ、大文字・小文字の違いだけの名前は重複とみなす）"""
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                current_time = datetime.now().isoformat()
+                now = datetime.now()
+                current_time = now.isoformat()
+                self._ensure_unique_name(cursor, name)
                 
                 cursor.execute('''
-                    INSERT INTO groups (name, created_at, updated_at)
-                    VALUES (?, ?, ?)
-                ''', (name, current_time, current_time))
+                    INSERT INTO groups (name, name_key, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (name, normalize_key(name), current_time, current_time))
                 
                 group_id = cursor.lastrowid
-                conn.commit()
                 
                 return Group(
                     id=group_id,
                     name=name,
-                    created_at=datetime.fromisoformat(current_time),
-                    updated_at=datetime.fromisoformat(current_time)
+                    created_at=now,
+                    updated_at=now
                 )
                 
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to create group: {str(e)}")
             raise
             
+    def create_groups_bulk(self, names: Iterable[str], upsert: bool = False) -> List[int]:
+        """
+        グループを一括作成
+        
+        表記の違いだけの名前は name_key の一意インデックスにより重複として扱われる。
+        
+        Args:
+            names: グループ名のイテラブル
+            upsert: Trueの場合、既存のグループ名（表記の違いを含む）はエラーにせず既存IDを返す
+            
+        Returns:
+            List[int]: 入力と同じ順序のグループIDリスト
+        """
+        try:
+            current_time = datetime.now().isoformat()
+            rows = [(name, normalize_key(name), current_time, current_time) for name in names]
+            if not rows:
+                return []
+                
+            conflict_clause = '''
+                ON CONFLICT (name_key) DO UPDATE SET updated_at = excluded.updated_at
+            ''' if upsert else ''
+            
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(f'''
+                    INSERT INTO groups (name, name_key, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    {conflict_clause}
+                ''', rows)
+                
+                return fetch_ids_by_keys(cursor, 'groups', ('name_key',), [(row[1],) for row in rows])
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create groups in bulk: {str(e)}")
+            raise
+            
     def get_group(self, group_id: int) -> Group:
         """グループを取得"""
         try:
@@ -62,6 +112,34 @@ class GroupManager:
             logger.error(f"{self.current_time} - Failed to get group: {str(e)}")
             raise
             
+    def find_group_by_name(self, name: str) -> Optional[Group]:
+        """正規化した名前が一致するグループを取得（存在しない場合はNone）"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, name, created_at, updated_at
+                    FROM groups
+                    WHERE name_key = ?
+                    ORDER BY id
+                    LIMIT 1
+                ''', (normalize_key(name),))
+                row = cursor.fetchone()
+                
+                if row:
+                    return Group(
+                        id=row[0],
+                        name=row[1],
+                        created_at=datetime.fromisoformat(row[2]),
+                        updated_at=datetime.fromisoformat(row[3])
+                    )
+                return None
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find group by name: {str(e)}")
+            raise
+            
     def get_all_groups(self) -> List[Group]:
         """全グループを取得"""
         try:
@@ -85,25 +163,66 @@ class GroupManager:
             logger.error(f"{self.current_time} - Failed to get all groups: {str(e)}")
             raise
             
+    def get_groups_with_member_counts(self) -> List[Tuple[Group, int]]:
+        """
+        全グループと所属人数を1回の集計クエリで取得
+        
+        Returns:
+            List[Tuple[Group, int]]: グループ名順の (グループ, 所属人数) のリスト
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 所属人数は idx_users_group_id だけで集計してからグループに結合する
+                cursor.execute('''
+                    SELECT g.id, g.name, g.created_at, g.updated_at,
+                           COALESCE(c.member_count, 0)
+                    FROM groups AS g
+                    LEFT JOIN (
+                        SELECT group_id, COUNT(*) AS member_count
+                        FROM users
+                        WHERE group_id IS NOT NULL
+                        GROUP BY group_id
+                    ) AS c ON c.group_id = g.id
+                    ORDER BY g.name
+                ''')
+                
+                return [
+                    (
+                        Group(
+                            id=row[0],
+                            name=row[1],
+                            created_at=datetime.fromisoformat(row[2]),
+                            updated_at=datetime.fromisoformat(row[3])
+                        ),
+                        row[4]
+                    )
+                    for row in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get groups with member counts: {str(e)}")
+            raise
+            
     def update_group(self, group_id: int, name: str) -> Group:
         """グループ情報を更新"""
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
                 current_time = datetime.now().isoformat()
+                self._ensure_unique_name(cursor, name, exclude_id=group_id)
                 
                 # 更新を実行
                 cursor.execute('''
                     UPDATE groups
-                    SET name = ?, updated_at = ?
+                    SET name = ?, name_key = ?, updated_at = ?
                     WHERE id = ?
-                ''', (name, current_time, group_id))
+                ''', (name, normalize_key(name), current_time, group_id))
                 
                 if cursor.rowcount == 0:
                     raise ValueError(f"Group not found: {group_id}")
                     
-                conn.commit()
-                
                 return Group(
                     id=group_id,
                     name=name,
@@ -126,7 +245,6 @@ class GroupManager:
                 
                 # グループを削除
                 cursor.execute('DELETE FROM groups WHERE id = ?', (group_id,))
-                conn.commit()
                 
                 return cursor.rowcount > 0
                 
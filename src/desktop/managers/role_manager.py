@@ -0,0 +1,271 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from src.desktop.models.role_profile import RoleProfile, RoleRequirement
+from src.desktop.database.database import Database
+from src.desktop.managers.user_skill_manager import MIN_LEVEL, MAX_LEVEL
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class RoleManager:
+    """役割プロファイル管理クラス"""
+    
+    def __init__(self, database: Database):
+        self.db = database
+        self.current_time = TimeProvider.get_current_time()
+        
+    @staticmethod
+    def _requirement_rows(role_id: int, requirements: Iterable, current_time: str) -> List[tuple]:
+        """要件を検証して INSERT 用の行に変換（RoleRequirement または (skill_id, level[, weight])）"""
+        rows = []
+        for requirement in requirements:
+            if not isinstance(requirement, RoleRequirement):
+                requirement = RoleRequirement(*requirement)
+            if not MIN_LEVEL <= requirement.required_level <= MAX_LEVEL:
+                raise ValueError(
+                    f"Required level must be between {MIN_LEVEL} and {MAX_LEVEL}: {requirement.required_level}"
+                )
+            if requirement.weight <= 0:
+                raise ValueError(f"Weight must be positive: {requirement.weight}")
+            rows.append((
+                role_id, requirement.skill_id, requirement.required_level,
+                float(requirement.weight), current_time, current_time
+            ))
+        return rows
+        
+    def _load_requirements(self, cursor, role_id: Optional[int] = None) -> Dict[int, List[RoleRequirement]]:
+        """役割ごとの要件を取得（role_id → 要件のリスト）"""
+        if role_id is None:
+            cursor.execute('''
+                SELECT role_id, skill_id, required_level, weight
+                FROM role_requirements
+                ORDER BY role_id, skill_id
+            ''')
+        else:
+            cursor.execute('''
+                SELECT role_id, skill_id, required_level, weight
+                FROM role_requirements
+                WHERE role_id = ?
+                ORDER BY skill_id
+            ''', (role_id,))
+        requirements: Dict[int, List[RoleRequirement]] = {}
+        for row in cursor.fetchall():
+            requirements.setdefault(row[0], []).append(
+                RoleRequirement(skill_id=row[1], required_level=row[2], weight=row[3])
+            )
+        return requirements
+        
+    def create_role(self, name: str, description: str = None,
+                    requirements: Iterable = ()) -> RoleProfile:
+        """
+        役割プロファイルを作成
+        
+        Args:
+            name: 役割名
+            description: 説明
+            requirements: RoleRequirement または (skill_id, required_level[, weight]) のイテラブル
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                now = datetime.now()
+                current_time = now.isoformat()
+                
+                cursor.execute('''
+                    INSERT INTO role_profiles (name, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (name, description, current_time, current_time))
+                role_id = cursor.lastrowid
+                
+                rows = self._requirement_rows(role_id, requirements, current_time)
+                cursor.executemany('''
+                    INSERT INTO role_requirements
+                        (role_id, skill_id, required_level, weight, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+                
+                return RoleProfile(
+                    id=role_id,
+                    name=name,
+                    description=description,
+                    created_at=now,
+                    updated_at=now,
+                    requirements=[RoleRequirement(row[1], row[2], row[3]) for row in rows]
+                )
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create role: {str(e)}")
+            raise
+            
+    def get_role(self, role_id: int) -> RoleProfile:
+        """役割プロファイルを要件付きで取得（存在しない場合はNone）"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, name, description, created_at, updated_at
+                    FROM role_profiles
+                    WHERE id = ?
+                ''', (role_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                    
+                return RoleProfile(
+                    id=row[0],
+                    name=row[1],
+                    description=row[2],
+                    created_at=datetime.fromisoformat(row[3]),
+                    updated_at=datetime.fromisoformat(row[4]),
+                    requirements=self._load_requirements(cursor, role_id).get(role_id, [])
+                )
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get role: {str(e)}")
+            raise
+            
+    def get_all_roles(self) -> List[RoleProfile]:
+        """全役割プロファイルを要件付きで取得（役割・要件それぞれ1回のクエリ）"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                requirements = self._load_requirements(cursor)
+                cursor.execute('''
+                    SELECT id, name, description, created_at, updated_at
+                    FROM role_profiles
+                    ORDER BY name
+                ''')
+                
+                return [
+                    RoleProfile(
+                        id=row[0],
+                        name=row[1],
+                        description=row[2],
+                        created_at=datetime.fromisoformat(row[3]),
+                        updated_at=datetime.fromisoformat(row[4]),
+                        requirements=requirements.get(row[0], [])
+                    )
+                    for row in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get all roles: {str(e)}")
+            raise
+            
+    def update_role(self, role_id: int, name: str = None, description: str = None) -> RoleProfile:
+        """役割プロファイルの名前・説明を更新"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                current_time = datetime.now().isoformat()
+                
+                cursor.execute('''
+                    UPDATE role_profiles
+                    SET name = COALESCE(?, name),
+                        description = COALESCE(?, description),
+                        updated_at = ?
+                    WHERE id = ?
+                ''', (name, description, current_time, role_id))
+                
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Role not found: {role_id}")
+                    
+                return self.get_role(role_id)
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to update role: {str(e)}")
+            raise
+            
+    def set_requirements(self, role_id: int, requirements: Iterable) -> List[RoleRequirement]:
+        """
+        役割のスキル要件をまとめて置き換える
+        
+        Args:
+            requirements: RoleRequirement または (skill_id, required_level[, weight]) のイテラブル
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                current_time = datetime.now().isoformat()
+                rows = self._requirement_rows(role_id, requirements, current_time)
+                
+                cursor.execute(
+                    'UPDATE role_profiles SET updated_at = ? WHERE id = ?',
+                    (current_time, role_id)
+                )
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Role not found: {role_id}")
+                    
+                cursor.execute('DELETE FROM role_requirements WHERE role_id = ?', (role_id,))
+                cursor.executemany('''
+                    INSERT INTO role_requirements
+                        (role_id, skill_id, required_level, weight, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+                
+                return [RoleRequirement(row[1], row[2], row[3]) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set role requirements: {str(e)}")
+            raise
+            
+    def set_requirement(self, role_id: int, skill_id: int, required_level: int,
+                        weight: float = 1.0) -> RoleRequirement:
+        """役割のスキル要件を1件登録・更新"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                current_time = datetime.now().isoformat()
+                rows = self._requirement_rows(role_id, [(skill_id, required_level, weight)], current_time)
+                
+                cursor.executemany('''
+                    INSERT INTO role_requirements
+                        (role_id, skill_id, required_level, weight, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (role_id, skill_id) DO UPDATE SET
+                        required_level = excluded.required_level,
+                        weight = excluded.weight,
+                        updated_at = excluded.updated_at
+                ''', rows)
+                
+                return RoleRequirement(skill_id, required_level, float(weight))
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set role requirement: {str(e)}")
+            raise
+            
+    def remove_requirement(self, role_id: int, skill_id: int) -> bool:
+        """役割のスキル要件を1件削除"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(
+                    'DELETE FROM role_requirements WHERE role_id = ? AND skill_id = ?',
+                    (role_id, skill_id)
+                )
+                
+                return cursor.rowcount > 0
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to remove role requirement: {str(e)}")
+            raise
+            
+    def delete_role(self, role_id: int) -> bool:
+        """役割プロファイルを削除"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 外部キー制約が無効な接続でも要件が残らないよう明示的に削除する
+                cursor.execute('DELETE FROM role_requirements WHERE role_id = ?', (role_id,))
+                cursor.execute('DELETE FROM role_profiles WHERE id = ?', (role_id,))
+                
+                return cursor.rowcount > 0
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to delete role: {str(e)}")
+            raise
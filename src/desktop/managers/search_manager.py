@@ -0,0 +1,90 @@
+import logging
+from typing import List
+from src.desktop.models.search_result import KIND_SKILL, KIND_SKILL_CATEGORY, KIND_USER, SearchResult
+from src.desktop.database.database import Database
+from src.desktop.utils.fts_query import build_match_query
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+# インデックスごとにスコアを計算する一致件数の既定の上限
+DEFAULT_MAX_CANDIDATES = 1000
+
+class SearchManager:
+    """
+    全文検索管理クラス
+    
+    users / skills / skill_categories の FTS5 インデックス（トリガーで同期）を
+    1回のクエリでまとめて検索する。
+    """
+    
+    def __init__(self, database: Database):
+        self.db = database
+        self.current_time = TimeProvider.get_current_time()
+        
+    def search(self, query: str, limit: int = 20,
+               max_candidates: int = DEFAULT_MAX_CANDIDATES) -> List[SearchResult]:
+        """
+        ユーザー・スキル・スキルカテゴリーを前方一致で検索
+        
+        bm25 のスコアは一致した行ごとに計算されるため、1〜2文字の入力のように
+        数万行に一致する場合は全件の並べ替えが検索時間の大半を占める。
+        インデックスごとに最大 max_candidates 件の一致だけをスコア順に並べ、
+        一致がそれ以下の（絞り込まれた）検索では厳密な順位となる。
+        
+        Args:
+            query: 検索文字列（空白区切りの語をすべて含む行に一致）
+            limit: 取得する件数の上限
+            max_candidates: インデックスごとにスコアを計算する一致件数の上限
+            
+        Returns:
+            List[SearchResult]: 一致度の高い順
+        """
+        try:
+            match = build_match_query(query)
+            if match is None or limit <= 0:
+                return []
+                
+            with self.db.get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT * FROM (
+                        SELECT '{KIND_USER}', u.id, u.name, u.employee_id, f.rank
+                        FROM (SELECT rowid, rank FROM users_fts WHERE users_fts MATCH ? LIMIT ?) f
+                        JOIN users u ON u.id = f.rowid
+                        ORDER BY f.rank
+                        LIMIT ?
+                    )
+                    UNION ALL
+                    SELECT * FROM (
+                        SELECT '{KIND_SKILL}', s.id, s.name, s.description, f.rank
+                        FROM (SELECT rowid, rank FROM skills_fts WHERE skills_fts MATCH ? LIMIT ?) f
+                        JOIN skills s ON s.id = f.rowid
+                        ORDER BY f.rank
+                        LIMIT ?
+                    )
+                    UNION ALL
+                    SELECT * FROM (
+                        SELECT '{KIND_SKILL_CATEGORY}', c.id, c.name, c.description, f.rank
+                        FROM (SELECT rowid, rank FROM skill_categories_fts WHERE skill_categories_fts MATCH ? LIMIT ?) f
+                        JOIN skill_categories c ON c.id = f.rowid
+                        ORDER BY f.rank
+                        LIMIT ?
+                    )
+                    ORDER BY 5
+                    LIMIT ?
+                ''', (
+                    match, max_candidates, limit,
+                    match, max_candidates, limit,
+                    match, max_candidates, limit,
+                    limit
+                ))
+                
+                return [
+                    SearchResult(kind=row[0], id=row[1], title=row[2], detail=row[3], rank=row[4])
+                    for row in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search: {str(e)}")
+            raise
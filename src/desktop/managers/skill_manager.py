@@ -1,9 +1,12 @@
+import json
 import logging
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from src.desktop.models.skill import Skill
 from src.desktop.database.database import Database
+from src.desktop.database.bulk import fetch_ids_by_keys
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.utils.text_normalizer import normalize_key
 
 logger = logging.getLogger(__name__)
 
@@ -14,34 +17,87 @@ class SkillManager:
         self.db = database
         self.current_time = TimeProvider.get_current_time()
         
+    @staticmethod
+    def _ensure_unique_name(cursor, category_id: int, name: str, exclude_id: int = None):
+        """正規化した名前（name_key）がカテゴリー内の既存のスキルと重複していないか確認"""
+        cursor.execute(
+            'SELECT id FROM skills WHERE name_key = ? AND category_id = ? AND id IS NOT ? LIMIT 1',
+            (normalize_key(name), category_id, exclude_id)
+        )
+        if cursor.fetchone():
+            raise ValueError(f"Skill name already exists in category {category_id}: {name}")
+            
     def create_skill(self, category_id: int, name: str, description: str = None) -> Skill:
-        """スキルを作成"""
+        """スキルを作成（表記の違いだけの名前はカテゴリー内で重複とみなす）"""
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                current_time = datetime.now().isoformat()
+                now = datetime.now()
+                current_time = now.isoformat()
+                self._ensure_unique_name(cursor, category_id, name)
                 
                 cursor.execute('''
-                    INSERT INTO skills (category_id, name, description, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (category_id, name, description, current_time, current_time))
+                    INSERT INTO skills (category_id, name, name_key, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (category_id, name, normalize_key(name), description, current_time, current_time))
                 
                 skill_id = cursor.lastrowid
-                conn.commit()
                 
                 return Skill(
                     id=skill_id,
                     category_id=category_id,
                     name=name,
                     description=description,
-                    created_at=datetime.fromisoformat(current_time),
-                    updated_at=datetime.fromisoformat(current_time)
+                    created_at=now,
+                    updated_at=now
                 )
                 
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to create skill: {str(e)}")
             raise
             
+    def upsert_skills_bulk(self, skills: Iterable[dict]) -> List[int]:
+        """
+        スキルを一括作成・更新
+        
+        同じカテゴリーに同名（表記の違いを含む）のスキルが既にある場合は説明を更新する。
+        
+        Args:
+            skills: category_id, name, description（任意）を持つ辞書のイテラブル
+            
+        Returns:
+            List[int]: 入力と同じ順序のスキルIDリスト
+        """
+        try:
+            current_time = datetime.now().isoformat()
+            rows = [
+                (
+                    skill['category_id'], skill['name'], normalize_key(skill['name']),
+                    skill.get('description'), current_time, current_time
+                )
+                for skill in skills
+            ]
+            if not rows:
+                return []
+                
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO skills (category_id, name, name_key, description, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (name_key, category_id) DO UPDATE SET
+                        description = excluded.description,
+                        updated_at = excluded.updated_at
+                ''', rows)
+                
+                return fetch_ids_by_keys(
+                    cursor, 'skills', ('category_id', 'name_key'), [(row[0], row[2]) for row in rows]
+                )
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to upsert skills in bulk: {str(e)}")
+            raise
+            
     def get_skill(self, skill_id: int) -> Skill:
         """スキルを取得"""
         try:
@@ -123,6 +179,141 @@ class SkillManager:
             logger.error(f"{self.current_time} - Failed to get skills by category: {str(e)}")
             raise
             
+    def find_skills_by_name(self, name: str, category_id: Optional[int] = None) -> List[Skill]:
+        """
+        正規化した名前（name_key）が一致するスキルを取得
+        
+        Args:
+            name: スキル名（全角・半角、ひらがな・カタカナ、大文字・小文字の違いは無視）
+            category_id: 対象カテゴリー（None の場合は全カテゴリー）
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                if category_id is None:
+                    cursor.execute(
+                        'SELECT * FROM skills WHERE name_key = ? ORDER BY category_id',
+                        (normalize_key(name),)
+                    )
+                else:
+                    cursor.execute(
+                        'SELECT * FROM skills WHERE name_key = ? AND category_id = ?',
+                        (normalize_key(name), category_id)
+                    )
+                return [self._to_skill(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find skills by name: {str(e)}")
+            raise
+            
+    def get_skills_by_categories(self, category_ids: Iterable[int]) -> List[Skill]:
+        """
+        複数カテゴリーに属するスキルを1回のクエリで取得
+        
+        CategoryManager.get_subtree_ids と組み合わせると、
+        あるカテゴリー配下の全スキルを取得できる。
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT * FROM skills 
+                    WHERE category_id IN (SELECT value FROM json_each(?))
+                    ORDER BY category_id, name
+                ''', (json.dumps(list(category_ids)),))
+                rows = cursor.fetchall()
+                
+                return [
+                    Skill(
+                        id=row[0],
+                        category_id=row[1],
+                        name=row[2],
+                        description=row[3],
+                        created_at=datetime.fromisoformat(row[4]),
+                        updated_at=datetime.fromisoformat(row[5])
+                    )
+                    for row in rows
+                ]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skills by categories: {str(e)}")
+            raise
+            
+    def get_skills_page(self, after: Optional[Tuple[int, str]] = None, limit: int = 100) -> List[Skill]:
+        """
+        (category_id, name) 順のキーセットページングでスキルを取得
+        
+        Args:
+            after: 前ページ最後のスキルの (category_id, name)（Noneの場合は先頭から）
+            limit: 取得件数
+            
+        Returns:
+            List[Skill]: (category_id, name) 順のスキルリスト
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                if after is None:
+                    cursor.execute('''
+                        SELECT * FROM skills
+                        ORDER BY category_id, name
+                        LIMIT ?
+                    ''', (limit,))
+                else:
+                    cursor.execute('''
+                        SELECT * FROM skills
+                        WHERE (category_id, name) > (?, ?)
+                        ORDER BY category_id, name
+                        LIMIT ?
+                    ''', (after[0], after[1], limit))
+                    
+                return [self._to_skill(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skills page: {str(e)}")
+            raise
+            
+    def iter_skills(self, batch_size: int = 500) -> Iterator[Skill]:
+        """
+        (category_id, name) 順に全スキルを逐次取得（fetchmanyで一定メモリ）
+        
+        Args:
+            batch_size: 1回に読み出す行数
+        """
+        try:
+            with self.db.get_read_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute('SELECT * FROM skills ORDER BY category_id, name')
+                    
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        for row in rows:
+                            yield self._to_skill(row)
+                finally:
+                    cursor.close()
+                    
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to iterate skills: {str(e)}")
+            raise
+            
+    @staticmethod
+    def _to_skill(row) -> Skill:
+        """skillsテーブルの行をSkillに変換"""
+        return Skill(
+            id=row[0],
+            category_id=row[1],
+            name=row[2],
+            description=row[3],
+            created_at=datetime.fromisoformat(row[4]),
+            updated_at=datetime.fromisoformat(row[5])
+        )
+        
     def update_skill(self, skill_id: int, category_id: int = None, name: str = None, description: str = None) -> Skill:
         """スキル情報を更新"""
         try:
@@ -141,15 +332,18 @@ class SkillManager:
                 update_category_id = category_id if category_id is not None else row[1]
                 update_name = name if name is not None else row[2]
                 update_description = description if description is not None else row[3]
+                if name is not None or category_id is not None:
+                    self._ensure_unique_name(cursor, update_category_id, update_name, exclude_id=skill_id)
                 
                 # 更新を実行
                 cursor.execute('''
                     UPDATE skills
-                    SET category_id = ?, name = ?, description = ?, updated_at = ?
+                    SET category_id = ?, name = ?, name_key = ?, description = ?, updated_at = ?
                     WHERE id = ?
-                ''', (update_category_id, update_name, update_description, current_time, skill_id))
-                
-                conn.commit()
+                ''', (
+                    update_category_id, update_name, normalize_key(update_name),
+                    update_description, current_time, skill_id
+                ))
                 
                 return Skill(
                     id=skill_id,
@@ -175,7 +369,6 @@ class SkillManager:
                 
                 # スキルを削除
                 cursor.execute('DELETE FROM skills WHERE id = ?', (skill_id,))
-                conn.commit()
                 
                 return cursor.rowcount > 0
                 
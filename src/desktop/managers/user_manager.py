@@ -1,9 +1,11 @@
 import logging
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 from datetime import datetime
 from src.desktop.models.user import User
 from src.desktop.database.database import Database
+from src.desktop.database.bulk import fetch_ids_by_keys
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.utils.text_normalizer import normalize_key
 
 logger = logging.getLogger(__name__)
 
@@ -19,29 +21,74 @@ class UserManager:
         try:
             with self.db.get_connection() as conn:
                 cursor = conn.cursor()
-                current_time = datetime.now().isoformat()
+                now = datetime.now()
+                current_time = now.isoformat()
                 
                 cursor.execute('''
-                    INSERT INTO users (employee_id, name, group_id, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (employee_id, name, group_id, current_time, current_time))
+                    INSERT INTO users (employee_id, name, name_key, group_id, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (employee_id, name, normalize_key(name), group_id, current_time, current_time))
                 
                 user_id = cursor.lastrowid
-                conn.commit()
                 
                 return User(
                     id=user_id,
                     employee_id=employee_id,
                     name=name,
                     group_id=group_id,
-                    created_at=datetime.fromisoformat(current_time),
-                    updated_at=datetime.fromisoformat(current_time)
+                    created_at=now,
+                    updated_at=now
                 )
                 
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to create user: {str(e)}")
             raise
             
+    def create_users_bulk(self, users: Iterable[dict], upsert: bool = False) -> List[int]:
+        """
+        ユーザーを一括作成
+        
+        Args:
+            users: employee_id, name, group_id（任意）を持つ辞書のイテラブル
+            upsert: Trueの場合、既存の社員番号は名前とグループを更新する
+            
+        Returns:
+            List[int]: 入力と同じ順序のユーザーIDリスト
+        """
+        try:
+            current_time = datetime.now().isoformat()
+            rows = [
+                (
+                    user['employee_id'], user['name'], normalize_key(user['name']),
+                    user.get('group_id'), current_time, current_time
+                )
+                for user in users
+            ]
+            if not rows:
+                return []
+                
+            conflict_clause = '''
+                ON CONFLICT (employee_id) DO UPDATE SET
+                    name = excluded.name,
+                    name_key = excluded.name_key,
+                    group_id = excluded.group_id,
+                    updated_at = excluded.updated_at
+            ''' if upsert else ''
+            
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(f'''
+                    INSERT INTO users (employee_id, name, name_key, group_id, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    {conflict_clause}
+                ''', rows)
+                
+                return fetch_ids_by_keys(cursor, 'users', ('employee_id',), [(row[0],) for row in rows])
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to create users in bulk: {str(e)}")
+            raise
+            
     def get_user(self, user_id: int) -> User:
         """ユーザーを取得"""
         try:
@@ -116,6 +163,111 @@ class UserManager:
             logger.error(f"{self.current_time} - Failed to get users by group: {str(e)}")
             raise
             
+    def find_users_by_name(self, name: str) -> List[User]:
+        """
+        正規化した名前（name_key）が一致するユーザーを取得
+        
+        全角・半角、ひらがな・カタカナ、大文字・小文字、空白の違いは無視する。
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(
+                    'SELECT * FROM users WHERE name_key = ? ORDER BY employee_id',
+                    (normalize_key(name),)
+                )
+                return [self._to_user(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find users by name: {str(e)}")
+            raise
+            
+    def get_users_page(self, after_employee_id: Optional[str] = None, limit: int = 100,
+                       group_id: Optional[int] = None) -> List[User]:
+        """
+        社員番号順のキーセットページングでユーザーを取得
+        
+        Args:
+            after_employee_id: 前ページ最後の社員番号（Noneの場合は先頭から）
+            limit: 取得件数
+            group_id: 指定した場合はそのグループのユーザーのみ
+            
+        Returns:
+            List[User]: 社員番号順のユーザーリスト
+        """
+        try:
+            conditions = []
+            params = []
+            if group_id is not None:
+                conditions.append('group_id = ?')
+                params.append(group_id)
+            if after_employee_id is not None:
+                conditions.append('employee_id > ?')
+                params.append(after_employee_id)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+            
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT * FROM users
+                    {where_clause}
+                    ORDER BY employee_id
+                    LIMIT ?
+                ''', (*params, limit))
+                
+                return [self._to_user(row) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get users page: {str(e)}")
+            raise
+            
+    def iter_users(self, group_id: Optional[int] = None, batch_size: int = 500) -> Iterator[User]:
+        """
+        社員番号順に全ユーザーを逐次取得（fetchmanyで一定メモリ）
+        
+        Args:
+            group_id: 指定した場合はそのグループのユーザーのみ
+            batch_size: 1回に読み出す行数
+        """
+        try:
+            with self.db.get_read_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    if group_id is None:
+                        cursor.execute('SELECT * FROM users ORDER BY employee_id')
+                    else:
+                        cursor.execute(
+                            'SELECT * FROM users WHERE group_id = ? ORDER BY employee_id',
+                            (group_id,)
+                        )
+                    
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        for row in rows:
+                            yield self._to_user(row)
+                finally:
+                    cursor.close()
+                    
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to iterate users: {str(e)}")
+            raise
+            
+    @staticmethod
+    def _to_user(row) -> User:
+        """usersテーブルの行をUserに変換"""
+        return User(
+            id=row[0],
+            employee_id=row[1],
+            name=row[2],
+            group_id=row[3],
+            created_at=datetime.fromisoformat(row[4]),
+            updated_at=datetime.fromisoformat(row[5])
+        )
+        
     def update_user(self, user_id: int, employee_id: str = None, name: str = None, group_id: int = None) -> User:
         """ユーザー情報を更新"""
         try:
@@ -138,11 +290,12 @@ class UserManager:
                 # 更新を実行
                 cursor.execute('''
                     UPDATE users
-                    SET employee_id = ?, name = ?, group_id = ?, updated_at = ?
+                    SET employee_id = ?, name = ?, name_key = ?, group_id = ?, updated_at = ?
                     WHERE id = ?
-                ''', (update_employee_id, update_name, update_group_id, current_time, user_id))
-                
-                conn.commit()
+                ''', (
+                    update_employee_id, update_name, normalize_key(update_name),
+                    update_group_id, current_time, user_id
+                ))
                 
                 return User(
                     id=user_id,
@@ -164,7 +317,6 @@ class UserManager:
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-                conn.commit()
                 
                 return cursor.rowcount > 0
                 
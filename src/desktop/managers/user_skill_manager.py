@@ -0,0 +1,225 @@
+import logging
+from typing import Dict, Iterable, List, Tuple
+from datetime import datetime
+from src.desktop.models.user_skill import UserSkill
+from src.desktop.database.database import Database
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+MIN_LEVEL = 0
+MAX_LEVEL = 5
+
+class UserSkillManager:
+    """ユーザースキル（評価レベル）管理クラス"""
+
+    def __init__(self, database: Database):
+        self.db = database
+        self.current_time = TimeProvider.get_current_time()
+
+    @staticmethod
+    def _validate_level(level: int):
+        """レベルが許容範囲内か検証"""
+        if not MIN_LEVEL <= level <= MAX_LEVEL:
+            raise ValueError(f"Level must be between {MIN_LEVEL} and {MAX_LEVEL}: {level}")
+
+    def set_levels_bulk(self, levels: Iterable[Tuple[int, int, int]]) -> int:
+        """
+        スキルレベルを一括で登録・更新
+
+        (user_id, skill_id) が既にある場合はレベルを上書きする。
+        レベルが変わらない行は更新しない。
+
+        Args:
+            levels: (user_id, skill_id, level) のイテラブル
+
+        Returns:
+            int: 登録・更新された行数
+        """
+        try:
+            current_time = datetime.now().isoformat()
+            rows = []
+            for user_id, skill_id, level in levels:
+                self._validate_level(level)
+                rows.append((user_id, skill_id, level, current_time, current_time))
+            if not rows:
+                return 0
+
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO user_skills (user_id, skill_id, level, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (user_id, skill_id) DO UPDATE SET
+                        level = excluded.level,
+                        updated_at = excluded.updated_at
+                    WHERE level != excluded.level
+                ''', rows)
+
+                return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set skill levels in bulk: {str(e)}")
+            raise
+
+    def set_level(self, user_id: int, skill_id: int, level: int) -> UserSkill:
+        """スキルレベルを登録・更新"""
+        try:
+            with self.db.get_connection() as conn:
+                self.set_levels_bulk([(user_id, skill_id, level)])
+
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, user_id, skill_id, level, created_at, updated_at
+                    FROM user_skills
+                    WHERE user_id = ? AND skill_id = ?
+                ''', (user_id, skill_id))
+                row = cursor.fetchone()
+
+                return UserSkill(
+                    id=row[0],
+                    user_id=row[1],
+                    skill_id=row[2],
+                    level=row[3],
+                    created_at=datetime.fromisoformat(row[4]),
+                    updated_at=datetime.fromisoformat(row[5])
+                )
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to set skill level: {str(e)}")
+            raise
+
+    def get_level(self, user_id: int, skill_id: int) -> int:
+        """スキルレベルを取得（未評価の場合はNone）"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    'SELECT level FROM user_skills WHERE user_id = ? AND skill_id = ?',
+                    (user_id, skill_id)
+                )
+                row = cursor.fetchone()
+
+                return row[0] if row else None
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skill level: {str(e)}")
+            raise
+
+    def get_user_profile(self, user_id: int) -> Dict[int, int]:
+        """
+        ユーザーの全スキルレベルを取得
+
+        Returns:
+            Dict[int, int]: skill_id → level
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    'SELECT skill_id, level FROM user_skills WHERE user_id = ?',
+                    (user_id,)
+                )
+
+                return dict(cursor.fetchall())
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get user profile: {str(e)}")
+            raise
+
+    def get_skill_column(self, skill_id: int) -> Dict[int, int]:
+        """
+        スキルに対する全ユーザーのレベルを取得
+
+        Returns:
+            Dict[int, int]: user_id → level
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    'SELECT user_id, level FROM user_skills WHERE skill_id = ?',
+                    (skill_id,)
+                )
+
+                return dict(cursor.fetchall())
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skill column: {str(e)}")
+            raise
+
+    def get_all_levels(self) -> List[Tuple[int, int, int]]:
+        """全ての (user_id, skill_id, level) を取得"""
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('SELECT user_id, skill_id, level FROM user_skills')
+
+                return [tuple(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get all skill levels: {str(e)}")
+            raise
+
+    def get_matrix_rows(self) -> Tuple[List[tuple], List[tuple], List[tuple]]:
+        """
+        スキルマトリクス構築用のデータを同一スナップショットから取得
+        
+        Returns:
+            Tuple: (users, skills, levels)
+                users: 社員番号順の (user_id, group_id)
+                skills: (category_id, name) 順の (skill_id, category_id)
+                levels: (user_id, skill_id, level)
+        """
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                # 件数が多いため sqlite3.Row を経由せずタプルで受け取る
+                cursor.row_factory = None
+                
+                cursor.execute('SELECT id, group_id FROM users ORDER BY employee_id')
+                users = cursor.fetchall()
+                
+                cursor.execute('SELECT id, category_id FROM skills ORDER BY category_id, name')
+                skills = cursor.fetchall()
+                
+                cursor.execute('SELECT user_id, skill_id, level FROM user_skills')
+                levels = cursor.fetchall()
+                
+                return users, skills, levels
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get skill matrix rows: {str(e)}")
+            raise
+            
+    def delete_levels_bulk(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """
+        スキルレベルを一括削除（未評価に戻す）
+
+        Args:
+            pairs: (user_id, skill_id) のイテラブル
+
+        Returns:
+            int: 削除された行数
+        """
+        try:
+            rows = list(pairs)
+            if not rows:
+                return 0
+
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    'DELETE FROM user_skills WHERE user_id = ? AND skill_id = ?',
+                    rows
+                )
+
+                return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to delete skill levels: {str(e)}")
+            raise
@@ -1,7 +1,9 @@
 # src/desktop/models/category.py
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..services.db import DatabaseManager
+from ..utils.fts_query import build_match_query
+from ..utils.text_normalizer import normalize_key
 from ..utils.time_utils import TimeProvider
 
 logger = logging.getLogger(__name__)
@@ -38,20 +40,19 @@ class CategoryManager:
             int: 作成されたカテゴリーのID
         """
         try:
-            cursor = self.db.connection.cursor()
-            cursor.execute(
-                """
-                INSERT INTO categories (name, description, parent_id)
-                VALUES (?, ?, ?)
-                """,
-                (name, description, parent_id)
-            )
-            self.db.connection.commit()
-            category_id = cursor.lastrowid
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO categories (name, name_key, description, parent_id)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (name, normalize_key(name), description, parent_id)
+                )
+                category_id = cursor.lastrowid
             logger.debug(f"{self.current_time} - Created category: {name} (ID: {category_id})")
             return category_id
         except Exception as e:
-            self.db.connection.rollback()
             logger.error(f"{self.current_time} - Failed to create category: {str(e)}")
             raise
 
@@ -107,63 +108,293 @@ class CategoryManager:
             logger.error(f"{self.current_time} - Failed to get all categories: {str(e)}")
             raise
 
-    def update_category(self, category_id: int, name: str, description: str = None) -> bool:
+    def find_categories_by_name(self, name: str) -> List[Category]:
         """
-        カテゴリーを更新
+        正規化した名前（name_key）が一致するカテゴリーを取得
+        
+        Args:
+            name: カテゴリー名（全角・半角、ひらがな・カタカナ、大文字・小文字の違いは無視）
+            
+        Returns:
+            List[Category]: カテゴリーオブジェクトのリスト
+        """
+        try:
+            cursor = self.db.connection.cursor()
+            cursor.execute(
+                "SELECT id, name, description, parent_id FROM categories WHERE name_key = ? ORDER BY id",
+                (normalize_key(name),)
+            )
+            return [
+                Category(
+                    id=row[0],
+                    name=row[1],
+                    description=row[2],
+                    parent_id=row[3]
+                )
+                for row in cursor.fetchall()
+            ]
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find categories by name: {str(e)}")
+            raise
+
+    def get_subtree(self, category_id: int, include_self: bool = True) -> List[Category]:
+        """
+        カテゴリー配下の全カテゴリーを取得（閉包テーブルを使用）
+        
+        Args:
+            category_id: 起点となるカテゴリーID
+            include_self: 起点自身を含めるかどうか
+            
+        Returns:
+            List[Category]: 浅い階層から順に並べたカテゴリーのリスト
+        """
+        try:
+            cursor = self.db.connection.cursor()
+            cursor.execute(
+                """
+                SELECT c.id, c.name, c.description, c.parent_id
+                FROM category_closure cc
+                JOIN categories c ON c.id = cc.descendant_id
+                WHERE cc.ancestor_id = ? AND cc.depth >= ?
+                ORDER BY cc.depth, c.name
+                """,
+                (category_id, 0 if include_self else 1)
+            )
+            return [
+                Category(
+                    id=row[0],
+                    name=row[1],
+                    description=row[2],
+                    parent_id=row[3]
+                )
+                for row in cursor.fetchall()
+            ]
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category subtree: {str(e)}")
+            raise
+
+    def get_subtree_ids(self, category_id: int) -> List[int]:
+        """
+        カテゴリー自身と配下の全カテゴリーのIDを取得
+        
+        Args:
+            category_id: 起点となるカテゴリーID
+            
+        Returns:
+            List[int]: カテゴリーIDのリスト
+        """
+        try:
+            cursor = self.db.connection.cursor()
+            cursor.execute(
+                "SELECT descendant_id FROM category_closure WHERE ancestor_id = ?",
+                (category_id,)
+            )
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category subtree ids: {str(e)}")
+            raise
+
+    def get_ancestors(self, category_id: int) -> List[Category]:
+        """
+        カテゴリーの祖先を取得（閉包テーブルを使用）
         
         Args:
             category_id: カテゴリーID
-            name: 新しいカテゴリー名
-            description: 新しい説明
             
         Returns:
-            bool: 更新が成功したかどうか
+            List[Category]: ルートから親までの順に並べたカテゴリーのリスト
         """
         try:
             cursor = self.db.connection.cursor()
             cursor.execute(
                 """
-                UPDATE categories
-                SET name = ?, description = ?
-                WHERE id = ?
+                SELECT c.id, c.name, c.description, c.parent_id
+                FROM category_closure cc
+                JOIN categories c ON c.id = cc.ancestor_id
+                WHERE cc.descendant_id = ? AND cc.depth > 0
+                ORDER BY cc.depth DESC
                 """,
-                (name, description, category_id)
+                (category_id,)
             )
-            self.db.connection.commit()
-            success = cursor.rowcount > 0
-            if success:
-                logger.debug(f"{self.current_time} - Updated category: {name} (ID: {category_id})")
-            return success
+            return [
+                Category(
+                    id=row[0],
+                    name=row[1],
+                    description=row[2],
+                    parent_id=row[3]
+                )
+                for row in cursor.fetchall()
+            ]
         except Exception as e:
-            self.db.connection.rollback()
-            logger.error(f"{self.current_time} - Failed to update category: {str(e)}")
+            logger.error(f"{self.current_time} - Failed to get category ancestors: {str(e)}")
             raise
 
-    def delete_category(self, category_id: int) -> bool:
+    def get_path(self, category_id: int, separator: str = " / ") -> str:
         """
-        カテゴリーを削除
+        ルートからカテゴリーまでのパス文字列を取得
         
         Args:
             category_id: カテゴリーID
+            separator: 区切り文字
             
         Returns:
-            bool: 削除が成功したかどうか
+            str: 例 "開発 / 言語 / Python"（該当なしの場合は空文字）
         """
         try:
             cursor = self.db.connection.cursor()
-            # 子カテゴリーを再帰的に削除
-            cursor.execute("SELECT id FROM categories WHERE parent_id = ?", (category_id,))
-            for (child_id,) in cursor.fetchall():
-                self.delete_category(child_id)
+            cursor.execute(
+                """
+                SELECT c.name
+                FROM category_closure cc
+                JOIN categories c ON c.id = cc.ancestor_id
+                WHERE cc.descendant_id = ?
+                ORDER BY cc.depth DESC
+                """,
+                (category_id,)
+            )
+            return separator.join(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to get category path: {str(e)}")
+            raise
+
+    def move_category(self, category_id: int, new_parent_id: Optional[int]) -> bool:
+        """
+        カテゴリーを別の親の下へ移動（配下のサブカテゴリーも一緒に移動）
+        
+        Args:
+            category_id: 移動するカテゴリーID
+            new_parent_id: 新しい親カテゴリーID（Noneの場合はルートへ移動）
             
-            # このカテゴリーを削除
-            cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
-            self.db.connection.commit()
-            success = cursor.rowcount > 0
+        Returns:
+            bool: 移動が成功したかどうか
+        """
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                if new_parent_id is not None:
+                    cursor.execute(
+                        "SELECT 1 FROM category_closure WHERE ancestor_id = ? AND descendant_id = ?",
+                        (category_id, new_parent_id)
+                    )
+                    if cursor.fetchone():
+                        raise ValueError(
+                            f"Cannot move category {category_id} under its own descendant {new_parent_id}"
+                        )
+                cursor.execute(
+                    "UPDATE categories SET parent_id = ? WHERE id = ?",
+                    (new_parent_id, category_id)
+                )
+                success = cursor.rowcount > 0
+            if success:
+                logger.debug(f"{self.current_time} - Moved category {category_id} under {new_parent_id}")
+            return success
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to move category: {str(e)}")
+            raise
+
+    def update_category(self, category_id: int, name: str, description: str = None) -> bool:
+        """
+        カテゴリーを更新
+        
+        Args:
+            category_id: カテゴリーID
+            name: 新しいカテゴリー名
+            description: 新しい説明
+            
+        Returns:
+            bool: 更新が成功したかどうか
+        """
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    UPDATE categories
+                    SET name = ?, name_key = ?, description = ?
+                    WHERE id = ?
+                    """,
+                    (name, normalize_key(name), description, category_id)
+                )
+                success = cursor.rowcount > 0
             if success:
-                logger.debug(f"{self.current_time} - Deleted category ID: {category_id}")
+                logger.debug(f"{self.current_time} - Updated category: {name} (ID: {category_id})")
             return success
         except Exception as e:
-            self.db.connection.rollback()
+            logger.error(f"{self.current_time} - Failed to update category: {str(e)}")
+            raise
+
+    def delete_category(self, category_id: int) -> int:
+        """
+        カテゴリーを配下のサブカテゴリーごと削除
+        
+        閉包テーブルから部分木を求め、グループとの関連付けとカテゴリー本体を
+        1つのトランザクション内でそれぞれ1文で削除する。
+        
+        Args:
+            category_id: カテゴリーID
+            
+        Returns:
+            int: 削除されたカテゴリー数（0の場合は該当なし）
+        """
+        subtree_query = "SELECT descendant_id FROM category_closure WHERE ancestor_id = ?"
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"DELETE FROM group_categories WHERE category_id IN ({subtree_query})",
+                    (category_id,)
+                )
+                cursor.execute(
+                    f"DELETE FROM categories WHERE id IN ({subtree_query})",
+                    (category_id,)
+                )
+                deleted_count = cursor.rowcount
+            if deleted_count:
+                logger.debug(f"{self.current_time} - Deleted category ID: {category_id} ({deleted_count} categories)")
+            return deleted_count
+        except Exception as e:
             logger.error(f"{self.current_time} - Failed to delete category: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def search_categories(self, query: str, limit: int = 20) -> List[Tuple[Category, float]]:
+        """
+        カテゴリーを名前・説明の前方一致で検索（FTS5 インデックスを使用）
+        
+        Args:
+            query: 検索文字列（空白区切りの語をすべて含むカテゴリーに一致）
+            limit: 取得する件数の上限
+            
+        Returns:
+            List[Tuple[Category, float]]: (カテゴリー, bm25 のスコア) を一致度の高い順に並べたリスト
+        """
+        try:
+            match = build_match_query(query)
+            if match is None or limit <= 0:
+                return []
+            cursor = self.db.connection.cursor()
+            cursor.execute(
+                """
+                SELECT c.id, c.name, c.description, c.parent_id, f.rank
+                FROM categories_fts f
+                JOIN categories c ON c.id = f.rowid
+                WHERE categories_fts MATCH ?
+                ORDER BY f.rank
+                LIMIT ?
+                """,
+                (match, limit)
+            )
+            return [
+                (
+                    Category(
+                        id=row[0],
+                        name=row[1],
+                        description=row[2],
+                        parent_id=row[3]
+                    ),
+                    row[4]
+                )
+                for row in cursor.fetchall()
+            ]
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search categories: {str(e)}")
+            raise
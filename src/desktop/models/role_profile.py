@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+@dataclass
+class RoleRequirement:
+    """役割のスキル要件"""
+    skill_id: int
+    required_level: int
+    weight: float = 1.0
+
+@dataclass
+class RoleProfile:
+    """役割プロファイルモデル"""
+    id: int
+    name: str
+    description: str | None
+    created_at: datetime
+    updated_at: datetime
+    requirements: List[RoleRequirement] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'RoleProfile':
+        """辞書からRoleProfileオブジェクトを作成"""
+        return RoleProfile(
+            id=data.get('id'),
+            name=data.get('name'),
+            description=data.get('description'),
+            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
+            updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else datetime.now(),
+            requirements=[
+                RoleRequirement(**requirement) if isinstance(requirement, dict) else requirement
+                for requirement in data.get('requirements', [])
+            ]
+        )
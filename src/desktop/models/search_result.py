@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+# 検索結果の種類
+KIND_USER = 'user'
+KIND_SKILL = 'skill'
+KIND_SKILL_CATEGORY = 'skill_category'
+KIND_CATEGORY = 'category'
+
+@dataclass
+class SearchResult:
+    """全文検索の結果"""
+    kind: str
+    id: int
+    title: str
+    detail: str | None
+    # bm25 のスコア（小さいほど一致度が高い）
+    rank: float
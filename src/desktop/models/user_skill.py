@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+@dataclass
+class UserSkill:
+    """ユーザースキル（評価レベル）モデル"""
+    id: int
+    user_id: int
+    skill_id: int
+    level: int
+    created_at: datetime
+    updated_at: datetime
+
+    @staticmethod
+    def from_dict(data: dict) -> 'UserSkill':
+        """辞書からUserSkillオブジェクトを作成"""
+        return UserSkill(
+            id=data.get('id'),
+            user_id=data.get('user_id'),
+            skill_id=data.get('skill_id'),
+            level=data.get('level'),
+            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
+            updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else datetime.now()
+        )
\ No newline at end of file
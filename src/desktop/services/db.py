@@ -3,8 +3,11 @@ import sqlite3
 import os
 import logging
 from pathlib import Path
+from typing import Callable, ContextManager
 from .migration_manager import MigrationManager  # 追加
+from ..database.unit_of_work import TransactionScope
 from ..utils.time_utils import TimeProvider
+from ..utils.text_normalizer import register_functions
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +28,41 @@ class DatabaseManager:
         migration_manager = MigrationManager(self.db_path)
         migration_manager.migrate()
         
-        # データベース接続を確立
-        self.connection = sqlite3.connect(self.db_path)
+        # データベース接続を確立（トランザクションは TransactionScope で管理）
+        self.connection = sqlite3.connect(self.db_path, isolation_level=None)
         self.connection.row_factory = sqlite3.Row
+        register_functions(self.connection)
+        self._scope = TransactionScope(self.connection)
         
         logger.info(f"{self.current_time} - Connected to database: {self.db_path}")
 
+    def transaction(self, immediate: bool = False) -> ContextManager[sqlite3.Connection]:
+        """
+        トランザクションを開始
+        
+        入れ子で呼び出された場合はセーブポイントとなり、
+        最も外側のブロックを抜けた時点で一度だけコミットされる。
+        
+        Args:
+            immediate: 書き込みロックを開始時に取得する（最も外側のみ有効）
+            
+        Returns:
+            ContextManager[sqlite3.Connection]: with文で使用する接続
+        """
+        return self._scope.begin(immediate=immediate)
+
+    def in_transaction(self) -> bool:
+        """トランザクション中かどうか"""
+        return self._scope.active
+
+    def after_commit(self, callback: Callable[[], None]):
+        """
+        現在のトランザクションのコミット後に実行する処理を登録
+        
+        巻き戻された場合は実行されない。トランザクション外では即座に実行する。
+        """
+        self._scope.after_commit(callback)
+
     def execute_query(self, query: str, params: tuple = ()) -> list:
         """
         SELECTクエリを実行
@@ -64,15 +96,14 @@ class DatabaseManager:
             int: 影響を受けた行数
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                affected_rows = cursor.rowcount
+                cursor.close()
             return affected_rows
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to execute update: {str(e)}")
-            self.connection.rollback()
             raise
 
     def reset_database(self):
@@ -3,19 +3,29 @@ import os
 import sqlite3
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ..utils.time_utils import TimeProvider
+from ..utils.text_normalizer import register_functions
 
 logger = logging.getLogger(__name__)
 
 class MigrationManager:
     """データベースマイグレーション管理クラス"""
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, migrations_dir: Optional[Path] = None):
+        """
+        Args:
+            db_path: データベースファイルのパス
+            migrations_dir: マイグレーションSQLのディレクトリ（省略時はservices/migrations）
+        """
         self.current_time = TimeProvider.get_current_time()
         self.current_user = TimeProvider.get_current_user()
         self.db_path = db_path
-        self.migrations_dir = Path(__file__).parent / 'migrations'
+        self.default_migrations_dir = Path(__file__).parent / 'migrations'
+        self.migrations_dir = Path(migrations_dir) if migrations_dir else self.default_migrations_dir
+        # 履歴はディレクトリごとに管理する（database/migrations と services/migrations は
+        # 同じバージョン番号を使うため、バージョンだけでは区別できない）
+        self.scope = f"{self.migrations_dir.parent.name}/{self.migrations_dir.name}"
         
         # マイグレーションディレクトリが存在しない場合は作成
         os.makedirs(self.migrations_dir, exist_ok=True)
@@ -35,9 +45,23 @@ class MigrationManager:
                         version TEXT NOT NULL,
                         name TEXT NOT NULL,
                         applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        applied_by TEXT
+                        applied_by TEXT,
+                        scope TEXT
                     )
                 """)
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(migrations)")]
+                if 'scope' not in columns:
+                    conn.execute("ALTER TABLE migrations ADD COLUMN scope TEXT")
+                
+                # scope を持たない以前の履歴は、同じファイル名のマイグレーションを持つ
+                # ディレクトリの履歴として引き継ぐ
+                stems = [file.stem for file in self.migrations_dir.glob('*.sql')]
+                if stems:
+                    placeholders = ', '.join('?' * len(stems))
+                    conn.execute(
+                        f"UPDATE migrations SET scope = ? WHERE scope IS NULL AND name IN ({placeholders})",
+                        [self.scope] + stems
+                    )
                 conn.commit()
             logger.debug(f"{self.current_time} - Migrations table created")
         except Exception as e:
@@ -46,6 +70,9 @@ class MigrationManager:
 
     def _create_initial_migration(self):
         """初期マイグレーションファイルを作成"""
+        if self.migrations_dir != self.default_migrations_dir:
+            return
+            
         migration_path = self.migrations_dir / '20250202083743_initial_schema.sql'
         
         if not migration_path.exists():
@@ -94,7 +121,10 @@ DROP TABLE IF EXISTS groups;
         """適用済みのマイグレーションバージョンを取得"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT version FROM migrations ORDER BY version")
+                cursor = conn.execute(
+                    "SELECT version FROM migrations WHERE scope = ? ORDER BY version",
+                    (self.scope,)
+                )
                 return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to get applied migrations: {str(e)}")
@@ -131,15 +161,21 @@ DROP TABLE IF EXISTS groups;
             up_sql = sql.split('-- Down migration')[0]
 
             with sqlite3.connect(self.db_path) as conn:
-                # マイグレーションを実行
-                conn.executescript(up_sql)
+                # マイグレーション内のトリガー・データ移行が使う関数を登録
+                register_functions(conn)
                 
-                # マイグレーション履歴を記録
-                conn.execute(
-                    "INSERT INTO migrations (version, name, applied_by) VALUES (?, ?, ?)",
-                    (version, file_path.stem, self.current_user)
-                )
-                conn.commit()
+                # マイグレーションと履歴の記録を1つのトランザクションで実行する
+                # （途中で失敗した場合は ALTER TABLE 等も巻き戻り、次回の起動で再実行できる）
+                try:
+                    conn.executescript("BEGIN;\n" + up_sql)
+                    conn.execute(
+                        "INSERT INTO migrations (version, name, applied_by, scope) VALUES (?, ?, ?, ?)",
+                        (version, file_path.stem, self.current_user, self.scope)
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
                 
             logger.info(f"{self.current_time} - Applied migration: {file_path.stem}")
         except Exception as e:
@@ -0,0 +1,17 @@
+-- src/desktop/services/migrations/20250204090000_add_indexes.sql
+
+-- Up migration
+-- 子カテゴリーの探索（parent_id）用
+CREATE INDEX IF NOT EXISTS idx_categories_parent_id
+    ON categories (parent_id);
+
+-- カテゴリー側からのグループ関連付けの検索用
+CREATE INDEX IF NOT EXISTS idx_group_categories_category_id
+    ON group_categories (category_id);
+
+-- クエリプランナー用の統計情報を収集
+ANALYZE;
+
+-- Down migration
+DROP INDEX IF EXISTS idx_group_categories_category_id;
+DROP INDEX IF EXISTS idx_categories_parent_id;
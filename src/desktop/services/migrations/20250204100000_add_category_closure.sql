@@ -0,0 +1,86 @@
+-- src/desktop/services/migrations/20250204100000_add_category_closure.sql
+
+-- Up migration
+-- カテゴリー階層の閉包テーブル（祖先・子孫の全組み合わせと距離）
+CREATE TABLE IF NOT EXISTS category_closure (
+    ancestor_id INTEGER NOT NULL,
+    descendant_id INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor_id, descendant_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_category_closure_descendant
+    ON category_closure (descendant_id, depth, ancestor_id);
+
+-- 既存のカテゴリーから閉包テーブルを構築
+INSERT OR IGNORE INTO category_closure (ancestor_id, descendant_id, depth)
+WITH RECURSIVE paths(ancestor_id, descendant_id, depth) AS (
+    SELECT id, id, 0 FROM categories
+    UNION ALL
+    SELECT p.ancestor_id, c.id, p.depth + 1
+    FROM paths p
+    JOIN categories c ON c.parent_id = p.descendant_id
+)
+SELECT ancestor_id, descendant_id, depth FROM paths;
+
+-- 追加時: 自分自身と親の祖先への経路を登録
+CREATE TRIGGER IF NOT EXISTS trg_categories_closure_insert
+AFTER INSERT ON categories
+BEGIN
+    INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+    VALUES (NEW.id, NEW.id, 0);
+
+    INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, NEW.id, depth + 1
+    FROM category_closure
+    WHERE descendant_id = NEW.parent_id;
+END;
+
+-- 削除時: 削除されたカテゴリーを含む経路を削除
+CREATE TRIGGER IF NOT EXISTS trg_categories_closure_delete
+AFTER DELETE ON categories
+BEGIN
+    DELETE FROM category_closure WHERE descendant_id = OLD.id;
+    DELETE FROM category_closure WHERE ancestor_id = OLD.id;
+END;
+
+-- 親変更時: 自分の子孫の下へ移動することは禁止
+CREATE TRIGGER IF NOT EXISTS trg_categories_closure_prevent_cycle
+BEFORE UPDATE OF parent_id ON categories
+WHEN NEW.parent_id IS NOT NULL AND EXISTS (
+    SELECT 1 FROM category_closure
+    WHERE ancestor_id = NEW.id AND descendant_id = NEW.parent_id
+)
+BEGIN
+    SELECT RAISE(ABORT, 'Cannot move a category under its own descendant');
+END;
+
+-- 親変更時: 部分木を旧祖先から切り離し、新しい祖先へ接続
+CREATE TRIGGER IF NOT EXISTS trg_categories_closure_move
+AFTER UPDATE OF parent_id ON categories
+WHEN OLD.parent_id IS NOT NEW.parent_id
+BEGIN
+    DELETE FROM category_closure
+    WHERE descendant_id IN (
+        SELECT descendant_id FROM category_closure WHERE ancestor_id = NEW.id
+    )
+    AND ancestor_id IN (
+        SELECT ancestor_id FROM category_closure
+        WHERE descendant_id = NEW.id AND ancestor_id != NEW.id
+    );
+
+    INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+    SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1
+    FROM category_closure a
+    JOIN category_closure d ON d.ancestor_id = NEW.id
+    WHERE a.descendant_id = NEW.parent_id;
+END;
+
+ANALYZE category_closure;
+
+-- Down migration
+DROP TRIGGER IF EXISTS trg_categories_closure_move;
+DROP TRIGGER IF EXISTS trg_categories_closure_prevent_cycle;
+DROP TRIGGER IF EXISTS trg_categories_closure_delete;
+DROP TRIGGER IF EXISTS trg_categories_closure_insert;
+DROP TABLE IF EXISTS category_closure;
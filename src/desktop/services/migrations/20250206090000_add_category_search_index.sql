@@ -0,0 +1,45 @@
+-- src/desktop/services/migrations/20250206090000_add_category_search_index.sql
+
+-- Up migration
+-- カテゴリーの全文検索インデックス（FTS5 の外部コンテンツテーブル、本体はトリガーで同期）
+CREATE VIRTUAL TABLE IF NOT EXISTS categories_fts USING fts5(
+    name, description,
+    content='categories', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3'
+);
+
+-- 並び順（rank）は名前の一致を説明文より重く評価する
+INSERT INTO categories_fts (categories_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)');
+
+-- 既存の行からインデックスを構築
+INSERT INTO categories_fts (categories_fts) VALUES ('rebuild');
+
+CREATE TRIGGER IF NOT EXISTS trg_categories_fts_insert
+AFTER INSERT ON categories
+BEGIN
+    INSERT INTO categories_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_categories_fts_delete
+AFTER DELETE ON categories
+BEGIN
+    INSERT INTO categories_fts (categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_categories_fts_update
+AFTER UPDATE OF name, description ON categories
+BEGIN
+    INSERT INTO categories_fts (categories_fts, rowid, name, description)
+    VALUES ('delete', OLD.id, OLD.name, OLD.description);
+    INSERT INTO categories_fts (rowid, name, description)
+    VALUES (NEW.id, NEW.name, NEW.description);
+END;
+
+-- Down migration
+DROP TRIGGER IF EXISTS trg_categories_fts_update;
+DROP TRIGGER IF EXISTS trg_categories_fts_delete;
+DROP TRIGGER IF EXISTS trg_categories_fts_insert;
+DROP TABLE IF EXISTS categories_fts;
@@ -0,0 +1,15 @@
+-- src/desktop/services/migrations/20250207090000_add_category_name_keys.sql
+
+-- Up migration
+-- カテゴリー名の比較用キー（NFKC 正規化・大文字小文字の畳み込み・カタカナをひらがなに統一）
+-- 値は CategoryManager の書き込み処理が設定する（埋め戻しのみ normalize_key() を使う）
+ALTER TABLE categories ADD COLUMN name_key TEXT;
+
+UPDATE categories SET name_key = normalize_key(name);
+
+-- 同じ親の下での重複確認にも使えるよう親IDを含める
+CREATE INDEX IF NOT EXISTS idx_categories_name_key ON categories (name_key, parent_id);
+
+-- Down migration
+DROP INDEX IF EXISTS idx_categories_name_key;
+ALTER TABLE categories DROP COLUMN name_key;
@@ -0,0 +1,16 @@
+from typing import Optional
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    入力文字列を FTS5 の MATCH 式に変換
+
+    空白で区切った語をそれぞれ引用符で囲んで前方一致（"語"*）にし、
+    すべての語を含む行に一致させる。FTS5 の演算子や記号は語の一部として扱う。
+
+    Returns:
+        str: MATCH 式（検索語が無い場合はNone）
+    """
+    terms = text.split()
+    if not terms:
+        return None
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
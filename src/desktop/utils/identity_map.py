@@ -0,0 +1,173 @@
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+@dataclass
+class CacheStatistics:
+    """キャッシュの統計情報"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率（0.0〜1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """辞書に変換"""
+        data = asdict(self)
+        data['hit_rate'] = self.hit_rate
+        return data
+
+def estimate_size(value: Any) -> int:
+    """
+    キャッシュ値のおおよそのメモリ使用量（バイト）を見積もる
+
+    リスト・タプル・辞書とモデルオブジェクトの属性を1段だけ辿る。
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + estimate_size(v) for k, v in value.items()
+        )
+    size = sys.getsizeof(value)
+    attributes = getattr(value, '__dict__', None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes) + sum(sys.getsizeof(v) for v in attributes.values())
+    return size
+
+class IdentityMap:
+    """
+    読み込み時キャッシュ（Identity Map）
+
+    同じキーに対しては同じモデルオブジェクトを返す。容量はバイト数で制限し、
+    超過した場合は最も長く使われていないエントリから破棄する（LRU）。
+    更新系の操作では呼び出し側が invalidate() で該当キーを無効化する。
+    """
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        # 無効化のたびに進める。読み込み中に無効化された値は格納しない
+        self._generation = 0
+        self._stats = CacheStatistics(max_bytes=max_bytes)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], store: bool = True) -> Any:
+        """
+        キャッシュから値を取得し、無ければ loader で読み込む
+
+        Args:
+            key: キャッシュキー
+            loader: キャッシュに無い場合に呼び出す読み込み関数
+            store: 読み込んだ値をキャッシュに格納するか（トランザクション中は False を渡す）
+
+        Returns:
+            キャッシュ済みまたは読み込んだ値（None はキャッシュしない）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry[0]
+            self._stats.misses += 1
+            generation = self._generation
+
+        value = loader()
+        if store and value is not None:
+            self._put(key, value, generation)
+        return value
+
+    def _put(self, key: Hashable, value: Any, generation: int):
+        """値を格納し、容量を超えた分を古い順に破棄"""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._stats.evictions += 1
+
+    def invalidate(self, *keys: Hashable):
+        """指定したキーを無効化"""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._size -= entry[1]
+                    self._stats.invalidations += 1
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]):
+        """条件に一致するキーを全て無効化"""
+        with self._lock:
+            self.invalidate(*[key for key in self._entries if predicate(key)])
+
+    def clear(self):
+        """全てのエントリを無効化"""
+        with self._lock:
+            self._generation += 1
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._size = 0
+
+    def get_statistics(self) -> CacheStatistics:
+        """現在の統計情報のスナップショットを取得"""
+        with self._lock:
+            stats = CacheStatistics(**asdict(self._stats))
+            stats.entries = len(self._entries)
+            stats.size_bytes = self._size
+            return stats
+
+# データベースごとの「テーブル名 → そのテーブルを参照するキャッシュ」の対応
+_watchers: "weakref.WeakKeyDictionary[Any, Dict[str, weakref.WeakSet]]" = weakref.WeakKeyDictionary()
+_watchers_lock = threading.Lock()
+
+def watch_tables(database: Any, cache: Any, tables: Iterable[str]):
+    """
+    キャッシュが内容に依存するテーブルを登録
+
+    他のコントローラーの操作（外部キーの連鎖更新など）でテーブルが変わった際に
+    notify_tables_changed() からキャッシュの clear() が呼ばれる。
+    cache は clear() を持つ任意のオブジェクト（弱参照で保持される）。
+    """
+    with _watchers_lock:
+        by_table = _watchers.setdefault(database, {})
+        for table in tables:
+            by_table.setdefault(table, weakref.WeakSet()).add(cache)
+
+def notify_tables_changed(database: Any, *tables: str, source: Optional[IdentityMap] = None):
+    """
+    テーブルの変更を通知し、そのテーブルに依存するキャッシュを無効化
+
+    Args:
+        database: 変更されたデータベース
+        tables: 変更されたテーブル名
+        source: 変更を行ったキャッシュ（自身で個別に無効化済みのため除外する）
+    """
+    with _watchers_lock:
+        by_table = _watchers.get(database, {})
+        caches = {cache for table in tables for cache in by_table.get(table, ())}
+    caches.discard(source)
+    for cache in caches:
+        cache.clear()
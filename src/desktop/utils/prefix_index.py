@@ -0,0 +1,83 @@
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.desktop.utils.text_normalizer import normalize_key
+
+class PrefixIndex:
+    """
+    前方一致検索用のメモリ上のインデックス
+
+    (正規化したキー, ID) を昇順に並べた配列を持ち、二分探索で接頭辞の開始位置を
+    求めてから一致する範囲だけを先頭から読む。キーは normalize_key() で正規化するため、
+    全角・半角、ひらがな・カタカナ、大文字・小文字の違いは無視される。
+    追加・削除は配列への挿入・削除（件数に比例するが memmove のみ）で反映する。
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, int]] = []
+        self._keys: Dict[int, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._keys
+
+    @staticmethod
+    def _normalize(keys: Iterable[str]) -> Tuple[str, ...]:
+        normalized = []
+        for key in keys:
+            key = normalize_key(key)
+            if key and key not in normalized:
+                normalized.append(key)
+        return tuple(normalized)
+
+    def build(self, items: Iterable[Tuple[int, Iterable[str]]]):
+        """(ID, キーのリスト) からまとめて作り直す（1回の並べ替え）"""
+        self._keys = {item_id: self._normalize(keys) for item_id, keys in items}
+        self._entries = sorted((key, item_id) for item_id, keys in self._keys.items() for key in keys)
+
+    def add(self, item_id: int, keys: Iterable[str]):
+        """項目を追加（既存の場合はキーを置き換える）"""
+        self.remove(item_id)
+        normalized = self._normalize(keys)
+        self._keys[item_id] = normalized
+        for key in normalized:
+            insort(self._entries, (key, item_id))
+
+    def remove(self, item_id: int) -> bool:
+        """項目を削除（存在しない場合はFalse）"""
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return False
+        for key in keys:
+            position = bisect_left(self._entries, (key, item_id))
+            if position < len(self._entries) and self._entries[position] == (key, item_id):
+                del self._entries[position]
+        return True
+
+    def search(self, prefix: str, limit: int = 50,
+               accept: Optional[Callable[[int], bool]] = None) -> List[int]:
+        """
+        キーが接頭辞で始まる項目のIDをキーの昇順に最大 limit 件取得
+
+        Args:
+            prefix: 接頭辞（空の場合は結果なし）
+            limit: 取得する件数の上限
+            accept: 結果に含めるかを判定する関数（None の場合は全て）
+        """
+        prefix = normalize_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+        results: List[int] = []
+        seen = set()
+        for position in range(bisect_left(self._entries, (prefix,)), len(self._entries)):
+            key, item_id = self._entries[position]
+            if not key.startswith(prefix):
+                break
+            if item_id in seen or (accept is not None and not accept(item_id)):
+                continue
+            seen.add(item_id)
+            results.append(item_id)
+            if len(results) >= limit:
+                break
+        return results
@@ -0,0 +1,34 @@
+import sqlite3
+import unicodedata
+from typing import Optional
+
+# カタカナ → ひらがな（ァ〜ヶ、ヽ・ヾ）
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+_KATAKANA_TO_HIRAGANA.update({0x30FD: 0x309D, 0x30FE: 0x309E})
+
+def normalize_key(text: Optional[str]) -> Optional[str]:
+    """
+    名前の比較・検索用のキーを作成
+
+    NFKC 正規化で全角英数字・半角カナを統一し（ｶﾞ → ガ）、大文字小文字を
+    畳み込んだうえでカタカナをひらがなにそろえる。前後の空白は除き、
+    連続する空白は1つにまとめる。
+
+    例: 'ＰｙｔｈｏｎｸﾞﾙｰﾌﾟＡ' と 'pythonぐるーぷa' は同じキーになる。
+    """
+    if text is None:
+        return None
+    if text.isascii():
+        # ASCII は NFKC・カタカナ変換の対象外
+        return ' '.join(text.lower().split())
+    text = unicodedata.normalize('NFKC', text).casefold()
+    return ' '.join(text.translate(_KATAKANA_TO_HIRAGANA).split())
+
+def register_functions(conn: sqlite3.Connection):
+    """
+    接続に normalize_key() を SQL 関数として登録
+
+    name_key 列の値は各マネージャーが Python 側で設定するため、書き込みに登録は不要。
+    マイグレーションでの既存行の埋め戻しと、SQL 上での比較に使う。
+    """
+    conn.create_function('normalize_key', 1, normalize_key, deterministic=True)
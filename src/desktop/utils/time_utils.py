@@ -3,4 +3,8 @@ from datetime import datetime
 class TimeProvider:
     @staticmethod
     def get_current_time():
-        return datetime(2025, 2, 3, 9, 5, 7)
\ No newline at end of file
+        return datetime(2025, 2, 3, 9, 5, 7)
+
+    @staticmethod
+    def get_current_user():
+        return "GingaDza"
@@ -1,21 +1,35 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QComboBox, QLabel, QPushButton,
-    QMessageBox, QDialog
+    QMessageBox, QDialog, QLineEdit
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 import logging
 from src.desktop.utils.time_utils import TimeProvider
 from src.desktop.views.components.users.user_list_widget import UserListWidget
 from src.desktop.views.dialogs.user_dialog import UserDialog
+from src.desktop.views.dialogs.candidate_search_dialog import CandidateSearchDialog
+from src.desktop.views.dialogs.team_cover_dialog import TeamCoverDialog
+from src.desktop.analytics.assignment import Position
 
 logger = logging.getLogger(__name__)
 
+# 検索欄の入力が止まってから検索するまでの待ち時間（ミリ秒）
+SEARCH_DEBOUNCE_MS = 150
+# 検索結果として表示する件数の上限
+SEARCH_RESULT_LIMIT = 50
+
 class MainPanel(QWidget):
-    def __init__(self, user_controller, group_controller, parent=None):
+    def __init__(self, user_controller, group_controller, parent=None,
+                 skill_controller=None, analytics_controller=None, role_controller=None):
         super().__init__(parent)
         self.user_controller = user_controller
         self.group_controller = group_controller
+        # 候補者検索（analytics_controller がある場合のみ有効）
+        self.skill_controller = skill_controller
+        self.analytics_controller = analytics_controller
+        # 役割配置（role_controller がある場合のみ有効）
+        self.role_controller = role_controller
         self.current_time = TimeProvider.get_current_time()
         
         # UIの初期化
@@ -40,6 +54,16 @@ class MainPanel(QWidget):
             group_layout.addWidget(self.group_combo)
             layout.addLayout(group_layout)
             
+            # 社員番号・氏名の検索欄（入力が止まってから検索する）
+            self.search_edit = QLineEdit()
+            self.search_edit.setPlaceholderText("社員番号・氏名で検索")
+            self.search_edit.setClearButtonEnabled(True)
+            self.search_edit.setMinimumHeight(30)
+            layout.addWidget(self.search_edit)
+            self.search_timer = QTimer(self)
+            self.search_timer.setSingleShot(True)
+            self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+            
             # ユーザーリスト
             self.user_list = UserListWidget(self.user_controller)
             layout.addWidget(self.user_list)
@@ -57,6 +81,26 @@ class MainPanel(QWidget):
             user_buttons_layout.addWidget(self.delete_button)
             button_layout.addLayout(user_buttons_layout)
             
+            # 分析ボタン（候補者検索・類似ユーザー・チーム編成・役割配置）
+            analytics_buttons_layout = QHBoxLayout()
+            self.candidate_search_button = QPushButton("候補者検索")
+            self.candidate_search_button.setVisible(
+                self.analytics_controller is not None and self.skill_controller is not None
+            )
+            self.similar_users_button = QPushButton("類似ユーザー")
+            self.similar_users_button.setVisible(self.analytics_controller is not None)
+            self.team_cover_button = QPushButton("チーム編成")
+            self.team_cover_button.setVisible(
+                self.analytics_controller is not None and self.skill_controller is not None
+            )
+            analytics_buttons_layout.addWidget(self.candidate_search_button)
+            analytics_buttons_layout.addWidget(self.similar_users_button)
+            self.role_assignment_button = QPushButton("役割配置")
+            self.role_assignment_button.setVisible(self.role_controller is not None)
+            analytics_buttons_layout.addWidget(self.team_cover_button)
+            analytics_buttons_layout.addWidget(self.role_assignment_button)
+            button_layout.addLayout(analytics_buttons_layout)
+            
             # 出力ボタン
             export_buttons_layout = QHBoxLayout()
             self.export_pdf_button = QPushButton("PDFレーダーチャート出力")
@@ -80,9 +124,15 @@ class MainPanel(QWidget):
         """シグナル/スロットの接続"""
         try:
             self.group_combo.currentIndexChanged.connect(self.on_group_changed)
+            self.search_edit.textChanged.connect(self.search_timer.start)
+            self.search_timer.timeout.connect(self.on_search_timeout)
             self.add_button.clicked.connect(self.on_add_clicked)
             self.edit_button.clicked.connect(self.on_edit_clicked)
             self.delete_button.clicked.connect(self.on_delete_clicked)
+            self.candidate_search_button.clicked.connect(self.on_candidate_search_clicked)
+            self.similar_users_button.clicked.connect(self.on_similar_users_clicked)
+            self.team_cover_button.clicked.connect(self.on_team_cover_clicked)
+            self.role_assignment_button.clicked.connect(self.on_role_assignment_clicked)
             self.export_pdf_button.clicked.connect(self.on_export_pdf_clicked)
             self.export_excel_button.clicked.connect(self.on_export_excel_clicked)
             
@@ -125,6 +175,15 @@ class MainPanel(QWidget):
             logger.error(f"{self.current_time} - Failed to handle group change: {str(e)}")
             QMessageBox.warning(self, "エラー", f"グループの変更に失敗しました: {str(e)}")
             
+    def on_search_timeout(self):
+        """検索欄の入力が止まった時のイベントハンドラ"""
+        try:
+            self.update_user_list(self.group_combo.currentData())
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search users: {str(e)}")
+            QMessageBox.warning(self, "エラー", f"ユーザーの検索に失敗しました: {str(e)}")
+            
     def on_add_clicked(self):
         """ユーザー追加ボタンのイベントハンドラ"""
         try:
@@ -135,7 +194,8 @@ class MainPanel(QWidget):
                     name=dialog.user_data['name'],
                     group_id=dialog.user_data['group_id']
                 )
-                self.update_user_list(self.group_combo.currentData())
+                if not self.user_list.insert_user(user):
+                    self.update_user_list(self.group_combo.currentData())
                 logger.debug(f"{self.current_time} - Added new user: {user.name}")
                 QMessageBox.information(self, "成功", "ユーザーを追加しました。")
                 
@@ -159,7 +219,8 @@ class MainPanel(QWidget):
                     name=dialog.user_data['name'],
                     group_id=dialog.user_data['group_id']
                 )
-                self.update_user_list(self.group_combo.currentData())
+                if not self.user_list.update_user(user):
+                    self.update_user_list(self.group_combo.currentData())
                 logger.debug(f"{self.current_time} - Updated user: {user.name}")
                 QMessageBox.information(self, "成功", "ユーザー情報を更新しました。")
                 
@@ -185,7 +246,8 @@ class MainPanel(QWidget):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.user_controller.delete_user(selected_user.id)
-                self.update_user_list(self.group_combo.currentData())
+                if not self.user_list.remove_user(selected_user.id):
+                    self.update_user_list(self.group_combo.currentData())
                 logger.debug(f"{self.current_time} - Deleted user: {selected_user.name}")
                 QMessageBox.information(self, "成功", "ユーザーを削除しました。")
                 
@@ -193,6 +255,111 @@ class MainPanel(QWidget):
             logger.error(f"{self.current_time} - Failed to delete user: {str(e)}")
             QMessageBox.critical(self, "エラー", f"ユーザーの削除に失敗しました: {str(e)}")
             
+    def on_candidate_search_clicked(self):
+        """候補者検索ボタンのイベントハンドラ"""
+        try:
+            dialog = CandidateSearchDialog(self.skill_controller, parent=self)
+            if dialog.exec() != QDialog.DialogCode.Accepted or not dialog.requirements:
+                return
+                
+            group_id = self.group_combo.currentData()
+            candidates = self.analytics_controller.find_candidates(
+                dialog.requirements,
+                dialog.limit,
+                group_id
+            )
+            
+            # 候補者をスコアの高い順にユーザーリストへ表示
+            self.user_list.set_users(self.user_controller.get_user(candidate.user_id) for candidate in candidates)
+                
+            logger.debug(f"{self.current_time} - Listed {len(candidates)} candidates for group {group_id}")
+            if not candidates:
+                QMessageBox.information(self, "情報", "条件に該当するユーザーがいません。")
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to search candidates: {str(e)}")
+            QMessageBox.critical(self, "エラー", f"候補者の検索に失敗しました: {str(e)}")
+            
+    def on_similar_users_clicked(self):
+        """類似ユーザーボタンのイベントハンドラ"""
+        try:
+            selected_user = self.user_list.get_selected_user()
+            if not selected_user:
+                QMessageBox.warning(self, "警告", "基準となるユーザーを選択してください。")
+                return
+                
+            group_id = self.group_combo.currentData()
+            similar_users = self.analytics_controller.find_similar_users(selected_user.id, group_id=group_id)
+            
+            # 基準のユーザーに続けて近い順に表示
+            self.user_list.set_users([selected_user] + [
+                self.user_controller.get_user(similar_user.user_id) for similar_user in similar_users
+            ])
+                
+            logger.debug(f"{self.current_time} - Listed {len(similar_users)} users similar to {selected_user.name}")
+            if not similar_users:
+                QMessageBox.information(self, "情報", "スキルプロファイルの近いユーザーがいません。")
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find similar users: {str(e)}")
+            QMessageBox.critical(self, "エラー", f"類似ユーザーの検索に失敗しました: {str(e)}")
+            
+    def on_team_cover_clicked(self):
+        """チーム編成ボタンのイベントハンドラ"""
+        try:
+            dialog = TeamCoverDialog(self.skill_controller, parent=self)
+            if dialog.exec() != QDialog.DialogCode.Accepted or not dialog.requirements:
+                return
+                
+            group_id = self.group_combo.currentData()
+            result = self.analytics_controller.find_team_cover(dialog.requirements, group_id, exact=dialog.exact)
+            
+            # 選んだ順にチームのメンバーをユーザーリストへ表示
+            self.user_list.set_users(self.user_controller.get_user(user_id) for user_id in result.user_ids)
+            
+            logger.debug(f"{self.current_time} - Listed team of {len(result.user_ids)} users for group {group_id}")
+            if result.uncovered:
+                skills = {skill.id: skill.name for skill in self.skill_controller.get_all_skills()}
+                QMessageBox.information(
+                    self,
+                    "情報",
+                    "次の要件を満たすユーザーがいません:\n" + "\n".join(
+                        f"{skills.get(skill_id, skill_id)}（レベル{level}以上）" for skill_id, level in result.uncovered
+                    )
+                )
+                
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to find team cover: {str(e)}")
+            QMessageBox.critical(self, "エラー", f"チームの編成に失敗しました: {str(e)}")
+            
+    def on_role_assignment_clicked(self):
+        """役割配置ボタンのイベントハンドラ"""
+        try:
+            roles = self.role_controller.get_all_roles()
+            if not roles:
+                QMessageBox.warning(self, "警告", "役割が登録されていません。")
+                return
+                
+            # 役割ごとに1人、選択中のグループから適合度の合計が最大になるように割り当てる
+            group_id = self.group_combo.currentData()
+            result = self.role_controller.assign_positions([Position(role.id, group_id) for role in roles])
+            
+            role_names = {role.id: role.name for role in roles}
+            users = [self.user_controller.get_user(user_id) for _, _, user_id, _ in result.assignments]
+            self.user_list.set_users(users)
+            
+            logger.debug(f"{self.current_time} - Assigned {len(users)} of {len(roles)} roles for group {group_id}")
+            lines = [
+                f"{role_names[role_id]}: {user.name}（適合度 {fit:.2f}）"
+                for (_, role_id, _, fit), user in zip(result.assignments, users)
+            ]
+            lines += [f"{role_names[roles[p].id]}: 該当者なし" for p in result.unfilled]
+            QMessageBox.information(self, "役割配置", "\n".join(lines))
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to assign roles: {str(e)}")
+            QMessageBox.critical(self, "エラー", f"役割の配置に失敗しました: {str(e)}")
+            
     def on_export_pdf_clicked(self):
         """PDFレーダーチャート出力ボタンのイベントハンドラ"""
         try:
@@ -224,18 +391,23 @@ class MainPanel(QWidget):
             QMessageBox.critical(self, "エラー", f"Excel出力に失敗しました: {str(e)}")
             
     def update_user_list(self, group_id=None):
-        """ユーザーリストの更新"""
+        """
+        ユーザーリストの更新
+        
+        検索欄に入力がある場合は前方一致する最大50件、それ以外はグループのユーザーを
+        スクロールに合わせて読み込む。
+        """
         try:
-            if group_id is None:
-                users = self.user_controller.get_all_users()
+            # 入力途中で別の操作により更新された場合、待機中の検索は不要になる
+            self.search_timer.stop()
+            search_text = self.search_edit.text().strip()
+            if search_text:
+                users = self.user_controller.search_users(search_text, SEARCH_RESULT_LIMIT, group_id)
+                self.user_list.set_users(users)
+                logger.debug(f"{self.current_time} - Updated user list with {len(users)} search results")
             else:
-                users = self.user_controller.get_users_by_group(group_id)
-                
-            self.user_list.clear()
-            for user in users:
-                self.user_list.add_user(user)
-                
-            logger.debug(f"{self.current_time} - Updated user list with {len(users)} users")
+                self.user_list.set_group(group_id)
+                logger.debug(f"{self.current_time} - Updated user list for group: {group_id}")
             
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to update user list: {str(e)}")
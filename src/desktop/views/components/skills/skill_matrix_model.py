@@ -0,0 +1,156 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
+from typing import Dict, List, Optional, Tuple
+import logging
+import numpy as np
+from src.desktop.analytics.skill_matrix import UNSET
+from src.desktop.managers.user_skill_manager import MIN_LEVEL, MAX_LEVEL
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class SkillMatrixTableModel(QAbstractTableModel):
+    """
+    ユーザー × スキルのレベル表のモデル
+    
+    分析コントローラーのスキルマトリクスを int8 の密行列として保持し、
+    data() は配列の1要素を読むだけで返す（行列の格納形式によらず O(1)）。
+    行はユーザー（社員番号順）、列はスキル（カテゴリー・スキル名順）で、
+    見出しの文字列・レベルごとの背景色は読み込み時に作っておく。
+    レベルの変更はコミット後の通知を受けてセル単位で反映する。
+    """
+    
+    def __init__(self, analytics_controller, user_controller, skill_controller,
+                 category_controller=None, parent=None):
+        """
+        Args:
+            analytics_controller: スキルマトリクスを提供する分析コントローラー
+            user_controller: 行見出し（社員番号・氏名）の取得に使うユーザーコントローラー
+            skill_controller: 列見出し（スキル名）の取得に使うスキルコントローラー
+            category_controller: 列見出しのカテゴリー名の取得に使う（省略時はカテゴリーIDを表示）
+        """
+        super().__init__(parent)
+        self.analytics_controller = analytics_controller
+        self.user_controller = user_controller
+        self.skill_controller = skill_controller
+        self.category_controller = category_controller
+        self.current_time = TimeProvider.get_current_time()
+        
+        self._levels = np.full((0, 0), UNSET, dtype=np.int8)
+        self._row_of: Dict[int, int] = {}
+        self._column_of: Dict[int, int] = {}
+        self._row_headers: List[str] = []
+        self._column_headers: List[str] = []
+        self._column_tooltips: List[str] = []
+        # レベル → 表示文字列・背景色（UNSET は末尾の要素 [-1] で None になる）
+        self._level_texts: List[Optional[str]] = [str(level) for level in range(MAX_LEVEL + 1)] + [None]
+        self._level_brushes: List[Optional[QBrush]] = [
+            QBrush(QColor.fromHsv(210, 40 + 200 * (level - MIN_LEVEL) // (MAX_LEVEL - MIN_LEVEL), 255))
+            for level in range(MAX_LEVEL + 1)
+        ] + [None]
+        self._center = int(Qt.AlignmentFlag.AlignCenter)
+        
+        analytics_controller.user_skill_controller.add_level_listener(self._on_levels_changed)
+        # 親ウィジェットと一緒に破棄された後は通知を受けない
+        listener = self._on_levels_changed
+        user_skill_controller = analytics_controller.user_skill_controller
+        self.destroyed.connect(lambda: user_skill_controller.remove_level_listener(listener))
+        self.reload()
+        
+    def close(self):
+        """レベル変更の通知を解除"""
+        self.analytics_controller.user_skill_controller.remove_level_listener(self._on_levels_changed)
+        
+    # ------------------------------------------------------------------
+    # 読み込み
+    # ------------------------------------------------------------------
+    def reload(self):
+        """スキルマトリクスと見出しを読み込み直す"""
+        try:
+            matrix = self.analytics_controller.get_matrix()
+            user_ids = [int(user_id) for user_id in matrix.user_ids]
+            skill_ids = [int(skill_id) for skill_id in matrix.skill_ids]
+            users = {user.id: user for user in self.user_controller.get_all_users()}
+            skills = {skill.id: skill for skill in self.skill_controller.get_all_skills()}
+            categories = {}
+            if self.category_controller is not None:
+                categories = {category.id: category.name for category in self.category_controller.get_all_categories()}
+                
+            self.beginResetModel()
+            self._levels = np.ascontiguousarray(matrix.to_dense(), dtype=np.int8)
+            self._row_of = {user_id: i for i, user_id in enumerate(user_ids)}
+            self._column_of = {skill_id: j for j, skill_id in enumerate(skill_ids)}
+            self._row_headers = [
+                f"{users[user_id].employee_id} {users[user_id].name}" if user_id in users else str(user_id)
+                for user_id in user_ids
+            ]
+            
+            # カテゴリーの先頭の列だけ1行目にカテゴリー名を出してまとまりを示す
+            self._column_headers = []
+            self._column_tooltips = []
+            previous_category = None
+            for skill_id, category_id in zip(skill_ids, matrix.skill_category_ids.tolist()):
+                skill_name = skills[skill_id].name if skill_id in skills else str(skill_id)
+                category_name = categories.get(category_id, str(category_id))
+                first_line = category_name if category_id != previous_category else ''
+                self._column_headers.append(f"{first_line}\n{skill_name}")
+                self._column_tooltips.append(f"{category_name} / {skill_name}")
+                previous_category = category_id
+            self.endResetModel()
+            
+            logger.debug(
+                f"{self.current_time} - Loaded skill matrix table: "
+                f"{len(user_ids)} users x {len(skill_ids)} skills"
+            )
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to load skill matrix table: {str(e)}")
+            raise
+            
+    def _on_levels_changed(self, changes: List[Tuple[int, int, Optional[int]]]):
+        """変更されたセルを書き換え、範囲をまとめて再描画を通知"""
+        rows = []
+        columns = []
+        for user_id, skill_id, level in changes:
+            i = self._row_of.get(user_id)
+            j = self._column_of.get(skill_id)
+            if i is None or j is None:
+                # 表に無いユーザー・スキルの変更は読み込み直して取り込む
+                self.reload()
+                return
+            self._levels[i, j] = UNSET if level is None else level
+            rows.append(i)
+            columns.append(j)
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), min(columns)),
+                self.index(max(rows), max(columns))
+            )
+            
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._levels.shape[0]
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._levels.shape[1]
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._level_texts[self._levels.item(index.row(), index.column())]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._level_brushes[self._levels.item(index.row(), index.column())]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._center
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._column_headers[section]
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self._column_tooltips[section]
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return self._row_headers[section]
+        return None
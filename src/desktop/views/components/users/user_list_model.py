@@ -0,0 +1,172 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+import logging
+from src.desktop.models.user import User
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+# 1回の追加読み込みで取得するユーザー数
+PAGE_SIZE = 200
+
+class UserListModel(QAbstractListModel):
+    """
+    ユーザーリストのモデル
+    
+    グループ表示では社員番号順のキーセットページングで、ビューのスクロールに合わせて
+    canFetchMore / fetchMore から必要な分だけ読み込む。作成・更新・削除は
+    行の挿入・削除・変更通知として反映し、一覧全体は作り直さない。
+    検索結果などの固定リストは set_users() で表示する（この場合は差分反映を行わない）。
+    """
+    
+    def __init__(self, user_controller, parent=None):
+        super().__init__(parent)
+        self.user_controller = user_controller
+        self.current_time = TimeProvider.get_current_time()
+        self._users: List[User] = []
+        # 読み込み済みユーザーの id → 社員番号（グループ表示中は社員番号の二分探索で行を求める）
+        self._employee_ids: Dict[int, str] = {}
+        # 固定リストの id → 行番号（固定リストは末尾への追加のみで行がずれない）
+        self._fixed_rows: Dict[int, int] = {}
+        # グループ表示（ページング）中かどうかと、その対象グループ（None の場合は全ユーザー）
+        self._paged = False
+        self._group_id: Optional[int] = None
+        self._has_more = False
+        
+    # ------------------------------------------------------------------
+    # QAbstractListModel
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._users)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._users):
+            return None
+        user = self._users[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{user.employee_id} - {user.name}"
+        if role == Qt.ItemDataRole.UserRole:
+            return user
+        return None
+        
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+        
+    def fetchMore(self, parent=QModelIndex()):
+        """次のページを末尾に追加"""
+        if not self.canFetchMore(parent):
+            return
+        try:
+            after = self._users[-1].employee_id if self._users else None
+            users = self.user_controller.get_users_page(after, PAGE_SIZE, self._group_id)
+            self._has_more = len(users) == PAGE_SIZE
+            if users:
+                self.beginInsertRows(QModelIndex(), len(self._users), len(self._users) + len(users) - 1)
+                self._users.extend(users)
+                self._employee_ids.update((user.id, user.employee_id) for user in users)
+                self.endInsertRows()
+                
+        except Exception as e:
+            self._has_more = False
+            logger.error(f"{self.current_time} - Failed to fetch users: {str(e)}")
+            raise
+            
+    # ------------------------------------------------------------------
+    # 表示内容の切り替え
+    # ------------------------------------------------------------------
+    def set_group(self, group_id: Optional[int] = None):
+        """グループのユーザーを社員番号順に表示（実際の読み込みはビューの要求時）"""
+        self.beginResetModel()
+        self._users = []
+        self._employee_ids = {}
+        self._fixed_rows = {}
+        self._paged = True
+        self._group_id = group_id
+        self._has_more = True
+        self.endResetModel()
+        
+    def set_users(self, users: Iterable[User]):
+        """ユーザーのリストをそのままの順序で表示"""
+        self.beginResetModel()
+        self._users = [user for user in users if user is not None]
+        self._employee_ids = {}
+        self._fixed_rows = {}
+        for row, user in enumerate(self._users):
+            self._fixed_rows.setdefault(user.id, row)
+        self._paged = False
+        self._group_id = None
+        self._has_more = False
+        self.endResetModel()
+        
+    def append_user(self, user: User):
+        """ユーザーを末尾に追加（固定リストとして表示中の場合）"""
+        self.beginInsertRows(QModelIndex(), len(self._users), len(self._users))
+        self._fixed_rows.setdefault(user.id, len(self._users))
+        self._users.append(user)
+        self.endInsertRows()
+        
+    def clear(self):
+        """空の固定リストにする"""
+        self.set_users(())
+        
+    def user_at(self, row: int) -> Optional[User]:
+        """行のユーザーを取得"""
+        if 0 <= row < len(self._users):
+            return self._users[row]
+        return None
+        
+    def row_of(self, user_id: int) -> int:
+        """ユーザーの行番号を取得（読み込み済みでない場合は -1）"""
+        if not self._paged:
+            return self._fixed_rows.get(user_id, -1)
+        employee_id = self._employee_ids.get(user_id)
+        if employee_id is None:
+            return -1
+        return bisect_left(self._users, employee_id, key=lambda loaded: loaded.employee_id)
+        
+    # ------------------------------------------------------------------
+    # 差分反映（グループ表示中のみ。固定リストの場合は False を返す）
+    # ------------------------------------------------------------------
+    def insert_user(self, user: User) -> bool:
+        """作成したユーザーを社員番号順の位置に挿入"""
+        if not self._paged:
+            return False
+        if self._group_id is not None and user.group_id != self._group_id:
+            return True
+        # 未読み込みの範囲に入るユーザーは以降の fetchMore で読み込まれる
+        if self._has_more and (not self._users or user.employee_id > self._users[-1].employee_id):
+            return True
+        row = bisect_left(self._users, user.employee_id, key=lambda loaded: loaded.employee_id)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._users.insert(row, user)
+        self._employee_ids[user.id] = user.employee_id
+        self.endInsertRows()
+        return True
+        
+    def update_user(self, user: User) -> bool:
+        """更新したユーザーの表示を変更（社員番号・グループの変更は削除と挿入）"""
+        if not self._paged:
+            return False
+        row = self.row_of(user.id)
+        if row >= 0 and self._users[row].employee_id == user.employee_id and (
+            self._group_id is None or user.group_id == self._group_id
+        ):
+            self._users[row] = user
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return True
+        self.remove_user(user.id)
+        return self.insert_user(user)
+        
+    def remove_user(self, user_id: int) -> bool:
+        """削除したユーザーの行を除く"""
+        if not self._paged:
+            return False
+        row = self.row_of(user_id)
+        if row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._users[row]
+            del self._employee_ids[user_id]
+            self.endRemoveRows()
+        return True
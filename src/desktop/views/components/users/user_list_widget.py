@@ -1,33 +1,68 @@
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem
+from PyQt6.QtWidgets import QListView, QAbstractItemView
 import logging
 from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.views.components.users.user_list_model import UserListModel
 
 logger = logging.getLogger(__name__)
 
-class UserListWidget(QListWidget):
+class UserListWidget(QListView):
+    """
+    ユーザーリスト
+    
+    UserListModel を表示し、スクロールに合わせて必要な分だけ読み込む。
+    行の高さをそろえてビューの再配置を行単位の計算で済ませる。
+    """
+    
     def __init__(self, user_controller, parent=None):
         super().__init__(parent)
         self.user_controller = user_controller
         self.current_time = TimeProvider.get_current_time()
         
+        self.user_model = UserListModel(user_controller, self)
+        self.setModel(self.user_model)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        
+    def set_group(self, group_id=None):
+        """グループのユーザーを社員番号順に表示（None の場合は全ユーザー）"""
+        self.user_model.set_group(group_id)
+        
+    def set_users(self, users):
+        """ユーザーのリストをそのままの順序で表示"""
+        self.user_model.set_users(users)
+        
     def add_user(self, user):
-        """ユーザーをリストに追加"""
+        """ユーザーをリストの末尾に追加"""
         try:
-            item = QListWidgetItem(f"{user.employee_id} - {user.name}")
-            item.user = user
-            self.addItem(item)
-            logger.debug(f"{self.current_time} - Added user to list: {user.name}")
+            self.user_model.append_user(user)
             
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to add user to list: {str(e)}")
             raise
             
+    def clear(self):
+        """リストを空にする"""
+        self.user_model.clear()
+        
+    def insert_user(self, user) -> bool:
+        """作成したユーザーを反映（差分反映できない表示の場合は False）"""
+        return self.user_model.insert_user(user)
+        
+    def update_user(self, user) -> bool:
+        """更新したユーザーを反映（差分反映できない表示の場合は False）"""
+        return self.user_model.update_user(user)
+        
+    def remove_user(self, user_id) -> bool:
+        """削除したユーザーを反映（差分反映できない表示の場合は False）"""
+        return self.user_model.remove_user(user_id)
+        
     def get_selected_user(self):
         """選択されているユーザーを取得"""
         try:
-            current_item = self.currentItem()
-            if current_item:
-                return current_item.user
+            index = self.currentIndex()
+            if index.isValid():
+                return self.user_model.user_at(index.row())
             return None
             
         except Exception as e:
@@ -0,0 +1,115 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout,
+    QLabel, QSpinBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QPushButton, QMessageBox
+)
+import logging
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+class CandidateSearchDialog(QDialog):
+    def __init__(self, skill_controller, parent=None):
+        """
+        候補者検索の要件入力ダイアログ
+        
+        Args:
+            skill_controller: スキルコントローラー
+            parent: 親ウィジェット
+        """
+        super().__init__(parent)
+        self.skill_controller = skill_controller
+        self.requirements = None
+        self.limit = 10
+        self.current_time = TimeProvider.get_current_time()
+        
+        self.init_ui()
+        self.load_skills()
+        
+    def init_ui(self):
+        """UIの初期化"""
+        try:
+            self.setWindowTitle("候補者検索")
+            
+            layout = QVBoxLayout(self)
+            layout.setSpacing(10)
+            
+            # スキルごとの重み（0は要件に含めない）
+            layout.addWidget(QLabel("スキルごとの重み（0は対象外）:"))
+            self.skill_table = QTableWidget(0, 2)
+            self.skill_table.setHorizontalHeaderLabels(["スキル", "重み"])
+            self.skill_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            self.skill_table.verticalHeader().setVisible(False)
+            layout.addWidget(self.skill_table)
+            
+            # 取得人数
+            limit_layout = QHBoxLayout()
+            limit_label = QLabel("人数:")
+            self.limit_spin = QSpinBox()
+            self.limit_spin.setRange(1, 100)
+            self.limit_spin.setValue(self.limit)
+            limit_layout.addWidget(limit_label)
+            limit_layout.addWidget(self.limit_spin)
+            layout.addLayout(limit_layout)
+            
+            # ボタン
+            button_layout = QHBoxLayout()
+            self.ok_button = QPushButton("検索")
+            self.cancel_button = QPushButton("キャンセル")
+            button_layout.addWidget(self.ok_button)
+            button_layout.addWidget(self.cancel_button)
+            layout.addLayout(button_layout)
+            
+            # シグナル/スロット接続
+            self.ok_button.clicked.connect(self.accept)
+            self.cancel_button.clicked.connect(self.reject)
+            
+            self.setMinimumSize(360, 420)
+            
+            logger.debug(f"{self.current_time} - CandidateSearchDialog UI initialized")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to initialize CandidateSearchDialog UI: {str(e)}")
+            raise
+            
+    def load_skills(self):
+        """スキル一覧を読み込む"""
+        try:
+            skills = self.skill_controller.get_all_skills()
+            self.skill_table.setRowCount(len(skills))
+            for row, skill in enumerate(skills):
+                item = QTableWidgetItem(skill.name)
+                item.skill_id = skill.id
+                self.skill_table.setItem(row, 0, item)
+                weight_spin = QSpinBox()
+                weight_spin.setRange(0, 10)
+                self.skill_table.setCellWidget(row, 1, weight_spin)
+                
+            logger.debug(f"{self.current_time} - Loaded {len(skills)} skills for candidate search")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to load skills: {str(e)}")
+            raise
+            
+    def accept(self):
+        """検索ボタンが押された時の処理"""
+        try:
+            requirements = {}
+            for row in range(self.skill_table.rowCount()):
+                weight = self.skill_table.cellWidget(row, 1).value()
+                if weight > 0:
+                    requirements[self.skill_table.item(row, 0).skill_id] = float(weight)
+                    
+            if not requirements:
+                QMessageBox.warning(self, "警告", "重みを1つ以上設定してください。")
+                return
+                
+            self.requirements = requirements
+            self.limit = self.limit_spin.value()
+            
+            logger.debug(f"{self.current_time} - Candidate search requirements accepted: {len(requirements)} skills")
+            super().accept()
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to process candidate search requirements: {str(e)}")
+            QMessageBox.critical(self, "エラー", "データの処理に失敗しました。")
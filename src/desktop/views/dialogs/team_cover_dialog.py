@@ -0,0 +1,114 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout,
+    QLabel, QSpinBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QPushButton, QMessageBox, QCheckBox
+)
+import logging
+from src.desktop.utils.time_utils import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+# 要件に含めないスキルを表すスピンボックスの値
+NOT_REQUIRED = -1
+
+class TeamCoverDialog(QDialog):
+    def __init__(self, skill_controller, parent=None):
+        """
+        チーム編成のスキル要件入力ダイアログ
+        
+        Args:
+            skill_controller: スキルコントローラー
+            parent: 親ウィジェット
+        """
+        super().__init__(parent)
+        self.skill_controller = skill_controller
+        self.requirements = None
+        self.exact = False
+        self.current_time = TimeProvider.get_current_time()
+        
+        self.init_ui()
+        self.load_skills()
+        
+    def init_ui(self):
+        """UIの初期化"""
+        try:
+            self.setWindowTitle("チーム編成")
+            
+            layout = QVBoxLayout(self)
+            layout.setSpacing(10)
+            
+            # スキルごとの最低レベル
+            layout.addWidget(QLabel("スキルごとの最低レベル:"))
+            self.skill_table = QTableWidget(0, 2)
+            self.skill_table.setHorizontalHeaderLabels(["スキル", "最低レベル"])
+            self.skill_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            self.skill_table.verticalHeader().setVisible(False)
+            layout.addWidget(self.skill_table)
+            
+            # 最小人数を厳密に求めるか（小規模向け）
+            self.exact_check = QCheckBox("最小人数を厳密に求める")
+            layout.addWidget(self.exact_check)
+            
+            # ボタン
+            button_layout = QHBoxLayout()
+            self.ok_button = QPushButton("編成")
+            self.cancel_button = QPushButton("キャンセル")
+            button_layout.addWidget(self.ok_button)
+            button_layout.addWidget(self.cancel_button)
+            layout.addLayout(button_layout)
+            
+            # シグナル/スロット接続
+            self.ok_button.clicked.connect(self.accept)
+            self.cancel_button.clicked.connect(self.reject)
+            
+            self.setMinimumSize(360, 420)
+            
+            logger.debug(f"{self.current_time} - TeamCoverDialog UI initialized")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to initialize TeamCoverDialog UI: {str(e)}")
+            raise
+            
+    def load_skills(self):
+        """スキル一覧を読み込む"""
+        try:
+            skills = self.skill_controller.get_all_skills()
+            self.skill_table.setRowCount(len(skills))
+            for row, skill in enumerate(skills):
+                item = QTableWidgetItem(skill.name)
+                item.skill_id = skill.id
+                self.skill_table.setItem(row, 0, item)
+                level_spin = QSpinBox()
+                level_spin.setRange(NOT_REQUIRED, 5)
+                level_spin.setSpecialValueText("対象外")
+                level_spin.setValue(NOT_REQUIRED)
+                self.skill_table.setCellWidget(row, 1, level_spin)
+                
+            logger.debug(f"{self.current_time} - Loaded {len(skills)} skills for team cover")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to load skills: {str(e)}")
+            raise
+            
+    def accept(self):
+        """編成ボタンが押された時の処理"""
+        try:
+            requirements = []
+            for row in range(self.skill_table.rowCount()):
+                level = self.skill_table.cellWidget(row, 1).value()
+                if level != NOT_REQUIRED:
+                    requirements.append((self.skill_table.item(row, 0).skill_id, level))
+                    
+            if not requirements:
+                QMessageBox.warning(self, "警告", "最低レベルを1つ以上設定してください。")
+                return
+                
+            self.requirements = requirements
+            self.exact = self.exact_check.isChecked()
+            
+            logger.debug(f"{self.current_time} - Team cover requirements accepted: {len(requirements)} skills")
+            super().accept()
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - Failed to process team cover requirements: {str(e)}")
+            QMessageBox.critical(self, "エラー", "データの処理に失敗しました。")
@@ -4,6 +4,9 @@ from PyQt6.QtWidgets import (
 )
 from datetime import datetime
 from .tabs.system_management.system_management_tab import SystemManagementTab
+from .components.main_panel import MainPanel
+from .tabs.search_tab import SearchTab
+from .tabs.skill_evaluation_tab import SkillEvaluationTab
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
@@ -38,6 +41,26 @@ class MainWindow(QMainWindow):
             self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
             self.tab_widget.setMovable(True)
             
+            # ユーザー管理タブの追加（コントローラーが渡された場合のみ）
+            if self.controllers:
+                self.main_panel = MainPanel(
+                    self.controllers['user'],
+                    self.controllers['group'],
+                    skill_controller=self.controllers['skill'],
+                    analytics_controller=self.controllers['analytics'],
+                    role_controller=self.controllers['role']
+                )
+                self.tab_widget.addTab(self.main_panel, "ユーザー管理")
+                self.skill_evaluation_tab = SkillEvaluationTab(
+                    self.controllers['analytics'],
+                    self.controllers['user'],
+                    self.controllers['skill'],
+                    self.controllers['category']
+                )
+                self.tab_widget.addTab(self.skill_evaluation_tab, "スキル評価")
+                self.search_tab = SearchTab(self.controllers['search'])
+                self.tab_widget.addTab(self.search_tab, "検索")
+            
             # システム管理タブの追加
             system_management_tab = SystemManagementTab(self.controllers)
             self.tab_widget.addTab(system_management_tab, "システム管理")
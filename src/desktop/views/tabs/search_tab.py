@@ -0,0 +1,85 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel,
+    QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer
+from src.desktop.models.search_result import KIND_USER, KIND_SKILL, KIND_SKILL_CATEGORY, KIND_CATEGORY
+from src.desktop.utils.time_utils import TimeProvider
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 検索欄の入力が止まってから検索するまでの待ち時間（ミリ秒）
+SEARCH_DEBOUNCE_MS = 150
+# 表示する検索結果の件数の上限
+SEARCH_RESULT_LIMIT = 50
+
+# 検索結果の種類の表示名
+KIND_LABELS = {
+    KIND_USER: "ユーザー",
+    KIND_SKILL: "スキル",
+    KIND_SKILL_CATEGORY: "スキルカテゴリー",
+    KIND_CATEGORY: "カテゴリー",
+}
+
+class SearchTab(QWidget):
+    def __init__(self, search_controller, parent=None):
+        super().__init__(parent)
+        self.search_controller = search_controller
+        self.current_time = TimeProvider.get_current_time()
+        self.current_user = "GingaDza"
+        
+        self.init_ui()
+        
+    def init_ui(self):
+        """UIの初期化"""
+        try:
+            layout = QVBoxLayout(self)
+            
+            # 検索欄（入力が止まってから検索する）
+            self.search_edit = QLineEdit()
+            self.search_edit.setPlaceholderText("ユーザー・スキル・カテゴリーを検索")
+            self.search_edit.setClearButtonEnabled(True)
+            layout.addWidget(self.search_edit)
+            self.search_timer = QTimer(self)
+            self.search_timer.setSingleShot(True)
+            self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+            
+            # 検索結果（一致度の高い順）
+            self.result_list = QListWidget()
+            layout.addWidget(self.result_list)
+            self.summary_label = QLabel()
+            layout.addWidget(self.summary_label)
+            
+            self.search_edit.textChanged.connect(self.search_timer.start)
+            self.search_timer.timeout.connect(self.update_results)
+            
+            logger.debug(f"{self.current_time} - {self.current_user} initialized SearchTab UI")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - {self.current_user} failed to initialize SearchTab UI: {str(e)}")
+            raise
+            
+    def update_results(self):
+        """検索欄の内容で検索し、結果を表示"""
+        try:
+            self.search_timer.stop()
+            self.result_list.clear()
+            query = self.search_edit.text().strip()
+            if not query:
+                self.summary_label.clear()
+                return
+                
+            results = self.search_controller.search(query, SEARCH_RESULT_LIMIT)
+            for result in results:
+                text = f"[{KIND_LABELS.get(result.kind, result.kind)}] {result.title}"
+                if result.detail:
+                    text += f" - {result.detail}"
+                item = QListWidgetItem(text)
+                item.setData(Qt.ItemDataRole.UserRole, result)
+                self.result_list.addItem(item)
+            self.summary_label.setText(f"{len(results)} 件")
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - {self.current_user} failed to search: {str(e)}")
+            QMessageBox.warning(self, "エラー", f"検索に失敗しました: {str(e)}")
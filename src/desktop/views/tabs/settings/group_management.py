@@ -63,10 +63,10 @@ class GroupManagementWidget(QWidget):
     def load_data(self):
         """グループデータの読み込み"""
         try:
-            groups = self.group_controller.get_all_groups()
+            groups = self.group_controller.get_groups_with_member_counts()
             
             self.table.setRowCount(len(groups))
-            for i, group in enumerate(groups):
+            for i, (group, member_count) in enumerate(groups):
                 # グループID
                 id_item = QTableWidgetItem(str(group.id))
                 id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
@@ -77,8 +77,8 @@ class GroupManagementWidget(QWidget):
                 name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
                 self.table.setItem(i, 1, name_item)
                 
-                # 所属人数（実装予定）
-                count_item = QTableWidgetItem("0")  # 仮の値
+                # 所属人数
+                count_item = QTableWidgetItem(str(member_count))
                 count_item.setFlags(count_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
                 self.table.setItem(i, 2, count_item)
                 
@@ -1,17 +1,27 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from datetime import datetime
-# 相対インポートを絶対インポートに変更
-from desktop.utils.time_utils import TimeProvider
-from desktop.controllers.skill_controller import SkillController
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableView, QHeaderView, QAbstractItemView
+)
+from src.desktop.utils.time_utils import TimeProvider
+from src.desktop.views.components.skills.skill_matrix_model import SkillMatrixTableModel
 import logging
 
 logger = logging.getLogger(__name__)
 
+# セルの幅・高さ（固定サイズにして見出しの内容からの計算を行わない）
+CELL_WIDTH = 56
+CELL_HEIGHT = 24
+ROW_HEADER_WIDTH = 200
+
 class SkillEvaluationTab(QWidget):
-    def __init__(self, controllers):
-        super().__init__()
-        self.controllers = controllers
-        self.current_time = datetime(2025, 2, 3, 9, 5, 7)
+    def __init__(self, analytics_controller, user_controller, skill_controller,
+                 category_controller=None, parent=None):
+        super().__init__(parent)
+        self.analytics_controller = analytics_controller
+        self.user_controller = user_controller
+        self.skill_controller = skill_controller
+        self.category_controller = category_controller
+        self.current_time = TimeProvider.get_current_time()
         self.current_user = "GingaDza"
         
         self.init_ui()
@@ -21,11 +31,57 @@ class SkillEvaluationTab(QWidget):
         try:
             layout = QVBoxLayout(self)
             
-            # 仮のラベル
-            layout.addWidget(QLabel("スキル評価タブ"))
+            # 件数表示・再読み込みボタン
+            header_layout = QHBoxLayout()
+            self.summary_label = QLabel()
+            self.reload_button = QPushButton("再読み込み")
+            header_layout.addWidget(self.summary_label)
+            header_layout.addStretch()
+            header_layout.addWidget(self.reload_button)
+            layout.addLayout(header_layout)
+            
+            # ユーザー × スキルの表（表示範囲のセルだけが描画される）
+            self.matrix_model = SkillMatrixTableModel(
+                self.analytics_controller, self.user_controller,
+                self.skill_controller, self.category_controller, self
+            )
+            self.matrix_view = QTableView()
+            self.matrix_view.setModel(self.matrix_model)
+            self.matrix_view.setWordWrap(False)
+            self.matrix_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            self.matrix_view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+            self.matrix_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+            
+            horizontal_header = self.matrix_view.horizontalHeader()
+            horizontal_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            horizontal_header.setDefaultSectionSize(CELL_WIDTH)
+            vertical_header = self.matrix_view.verticalHeader()
+            vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            vertical_header.setDefaultSectionSize(CELL_HEIGHT)
+            vertical_header.setFixedWidth(ROW_HEADER_WIDTH)
+            layout.addWidget(self.matrix_view)
+            
+            self.reload_button.clicked.connect(self.reload)
+            self.matrix_model.modelReset.connect(self.update_summary)
+            self.update_summary()
             
             logger.debug(f"{self.current_time} - {self.current_user} initialized SkillEvaluationTab UI")
             
         except Exception as e:
             logger.error(f"{self.current_time} - {self.current_user} failed to initialize SkillEvaluationTab UI: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+            
+    def reload(self):
+        """スキルマトリクスを読み込み直す"""
+        try:
+            self.matrix_model.reload()
+            
+        except Exception as e:
+            logger.error(f"{self.current_time} - {self.current_user} failed to reload skill matrix: {str(e)}")
+            raise
+            
+    def update_summary(self):
+        """ユーザー数・スキル数の表示を更新"""
+        self.summary_label.setText(
+            f"ユーザー: {self.matrix_model.rowCount()} 人 / スキル: {self.matrix_model.columnCount()} 件"
+        )
\ No newline at end of file
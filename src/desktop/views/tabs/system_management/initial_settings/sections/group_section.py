@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QListWidget, QDialog, QMessageBox
 )
 from .....dialogs.input_dialog import InputDialog
+from ......utils.text_normalizer import normalize_key
 import logging
 from datetime import datetime
 
@@ -17,6 +18,8 @@ class GroupSection(QGroupBox):
         
         logger.debug(f"{self.current_time} - {self.current_user} GroupSection initialization started")
         self.groups = []
+        # 重複確認用の正規化したグループ名（全角・半角、ひらがな・カタカナ、大文字・小文字を区別しない）
+        self.group_keys = set()
         self.setup_ui()
         logger.debug(f"{self.current_time} - {self.current_user} GroupSection initialization completed")
     
@@ -86,6 +89,7 @@ class GroupSection(QGroupBox):
                 
                 if self.validate_input(name):
                     self.groups.append(name)
+                    self.group_keys.add(normalize_key(name))
                     self.group_list.addItem(name)
                     logger.info(f"{self.current_time} - {self.current_user} Group added: {name}")
         except Exception as e:
@@ -113,6 +117,8 @@ class GroupSection(QGroupBox):
                 if self.validate_input(new_name, exclude=old_name):
                     idx = self.groups.index(old_name)
                     self.groups[idx] = new_name
+                    self.group_keys.discard(normalize_key(old_name))
+                    self.group_keys.add(normalize_key(new_name))
                     current_item.setText(new_name)
                     logger.info(f"{self.current_time} - {self.current_user} Group edited: {old_name} -> {new_name}")
         except Exception as e:
@@ -134,6 +140,7 @@ class GroupSection(QGroupBox):
             
             if self.show_confirmation(f"グループ '{name}' を削除しますか？"):
                 self.groups.remove(name)
+                self.group_keys.discard(normalize_key(name))
                 self.group_list.takeItem(self.group_list.row(current_item))
                 logger.info(f"{self.current_time} - {self.current_user} Group deleted: {name}")
         except Exception as e:
@@ -154,7 +161,8 @@ class GroupSection(QGroupBox):
         if not name:
             self.show_error("グループ名を入力してください。")
             return False
-        if name in self.groups and name != exclude:
+        key = normalize_key(name)
+        if key in self.group_keys and (exclude is None or key != normalize_key(exclude)):
             self.show_error("このグループ名は既に存在します。")
             return False
         return True
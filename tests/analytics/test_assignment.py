@@ -0,0 +1,73 @@
+import itertools
+import time
+import numpy as np
+import pytest
+from src.desktop.analytics.assignment import Position, assign_positions, solve_assignment
+
+def brute_force(cost):
+    """割り当て件数が最大で、その中でコスト合計が最小となる (件数, 合計)"""
+    n_rows, n_cols = cost.shape
+    best = (0, 0.0)
+    for cols in itertools.permutations(range(n_cols), n_rows) if n_rows <= n_cols else ():
+        pairs = [(i, j) for i, j in enumerate(cols) if np.isfinite(cost[i, j])]
+        total = sum(cost[i, j] for i, j in pairs)
+        if (len(pairs), -total) > (best[0], -best[1]):
+            best = (len(pairs), total)
+    return best
+
+def check_against_brute_force(cost):
+    rows, cols = solve_assignment(cost)
+    assert len(set(rows.tolist())) == len(rows)
+    assert len(set(cols.tolist())) == len(cols)
+    assert np.isfinite(cost[rows, cols]).all()
+    assert list(rows) == sorted(rows)
+    count, total = brute_force(cost if cost.shape[0] <= cost.shape[1] else cost.T)
+    assert len(rows) == count
+    assert cost[rows, cols].sum() == pytest.approx(total)
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_brute_force_on_small_tied_costs(seed):
+    rng = np.random.default_rng(seed)
+    shape = tuple(rng.integers(1, 6, 2))
+    # 0.2 刻みの適合度（同点が多い）と割り当て不可の組
+    cost = -rng.integers(0, 6, shape) * 0.2
+    cost[rng.random(shape) < 0.3] = np.inf
+    check_against_brute_force(cost)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_matches_brute_force_on_small_continuous_costs(seed):
+    rng = np.random.default_rng(100 + seed)
+    shape = tuple(rng.integers(1, 6, 2))
+    check_against_brute_force(rng.normal(size=shape))
+
+def test_all_infinite_costs_assign_nothing():
+    rows, cols = solve_assignment(np.full((3, 4), np.inf))
+    assert len(rows) == len(cols) == 0
+
+def test_tied_benchmark_size_is_fast():
+    rng = np.random.default_rng(19)
+    cost = -rng.integers(0, 6, (200, 2000)) * 0.2
+    start = time.perf_counter()
+    rows, cols = solve_assignment(cost)
+    elapsed = time.perf_counter() - start
+    # 各行に最大の適合度 1.0 の列が十分あるため全行が 1.0 で割り当てられる
+    assert len(rows) == 200
+    assert cost[rows, cols].sum() == pytest.approx(-200.0)
+    assert elapsed < 0.3
+
+def test_assign_positions_respects_groups_and_min_fit():
+    fit = np.array([
+        [0.9, 0.1],
+        [0.8, 0.7],
+        [0.2, 0.6],
+    ])
+    result = assign_positions(
+        fit,
+        role_ids=np.array([10, 20]),
+        user_ids=np.array([1, 2, 3]),
+        user_group_ids=np.array([5, 6, 6]),
+        positions=[Position(10), Position(20, group_id=6), Position(20, group_id=5)],
+        min_fit=0.5
+    )
+    assert sorted(result.assignments) == [(0, 10, 1, 0.9), (1, 20, 2, 0.7)]
+    assert result.unfilled == [2]
@@ -0,0 +1,105 @@
+import random
+import numpy as np
+import pytest
+from src.desktop.analytics.bitset_index import N_THRESHOLDS, And, Has, InGroup, Not, Or, Query, SkillBitsetIndex
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.skill_matrix import UNSET, SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+GROUPS = [None, 1, 2, 3]
+
+def random_rows(rng, n_users, n_skills):
+    """ランダムなユーザー・スキル・レベルの行と、対応する密行列"""
+    users = [(user_id, rng.choice(GROUPS)) for user_id in rng.sample(range(1, 1000), n_users)]
+    skills = [(skill_id, 1) for skill_id in range(100, 100 + n_skills)]
+    dense = np.full((n_users, n_skills), UNSET)
+    for i in range(n_users):
+        for j in range(n_skills):
+            if rng.random() < 0.6:
+                dense[i, j] = rng.randint(0, 5)
+    levels = [(users[i][0], skills[j][0], int(dense[i, j])) for i, j in zip(*np.nonzero(dense != UNSET))]
+    return users, skills, levels, dense
+
+def random_query(rng, skills, depth=0):
+    """ランダムな条件と、行列の各行が条件を満たすかを返す関数"""
+    kind = rng.random() if depth < 3 else 0.0
+    if kind < 0.45:
+        j = rng.randrange(len(skills) + 1)
+        level = rng.randrange(N_THRESHOLDS)
+        if j == len(skills):
+            # 未知のスキルは誰も満たさない
+            return Has(9999, level), lambda dense, groups: np.zeros(len(dense), dtype=bool)
+        return Has(skills[j][0], level), lambda dense, groups: dense[:, j] >= level
+    if kind < 0.55:
+        group_id = rng.choice(GROUPS + [99])
+        return InGroup(group_id), lambda dense, groups: np.array([g == group_id for g in groups], dtype=bool)
+    if kind < 0.7:
+        query, expected = random_query(rng, skills, depth + 1)
+        return ~query, lambda dense, groups: ~expected(dense, groups)
+    terms = [random_query(rng, skills, depth + 1) for _ in range(rng.randint(1, 3))]
+    combine = np.logical_and if kind < 0.85 else np.logical_or
+    query_class = And if kind < 0.85 else Or
+    query = query_class(*[query for query, _ in terms])
+
+    def expected(dense, groups):
+        result = terms[0][1](dense, groups)
+        for _, term in terms[1:]:
+            result = combine(result, term(dense, groups))
+        return result
+    return query, expected
+
+def check_queries(index, rng, users, skills, dense, n_queries=60):
+    groups = [group_id for _, group_id in users]
+    user_ids = np.array([user_id for user_id, _ in users])
+    assert index.row_user_ids.tolist() == user_ids.tolist()
+    for _ in range(n_queries):
+        query, expected = random_query(rng, skills)
+        mask = expected(dense, groups)
+        assert index.user_ids(query).tolist() == user_ids[mask].tolist(), repr(query)
+        assert index.count(query) == int(mask.sum())
+
+@pytest.mark.parametrize('matrix_class', [SkillMatrix, SparseSkillMatrix, PackedSkillMatrix])
+@pytest.mark.parametrize('n_users', [1, 63, 64, 65, 200])
+def test_queries_match_brute_force(matrix_class, n_users):
+    rng = random.Random(n_users)
+    users, skills, levels, dense = random_rows(rng, n_users, n_skills=6)
+    index = SkillBitsetIndex(matrix_class.from_rows(users, skills, levels))
+    check_queries(index, rng, users, skills, dense)
+    for j, (skill_id, _) in enumerate(skills):
+        for level in range(N_THRESHOLDS):
+            assert index.count(Has(skill_id, level)) == int((dense[:, j] >= level).sum())
+
+def test_cell_updates_match_brute_force():
+    rng = random.Random(11)
+    users, skills, levels, dense = random_rows(rng, 130, n_skills=5)
+    index = SkillBitsetIndex(SkillMatrix.from_rows(users, skills, levels))
+    changes = []
+    for _ in range(200):
+        i, j = rng.randrange(len(users)), rng.randrange(len(skills))
+        level = rng.choice([None, 0, 1, 2, 3, 4, 5])
+        dense[i, j] = UNSET if level is None else level
+        changes.append((users[i][0], skills[j][0], level))
+    assert index.apply_changes(changes)
+    assert not index.apply_changes([(users[0][0], 9999, 3)])
+    check_queries(index, rng, users, skills, dense)
+
+def test_not_excludes_padding_bits():
+    index = SkillBitsetIndex(SkillMatrix.from_rows([(1, None), (2, 1)], [(10, 1)], [(1, 10, 4)]))
+    assert index.user_ids(~Has(10, 5)).tolist() == [1, 2]
+    assert index.count(Not(InGroup(7))) == 2
+    assert index.user_ids(Has(10) & ~InGroup(None)).tolist() == []
+
+@pytest.mark.parametrize('level', [-1, N_THRESHOLDS])
+def test_has_rejects_levels_outside_range(level):
+    with pytest.raises(ValueError):
+        Has(10, level)
+
+def test_query_requires_evaluate():
+    with pytest.raises(TypeError):
+        Query()
+
+    class Incomplete(Query):
+        pass
+
+    with pytest.raises(TypeError, match='evaluate'):
+        Incomplete()
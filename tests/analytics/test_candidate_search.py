@@ -0,0 +1,125 @@
+import random
+import numpy as np
+import pytest
+from src.desktop.analytics.candidate_search import CandidateSearch
+from src.desktop.analytics.skill_matrix import SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+from src.desktop.controllers.analytics_controller import AnalyticsController
+from src.desktop.controllers.user_skill_controller import UserSkillController
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.managers.user_skill_manager import UserSkillManager
+
+def random_matrix(rng, matrix_class, n_users, n_skills, density):
+    users = [(user_id, rng.choice([None, 1, 2])) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, 1) for skill_id in range(100, 100 + n_skills)]
+    levels = [
+        (user_id, skill_id, rng.randint(0, 5))
+        for user_id, _ in users for skill_id, _ in skills if rng.random() < density
+    ]
+    return matrix_class.from_rows(users, skills, levels)
+
+def brute_force_scores(matrix, requirements, rows=None):
+    """対象の全ユーザーを採点した user_id → スコア（スコア0は除く）"""
+    rows = np.arange(matrix.shape[0]) if rows is None else rows
+    scores = {}
+    for i in rows.tolist():
+        user_id = int(matrix.user_ids[i])
+        score = sum(
+            weight * max(matrix.get_level(user_id, skill_id) or 0, 0)
+            for skill_id, weight in requirements.items()
+        )
+        if score > 0:
+            scores[user_id] = score
+    return scores
+
+def check_top_k(candidates, scores, k):
+    """上位 k 人であること（k 位の同点はどれを選んでもよい）"""
+    expected = sorted(scores.values(), reverse=True)[:k]
+    assert [candidate.score for candidate in candidates] == pytest.approx(expected)
+    assert len({candidate.user_id for candidate in candidates}) == len(candidates)
+    for candidate in candidates:
+        assert candidate.score == pytest.approx(scores[candidate.user_id])
+    if candidates:
+        kth = candidates[-1].score
+        chosen = {candidate.user_id for candidate in candidates}
+        assert all(user_id in chosen for user_id, score in scores.items() if score > kth + 1e-9)
+
+@pytest.mark.parametrize('matrix_class', [SkillMatrix, SparseSkillMatrix])
+@pytest.mark.parametrize('seed', range(6))
+def test_top_k_matches_brute_force(matrix_class, seed):
+    rng = random.Random(seed)
+    matrix = random_matrix(rng, matrix_class, n_users=150, n_skills=8, density=rng.choice([0.1, 0.5, 0.9]))
+    search = CandidateSearch(matrix, max_batch_size=16)
+    for _ in range(20):
+        skills = rng.sample(range(100, 108), rng.randint(1, 4))
+        # 整数の重みでは同点が多く、小数の重みでは少ない
+        requirements = {skill_id: rng.choice([1, 2, 0.7, 1.3]) for skill_id in skills}
+        k = rng.choice([1, 3, 10, 200])
+        group_id = rng.choice([None, 1, 2])
+        rows = None if group_id is None else matrix.user_indices(group_id)
+        candidates = search.top_k(requirements, k, rows)
+        check_top_k(candidates, brute_force_scores(matrix, requirements, rows), k)
+
+def test_posting_lists_follow_level_changes():
+    rng = random.Random(5)
+    matrix = random_matrix(rng, SkillMatrix, n_users=60, n_skills=4, density=0.5)
+    search = CandidateSearch(matrix)
+    requirements = {100: 1.0, 101: 2.0}
+    search.top_k(requirements, 5)
+    for _ in range(30):
+        user_id, skill_id = rng.randint(1, 60), rng.choice([100, 101])
+        matrix.set_level(user_id, skill_id, rng.choice([None, 0, 5]))
+        search.invalidate_skills([skill_id])
+    check_top_k(search.top_k(requirements, 5), brute_force_scores(matrix, requirements), 5)
+
+def test_threshold_stops_before_scoring_everyone():
+    # 先頭の数人だけがレベル5で、残りは低いレベル
+    users = [(user_id, None) for user_id in range(1, 1001)]
+    levels = [(user_id, 10, 5 if user_id <= 3 else 1) for user_id, _ in users]
+    matrix = SkillMatrix.from_rows(users, [(10, 1)], levels)
+    search = CandidateSearch(matrix)
+    candidates = search.top_k({10: 1.0}, 3)
+    assert sorted(candidate.user_id for candidate in candidates) == [1, 2, 3]
+    assert search.last_scored_count < 100
+
+def test_invalid_and_unknown_requirements():
+    matrix = SkillMatrix.from_rows([(1, None)], [(10, 1)], [(1, 10, 3)])
+    search = CandidateSearch(matrix)
+    with pytest.raises(ValueError):
+        search.top_k({10: 0}, 3)
+    assert search.top_k({99: 1.0}, 3) == []
+    assert search.top_k({10: 1.0}, 0) == []
+
+def test_controller_candidates_follow_committed_levels(database):
+    group = GroupManager(database).create_group('開発')
+    users = UserManager(database)
+    skills = SkillManager(database)
+    user_skill_controller = UserSkillController(UserSkillManager(database))
+    analytics = AnalyticsController(user_skill_controller)
+    user_ids = [users.create_user(f'E{i}', f'ユーザー{i}', group.id if i % 2 else None).id for i in range(6)]
+    skill_ids = [skills.create_skill(1, name).id for name in ('Python', 'SQL')]
+    user_skill_controller.set_levels_bulk(
+        [(user_id, skill_ids[0], i) for i, user_id in enumerate(user_ids)]
+        + [(user_id, skill_ids[1], 5 - i) for i, user_id in enumerate(user_ids)]
+    )
+    requirements = {skill_ids[0]: 2.0, skill_ids[1]: 1.0}
+    scores = brute_force_scores(analytics.get_matrix(), requirements)
+    check_top_k(analytics.find_candidates(requirements, 2), scores, 2)
+
+    # コミットされたレベル変更は転置リストに反映される
+    user_skill_controller.set_level(user_ids[0], skill_ids[0], 5)
+    scores = brute_force_scores(analytics.get_matrix(), requirements)
+    assert scores[user_ids[0]] == 15.0
+    candidates = analytics.find_candidates(requirements, 2)
+    check_top_k(candidates, scores, 2)
+    assert candidates[0].user_id == user_ids[0]
+
+    group_rows = analytics.get_matrix().user_indices(group.id)
+    check_top_k(
+        analytics.find_candidates(requirements, 2, group_id=group.id),
+        brute_force_scores(analytics.get_matrix(), requirements, group_rows),
+        2
+    )
+    analytics.close()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from src.desktop.analytics.factory import create_skill_matrix, estimate_bytes
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.skill_matrix import UNSET, SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+def rows_with_density(n_users, n_skills, density, seed=0):
+    rng = np.random.default_rng(seed)
+    users = [(user_id, None) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, 1) for skill_id in range(1, n_skills + 1)]
+    mask = rng.random((n_users, n_skills)) < density
+    dense = np.where(mask, rng.integers(0, 6, (n_users, n_skills)), UNSET)
+    levels = [(i + 1, j + 1, int(dense[i, j])) for i, j in zip(*np.nonzero(mask))]
+    return users, skills, levels, dense
+
+def test_estimate_bytes():
+    assert estimate_bytes(10, 8, 5) == {'dense': 80, 'packed': 30, 'sparse': 5 * 5 + 11 * 8}
+
+def test_small_matrix_is_always_dense():
+    users, skills, levels, dense = rows_with_density(20, 10, 0.01)
+    matrix = create_skill_matrix(users, skills, levels)
+    assert type(matrix) is SkillMatrix
+    assert np.array_equal(matrix.to_dense(), dense)
+
+@pytest.mark.parametrize('density, packed_min_cells, expected', [
+    (0.01, 10**9, SparseSkillMatrix),
+    (0.9, 10**9, SkillMatrix),
+    (0.01, 0, SparseSkillMatrix),
+    (0.9, 0, PackedSkillMatrix),
+])
+def test_backend_follows_estimated_memory(density, packed_min_cells, expected):
+    users, skills, levels, dense = rows_with_density(60, 40, density)
+    matrix = create_skill_matrix(users, skills, levels, dense_max_cells=0, packed_min_cells=packed_min_cells)
+    assert type(matrix) is expected
+    # どの格納方式でも内容は同じ
+    assert np.array_equal(matrix.to_dense(), dense)
+    assert matrix.nnz == len(levels)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.skill_matrix import UNSET
+
+def random_rows(rng, n_users=130, n_skills=9, density=0.6):
+    """ランダムなユーザー・スキル・レベルの行と、対応する密行列"""
+    users = [(user_id, int(rng.integers(3))) for user_id in range(1, n_users + 1)]
+    skills = [(100 + j, j % 3) for j in range(n_skills)]
+    dense = np.where(rng.random((n_users, n_skills)) < density, rng.integers(0, 6, (n_users, n_skills)), UNSET)
+    levels = [
+        (users[i][0], skills[j][0], int(dense[i, j]))
+        for i, j in zip(*np.nonzero(dense != UNSET))
+    ]
+    return users, skills, levels, dense
+
+def test_packed_matrix_matches_dense_reference():
+    rng = np.random.default_rng(13)
+    users, skills, levels, dense = random_rows(rng)
+    matrix = PackedSkillMatrix.from_rows(users, skills, levels)
+    rows = np.arange(0, len(users), 3)
+
+    assert np.array_equal(matrix.to_dense(), dense)
+    assert matrix.nnz == np.count_nonzero(dense != UNSET)
+    assert np.array_equal(matrix.skill_rated_counts(), (dense != UNSET).sum(axis=0))
+    assert np.array_equal(matrix.skill_level_sums(rows), np.where(dense[rows] == UNSET, 0, dense[rows]).sum(axis=0))
+    for level in range(6):
+        assert np.array_equal(matrix.skill_counts_at_least(level), (dense >= level).sum(axis=0))
+        assert np.array_equal(matrix.skill_counts_at_least(level, rows), (dense[rows] >= level).sum(axis=0))
+        expected_users = [users[i][0] for i in np.flatnonzero(dense[:, 4] >= level)]
+        assert matrix.users_at_least(skills[4][0], level).tolist() == expected_users
+
+def test_packed_matrix_cell_updates_and_row_moves():
+    rng = np.random.default_rng(7)
+    users, skills, levels, dense = random_rows(rng, n_users=70, n_skills=4)
+    matrix = PackedSkillMatrix.from_rows(users, skills, levels)
+
+    matrix.set_level(5, 101, 5)
+    matrix.set_level(6, 101, None)
+    dense[4, 1] = 5
+    dense[5, 1] = UNSET
+    matrix.remove_user(1)
+    dense[0] = dense[-1]
+    dense = dense[:-1]
+    matrix.add_user(999)
+    dense = np.vstack([dense, np.full(4, UNSET)])
+    matrix.set_level(999, 103, 2)
+    dense[-1, 3] = 2
+
+    assert np.array_equal(matrix.to_dense(), dense)
+
+@pytest.mark.parametrize('level', [-1, 6, 7, 100])
+def test_at_least_rejects_levels_outside_range(level):
+    matrix = PackedSkillMatrix.from_rows([(1, None)], [(10, 0)], [(1, 10, 5)])
+    with pytest.raises(ValueError):
+        matrix.at_least_bitsets(level)
+    with pytest.raises(ValueError):
+        matrix.users_at_least(10, level)
+    with pytest.raises(ValueError):
+        PackedSkillMatrix._compare_at_least(matrix._planes_for(None), level + 1)
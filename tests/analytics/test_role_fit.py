@@ -0,0 +1,106 @@
+import random
+from functools import partial
+import numpy as np
+import pytest
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.role_fit import RoleFitEngine
+from src.desktop.analytics.skill_matrix import SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+BACKENDS = [
+    pytest.param(SkillMatrix.from_rows, id='dense'),
+    pytest.param(partial(SparseSkillMatrix.from_rows, compact_threshold=1), id='sparse'),
+    pytest.param(PackedSkillMatrix.from_rows, id='packed'),
+]
+
+def random_rows(rng, n_users, n_skills, density):
+    users = [(user_id, None) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, 1) for skill_id in range(100, 100 + n_skills)]
+    levels = [
+        (user_id, skill_id, rng.randint(0, 5))
+        for user_id, _ in users for skill_id, _ in skills if rng.random() < density
+    ]
+    return users, skills, levels
+
+def random_requirements(rng, skill_ids):
+    # 行列に無いスキル（999）の要件は常に未評価として不足に数える
+    candidates = skill_ids + [999]
+    return [
+        (skill_id, rng.randint(0, 5), rng.choice([0.5, 1.0, 2.0]))
+        for skill_id in rng.sample(candidates, rng.randint(1, min(4, len(candidates))))
+    ]
+
+def brute_force_gaps(matrix, roles):
+    """user_id → role_id → Σ 重み × max(必要レベル - レベル, 0)（未評価はレベル0）"""
+    return {
+        user_id: {
+            role_id: sum(
+                weight * max(level - (matrix.get_level(user_id, skill_id) or 0), 0)
+                for skill_id, level, weight in requirements
+            )
+            for role_id, requirements in roles.items()
+        }
+        for user_id in matrix.user_ids.tolist()
+    }
+
+def check_result(result, matrix, roles):
+    assert result.user_ids.tolist() == matrix.user_ids.tolist()
+    assert sorted(result.role_ids.tolist()) == sorted(roles)
+    expected = brute_force_gaps(matrix, roles)
+    for r, role_id in enumerate(result.role_ids.tolist()):
+        total = sum(level * weight for _, level, weight in roles[role_id])
+        for i, user_id in enumerate(result.user_ids.tolist()):
+            gap = expected[user_id][role_id]
+            assert result.gaps[i, r] == pytest.approx(gap, abs=1e-4)
+            assert result.fit[i, r] == pytest.approx(1.0 - gap / total if total > 0 else 1.0, abs=1e-4)
+
+@pytest.mark.parametrize('build', BACKENDS)
+@pytest.mark.parametrize('seed', range(4))
+def test_incremental_updates_match_brute_force(build, seed):
+    rng = random.Random(seed)
+    users, skills, levels = random_rows(rng, n_users=40, n_skills=8, density=rng.choice([0.2, 0.6]))
+    matrix = build(users, skills, levels)
+    skill_ids = [skill_id for skill_id, _ in skills]
+    # 小さいブロックで行列積を分割する経路も通す
+    engine = RoleFitEngine(matrix, block_size=7)
+    roles = {}
+
+    for step in range(120):
+        operation = rng.random()
+        if operation < 0.25 or not roles:
+            role_id = rng.randint(1, 8)
+            roles[role_id] = random_requirements(rng, skill_ids)
+            engine.set_role(role_id, roles[role_id])
+        elif operation < 0.35:
+            role_id = rng.choice(list(roles))
+            assert engine.remove_role(role_id)
+            del roles[role_id]
+        else:
+            changes = [
+                (rng.randint(1, 40), rng.choice(skill_ids), rng.choice([None, 0, 1, 2, 3, 4, 5]))
+                for _ in range(rng.randint(1, 5))
+            ]
+            assert matrix.apply_changes(changes)
+            engine.invalidate_users({user_id for user_id, _, _ in changes})
+        if step % 10 == 0:
+            check_result(engine.result(), matrix, roles)
+    check_result(engine.result(), matrix, roles)
+
+def test_top_users_and_user_fit_follow_the_gaps():
+    matrix = SkillMatrix.from_rows(
+        [(1, None), (2, None), (3, None)], [(10, 1), (11, 1)],
+        [(1, 10, 5), (1, 11, 1), (2, 10, 3), (2, 11, 4), (3, 11, 5)]
+    )
+    engine = RoleFitEngine(matrix)
+    engine.set_role(7, [(10, 4, 2.0), (11, 4, 1.0)])
+    engine.set_role(8, [])
+    result = engine.result()
+    check_result(result, matrix, {7: [(10, 4, 2.0), (11, 4, 1.0)], 8: []})
+    # 不足: ユーザー1 = 3, ユーザー2 = 2, ユーザー3 = 8（最大不足 12）
+    assert [user_id for user_id, _ in result.top_users(7, 2)] == [2, 1]
+    assert result.top_users(7, 2)[0][1] == pytest.approx(1 - 2 / 12)
+    assert result.user_fit(3) == pytest.approx({7: 1 - 8 / 12, 8: 1.0})
+    assert result.top_users(99) == []
+    assert result.user_fit(99) == {}
+    assert not engine.remove_role(99)
+    assert np.all(engine.result().fit[:, 1] == 1.0)
@@ -0,0 +1,81 @@
+import random
+import numpy as np
+import pytest
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.rollup import compute_rollup
+from src.desktop.analytics.skill_matrix import NO_GROUP, SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+BACKENDS = [SkillMatrix, SparseSkillMatrix, PackedSkillMatrix]
+
+def random_rows(rng, n_users, n_skills, density):
+    # 未所属（None）のユーザーと、評価者のいないグループ × カテゴリーを含む
+    users = [(user_id, rng.choice([None, 1, 2, 3])) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, rng.choice([10, 20, 30])) for skill_id in range(100, 100 + n_skills)]
+    levels = [
+        (user_id, skill_id, rng.randint(0, 5))
+        for user_id, group_id in users for skill_id, category_id in skills
+        if group_id != 3 or category_id != 30
+        if rng.random() < density
+    ]
+    return users, skills, levels
+
+def brute_force_cells(users, skills, levels):
+    """(group_id, category_id) → 評価済みレベルのリスト（未所属は NO_GROUP）"""
+    groups = {user_id: NO_GROUP if group_id is None else group_id for user_id, group_id in users}
+    categories = dict(skills)
+    cells = {(g, c): [] for g in set(groups.values()) for c in set(categories.values())}
+    for user_id, skill_id, level in levels:
+        cells[(groups[user_id], categories[skill_id])].append(level)
+    return groups, categories, cells
+
+@pytest.mark.parametrize('matrix_class', BACKENDS)
+@pytest.mark.parametrize('seed', range(5))
+def test_rollup_matches_brute_force(matrix_class, seed):
+    rng = random.Random(seed)
+    users, skills, levels = random_rows(rng, n_users=rng.randint(5, 80), n_skills=12, density=rng.choice([0.1, 0.5]))
+    result = compute_rollup(matrix_class.from_rows(users, skills, levels))
+    groups, categories, cells = brute_force_cells(users, skills, levels)
+
+    assert sorted(result.group_ids.tolist()) == sorted(set(groups.values()))
+    assert sorted(result.category_ids.tolist()) == sorted(set(categories.values()))
+    for (group_id, category_id), values in cells.items():
+        g = result.group_index(None if group_id == NO_GROUP else group_id)
+        c = result.category_index(category_id)
+        members = sum(1 for value in groups.values() if value == group_id)
+        n_skills = sum(1 for value in categories.values() if value == category_id)
+        assert result.member_counts[g] == members
+        assert result.skill_counts[c] == n_skills
+        assert result.histogram[g, c].tolist() == [values.count(level) for level in range(6)]
+        assert result.counts[g, c] == len(values)
+        assert result.at_least[g, c].tolist() == [sum(v >= level for v in values) for level in range(6)]
+        assert result.coverage[g, c] == pytest.approx(len(values) / (members * n_skills))
+        if values:
+            assert result.means[g, c] == pytest.approx(np.mean(values))
+            assert result.medians[g, c] == pytest.approx(np.median(values))
+            for q in (0, 10, 25, 50, 75, 90, 100):
+                assert result.percentile(q)[g, c] == pytest.approx(np.percentile(values, q)), q
+        else:
+            # 評価者のいないセルは NaN
+            assert np.isnan(result.means[g, c])
+            assert np.isnan(result.medians[g, c])
+            assert np.isnan(result.percentile(90)[g, c])
+            assert result.coverage[g, c] == 0.0
+
+def test_cells_for_unassigned_and_unknown_groups():
+    users = [(1, None), (2, None), (3, 7)]
+    skills = [(100, 10), (101, 10)]
+    matrix = SkillMatrix.from_rows(users, skills, [(1, 100, 1), (2, 100, 4), (2, 101, 3), (3, 100, 5)])
+    result = compute_rollup(matrix)
+    assert result.cell(None, 10) == {
+        'count': 3, 'mean': pytest.approx(8 / 3), 'median': 3.0,
+        'at_least': [3, 3, 2, 2, 1, 0], 'coverage': 0.75,
+    }
+    assert result.cell(7, 10)['count'] == 1
+    assert result.cell(8, 10) is None
+    assert result.cell(7, 99) is None
+
+def test_rollup_of_an_empty_matrix():
+    result = compute_rollup(SkillMatrix.from_rows([], [], []))
+    assert result.histogram.shape == (0, 0, 6)
+    assert result.percentile(50).shape == (0, 0)
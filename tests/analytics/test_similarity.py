@@ -0,0 +1,108 @@
+import math
+import random
+import numpy as np
+import pytest
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.similarity import COSINE, EUCLIDEAN, SimilaritySearch
+from src.desktop.analytics.skill_matrix import SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+BACKENDS = [SkillMatrix, SparseSkillMatrix, PackedSkillMatrix]
+
+def random_matrix(rng, matrix_class, n_users, n_skills, density):
+    users = [(user_id, rng.choice([None, 1])) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, 1) for skill_id in range(100, 100 + n_skills)]
+    # 全て未評価・全てレベル0のユーザー（ノルム0）を含む
+    levels = [
+        (user_id, skill_id, 0 if user_id % 7 == 0 else rng.randint(0, 5))
+        for user_id, _ in users if user_id % 11 != 0
+        for skill_id, _ in skills if rng.random() < density
+    ]
+    return matrix_class.from_rows(users, skills, levels)
+
+def profile(matrix, user_id):
+    return [max(matrix.get_level(user_id, skill_id) or 0, 0) for skill_id in matrix.skill_ids.tolist()]
+
+def brute_force_distances(matrix, user_id, metric, candidates=None):
+    """本人以外の候補との距離（コサインではノルム0のユーザーを除く）"""
+    query = profile(matrix, user_id)
+    query_norm = math.sqrt(sum(v * v for v in query))
+    distances = {}
+    for other in (matrix.user_ids.tolist() if candidates is None else candidates):
+        if other == user_id:
+            continue
+        vector = profile(matrix, other)
+        if metric == EUCLIDEAN:
+            distances[other] = math.sqrt(sum((a - b) ** 2 for a, b in zip(query, vector)))
+        else:
+            norm = math.sqrt(sum(v * v for v in vector))
+            if norm > 0 and query_norm > 0:
+                distances[other] = 1.0 - sum(a * b for a, b in zip(query, vector)) / (query_norm * norm)
+    return distances
+
+def check_nearest(results, distances, k):
+    """距離の近い k 人であること（k 位の同点はどれを選んでもよい）"""
+    expected = sorted(distances.values())[:k]
+    assert [result.distance for result in results] == pytest.approx(expected, abs=1e-5)
+    for result in results:
+        assert result.distance == pytest.approx(distances[result.user_id], abs=1e-5)
+    if results:
+        kth = results[-1].distance
+        chosen = {result.user_id for result in results}
+        assert all(user_id in chosen for user_id, distance in distances.items() if distance < kth - 1e-5)
+
+@pytest.mark.parametrize('matrix_class', BACKENDS)
+@pytest.mark.parametrize('metric', [COSINE, EUCLIDEAN])
+@pytest.mark.parametrize('seed', range(3))
+def test_nearest_matches_brute_force(matrix_class, metric, seed):
+    rng = random.Random(seed)
+    matrix = random_matrix(rng, matrix_class, n_users=70, n_skills=10, density=rng.choice([0.2, 0.6]))
+    search = SimilaritySearch(matrix, block_size=16)
+    user_ids = matrix.user_ids.tolist()
+    for _ in range(10):
+        k = rng.choice([1, 5, 100])
+        queries = rng.sample(user_ids, 4)
+        for user_id, results in zip(queries, search.nearest_many(queries, k, metric)):
+            check_nearest(results, brute_force_distances(matrix, user_id, metric), k)
+
+    group_rows = matrix.user_indices(1)
+    candidates = matrix.user_ids[group_rows].tolist()
+    for user_id in rng.sample(user_ids, 5):
+        check_nearest(
+            search.nearest(user_id, 5, metric, rows=group_rows),
+            brute_force_distances(matrix, user_id, metric, candidates), 5
+        )
+
+def test_cosine_excludes_users_without_levels():
+    users = [(1, None), (2, None), (3, None), (4, None)]
+    matrix = SkillMatrix.from_rows(users, [(10, 1), (11, 1)], [(1, 10, 3), (2, 10, 5), (3, 10, 0)])
+    search = SimilaritySearch(matrix)
+    # レベル0のみのユーザー3と未評価のユーザー4はコサインでは候補にならない
+    assert [result.user_id for result in search.nearest(1, 10, COSINE)] == [2]
+    assert sorted(result.user_id for result in search.nearest(1, 10, EUCLIDEAN)) == [2, 3, 4]
+    # 基準のユーザー自身のノルムが0の場合、コサインでは近いユーザーが無い
+    assert search.nearest(4, 10, COSINE) == []
+    assert search.nearest(99, 10) == []
+    assert search.nearest_many([1, 99], 1, COSINE)[1] == []
+    with pytest.raises(ValueError):
+        search.nearest(1, 10, 'manhattan')
+
+@pytest.mark.parametrize('matrix_class', BACKENDS)
+def test_changed_rows_refresh_their_norms(matrix_class):
+    rng = random.Random(4)
+    matrix = random_matrix(rng, matrix_class, n_users=40, n_skills=6, density=0.5)
+    search = SimilaritySearch(matrix, block_size=8)
+    user_ids = matrix.user_ids.tolist()
+    search.squared_norms()
+    for _ in range(20):
+        changes = [
+            (rng.choice(user_ids), rng.randint(100, 105), rng.choice([None, 0, 1, 5]))
+            for _ in range(rng.randint(1, 4))
+        ]
+        assert matrix.apply_changes(changes)
+        search.invalidate_users({user_id for user_id, _, _ in changes})
+        expected = [sum(v * v for v in profile(matrix, user_id)) for user_id in user_ids]
+        assert search.squared_norms().tolist() == pytest.approx(expected)
+        user_id = rng.choice(user_ids)
+        for metric in (COSINE, EUCLIDEAN):
+            check_nearest(search.nearest(user_id, 5, metric), brute_force_distances(matrix, user_id, metric), 5)
@@ -0,0 +1,204 @@
+import random
+from functools import partial
+import numpy as np
+import pytest
+from src.desktop.analytics.packed_matrix import PackedSkillMatrix
+from src.desktop.analytics.skill_matrix import NO_GROUP, UNSET, BaseSkillMatrix, SkillMatrix
+from src.desktop.analytics.sparse_matrix import SparseSkillMatrix
+
+# 比較する格納方式（rows → 行列）
+BACKENDS = [
+    pytest.param(SkillMatrix.from_rows, id='dense'),
+    pytest.param(SparseSkillMatrix.from_rows, id='sparse'),
+    # 差分の反映を頻繁に起こす
+    pytest.param(partial(SparseSkillMatrix.from_rows, compact_threshold=1), id='sparse-compact'),
+]
+
+class ReferenceMatrix:
+    """辞書で持つ参照実装（行・列の順序は持たず、IDで比較する）"""
+
+    def __init__(self, users, skills, levels):
+        self.groups = dict(users)
+        self.categories = dict(skills)
+        self.levels = {(user_id, skill_id): level for user_id, skill_id, level in levels}
+
+    def remove_user(self, user_id):
+        del self.groups[user_id]
+        self.levels = {key: level for key, level in self.levels.items() if key[0] != user_id}
+
+    def remove_skill(self, skill_id):
+        del self.categories[skill_id]
+        self.levels = {key: level for key, level in self.levels.items() if key[1] != skill_id}
+
+    def dense(self, user_ids, skill_ids):
+        """行列の現在の行・列の順序に並べた密行列"""
+        return np.array(
+            [[self.levels.get((int(u), int(s)), UNSET) for s in skill_ids] for u in user_ids],
+            dtype=np.int8
+        ).reshape(len(user_ids), len(skill_ids))
+
+def random_rows(rng, n_users, n_skills, density):
+    users = [(user_id, rng.choice([None, 1, 2])) for user_id in rng.sample(range(1, 500), n_users)]
+    skills = [(skill_id, rng.randint(1, 3)) for skill_id in rng.sample(range(1, 500), n_skills)]
+    levels = [
+        (user_id, skill_id, rng.randint(0, 5))
+        for user_id, _ in users for skill_id, _ in skills if rng.random() < density
+    ]
+    return users, skills, levels
+
+def check_against_reference(matrix, reference):
+    user_ids, skill_ids = matrix.user_ids, matrix.skill_ids
+    assert sorted(user_ids.tolist()) == sorted(reference.groups)
+    assert sorted(skill_ids.tolist()) == sorted(reference.categories)
+    assert matrix.shape == (len(user_ids), len(skill_ids))
+    assert matrix.user_group_ids.tolist() == [
+        NO_GROUP if reference.groups[u] is None else reference.groups[u] for u in user_ids.tolist()
+    ]
+    assert matrix.skill_category_ids.tolist() == [reference.categories[s] for s in skill_ids.tolist()]
+
+    dense = reference.dense(user_ids, skill_ids)
+    assert np.array_equal(matrix.to_dense(), dense)
+    assert matrix.nnz == len(reference.levels)
+    rows, cols, levels = matrix.to_coo()
+    assert sorted(zip(rows.tolist(), cols.tolist(), levels.tolist())) == sorted(
+        (u, s, level) for (u, s), level in reference.levels.items()
+    )
+
+    rated = dense != UNSET
+    for rows in (None, np.arange(0, len(user_ids), 2)):
+        part = dense if rows is None else dense[rows]
+        part_rated = part != UNSET
+        assert np.array_equal(matrix.skill_rated_counts(rows), part_rated.sum(axis=0))
+        assert np.array_equal(matrix.skill_level_sums(rows), np.where(part_rated, part, 0).sum(axis=0))
+        for level in range(6):
+            assert np.array_equal(matrix.skill_counts_at_least(level, rows), (part >= level).sum(axis=0))
+        means = matrix.skill_means(rows)
+        counts = part_rated.sum(axis=0)
+        expected = np.where(part_rated, part, 0).sum(axis=0) / np.maximum(counts, 1)
+        assert np.array_equal(np.isnan(means), counts == 0)
+        assert np.allclose(means[counts > 0], expected[counts > 0])
+
+    for i, user_id in enumerate(user_ids.tolist()):
+        skills, levels = matrix.user_levels(user_id)
+        assert dict(zip(skills.tolist(), levels.tolist())) == {
+            s: level for (u, s), level in reference.levels.items() if u == user_id
+        }
+        assert matrix.user_index(user_id) == i
+    for j, skill_id in enumerate(skill_ids.tolist()):
+        entry_rows, levels = matrix.column_entries(j)
+        assert entry_rows.tolist() == np.flatnonzero(rated[:, j]).tolist()
+        assert levels.tolist() == dense[rated[:, j], j].tolist()
+        users, levels = matrix.skill_levels(skill_id)
+        assert dict(zip(users.tolist(), levels.tolist())) == {
+            u: level for (u, s), level in reference.levels.items() if s == skill_id
+        }
+
+@pytest.mark.parametrize('build', BACKENDS)
+@pytest.mark.parametrize('seed', range(5))
+def test_random_operations_match_reference(build, seed):
+    rng = random.Random(seed)
+    users, skills, levels = random_rows(rng, n_users=25, n_skills=12, density=rng.choice([0.05, 0.4, 0.9]))
+    matrix = build(users, skills, levels)
+    reference = ReferenceMatrix(users, skills, levels)
+    check_against_reference(matrix, reference)
+
+    next_id = 1000
+    for step in range(300):
+        user_ids = list(reference.groups)
+        skill_ids = list(reference.categories)
+        operation = rng.random()
+        if operation < 0.6 and user_ids and skill_ids:
+            user_id, skill_id = rng.choice(user_ids), rng.choice(skill_ids)
+            level = rng.choice([None, 0, 1, 2, 3, 4, 5])
+            assert matrix.set_level(user_id, skill_id, level)
+            if level is None:
+                reference.levels.pop((user_id, skill_id), None)
+            else:
+                reference.levels[(user_id, skill_id)] = level
+        elif operation < 0.7:
+            group_id = rng.choice([None, 1, 2])
+            matrix.add_user(next_id, group_id)
+            reference.groups[next_id] = group_id
+            next_id += 1
+        elif operation < 0.78:
+            category_id = rng.randint(1, 3)
+            matrix.add_skill(next_id, category_id)
+            reference.categories[next_id] = category_id
+            next_id += 1
+        elif operation < 0.88 and user_ids:
+            user_id = rng.choice(user_ids)
+            assert matrix.remove_user(user_id)
+            reference.remove_user(user_id)
+        elif operation < 0.94 and skill_ids:
+            skill_id = rng.choice(skill_ids)
+            assert matrix.remove_skill(skill_id)
+            reference.remove_skill(skill_id)
+        elif user_ids:
+            user_id, group_id = rng.choice(user_ids), rng.choice([None, 1, 2])
+            assert matrix.set_user_group(user_id, group_id)
+            reference.groups[user_id] = group_id
+        if step % 20 == 0:
+            check_against_reference(matrix, reference)
+    check_against_reference(matrix, reference)
+
+@pytest.mark.parametrize('build', BACKENDS)
+def test_slice_matches_reference_submatrix(build):
+    rng = random.Random(3)
+    users, skills, levels = random_rows(rng, n_users=30, n_skills=10, density=0.5)
+    matrix = build(users, skills, levels)
+    reference = ReferenceMatrix(users, skills, levels)
+    for group_id in (None, 1, 2):
+        for category_ids in (None, [1], [2, 3]):
+            part = matrix.slice(group_id, category_ids)
+            assert part.user_ids.tolist() == [u for u, g in users if group_id is None or g == group_id]
+            assert part.skill_ids.tolist() == [s for s, c in skills if category_ids is None or c in category_ids]
+            assert np.array_equal(part.levels, reference.dense(part.user_ids, part.skill_ids))
+            # 切り出しはコピーであり、元の行列を変更しない
+            part.levels[...] = 5
+    assert np.array_equal(matrix.to_dense(), reference.dense(matrix.user_ids, matrix.skill_ids))
+
+@pytest.mark.parametrize('build', BACKENDS)
+def test_unknown_ids_are_ignored(build):
+    matrix = build([(1, None), (2, 1)], [(10, 1)], [(1, 10, 3), (9, 10, 5), (1, 99, 4)])
+    assert matrix.nnz == 1
+    assert matrix.get_level(1, 10) == 3
+    assert matrix.get_level(2, 10) is None
+    assert matrix.get_level(9, 10) is None
+    assert not matrix.set_level(9, 10, 1)
+    assert not matrix.remove_user(9)
+    assert not matrix.apply_changes([(2, 10, 4), (9, 10, 1)])
+    assert matrix.get_level(2, 10) == 4
+    assert matrix.add_user(1) == 0
+
+@pytest.mark.parametrize('build', BACKENDS + [pytest.param(PackedSkillMatrix.from_rows, id='packed')])
+@pytest.mark.parametrize('level', [-2, -1, 6, 9])
+def test_levels_outside_range_are_rejected(build, level):
+    matrix = build([(1, None), (2, None)], [(10, 1)], [(1, 10, 3)])
+    with pytest.raises(ValueError):
+        matrix.set_level(1, 10, level)
+    # 範囲外のレベルを含む変更はいずれも反映しない
+    with pytest.raises(ValueError):
+        matrix.apply_changes([(2, 10, 4), (1, 10, level)])
+    with pytest.raises(ValueError):
+        build([(1, None)], [(10, 1)], [(1, 10, level)])
+    assert matrix.get_level(1, 10) == 3
+    assert matrix.get_level(2, 10) is None
+    assert matrix.set_level(1, 10, None)
+    assert matrix.get_level(1, 10) is None
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        SkillMatrix([1, 1], [10])
+    with pytest.raises(ValueError):
+        SkillMatrix([1], [10], user_group_ids=[None, None])
+
+def test_base_matrix_requires_a_storage_implementation():
+    with pytest.raises(TypeError):
+        BaseSkillMatrix([1], [10])
+
+    class Incomplete(BaseSkillMatrix):
+        def _get_cell(self, i, j):
+            return UNSET
+
+    with pytest.raises(TypeError, match='_set_cell'):
+        Incomplete([1], [10])
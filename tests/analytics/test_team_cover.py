@@ -0,0 +1,104 @@
+import random
+from itertools import combinations
+import numpy as np
+import pytest
+from src.desktop.analytics.bitset_index import SkillBitsetIndex
+from src.desktop.analytics.skill_matrix import UNSET, SkillMatrix
+from src.desktop.analytics.team_cover import TeamCoverSolver
+
+def random_instance(rng, n_users, n_skills, density):
+    users = [(user_id, rng.choice([None, 1])) for user_id in range(1, n_users + 1)]
+    skills = [(skill_id, 1) for skill_id in range(100, 100 + n_skills)]
+    dense = np.full((n_users, n_skills), UNSET)
+    for i in range(n_users):
+        for j in range(n_skills):
+            if rng.random() < density:
+                dense[i, j] = rng.randint(0, 5)
+    levels = [(users[i][0], skills[j][0], int(dense[i, j])) for i, j in zip(*np.nonzero(dense != UNSET))]
+    requirements = [(rng.choice(skills)[0], rng.randint(0, 5)) for _ in range(rng.randint(1, 8))]
+    return users, skills, levels, requirements
+
+def meets(matrix, user_id, requirement):
+    skill_id, level = requirement
+    user_level = matrix.get_level(user_id, skill_id)
+    return user_level is not None and user_level >= level
+
+def brute_force_minimum(matrix, user_ids, requirements):
+    """全ての組み合わせを人数の少ない順に試した最小人数（満たせる要件のみ対象）"""
+    coverable = [r for r in requirements if any(meets(matrix, u, r) for u in user_ids)]
+    for size in range(len(user_ids) + 1):
+        for team in combinations(user_ids, size):
+            if all(any(meets(matrix, u, r) for u in team) for r in coverable):
+                return size, coverable
+    raise AssertionError("unreachable")
+
+def check_result(result, matrix, user_ids, requirements):
+    """チームが満たせる要件を全て満たし、充足状況が正しいこと。最小人数を返す"""
+    minimum, coverable = brute_force_minimum(matrix, user_ids, requirements)
+    requirements = list(dict.fromkeys(requirements))
+    assert set(result.user_ids) <= set(user_ids)
+    assert len(set(result.user_ids)) == len(result.user_ids)
+    assert result.uncovered == [r for r in requirements if r not in coverable]
+    assert [(c.skill_id, c.min_level) for c in result.coverage] == requirements
+    for coverage in result.coverage:
+        requirement = (coverage.skill_id, coverage.min_level)
+        assert coverage.user_ids == [u for u in result.user_ids if meets(matrix, u, requirement)]
+        assert coverage.candidate_count == sum(meets(matrix, u, requirement) for u in user_ids)
+        assert coverage.covered == (requirement in coverable)
+    assert len(result.user_ids) >= minimum
+    return minimum
+
+@pytest.mark.parametrize('seed', range(40))
+def test_exact_cover_matches_brute_force_minimum(seed):
+    rng = random.Random(seed)
+    users, skills, levels, requirements = random_instance(
+        rng, n_users=rng.randint(1, 10), n_skills=6, density=rng.choice([0.2, 0.5, 0.8])
+    )
+    matrix = SkillMatrix.from_rows(users, skills, levels)
+    solver = TeamCoverSolver(SkillBitsetIndex(matrix))
+    user_ids = [user_id for user_id, _ in users]
+
+    exact = solver.solve(requirements, exact=True)
+    assert exact.optimal
+    assert len(exact.user_ids) == check_result(exact, matrix, user_ids, requirements)
+
+    greedy = solver.solve(requirements)
+    assert not greedy.optimal
+    check_result(greedy, matrix, user_ids, requirements)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_candidates_restrict_the_team(seed):
+    rng = random.Random(100 + seed)
+    users, skills, levels, requirements = random_instance(rng, n_users=10, n_skills=5, density=0.5)
+    matrix = SkillMatrix.from_rows(users, skills, levels)
+    index = SkillBitsetIndex(matrix)
+    group_users = [user_id for user_id, group_id in users if group_id == 1]
+
+    result = TeamCoverSolver(index).solve(requirements, index.group_bitset(1), exact=True)
+    assert len(result.user_ids) == check_result(result, matrix, group_users, requirements)
+
+def test_greedy_can_be_beaten_by_exact_search():
+    # 貪欲法は4要件を満たす1人目を選ぶと残りに2人必要になるが、最小は2人
+    users = [(user_id, None) for user_id in range(1, 4)]
+    skills = [(skill_id, 1) for skill_id in range(100, 106)]
+    covers = {1: [100, 101, 102, 103], 2: [100, 101, 104], 3: [102, 103, 105]}
+    levels = [(user_id, skill_id, 3) for user_id, skill_ids in covers.items() for skill_id in skill_ids]
+    requirements = [(skill_id, 1) for skill_id, _ in skills]
+    solver = TeamCoverSolver(SkillBitsetIndex(SkillMatrix.from_rows(users, skills, levels)))
+
+    assert len(solver.solve(requirements).user_ids) == 3
+    exact = solver.solve(requirements, exact=True)
+    assert sorted(exact.user_ids) == [2, 3]
+    assert exact.optimal
+
+    # 探索を打ち切った場合も、その時点の解で全ての要件を満たす
+    limited = solver.solve(requirements, exact=True, max_nodes=1)
+    assert not limited.optimal
+    assert not limited.uncovered
+
+def test_empty_and_invalid_requirements():
+    solver = TeamCoverSolver(SkillBitsetIndex(SkillMatrix.from_rows([(1, None)], [(10, 1)], [(1, 10, 3)])))
+    assert solver.solve([]).user_ids == []
+    assert solver.solve([(99, 1)]).uncovered == [(99, 1)]
+    with pytest.raises(ValueError):
+        solver.solve([(10, 6)])
@@ -0,0 +1,26 @@
+import pytest
+from src.desktop.database.database import Database
+from src.desktop.utils.text_normalizer import normalize_key
+
+# database フィクスチャが作成するスキルカテゴリー（id は 1 から順に振られる）
+SKILL_CATEGORIES = ['技術', '業務', '語学']
+
+def create_database(path) -> Database:
+    """
+    外部キー制約を有効にしたままのデータベースを作成し、スキルの親となる
+    スキルカテゴリーを登録する
+    """
+    database = Database(str(path))
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO skill_categories (name, name_key, created_at, updated_at) "
+            "VALUES (?, ?, '2025-01-01', '2025-01-01')",
+            [(name, normalize_key(name)) for name in SKILL_CATEGORIES]
+        )
+    return database
+
+@pytest.fixture
+def database(tmp_path):
+    db = create_database(tmp_path / 'main.db')
+    yield db
+    db.pool.close_all()
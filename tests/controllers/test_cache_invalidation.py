@@ -0,0 +1,63 @@
+import threading
+import pytest
+from src.desktop.controllers.group_controller import GroupController
+from src.desktop.controllers.user_controller import UserController
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.user_manager import UserManager
+
+def read_in_thread(func):
+    """別スレッド（トランザクション外）で読み込み、結果を返す"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+def test_stale_read_during_transaction_is_dropped_after_commit(database):
+    users = UserController(UserManager(database))
+    user = users.create_user('E1', '山田', None)
+
+    with users.transaction():
+        users.update_user(user.id, name='鈴木')
+        # 無効化からコミットまでの間に別スレッドが確定済みの古い行をキャッシュに格納する
+        assert read_in_thread(lambda: users.get_user(user.id)).name == '山田'
+        assert [u.name for u in read_in_thread(users.get_all_users)] == ['山田']
+
+    assert users.get_user(user.id).name == '鈴木'
+    assert [u.name for u in users.get_all_users()] == ['鈴木']
+
+def test_rolled_back_change_keeps_committed_values(database):
+    groups = GroupController(GroupManager(database))
+    group = groups.create_group('開発')
+    assert groups.get_group(group.id).name == '開発'
+
+    with pytest.raises(RuntimeError):
+        with groups.transaction():
+            groups.update_group(group.id, '営業')
+            raise RuntimeError('rollback')
+
+    assert groups.get_group(group.id).name == '開発'
+    assert [(g.name, count) for g, count in groups.get_groups_with_member_counts()] == [('開発', 0)]
+
+def test_controllers_share_one_transaction_method(database):
+    users = UserController(UserManager(database))
+    groups = GroupController(GroupManager(database))
+    assert type(users).transaction is type(groups).transaction
+    with groups.transaction():
+        group = groups.create_group('人事')
+        users.create_user('E2', '佐藤', group.id)
+        assert database.in_transaction()
+    assert [u.name for u in users.get_users_by_group(group.id)] == ['佐藤']
+
+def test_deleting_a_group_clears_cached_user_groups(database):
+    users = UserController(UserManager(database))
+    groups = GroupController(GroupManager(database))
+    group = groups.create_group('開発')
+    user = users.create_user('E3', '田中', group.id)
+    assert users.get_user(user.id).group_id == group.id
+    assert [u.id for u in users.get_users_by_group(group.id)] == [user.id]
+
+    # 外部キー制約（ON DELETE SET NULL）で所属が外れ、ユーザーのキャッシュも破棄される
+    groups.delete_group(group.id)
+    assert users.get_user(user.id).group_id is None
+    assert users.get_users_by_group(group.id) == []
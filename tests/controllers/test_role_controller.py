@@ -0,0 +1,97 @@
+import pytest
+from src.desktop.analytics.role_fit import RoleFitEngine
+from src.desktop.controllers.analytics_controller import AnalyticsController
+from src.desktop.controllers.role_controller import RoleController
+from src.desktop.controllers.user_skill_controller import UserSkillController
+from src.desktop.managers.role_manager import RoleManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.managers.user_skill_manager import UserSkillManager
+from tests.analytics.test_role_fit import check_result
+
+@pytest.fixture
+def roles(database, monkeypatch):
+    users = UserManager(database)
+    skills = SkillManager(database)
+    user_skill_controller = UserSkillController(UserSkillManager(database))
+    analytics = AnalyticsController(user_skill_controller)
+    controller = RoleController(RoleManager(database), analytics)
+    user_ids = [users.create_user(f'E{i}', f'ユーザー{i}').id for i in range(5)]
+    skill_ids = [skills.create_skill(1, name).id for name in ('Python', 'SQL', 'Go')]
+    user_skill_controller.set_levels_bulk(
+        [(user_id, skill_id, (i + j) % 6) for i, user_id in enumerate(user_ids) for j, skill_id in enumerate(skill_ids)]
+    )
+
+    # 再計算した行・役割を記録する
+    computed = []
+    compute = RoleFitEngine._compute
+
+    def record(engine, rows, role_ids):
+        computed.append((rows.tolist(), list(role_ids)))
+        return compute(engine, rows, role_ids)
+
+    monkeypatch.setattr(RoleFitEngine, '_compute', record)
+    yield controller, user_skill_controller, analytics, user_ids, skill_ids, computed
+    controller.close()
+    analytics.close()
+
+def expected_roles(controller):
+    return {
+        role.id: [(r.skill_id, r.required_level, r.weight) for r in role.requirements]
+        for role in controller.get_all_roles()
+    }
+
+def test_level_change_recomputes_only_the_changed_user(roles):
+    controller, user_skill_controller, analytics, user_ids, skill_ids, computed = roles
+    backend = controller.create_role('バックエンド', requirements=[(skill_ids[0], 4), (skill_ids[1], 3, 2.0)])
+    controller.create_role('インフラ', requirements=[(skill_ids[2], 5)])
+    check_result(controller.get_role_fit(), analytics.get_matrix(), expected_roles(controller))
+    computed.clear()
+
+    user_skill_controller.set_level(user_ids[2], skill_ids[0], 5)
+    result = controller.get_role_fit()
+    row = analytics.get_matrix().user_index(user_ids[2])
+    assert computed == [([row], result.role_ids.tolist())]
+    check_result(result, analytics.get_matrix(), expected_roles(controller))
+    assert controller.get_best_users_for_role(backend.id, 1)[0][0] == user_ids[2]
+
+    # 変更が無ければ再計算しない
+    computed.clear()
+    assert controller.get_role_fit() is result
+    assert computed == []
+
+def test_requirement_edit_recomputes_only_the_changed_role(roles):
+    controller, _, analytics, user_ids, skill_ids, computed = roles
+    backend = controller.create_role('バックエンド', requirements=[(skill_ids[0], 4)])
+    infra = controller.create_role('インフラ', requirements=[(skill_ids[2], 5)])
+    controller.get_role_fit()
+    computed.clear()
+
+    controller.set_requirement(infra.id, skill_ids[1], 2, 3.0)
+    result = controller.get_role_fit()
+    all_rows = list(range(len(user_ids)))
+    assert computed == [(all_rows, [infra.id])]
+    check_result(result, analytics.get_matrix(), expected_roles(controller))
+
+    # 削除した役割は列ごと取り除かれ、残りの役割は再計算しない
+    computed.clear()
+    controller.delete_role(backend.id)
+    result = controller.get_role_fit()
+    assert computed == []
+    assert result.role_ids.tolist() == [infra.id]
+    check_result(result, analytics.get_matrix(), expected_roles(controller))
+
+def test_rolled_back_requirement_edit_keeps_the_fit(roles):
+    controller, _, analytics, _, skill_ids, computed = roles
+    role = controller.create_role('バックエンド', requirements=[(skill_ids[0], 4)])
+    before = controller.get_role_fit()
+    computed.clear()
+
+    with pytest.raises(RuntimeError):
+        with controller.transaction():
+            controller.set_requirement(role.id, skill_ids[1], 5)
+            raise RuntimeError('rollback')
+
+    assert controller.get_role_fit() is before
+    assert computed == []
+    check_result(before, analytics.get_matrix(), expected_roles(controller))
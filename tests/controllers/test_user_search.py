@@ -0,0 +1,103 @@
+import random
+import pytest
+from src.desktop.controllers.user_controller import UserController
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.user_manager import UserManager
+from tests.utils.test_prefix_index import brute_force_search
+
+SURNAMES = ['山田', 'ヤマモト', 'ﾔﾏｸﾞﾁ', 'Suzuki', 'ＳＡＴＯ', 'さとう']
+GIVEN_NAMES = ['太郎', 'ハナコ', 'Ken', 'ｹﾝｼﾞ']
+PREFIXES = ['山', 'やま', 'ﾔﾏﾓ', 'suz', 'ｓａ', 'サト', 'はな', 'けん', 'E0', 'ｅ01', 'E1', 'x']
+
+@pytest.fixture
+def search(database):
+    groups = GroupManager(database)
+    group_ids = groups.create_groups_bulk(['開発', '営業'])
+    return UserController(UserManager(database)), group_ids
+
+def search_keys(user):
+    return [user.employee_id, user.name, *user.name.split()[1:]]
+
+def check_search(controller, users, group_ids):
+    for group_id in [None] + group_ids:
+        items = {
+            user.id: search_keys(user) for user in users.values()
+            if group_id is None or user.group_id == group_id
+        }
+        for prefix in PREFIXES:
+            results = controller.search_users(prefix, 5, group_id)
+            assert [user.id for user in results] == brute_force_search(items, prefix, 5), (group_id, prefix)
+            assert all(user == users[user.id] for user in results)
+
+def test_given_names_width_and_kana_variants_match(search):
+    controller, (develop, sales) = search
+    yamada = controller.create_user('E001', '山田 ハナコ', develop)
+    yamamoto = controller.create_user('E002', 'ﾔﾏﾓﾄ 太郎', sales)
+    assert [user.id for user in controller.search_users('はなこ')] == [yamada.id]
+    assert [user.id for user in controller.search_users('やまも')] == [yamamoto.id]
+    assert [user.id for user in controller.search_users('ｅ00')] == [yamada.id, yamamoto.id]
+    assert [user.id for user in controller.search_users('e00', group_id=sales)] == [yamamoto.id]
+    assert controller.search_users('') == []
+
+@pytest.mark.parametrize('seed', range(3))
+def test_index_follows_creates_updates_and_deletes(search, seed):
+    controller, group_ids = search
+    rng = random.Random(seed)
+    users = {}
+    serial = iter(range(1000))
+
+    def random_name():
+        return f'{rng.choice(SURNAMES)} {rng.choice(GIVEN_NAMES)}'
+
+    for _ in range(8):
+        user = controller.create_user(f'E{next(serial):03d}', random_name(), rng.choice([None] + group_ids))
+        users[user.id] = user
+    # 検索でインデックス（全体・グループ別）を作ってから差分を反映する
+    check_search(controller, users, group_ids)
+
+    for step in range(60):
+        operation = rng.random()
+        if operation < 0.3 or not users:
+            user = controller.create_user(f'E{next(serial):03d}', random_name(), rng.choice([None] + group_ids))
+        elif operation < 0.8:
+            user_id = rng.choice(list(users))
+            # グループの移動を含む更新
+            user = controller.update_user(
+                user_id,
+                employee_id=rng.choice([None, f'E{next(serial):03d}']),
+                name=rng.choice([None, random_name()]),
+                group_id=rng.choice(group_ids)
+            )
+        else:
+            user_id = rng.choice(list(users))
+            assert controller.delete_user(user_id)
+            del users[user_id]
+            user = None
+        if user is not None:
+            users[user.id] = user
+        if step % 5 == 0:
+            check_search(controller, users, group_ids)
+    check_search(controller, users, group_ids)
+
+def test_group_move_updates_both_group_indexes(search):
+    controller, (develop, sales) = search
+    user = controller.create_user('E001', '山田 太郎', develop)
+    assert [u.id for u in controller.search_users('山田', group_id=develop)] == [user.id]
+    assert controller.search_users('山田', group_id=sales) == []
+
+    controller.update_user(user.id, group_id=sales)
+    assert controller.search_users('山田', group_id=develop) == []
+    assert [u.id for u in controller.search_users('山田', group_id=sales)] == [user.id]
+
+def test_rolled_back_changes_do_not_reach_the_index(search):
+    controller, (develop, _) = search
+    user = controller.create_user('E001', '山田 太郎', develop)
+    controller.search_users('山田')
+    with pytest.raises(RuntimeError):
+        with controller.transaction():
+            controller.update_user(user.id, name='鈴木 太郎')
+            controller.create_user('E002', '佐藤 花子', develop)
+            raise RuntimeError('rollback')
+    assert [u.name for u in controller.search_users('山田')] == ['山田 太郎']
+    assert controller.search_users('鈴木') == []
+    assert controller.search_users('佐藤') == []
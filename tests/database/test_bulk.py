@@ -0,0 +1,85 @@
+import sqlite3
+import pytest
+from src.desktop.database.bulk import MAX_BIND_PARAMS, chunked
+from tests.conftest import create_database
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+
+@pytest.fixture
+def reference_database(tmp_path):
+    db = create_database(tmp_path / 'reference.db')
+    yield db
+    db.pool.close_all()
+
+def user_rows(users):
+    return sorted((user.employee_id, user.name, user.group_id) for user in users)
+
+def test_chunked_splits_into_fixed_size_lists():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+def test_bulk_users_match_one_by_one_creation(database, reference_database):
+    # 1文のバインド変数の上限を超える件数で、ID取得の分割も確認する
+    users = [
+        {'employee_id': f'E{i:05d}', 'name': f'ユーザー{i}', 'group_id': i % 4 or None}
+        for i in range(MAX_BIND_PARAMS + 150)
+    ]
+    for db in (database, reference_database):
+        GroupManager(db).create_groups_bulk(['開発', '営業', '人事'])
+    bulk = UserManager(database)
+    reference = UserManager(reference_database)
+
+    user_ids = bulk.create_users_bulk(users)
+    for user in users:
+        reference.create_user(user['employee_id'], user['name'], user['group_id'])
+
+    assert user_rows(bulk.get_all_users()) == user_rows(reference.get_all_users())
+    assert [bulk.get_user(user_id).employee_id for user_id in user_ids] == [user['employee_id'] for user in users]
+
+def test_bulk_user_upsert_updates_existing_rows(database):
+    users = UserManager(database)
+    group_ids = GroupManager(database).create_groups_bulk(['開発', '営業', '人事'])
+    first_ids = users.create_users_bulk([
+        {'employee_id': 'E1', 'name': '山田'},
+        {'employee_id': 'E2', 'name': '鈴木'},
+    ])
+    ids = users.create_users_bulk([
+        {'employee_id': 'E2', 'name': '鈴木 次郎', 'group_id': group_ids[2]},
+        {'employee_id': 'E3', 'name': '佐藤'},
+    ], upsert=True)
+    assert ids[0] == first_ids[1]
+    assert user_rows(users.get_all_users()) == [('E1', '山田', None), ('E2', '鈴木 次郎', group_ids[2]), ('E3', '佐藤', None)]
+    assert [user.id for user in users.find_users_by_name('鈴木 次郎')] == [first_ids[1]]
+
+def test_bulk_insert_failure_rolls_back_the_whole_batch(database):
+    users = UserManager(database)
+    users.create_user('E2', '既存')
+    with pytest.raises(sqlite3.IntegrityError):
+        users.create_users_bulk([
+            {'employee_id': 'E1', 'name': '山田'},
+            {'employee_id': 'E2', 'name': '重複'},
+        ])
+    assert user_rows(users.get_all_users()) == [('E2', '既存', None)]
+
+def test_bulk_groups_return_ids_in_input_order_with_duplicates(database):
+    groups = GroupManager(database)
+    existing = groups.create_group('開発')
+    ids = groups.create_groups_bulk(['営業', '開発', '営業'], upsert=True)
+    assert ids[1] == existing.id
+    assert ids[0] == ids[2]
+    assert sorted(group.name for group in groups.get_all_groups()) == sorted(['開発', '営業'])
+
+def test_bulk_skill_upsert_is_keyed_by_category_and_name(database):
+    skills = SkillManager(database)
+    ids = skills.upsert_skills_bulk([
+        {'category_id': 1, 'name': 'Python'},
+        {'category_id': 2, 'name': 'Python'},
+    ])
+    assert ids[0] != ids[1]
+    again = skills.upsert_skills_bulk([
+        {'category_id': 1, 'name': 'ＰＹＴＨＯＮ', 'description': '更新'},
+    ])
+    assert again == [ids[0]]
+    skill = skills.get_skill(ids[0])
+    assert (skill.name, skill.description) == ('Python', '更新')
@@ -0,0 +1,123 @@
+import sqlite3
+import threading
+import pytest
+from src.desktop.database.connection_pool import ConnectionPool, PragmaSettings
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=2, timeout=1.0)
+    yield pool
+    pool.close_all()
+
+def run_in_thread(func):
+    """別スレッドで実行し、結果（または例外）を返す"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(_call(func)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+def _call(func):
+    try:
+        return func()
+    except Exception as e:
+        return e
+
+def test_pragmas_are_applied_to_each_connection(tmp_path):
+    pool = ConnectionPool(
+        str(tmp_path / 'pragmas.db'),
+        pragmas=PragmaSettings.from_dict({'busy_timeout': 1234, 'foreign_keys': False})
+    )
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 0
+        # 大文字小文字・全角半角を無視する比較用の関数も登録される
+        assert conn.execute("SELECT normalize_key('ＡＢＣ')").fetchone()[0] == 'abc'
+    pool.close_all()
+
+def test_unknown_pragma_setting_is_rejected():
+    with pytest.raises(ValueError):
+        PragmaSettings.from_dict({'journal': 'WAL'})
+
+def test_nested_checkouts_reuse_the_thread_connection(pool):
+    with pool.connection() as outer:
+        with pool.transaction() as inner:
+            assert inner is outer
+    with pool.connection() as again:
+        assert again is outer
+    stats = pool.get_statistics()
+    assert stats.checkouts == 2
+    assert stats.reentrant_checkouts == 1
+    assert stats.created_connections == 1
+    assert stats.idle_connections == 1
+
+def test_threads_get_separate_connections_up_to_max_size(pool):
+    with pool.connection() as main_conn:
+        other = run_in_thread(lambda: _checkout_id(pool))
+        assert other != id(main_conn)
+    assert pool.get_statistics().created_connections == 2
+
+def _checkout_id(pool):
+    with pool.connection() as conn:
+        return id(conn)
+
+def test_checkout_times_out_when_pool_is_exhausted(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'small.db'), max_size=1, timeout=0.05)
+    with pool.connection():
+        assert isinstance(run_in_thread(lambda: _checkout_id(pool)), TimeoutError)
+    # 返却後は借り出せる
+    assert isinstance(run_in_thread(lambda: _checkout_id(pool)), int)
+    pool.close_all()
+
+def test_waiting_thread_gets_released_connection(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'wait.db'), max_size=1, timeout=5.0)
+    checked_out = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            checked_out.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    checked_out.wait()
+    waiter_result = []
+    waiter = threading.Thread(target=lambda: waiter_result.append(_checkout_id(pool)))
+    waiter.start()
+    release.set()
+    holder.join()
+    waiter.join()
+    assert waiter_result
+    # 上限に達していたため新しい接続は作られず、返却された接続を使う
+    assert pool.get_statistics().created_connections == 1
+    pool.close_all()
+
+def test_unfinished_transaction_is_rolled_back_on_release(pool):
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO items VALUES ('a')")
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+def test_unhealthy_idle_connection_is_replaced(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'health.db'), health_check_interval=0.0)
+    with pool.connection() as conn:
+        pass
+    conn.close()
+    with pool.connection() as replacement:
+        assert replacement is not conn
+        assert replacement.execute("SELECT 1").fetchone()[0] == 1
+    stats = pool.get_statistics()
+    assert stats.health_check_failures == 1
+    assert stats.discarded_connections == 1
+    pool.close_all()
+
+def test_closed_pool_rejects_checkouts(pool):
+    pool.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        with pool.connection():
+            pass
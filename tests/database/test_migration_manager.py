@@ -0,0 +1,61 @@
+import sqlite3
+from src.desktop.services.migration_manager import MigrationManager
+
+def write_migration(directory, stem, sql):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f'{stem}.sql').write_text(f"-- Up migration\n{sql}\n-- Down migration\n")
+
+def table_names(db_path):
+    conn = sqlite3.connect(db_path)
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    conn.close()
+    return names
+
+def test_directories_with_the_same_version_are_applied_separately(tmp_path):
+    db_path = str(tmp_path / 'shared.db')
+    database_dir = tmp_path / 'database' / 'migrations'
+    services_dir = tmp_path / 'services' / 'migrations'
+    write_migration(database_dir, '20250204090000_add_indexes', "CREATE TABLE database_items (id INTEGER);")
+    write_migration(services_dir, '20250204090000_add_indexes', "CREATE TABLE services_items (id INTEGER);")
+
+    database = MigrationManager(db_path, migrations_dir=database_dir)
+    services = MigrationManager(db_path, migrations_dir=services_dir)
+    database.migrate()
+    assert services.get_pending_migrations() == [('20250204090000', services_dir / '20250204090000_add_indexes.sql')]
+    services.migrate()
+    assert {'database_items', 'services_items'} <= table_names(db_path)
+    assert database.get_applied_migrations() == ['20250204090000']
+    assert services.get_applied_migrations() == ['20250204090000']
+
+    # 再実行しても適用済みのマイグレーションは実行されない
+    MigrationManager(db_path, migrations_dir=database_dir).migrate()
+    MigrationManager(db_path, migrations_dir=services_dir).migrate()
+
+def test_history_without_scope_is_claimed_by_matching_directory(tmp_path):
+    db_path = str(tmp_path / 'legacy.db')
+    database_dir = tmp_path / 'database' / 'migrations'
+    services_dir = tmp_path / 'services' / 'migrations'
+    write_migration(database_dir, '20250206090000_add_search_index', "CREATE TABLE search_items (id INTEGER);")
+    write_migration(services_dir, '20250206090000_add_category_search_index', "CREATE TABLE category_items (id INTEGER);")
+
+    # scope 列を持たない以前の履歴テーブル（database 側のみ適用済み）
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE migrations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            version TEXT NOT NULL,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            applied_by TEXT
+        );
+        INSERT INTO migrations (version, name) VALUES ('20250206090000', '20250206090000_add_search_index');
+        CREATE TABLE search_items (id INTEGER);
+    """)
+    conn.close()
+
+    database = MigrationManager(db_path, migrations_dir=database_dir)
+    assert database.get_pending_migrations() == []
+    services = MigrationManager(db_path, migrations_dir=services_dir)
+    assert [version for version, _ in services.get_pending_migrations()] == ['20250206090000']
+    services.migrate()
+    assert 'category_items' in table_names(db_path)
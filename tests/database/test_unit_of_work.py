@@ -0,0 +1,133 @@
+import random
+import sqlite3
+import pytest
+from src.desktop.database.unit_of_work import TransactionScope
+from src.desktop.managers.user_manager import UserManager
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'uow.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (value INTEGER)")
+    conn.commit()
+    conn.close()
+    return path
+
+@pytest.fixture
+def scope(db_path):
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    yield TransactionScope(conn)
+    conn.close()
+
+def committed_values(db_path):
+    """別の接続から見える（コミット済みの）値"""
+    conn = sqlite3.connect(db_path)
+    values = sorted(row[0] for row in conn.execute("SELECT value FROM items"))
+    conn.close()
+    return values
+
+class Abort(Exception):
+    pass
+
+def test_nested_blocks_commit_once_at_the_outermost_block(scope, db_path):
+    with scope.begin() as conn:
+        conn.execute("INSERT INTO items VALUES (1)")
+        with scope.begin() as inner:
+            inner.execute("INSERT INTO items VALUES (2)")
+        assert scope.depth == 1
+        assert committed_values(db_path) == []
+    assert not scope.active
+    assert committed_values(db_path) == [1, 2]
+
+def test_inner_failure_rolls_back_only_its_savepoint(scope, db_path):
+    with scope.begin() as conn:
+        conn.execute("INSERT INTO items VALUES (1)")
+        with pytest.raises(Abort):
+            with scope.begin() as inner:
+                inner.execute("INSERT INTO items VALUES (2)")
+                raise Abort()
+        conn.execute("INSERT INTO items VALUES (3)")
+    assert committed_values(db_path) == [1, 3]
+
+def test_outer_failure_discards_released_savepoints(scope, db_path):
+    with pytest.raises(Abort):
+        with scope.begin() as conn:
+            with scope.begin() as inner:
+                inner.execute("INSERT INTO items VALUES (1)")
+            conn.execute("INSERT INTO items VALUES (2)")
+            raise Abort()
+    assert not scope.connection.in_transaction
+    assert committed_values(db_path) == []
+
+def test_after_commit_callbacks_follow_the_outermost_commit(scope):
+    calls = []
+    scope.after_commit(lambda: calls.append('outside'))
+    assert calls == ['outside']
+
+    with scope.begin():
+        scope.after_commit(lambda: calls.append('outer'))
+        with scope.begin():
+            scope.after_commit(lambda: calls.append('released'))
+        with pytest.raises(Abort):
+            with scope.begin():
+                scope.after_commit(lambda: calls.append('rolled back'))
+                raise Abort()
+        scope.after_commit(lambda: 1 / 0)
+        scope.after_commit(lambda: calls.append('after failure'))
+        assert calls == ['outside']
+    assert calls == ['outside', 'outer', 'released', 'after failure']
+
+def test_outer_rollback_drops_all_callbacks(scope):
+    calls = []
+    with pytest.raises(Abort):
+        with scope.begin():
+            with scope.begin():
+                scope.after_commit(lambda: calls.append('inner'))
+            raise Abort()
+    assert calls == []
+
+@pytest.mark.parametrize('seed', range(30))
+def test_random_nesting_matches_reference_model(scope, db_path, seed):
+    rng = random.Random(seed)
+    counter = iter(range(1, 10_000))
+
+    def run_block(depth):
+        """
+        ランダムな入れ子のブロックを実行し、そのブロックで確定する値を返す
+        （例外で抜ける場合は Abort を送出し、値は残らない）
+        """
+        kept = []
+        with scope.begin() as conn:
+            for _ in range(rng.randint(0, 3)):
+                if depth < 3 and rng.random() < 0.5:
+                    try:
+                        kept.extend(run_block(depth + 1))
+                    except Abort:
+                        pass
+                else:
+                    value = next(counter)
+                    conn.execute("INSERT INTO items VALUES (?)", (value,))
+                    kept.append(value)
+            if depth > 0 and rng.random() < 0.3:
+                raise Abort()
+        return kept
+
+    expected = run_block(0)
+    assert committed_values(db_path) == sorted(expected)
+
+def test_database_transaction_spans_manager_calls(database):
+    users = UserManager(database)
+    with pytest.raises(Abort):
+        with database.transaction():
+            users.create_user('E1', '山田')
+            users.create_user('E2', '鈴木')
+            raise Abort()
+    assert users.get_all_users() == []
+
+    with database.transaction():
+        users.create_user('E1', '山田')
+        with pytest.raises(sqlite3.IntegrityError):
+            # 社員番号の重複はこの呼び出しのセーブポイントだけを巻き戻す
+            users.create_user('E1', '重複')
+        users.create_user('E2', '鈴木')
+    assert [user.employee_id for user in users.get_all_users()] == ['E1', 'E2']
@@ -0,0 +1,59 @@
+import random
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.user_manager import UserManager
+
+def brute_force_counts(groups, users):
+    """グループ名順の (group_id, 所属人数)"""
+    return [
+        (group.id, sum(1 for user in users.get_all_users() if user.group_id == group.id))
+        for group in sorted(groups.get_all_groups(), key=lambda group: group.name)
+    ]
+
+def member_counts(groups):
+    return [(group.id, count) for group, count in groups.get_groups_with_member_counts()]
+
+def test_counts_include_empty_groups_and_follow_moves_and_deletes(database):
+    groups = GroupManager(database)
+    users = UserManager(database)
+    assert groups.get_groups_with_member_counts() == []
+
+    develop, sales, empty = (groups.create_group(name) for name in ('開発', '営業', '総務'))
+    user_ids = [users.create_user(f'E{i}', f'ユーザー{i}', develop.id if i < 3 else None).id for i in range(5)]
+    assert [(group.name, count) for group, count in groups.get_groups_with_member_counts()] == [
+        ('営業', 0), ('総務', 0), ('開発', 3)
+    ]
+
+    # 所属の付け替え・未所属への移動・ユーザーの削除
+    users.update_user(user_ids[0], group_id=sales.id)
+    users.update_user(user_ids[3], group_id=sales.id)
+    users.delete_user(user_ids[1])
+    assert member_counts(groups) == [(sales.id, 2), (empty.id, 0), (develop.id, 1)]
+
+    # グループを削除すると所属していたユーザーは未所属になり、他のグループの人数は変わらない
+    assert groups.delete_group(sales.id)
+    assert member_counts(groups) == [(empty.id, 0), (develop.id, 1)]
+    assert [users.get_user(user_id).group_id for user_id in (user_ids[0], user_ids[3])] == [None, None]
+
+def test_random_changes_match_brute_force(database):
+    groups = GroupManager(database)
+    users = UserManager(database)
+    rng = random.Random(10)
+    group_ids = [groups.create_group(f'G{i}').id for i in range(5)]
+    user_ids = []
+    for step in range(120):
+        operation = rng.random()
+        if operation < 0.4 or not user_ids:
+            user_ids.append(users.create_user(f'E{step}', f'U{step}', rng.choice([None] + group_ids)).id)
+        elif operation < 0.75:
+            users.update_user(rng.choice(user_ids), group_id=rng.choice(group_ids))
+        elif operation < 0.9:
+            user_id = rng.choice(user_ids)
+            users.delete_user(user_id)
+            user_ids.remove(user_id)
+        elif operation < 0.95 and group_ids:
+            group_id = rng.choice(group_ids)
+            groups.delete_group(group_id)
+            group_ids.remove(group_id)
+        else:
+            group_ids.append(groups.create_group(f'N{step}').id)
+        assert member_counts(groups) == brute_force_counts(groups, users)
@@ -0,0 +1,112 @@
+import random
+import pytest
+from src.desktop.controllers.skill_controller import SkillController
+from src.desktop.controllers.user_controller import UserController
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+
+# 接頭辞が重なり、長さの異なる社員番号・スキル名
+ALPHABET = ['0', '1', '9', 'A', 'a', 'ｱ', 'あ', '-']
+
+def random_code(rng):
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 4)))
+
+@pytest.fixture
+def users(database):
+    group_ids = GroupManager(database).create_groups_bulk(['開発', '営業'])
+    rng = random.Random(8)
+    employee_ids = sorted({f'E{random_code(rng)}' for _ in range(150)})
+    rng.shuffle(employee_ids)
+    UserManager(database).create_users_bulk(
+        {'employee_id': employee_id, 'name': f'ユーザー{i}', 'group_id': rng.choice([None] + group_ids)}
+        for i, employee_id in enumerate(employee_ids)
+    )
+    return UserController(UserManager(database)), group_ids
+
+@pytest.fixture
+def skills(database):
+    rng = random.Random(9)
+    names = {(rng.randint(1, 3), f'S{random_code(rng)}') for _ in range(150)}
+    SkillManager(database).upsert_skills_bulk(
+        {'category_id': category_id, 'name': name} for category_id, name in rng.sample(sorted(names), len(names))
+    )
+    return SkillController(SkillManager(database))
+
+def expected_users(controller, group_id=None):
+    """全ユーザーを社員番号順に並べた参照結果"""
+    return sorted(
+        (user for user in controller.get_all_users() if group_id is None or user.group_id == group_id),
+        key=lambda user: user.employee_id
+    )
+
+def page_users(controller, limit, group_id=None, after=None):
+    """社員番号 after より後を最後まで1ページずつ読み込む"""
+    pages = []
+    while True:
+        page = controller.get_users_page(after, limit, group_id)
+        pages.append(page)
+        if len(page) < limit:
+            return pages
+        after = page[-1].employee_id
+
+def page_skills(controller, limit):
+    pages, after = [], None
+    while True:
+        page = controller.get_skills_page(after, limit)
+        pages.append(page)
+        if len(page) < limit:
+            return pages
+        after = (page[-1].category_id, page[-1].name)
+
+@pytest.mark.parametrize('limit', [1, 7, 50, 1000])
+def test_user_pages_cover_every_row_once(users, limit):
+    controller, group_ids = users
+    for group_id in [None] + group_ids:
+        pages = page_users(controller, limit, group_id)
+        assert all(len(page) == limit for page in pages[:-1])
+        assert [user for page in pages for user in page] == expected_users(controller, group_id)
+
+@pytest.mark.parametrize('limit', [1, 7, 1000])
+def test_skill_pages_cover_every_row_once(skills, limit):
+    all_skills = sorted(skills.get_all_skills(), key=lambda skill: (skill.category_id, skill.name))
+    pages = page_skills(skills, limit)
+    assert all(len(page) == limit for page in pages[:-1])
+    assert [skill for page in pages for skill in page] == all_skills
+
+def test_rows_changed_between_pages_are_neither_repeated_nor_skipped(users):
+    controller, _ = users
+    ordered = expected_users(controller)
+    first = controller.get_users_page(None, 10)
+    boundary = first[-1].employee_id
+    # ページの間に読み込み済みの範囲・未読み込みの範囲それぞれで作成・削除する
+    controller.create_user(f'{ordered[0].employee_id}0', '読み込み済みの範囲')
+    created = controller.create_user(f'{boundary}0', '未読み込みの範囲')
+    controller.delete_user(first[3].id)
+    controller.delete_user(ordered[20].id)
+
+    rest = [user for page in page_users(controller, 10, after=boundary) for user in page]
+    seen = [user.employee_id for user in first + rest]
+    assert len(seen) == len(set(seen))
+    assert [user.id for user in rest] == [
+        user.id for user in expected_users(controller) if user.employee_id > boundary
+    ]
+    assert created.id in {user.id for user in rest}
+
+@pytest.mark.parametrize('batch_size', [1, 13, 500])
+def test_streams_match_pages(users, skills, batch_size):
+    controller, group_ids = users
+    for group_id in [None] + group_ids:
+        assert list(controller.iter_users(group_id, batch_size)) == expected_users(controller, group_id)
+    assert list(skills.iter_skills(batch_size)) == [skill for page in page_skills(skills, 1000) for skill in page]
+
+def test_abandoned_stream_returns_its_connection(database, users):
+    controller, _ = users
+    stream = controller.iter_users(batch_size=5)
+    first = [next(stream) for _ in range(3)]
+    assert database.pool.get_statistics().in_use_connections == 1
+    # 読み出し中でも他の接続から書き込める
+    controller.create_user('Z999', '追加')
+    stream.close()
+    assert database.pool.get_statistics().in_use_connections == 0
+    assert first == expected_users(controller)[:3]
@@ -0,0 +1,138 @@
+import random
+import pytest
+from src.desktop.controllers.search_controller import SearchController
+from src.desktop.managers.search_manager import SearchManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.models.category import CategoryManager
+from src.desktop.models.search_result import KIND_CATEGORY, KIND_SKILL, KIND_SKILL_CATEGORY, KIND_USER
+from src.desktop.services.db import DatabaseManager
+
+# 検索語の前方一致が重なるように選んだ語
+WORDS = ['alpha', 'alpine', 'beta', 'bet', 'gamma', 'データ', 'データベース', '設計']
+QUERIES = ['a', 'al', 'alp', 'alpha', 'be', 'beta', 'g', 'デ', 'データベ', '設', 'al be', 'データ 設計', 'zzz']
+
+class Abort(Exception):
+    pass
+
+@pytest.fixture
+def search(database, tmp_path, monkeypatch):
+    # カテゴリー管理のデータベースはホームディレクトリ配下に作られる
+    monkeypatch.setenv('HOME', str(tmp_path))
+    db_manager = DatabaseManager()
+    categories = CategoryManager(db_manager)
+    yield database, categories, SearchController(SearchManager(database), categories)
+    db_manager.connection.close()
+
+def random_text(rng, serial):
+    """ランダムな語と、他と重ならない通し番号の語"""
+    return ' '.join(rng.sample(WORDS, rng.randint(1, 3)) + [f'n{serial}'])
+
+def matches(query, texts):
+    """各検索語がいずれかの列のいずれかの語の接頭辞になっているか"""
+    tokens = [token.lower() for text in texts if text for token in text.split()]
+    return all(any(token.startswith(term.lower()) for token in tokens) for term in query.split())
+
+def expected_results(reference, query):
+    return {
+        (kind, row_id)
+        for kind, rows in reference.items()
+        for row_id, texts in rows.items()
+        if matches(query, texts)
+    }
+
+def check_search(controller, reference):
+    for query in QUERIES:
+        results = controller.search(query, limit=1000)
+        assert {(result.kind, result.id) for result in results} == expected_results(reference, query), query
+        assert [result.rank for result in results] == sorted(result.rank for result in results)
+
+def insert_skill_category(database, name, description):
+    with database.transaction() as conn:
+        cursor = conn.execute(
+            "INSERT INTO skill_categories (name, name_key, description, created_at, updated_at) "
+            "VALUES (?, ?, ?, '2025-01-01', '2025-01-01')",
+            (name, name, description)
+        )
+        return cursor.lastrowid
+
+def test_index_follows_random_inserts_updates_and_deletes(search):
+    database, categories, controller = search
+    users = UserManager(database)
+    skills = SkillManager(database)
+    rng = random.Random(21)
+    reference = {KIND_USER: {}, KIND_SKILL: {}, KIND_SKILL_CATEGORY: {}, KIND_CATEGORY: {}}
+    serial = iter(range(100000))
+
+    for step in range(150):
+        kind = rng.choice(list(reference))
+        rows = reference[kind]
+        operation = rng.random()
+        name, description = random_text(rng, next(serial)), random_text(rng, next(serial))
+        if operation < 0.5 or not rows:
+            if kind == KIND_USER:
+                employee_id = f'E{next(serial)}'
+                rows[users.create_user(employee_id, name).id] = (name, employee_id)
+            elif kind == KIND_SKILL:
+                rows[skills.create_skill(1, name, description).id] = (name, description)
+            elif kind == KIND_SKILL_CATEGORY:
+                rows[insert_skill_category(database, name, description)] = (name, description)
+            else:
+                rows[categories.create_category(name, description)] = (name, description)
+        elif operation < 0.8:
+            row_id = rng.choice(list(rows))
+            if kind == KIND_USER:
+                users.update_user(row_id, name=name)
+                rows[row_id] = (name, rows[row_id][1])
+            elif kind == KIND_SKILL:
+                skills.update_skill(row_id, name=name, description=description)
+                rows[row_id] = (name, description)
+            elif kind == KIND_SKILL_CATEGORY:
+                with database.transaction() as conn:
+                    conn.execute(
+                        "UPDATE skill_categories SET name = ?, name_key = ?, description = ? WHERE id = ?",
+                        (name, name, description, row_id)
+                    )
+                rows[row_id] = (name, description)
+            else:
+                categories.update_category(row_id, name, description)
+                rows[row_id] = (name, description)
+        else:
+            row_id = rng.choice(list(rows))
+            if kind == KIND_USER:
+                assert users.delete_user(row_id)
+            elif kind == KIND_SKILL:
+                assert skills.delete_skill(row_id)
+            elif kind == KIND_SKILL_CATEGORY:
+                with database.transaction() as conn:
+                    conn.execute("DELETE FROM skill_categories WHERE id = ?", (row_id,))
+            else:
+                assert categories.delete_category(row_id) == 1
+            del rows[row_id]
+        if step % 10 == 0:
+            check_search(controller, reference)
+    check_search(controller, reference)
+
+def test_rolled_back_changes_do_not_reach_the_index(search):
+    database, _, controller = search
+    users = UserManager(database)
+    user = users.create_user('E1', 'alpha')
+    with pytest.raises(Abort):
+        with database.transaction():
+            users.create_user('E2', 'beta')
+            users.update_user(user.id, name='gamma')
+            raise Abort()
+    assert [(result.kind, result.id) for result in controller.search('alpha')] == [(KIND_USER, user.id)]
+    assert controller.search('beta') == []
+    assert controller.search('gamma') == []
+
+def test_limit_keeps_best_ranked_results(search):
+    database, categories, controller = search
+    users = UserManager(database)
+    for i in range(5):
+        users.create_user(f'E{i}', f'alpha n{i}')
+        categories.create_category(f'alpha c{i}')
+    everything = controller.search('alpha', limit=1000)
+    assert len(everything) == 10
+    assert controller.search('alpha', limit=3) == everything[:3]
+    assert controller.search('   ') == []
@@ -0,0 +1,90 @@
+import pytest
+from src.desktop.controllers.user_skill_controller import UserSkillController
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.managers.user_skill_manager import MAX_LEVEL, MIN_LEVEL, UserSkillManager
+
+@pytest.fixture
+def levels(database):
+    user_ids = [UserManager(database).create_user(f'E{i}', f'ユーザー{i}').id for i in range(3)]
+    skill_ids = [SkillManager(database).create_skill(1, name).id for name in ('Python', 'SQL')]
+    manager = UserSkillManager(database)
+    controller = UserSkillController(manager)
+    received = []
+    controller.add_level_listener(received.append)
+    return manager, controller, user_ids, skill_ids, received
+
+def updated_at(database, user_id, skill_id):
+    with database.get_connection() as conn:
+        return conn.execute(
+            'SELECT updated_at FROM user_skills WHERE user_id = ? AND skill_id = ?', (user_id, skill_id)
+        ).fetchone()[0]
+
+def test_unchanged_levels_are_not_rewritten(database, levels):
+    manager, _, user_ids, skill_ids, _ = levels
+    rows = [(user_id, skill_id, 3) for user_id in user_ids for skill_id in skill_ids]
+    assert manager.set_levels_bulk(rows) == len(rows)
+    before = updated_at(database, user_ids[0], skill_ids[0])
+
+    # 同じレベルの upsert は行を更新しない（updated_at も変わらない）
+    assert manager.set_levels_bulk(rows) == 0
+    assert updated_at(database, user_ids[0], skill_ids[0]) == before
+    assert manager.set_levels_bulk([(user_ids[0], skill_ids[0], 3), (user_ids[1], skill_ids[0], 4)]) == 1
+    assert manager.get_level(user_ids[1], skill_ids[0]) == 4
+    assert manager.set_level(user_ids[0], skill_ids[0], 3).updated_at.isoformat() == before
+    assert manager.get_all_levels() == [
+        (user_id, skill_id, 4 if (user_id, skill_id) == (user_ids[1], skill_ids[0]) else 3)
+        for user_id in user_ids for skill_id in skill_ids
+    ]
+
+@pytest.mark.parametrize('level', [MIN_LEVEL - 1, MAX_LEVEL + 1, 9])
+def test_levels_outside_range_are_rejected_without_writing(levels, level):
+    manager, controller, user_ids, skill_ids, received = levels
+    with pytest.raises(ValueError):
+        manager.set_level(user_ids[0], skill_ids[0], level)
+    # 範囲外のレベルを含む一括登録は1件も書き込まない
+    with pytest.raises(ValueError):
+        controller.set_levels_bulk([(user_ids[0], skill_ids[0], 2), (user_ids[1], skill_ids[0], level)])
+    assert manager.get_all_levels() == []
+    assert received == []
+    for valid in (MIN_LEVEL, MAX_LEVEL):
+        assert controller.set_level(user_ids[0], skill_ids[0], valid).level == valid
+
+def test_listeners_receive_changes_after_commit(levels):
+    manager, controller, user_ids, skill_ids, received = levels
+    controller.set_level(user_ids[0], skill_ids[0], 2)
+    assert received == [[(user_ids[0], skill_ids[0], 2)]]
+
+    received.clear()
+    with controller.transaction():
+        controller.set_levels_bulk([(user_ids[1], skill_ids[0], 5)])
+        controller.delete_levels_bulk([(user_ids[0], skill_ids[0])])
+        # コミットまでは通知しない
+        assert received == []
+    assert received == [[(user_ids[1], skill_ids[0], 5)], [(user_ids[0], skill_ids[0], None)]]
+    assert manager.get_skill_column(skill_ids[0]) == {user_ids[1]: 5}
+
+def test_rolled_back_changes_are_not_dispatched(levels):
+    manager, controller, user_ids, skill_ids, received = levels
+    controller.set_level(user_ids[0], skill_ids[0], 1)
+    received.clear()
+    with pytest.raises(RuntimeError):
+        with controller.transaction():
+            controller.set_level(user_ids[0], skill_ids[0], 4)
+            controller.set_levels_bulk([(user_ids[1], skill_ids[1], 2)])
+            raise RuntimeError('rollback')
+    assert received == []
+    assert manager.get_user_profile(user_ids[0]) == {skill_ids[0]: 1}
+    assert manager.get_user_profile(user_ids[1]) == {}
+
+    # 入れ子のトランザクションを含め、外側のコミット後に1回ずつ通知する
+    with controller.transaction():
+        with controller.transaction():
+            controller.set_level(user_ids[2], skill_ids[1], 3)
+        assert received == []
+    assert received == [[(user_ids[2], skill_ids[1], 3)]]
+
+    received.clear()
+    controller.remove_level_listener(received.append)
+    controller.set_level(user_ids[2], skill_ids[1], 4)
+    assert received == []
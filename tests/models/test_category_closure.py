@@ -0,0 +1,95 @@
+import random
+import sqlite3
+import pytest
+from src.desktop.models.category import CategoryManager
+from src.desktop.services.db import DatabaseManager
+
+@pytest.fixture
+def categories(tmp_path, monkeypatch):
+    # カテゴリー管理のデータベースはホームディレクトリ配下に作られる
+    monkeypatch.setenv('HOME', str(tmp_path))
+    db_manager = DatabaseManager()
+    yield CategoryManager(db_manager)
+    db_manager.connection.close()
+
+def parents(categories):
+    """id → parent_id"""
+    rows = categories.db.connection.execute("SELECT id, parent_id FROM categories").fetchall()
+    return {row[0]: row[1] for row in rows}
+
+def reference_closure(parent_of):
+    """親の対応から求めた (祖先, 子孫, 距離) の集合"""
+    closure = set()
+    for node in parent_of:
+        ancestor, depth = node, 0
+        while ancestor is not None:
+            closure.add((ancestor, node, depth))
+            ancestor, depth = parent_of[ancestor], depth + 1
+    return closure
+
+def stored_closure(categories):
+    rows = categories.db.connection.execute(
+        "SELECT ancestor_id, descendant_id, depth FROM category_closure"
+    ).fetchall()
+    return {tuple(row) for row in rows}
+
+def check_against_reference(categories):
+    parent_of = parents(categories)
+    closure = reference_closure(parent_of)
+    assert stored_closure(categories) == closure
+    for node in parent_of:
+        descendants = {d for a, d, _ in closure if a == node}
+        assert set(categories.get_subtree_ids(node)) == descendants
+        chain = sorted(((depth, a) for a, d, depth in closure if d == node), reverse=True)
+        assert [category.id for category in categories.get_ancestors(node)] == [a for _, a in chain if a != node]
+
+def test_closure_follows_random_inserts_moves_and_deletes(categories):
+    rng = random.Random(7)
+    ids = []
+    for i in range(40):
+        parent_id = rng.choice(ids) if ids and rng.random() < 0.8 else None
+        ids.append(categories.create_category(f'カテゴリー{i}', parent_id=parent_id))
+    check_against_reference(categories)
+
+    for _ in range(60):
+        parent_of = parents(categories)
+        node = rng.choice(list(parent_of))
+        new_parent = rng.choice(list(parent_of) + [None])
+        closure = reference_closure(parent_of)
+        # 自分自身または子孫の下への移動は循環になるため拒否される
+        if new_parent is not None and any(a == node and d == new_parent for a, d, _ in closure):
+            with pytest.raises(ValueError):
+                categories.move_category(node, new_parent)
+        else:
+            assert categories.move_category(node, new_parent)
+        check_against_reference(categories)
+
+    for _ in range(5):
+        parent_of = parents(categories)
+        node = rng.choice(list(parent_of))
+        subtree = {d for a, d, _ in reference_closure(parent_of) if a == node}
+        assert categories.delete_category(node) == len(subtree)
+        assert not subtree & set(parents(categories))
+        check_against_reference(categories)
+
+def test_trigger_prevents_cycles_without_the_manager_check(categories):
+    root = categories.create_category('ルート')
+    child = categories.create_category('子', parent_id=root)
+    grandchild = categories.create_category('孫', parent_id=child)
+    with pytest.raises(sqlite3.IntegrityError, match='own descendant'):
+        categories.db.connection.execute(
+            "UPDATE categories SET parent_id = ? WHERE id = ?", (grandchild, root)
+        )
+    with pytest.raises(sqlite3.IntegrityError):
+        categories.db.connection.execute(
+            "UPDATE categories SET parent_id = ? WHERE id = ?", (root, root)
+        )
+    assert parents(categories) == {root: None, child: root, grandchild: child}
+    check_against_reference(categories)
+
+def test_path_lists_names_from_the_root(categories):
+    root = categories.create_category('技術')
+    child = categories.create_category('言語', parent_id=root)
+    leaf = categories.create_category('Python', parent_id=child)
+    assert categories.get_path(leaf) == '技術 / 言語 / Python'
+    assert [category.id for category in categories.get_subtree(root, include_self=False)] == [child, leaf]
@@ -0,0 +1,156 @@
+import sqlite3
+import pytest
+from src.desktop.database.database import Database
+from src.desktop.managers.group_manager import GroupManager
+from src.desktop.managers.skill_manager import SkillManager
+from src.desktop.managers.user_manager import UserManager
+from src.desktop.services.migration_manager import MigrationManager
+
+def test_name_key_is_written_by_managers(database):
+    groups = GroupManager(database)
+    users = UserManager(database)
+    group = groups.create_group('ｶｲﾊﾂ')
+    user = users.create_user('E1', 'ヤマダ　タロウ', group.id)
+    users.update_user(user.id, name='スズキ')
+    assert groups.find_group_by_name('かいはつ').id == group.id
+    assert [u.id for u in users.find_users_by_name('すずき')] == [user.id]
+    assert users.find_users_by_name('やまだ たろう') == []
+
+def test_plain_connection_can_write_without_custom_functions(database):
+    conn = sqlite3.connect(database.db_path)
+    conn.execute(
+        "INSERT INTO groups (name, created_at, updated_at) VALUES ('外部', '2025-01-01', '2025-01-01')"
+    )
+    conn.execute("UPDATE groups SET name = '外部2' WHERE name = '外部'")
+    conn.commit()
+    conn.close()
+
+def test_bulk_group_create_rejects_width_variants(database):
+    groups = GroupManager(database)
+    groups.create_group('Dev')
+    with pytest.raises(sqlite3.IntegrityError):
+        groups.create_groups_bulk(['ＤＥＶ'])
+    with pytest.raises(sqlite3.IntegrityError):
+        groups.create_groups_bulk(['ﾃｽﾄ', 'テスト'])
+
+def test_bulk_group_upsert_returns_existing_id_for_variants(database):
+    groups = GroupManager(database)
+    group = groups.create_group('Dev')
+    assert groups.create_groups_bulk(['ｄｅｖ', 'New'], upsert=True)[0] == group.id
+
+def test_bulk_skill_upsert_matches_on_normalised_name(database):
+    skills = SkillManager(database)
+    skill = skills.create_skill(1, 'Python')
+    ids = skills.upsert_skills_bulk([
+        {'category_id': 1, 'name': 'ＰＹＴＨＯＮ', 'description': 'updated'},
+        {'category_id': 2, 'name': 'python'},
+    ])
+    assert ids[0] == skill.id
+    assert ids[1] != skill.id
+    assert skills.get_skill(skill.id).description == 'updated'
+
+def test_create_skill_rejects_variant_in_same_category(database):
+    skills = SkillManager(database)
+    skills.create_skill(1, 'パイソン')
+    with pytest.raises(ValueError):
+        skills.create_skill(1, 'ﾊﾟｲｿﾝ')
+    skills.create_skill(2, 'ﾊﾟｲｿﾝ')
+
+# name_key のマイグレーション前のスキーマ（Database が作成するテーブルのうち必要なもの）
+BASELINE_SCHEMA = """
+CREATE TABLE groups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE skill_categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    FOREIGN KEY (category_id) REFERENCES skill_categories (id),
+    UNIQUE (category_id, name)
+);
+INSERT INTO groups (name, created_at, updated_at) VALUES
+    ('ABC', '2025-01-01', '2025-01-01'),
+    ('ａｂｃ', '2025-01-01', '2025-01-01'),
+    ('Abc', '2025-01-01', '2025-01-01');
+INSERT INTO skill_categories (name, created_at, updated_at) VALUES
+    ('技術', '2025-01-01', '2025-01-01'),
+    ('業務', '2025-01-01', '2025-01-01');
+INSERT INTO skills (category_id, name, created_at, updated_at) VALUES
+    (1, 'パイソン', '2025-01-01', '2025-01-01'),
+    (1, 'ﾊﾟｲｿﾝ', '2025-01-01', '2025-01-01'),
+    (2, 'ﾊﾟｲｿﾝ', '2025-01-01', '2025-01-01');
+"""
+
+def test_migration_keeps_colliding_names_of_an_existing_database(tmp_path, caplog):
+    db_path = tmp_path / 'baseline.db'
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.close()
+
+    with caplog.at_level('WARNING', logger='src.desktop.database.database'):
+        database = Database(str(db_path))
+    groups = GroupManager(database)
+    skills = SkillManager(database)
+    # 名前は変更せず、最も古い行だけが名前で見つかる
+    assert {group.id: group.name for group in groups.get_all_groups()} == {1: 'ABC', 2: 'ａｂｃ', 3: 'Abc'}
+    assert groups.find_group_by_name('abc').id == 1
+    assert [skill.id for skill in skills.find_skills_by_name('ぱいそん')] == [1, 3]
+    reported = [record.getMessage() for record in caplog.records if record.levelname == 'WARNING']
+    assert len(reported) == 3
+    assert any('groups 2 ' in message for message in reported)
+    assert any('skills 2 ' in message for message in reported)
+
+    # 一意インデックスが作成され、以降の登録では表記の違いを重複として扱う
+    with pytest.raises(ValueError):
+        groups.create_group('ＡＢＣ')
+    database.pool.close_all()
+
+    # 再度開いてもマイグレーションは再実行されない
+    reopened = Database(str(db_path))
+    assert GroupManager(reopened).find_group_by_name('ABC').id == 1
+    reopened.pool.close_all()
+
+def test_failed_migration_is_rolled_back_and_can_be_rerun(tmp_path):
+    db_path = tmp_path / 'migrate.db'
+    migrations_dir = tmp_path / 'migrations'
+    migrations_dir.mkdir()
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);"
+        "INSERT INTO items (name) VALUES ('a'), ('a');"
+    )
+    conn.close()
+    (migrations_dir / '20250301090000_add_item_key.sql').write_text(
+        "-- Up migration\n"
+        "ALTER TABLE items ADD COLUMN name_key TEXT;\n"
+        "UPDATE items SET name_key = name;\n"
+        "CREATE UNIQUE INDEX idx_items_name_key ON items (name_key);\n"
+        "-- Down migration\n"
+    )
+    manager = MigrationManager(str(db_path), migrations_dir=migrations_dir)
+    with pytest.raises(sqlite3.IntegrityError):
+        manager.migrate()
+
+    # 列の追加も巻き戻り、履歴にも記録されない
+    conn = sqlite3.connect(db_path)
+    assert [row[1] for row in conn.execute("PRAGMA table_info(items)")] == ['id', 'name']
+    conn.execute("DELETE FROM items WHERE id = 2")
+    conn.commit()
+    conn.close()
+    assert manager.get_applied_migrations() == []
+
+    manager.migrate()
+    assert manager.get_applied_migrations() == ['20250301090000']
@@ -0,0 +1,49 @@
+import re
+import sqlite3
+import pytest
+from src.desktop.database.database import Database
+from src.desktop.services.migration_manager import MigrationManager
+from src.desktop.utils.text_normalizer import register_functions
+
+# 「SCAN users」のようにインデックスを使わない全件走査（USING INDEX 付きの走査は許容）
+BARE_SCAN = re.compile(r'^SCAN (\w+)$')
+
+def assert_no_bare_scan(plan):
+    for step in plan:
+        assert not BARE_SCAN.match(step), f"table scan in plan: {plan}"
+        assert 'USE TEMP B-TREE' not in step, f"sort without index in plan: {plan}"
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(str(tmp_path / 'main.db'))
+    yield db
+    db.pool.close_all()
+
+@pytest.fixture
+def category_connection(tmp_path):
+    path = str(tmp_path / 'categories.db')
+    MigrationManager(path).migrate()
+    conn = sqlite3.connect(path)
+    register_functions(conn)
+    yield conn
+    conn.close()
+
+@pytest.mark.parametrize('query, params', [
+    ('SELECT * FROM users WHERE group_id = ? ORDER BY employee_id', (1,)),
+    ('SELECT * FROM users ORDER BY employee_id', ()),
+    ('SELECT * FROM users WHERE employee_id > ? ORDER BY employee_id LIMIT 100', ('E1',)),
+    ('SELECT * FROM skills WHERE category_id = ? ORDER BY name', (1,)),
+    ('SELECT * FROM skills ORDER BY category_id, name', ()),
+    ('SELECT user_id, level FROM user_skills WHERE skill_id = ?', (1,)),
+    ('SELECT skill_id, level FROM user_skills WHERE user_id = ?', (1,)),
+])
+def test_main_database_hot_queries_use_indexes(database, query, params):
+    assert_no_bare_scan(database.explain_query_plan(query, params))
+
+@pytest.mark.parametrize('query, params', [
+    ('SELECT id, name FROM categories WHERE parent_id = ?', (1,)),
+    ('SELECT group_id FROM group_categories WHERE category_id = ?', (1,)),
+])
+def test_category_database_hot_queries_use_indexes(category_connection, query, params):
+    plan = [row[3] for row in category_connection.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+    assert_no_bare_scan(plan)
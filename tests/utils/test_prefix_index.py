@@ -0,0 +1,67 @@
+import random
+import pytest
+from src.desktop.utils.prefix_index import PrefixIndex
+from src.desktop.utils.text_normalizer import normalize_key
+
+# 表記の違いを含む語（正規化すると前方一致が重なる）
+WORDS = ['Yamada', 'ＹＡＭＡＭＯＴＯ', 'yamashita', 'ヤマダ', 'やまぐち', 'ﾔﾏﾓﾄ', 'E001', 'E0012', 'e010', '山田', '山本']
+PREFIXES = ['y', 'YAMA', 'ｙａｍａｄ', 'やま', 'ヤマモ', 'ﾔﾏﾀﾞ', 'e0', 'Ｅ001', '山', '山田', 'z', '']
+
+def brute_force_search(items, prefix, limit, accept=None):
+    """接頭辞で始まるキーのうち最小のキー、ID の順に並べた最大 limit 件"""
+    prefix = normalize_key(prefix)
+    if not prefix or limit <= 0:
+        return []
+    matches = []
+    for item_id, keys in items.items():
+        matching = [normalize_key(key) for key in keys if normalize_key(key).startswith(prefix)]
+        if matching and (accept is None or accept(item_id)):
+            matches.append((min(matching), item_id))
+    return [item_id for _, item_id in sorted(matches)[:limit]]
+
+def random_keys(rng):
+    return rng.sample(WORDS, rng.randint(1, 3))
+
+def test_width_kana_and_case_variants_match():
+    index = PrefixIndex()
+    index.build([(1, ['ヤマダ タロウ']), (2, ['ＹＡＭＡＤＡ']), (3, ['ﾔﾏﾓﾄ']), (4, ['やまぐち'])])
+    assert index.search('やまだ') == [1]
+    assert index.search('ﾔﾏ') == [4, 1, 3]
+    assert index.search('yamad') == [2]
+    assert index.search('ヤマモト') == [3]
+    assert index.search('  ') == []
+    assert index.search('やま', limit=2) == [4, 1]
+    assert index.search('やま', accept=lambda item_id: item_id != 4) == [1, 3]
+    assert len(index) == 4 and 3 in index
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_changes_match_brute_force(seed):
+    rng = random.Random(seed)
+    items = {item_id: random_keys(rng) for item_id in range(1, 20)}
+    index = PrefixIndex()
+    index.build(items.items())
+    next_id = 100
+    for step in range(200):
+        operation = rng.random()
+        if operation < 0.4:
+            items[next_id] = random_keys(rng)
+            index.add(next_id, items[next_id])
+            next_id += 1
+        elif operation < 0.7 and items:
+            # 既存の項目はキーを置き換える
+            item_id = rng.choice(list(items))
+            items[item_id] = random_keys(rng)
+            index.add(item_id, items[item_id])
+        elif items:
+            item_id = rng.choice(list(items))
+            del items[item_id]
+            assert index.remove(item_id)
+            assert not index.remove(item_id)
+        if step % 10 == 0:
+            for prefix in PREFIXES:
+                limit = rng.choice([1, 3, 50])
+                assert index.search(prefix, limit) == brute_force_search(items, prefix, limit), prefix
+    assert len(index) == len(items)
+    odd = lambda item_id: item_id % 2 == 1
+    for prefix in PREFIXES:
+        assert index.search(prefix, 5, odd) == brute_force_search(items, prefix, 5, odd), prefix
@@ -0,0 +1,137 @@
+import os
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QDialog
+from src.desktop.main import close_controllers, create_controllers
+from src.desktop.views.main_window import MainWindow
+from src.desktop.views.dialogs import team_cover_dialog
+from src.desktop.views.components import main_panel
+from src.desktop.models.role_profile import RoleRequirement
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def controllers(tmp_path, monkeypatch):
+    # カテゴリー管理のデータベースはホームディレクトリ配下に作られる
+    monkeypatch.setenv('HOME', str(tmp_path))
+    controllers = create_controllers(str(tmp_path / 'main.db'))
+    yield controllers
+    close_controllers(controllers)
+
+def tab_titles(window):
+    return [window.tab_widget.tabText(i) for i in range(window.tab_widget.count())]
+
+def test_controllers_share_one_database(controllers):
+    database = controllers['database']
+    assert controllers['user'].user_manager.db is database
+    assert controllers['group'].group_manager.db is database
+    assert controllers['skill'].skill_manager.db is database
+    assert controllers['user_skill'].user_skill_manager.db is database
+    assert controllers['analytics'].user_skill_controller is controllers['user_skill']
+    assert controllers['role'].role_manager.db is database
+    assert controllers['role'].analytics_controller is controllers['analytics']
+
+def test_main_panel_shows_users_and_analytics_buttons(app, controllers):
+    group = controllers['group'].create_group('開発')
+    controllers['user'].create_user('E1', '山田', group.id)
+
+    window = MainWindow(controllers=controllers)
+    window.show()
+    app.processEvents()
+    panel = window.main_panel
+    assert 'ユーザー管理' in tab_titles(window)
+    assert not panel.candidate_search_button.isHidden()
+    assert not panel.similar_users_button.isHidden()
+    assert panel.user_list.model().rowCount() == 1
+    window.close()
+
+def test_main_window_without_controllers_shows_only_system_tab(app):
+    window = MainWindow(controllers=None)
+    assert tab_titles(window) == ['システム管理']
+    window.close()
+
+def create_skill(controllers, name):
+    with controllers['database'].transaction() as conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO skill_categories (id, name, name_key, created_at, updated_at) "
+            "VALUES (1, '技術', '技術', '2025-01-01', '2025-01-01')"
+        )
+    return controllers['skill'].create_skill(1, name)
+
+def test_team_cover_button_lists_team(app, controllers, monkeypatch):
+    python = create_skill(controllers, 'Python')
+    sql = create_skill(controllers, 'SQL')
+    users = [controllers['user'].create_user(f'E{i}', name, None) for i, name in enumerate(['山田', '鈴木', '佐藤'])]
+    controllers['user_skill'].set_levels_bulk([
+        (users[0].id, python.id, 4),
+        (users[1].id, sql.id, 5),
+        (users[2].id, python.id, 1),
+    ])
+
+    def accept_requirements(dialog):
+        dialog.requirements = [(python.id, 3), (sql.id, 3)]
+        dialog.exact = True
+        return QDialog.DialogCode.Accepted
+
+    monkeypatch.setattr(team_cover_dialog.TeamCoverDialog, 'exec', accept_requirements)
+    window = MainWindow(controllers=controllers)
+    panel = window.main_panel
+    assert not panel.team_cover_button.isHidden()
+    panel.team_cover_button.click()
+    model = panel.user_list.model()
+    assert sorted(model.user_at(row).name for row in range(model.rowCount())) == ['山田', '鈴木']
+    window.close()
+
+def test_search_tab_lists_results(app, controllers):
+    controllers['user'].create_user('E100', '山田 太郎', None)
+    window = MainWindow(controllers=controllers)
+    tab = window.search_tab
+    tab.search_edit.setText('山田')
+    tab.update_results()
+    assert tab.result_list.count() == 1
+    assert '山田 太郎' in tab.result_list.item(0).text()
+    window.close()
+
+def test_role_assignment_button_assigns_best_fit_per_role(app, controllers, monkeypatch):
+    python = create_skill(controllers, 'Python')
+    sql = create_skill(controllers, 'SQL')
+    yamada = controllers['user'].create_user('E1', '山田', None)
+    suzuki = controllers['user'].create_user('E2', '鈴木', None)
+    controllers['user_skill'].set_levels_bulk([
+        (yamada.id, python.id, 5), (yamada.id, sql.id, 4),
+        (suzuki.id, python.id, 1), (suzuki.id, sql.id, 3),
+    ])
+    # 山田はどちらにも適合度が高いが、合計が最大になるよう鈴木を SQL に割り当てる
+    controllers['role'].create_role('開発', requirements=[RoleRequirement(python.id, 5)])
+    controllers['role'].create_role('DB', requirements=[RoleRequirement(sql.id, 3)])
+
+    messages = []
+    monkeypatch.setattr(main_panel.QMessageBox, 'information', lambda parent, title, text: messages.append(text))
+    window = MainWindow(controllers=controllers)
+    panel = window.main_panel
+    assert not panel.role_assignment_button.isHidden()
+    panel.role_assignment_button.click()
+    model = panel.user_list.model()
+    assert sorted(model.user_at(row).name for row in range(model.rowCount())) == ['山田', '鈴木']
+    assert messages and '開発: 山田' in messages[0] and 'DB: 鈴木' in messages[0]
+    window.close()
+
+def test_skill_evaluation_tab_follows_level_changes(app, controllers):
+    python = create_skill(controllers, 'Python')
+    yamada = controllers['user'].create_user('E1', '山田', None)
+    controllers['user_skill'].set_level(yamada.id, python.id, 2)
+
+    window = MainWindow(controllers=controllers)
+    model = window.skill_evaluation_tab.matrix_model
+    assert 'スキル評価' in tab_titles(window)
+    assert (model.rowCount(), model.columnCount()) == (1, 1)
+    assert model.data(model.index(0, 0)) == '2'
+
+    # 画面と同じユーザースキルコントローラー経由の変更はセル単位で反映される
+    controllers['user_skill'].set_level(yamada.id, python.id, 4)
+    assert model.data(model.index(0, 0)) == '4'
+    window.close()
@@ -0,0 +1,199 @@
+import os
+import random
+from datetime import datetime
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+from src.desktop.models.user import User
+from src.desktop.views.components.users import user_list_model
+from src.desktop.views.components.users.user_list_model import UserListModel
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+class StubUserController:
+    """社員番号順のキーセットページングだけを持つユーザーコントローラー"""
+
+    def __init__(self, users):
+        self.users = {user.id: user for user in users}
+        self.pages = []
+
+    def get_users_page(self, after_employee_id=None, limit=100, group_id=None):
+        self.pages.append(after_employee_id)
+        users = sorted(
+            (user for user in self.users.values()
+             if (group_id is None or user.group_id == group_id)
+             and (after_employee_id is None or user.employee_id > after_employee_id)),
+            key=lambda user: user.employee_id
+        )
+        return users[:limit]
+
+def make_user(user_id, employee_id, group_id=None, name=None):
+    now = datetime(2025, 1, 1)
+    return User(user_id, employee_id, name or f'ユーザー{user_id}', group_id, now, now)
+
+class SignalLog:
+    """モデルの行の挿入・削除・変更通知を記録する"""
+
+    def __init__(self, model):
+        self.events = []
+        model.rowsInserted.connect(lambda parent, first, last: self.events.append(('insert', first, last)))
+        model.rowsRemoved.connect(lambda parent, first, last: self.events.append(('remove', first, last)))
+        model.dataChanged.connect(lambda top, bottom: self.events.append(('change', top.row(), bottom.row())))
+        model.modelReset.connect(lambda: self.events.append(('reset',)))
+
+    def take(self):
+        events, self.events = self.events, []
+        return events
+
+def loaded(model):
+    return [model.user_at(row) for row in range(model.rowCount())]
+
+def fetch_all(model):
+    while model.canFetchMore():
+        model.fetchMore()
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    monkeypatch.setattr(user_list_model, 'PAGE_SIZE', 3)
+
+def test_fetch_more_loads_pages_in_employee_order(app, small_pages):
+    users = [make_user(i, f'E{i:03d}', group_id=1 if i % 2 else 2) for i in range(1, 11)]
+    controller = StubUserController(users)
+    model = UserListModel(controller)
+    assert not model.canFetchMore()
+
+    model.set_group(1)
+    assert model.rowCount() == 0
+    assert model.canFetchMore()
+    model.fetchMore()
+    assert [user.employee_id for user in loaded(model)] == ['E001', 'E003', 'E005']
+    fetch_all(model)
+    assert [user.employee_id for user in loaded(model)] == ['E001', 'E003', 'E005', 'E007', 'E009']
+    # 2ページ目以降は直前のページの最後の社員番号から読み込む
+    assert controller.pages == [None, 'E005']
+    assert not model.canFetchMore()
+
+    # 件数がページサイズちょうどの場合は空のページで終わる
+    model.set_group(None)
+    controller.pages.clear()
+    controller.users = {user.id: user for user in users[:6]}
+    fetch_all(model)
+    assert model.rowCount() == 6
+    assert controller.pages == [None, 'E003', 'E006']
+
+def test_insert_places_users_in_employee_order_and_skips_the_unloaded_tail(app, small_pages):
+    controller = StubUserController([make_user(i, f'E{i * 10:03d}') for i in range(1, 6)])
+    model = UserListModel(controller)
+    model.set_group(None)
+    model.fetchMore()
+    log = SignalLog(model)
+
+    # 読み込み済みの範囲に入るユーザーはその位置に挿入する
+    assert model.insert_user(make_user(20, 'E015'))
+    assert log.take() == [('insert', 1, 1)]
+    # 未読み込みの範囲（最後の読み込み済みより後）は以降の fetchMore に任せる
+    new_tail = make_user(21, 'E045')
+    assert model.insert_user(new_tail)
+    assert log.take() == []
+    controller.users[new_tail.id] = new_tail
+    fetch_all(model)
+    assert [user.employee_id for user in loaded(model)] == ['E010', 'E015', 'E020', 'E030', 'E040', 'E045', 'E050']
+
+    # 全て読み込んだ後は末尾にも挿入する
+    assert model.insert_user(make_user(22, 'E060'))
+    assert log.take()[-1] == ('insert', 7, 7)
+    # 他のグループのユーザーは表示しない
+    model.set_group(1)
+    log.take()
+    assert model.insert_user(make_user(23, 'E001', group_id=2))
+    assert log.take() == []
+
+def test_update_and_remove_emit_row_diffs(app, small_pages):
+    users = [make_user(i, f'E{i:03d}', group_id=1) for i in range(1, 7)]
+    controller = StubUserController(users)
+    model = UserListModel(controller)
+    model.set_group(1)
+    fetch_all(model)
+    log = SignalLog(model)
+
+    # 名前だけの変更は行の変更通知
+    assert model.update_user(make_user(3, 'E003', group_id=1, name='改名'))
+    assert log.take() == [('change', 2, 2)]
+    assert model.user_at(2).name == '改名'
+
+    # 社員番号の変更は削除と挿入
+    assert model.update_user(make_user(1, 'E100', group_id=1))
+    assert log.take() == [('remove', 0, 0), ('insert', 5, 5)]
+    assert model.row_of(1) == 5
+
+    # 他のグループへの移動は削除のみ
+    assert model.update_user(make_user(4, 'E004', group_id=2))
+    assert log.take() == [('remove', 2, 2)]
+    assert model.row_of(4) == -1
+
+    # 他のグループから移ってきたユーザーは挿入
+    assert model.update_user(make_user(9, 'E0035', group_id=1))
+    assert log.take() == [('insert', 2, 2)]
+
+    assert model.remove_user(2)
+    assert log.take() == [('remove', 0, 0)]
+    assert model.remove_user(2)
+    assert log.take() == []
+    assert [user.employee_id for user in loaded(model)] == ['E003', 'E0035', 'E005', 'E006', 'E100']
+    assert [model.row_of(user.id) for user in loaded(model)] == list(range(5))
+
+def test_fixed_lists_are_not_diffed(app):
+    model = UserListModel(StubUserController([]))
+    users = [make_user(1, 'E9'), make_user(2, 'E1')]
+    model.set_users(users)
+    model.append_user(make_user(3, 'E5'))
+    assert [model.row_of(user_id) for user_id in (1, 2, 3, 4)] == [0, 1, 2, -1]
+    log = SignalLog(model)
+    assert not model.insert_user(make_user(4, 'E0'))
+    assert not model.update_user(make_user(1, 'E9', name='改名'))
+    assert not model.remove_user(1)
+    assert log.take() == []
+    assert not model.canFetchMore()
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_changes_match_a_fresh_load(app, small_pages, seed):
+    rng = random.Random(seed)
+    controller = StubUserController(
+        [make_user(i, f'E{rng.randrange(10000):05d}-{i}', rng.choice([1, 2])) for i in range(1, 30)]
+    )
+    model = UserListModel(controller)
+    model.set_group(1)
+    model.fetchMore()
+    next_id = 100
+    for _ in range(60):
+        operation = rng.random()
+        if operation < 0.35:
+            user = make_user(next_id, f'E{rng.randrange(10000):05d}-{next_id}', rng.choice([1, 2]))
+            next_id += 1
+            controller.users[user.id] = user
+            model.insert_user(user)
+        elif operation < 0.7 and controller.users:
+            old = rng.choice(list(controller.users.values()))
+            user = make_user(
+                old.id, rng.choice([old.employee_id, f'E{rng.randrange(10000):05d}-{old.id}']),
+                rng.choice([1, 2]), name=f'更新{rng.randrange(100)}'
+            )
+            controller.users[user.id] = user
+            model.update_user(user)
+        elif operation < 0.85 and controller.users:
+            user_id = rng.choice(list(controller.users))
+            del controller.users[user_id]
+            model.remove_user(user_id)
+        else:
+            model.fetchMore()
+        rows = loaded(model)
+        assert [model.row_of(user.id) for user in rows] == list(range(len(rows)))
+    fetch_all(model)
+    expected = sorted(
+        (user for user in controller.users.values() if user.group_id == 1), key=lambda user: user.employee_id
+    )
+    assert loaded(model) == expected